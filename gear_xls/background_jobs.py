@@ -0,0 +1,181 @@
+"""Bounded background worker pool for long-running admin operations.
+
+Backup creation, backup upload and restore can take long enough for the
+browser to give up on a synchronous request.  Routes submit them here instead
+and answer immediately with a job id; clients follow the job through
+``GET /api/jobs/<id>`` or the ``/api/jobs/<id>/events`` SSE stream.
+
+A job function receives a ``progress(stage)`` callable and returns
+``(payload, status_code)`` — the same JSON payload and HTTP status the
+synchronous route would have produced — so a finished job carries exactly
+what the client would otherwise have received.  Jobs live in memory only;
+finished ones are dropped after :data:`JOB_RETENTION_SECONDS`.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+
+JOB_WORKERS = 2
+MAX_PENDING_JOBS = 8
+JOB_RETENTION_SECONDS = 3600
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+FINISHED_STATES = frozenset({JOB_SUCCEEDED, JOB_FAILED})
+
+logger = logging.getLogger(__name__)
+
+_jobs: dict[str, dict[str, Any]] = {}
+_jobs_changed = threading.Condition()
+_sequence = itertools.count(1)
+_executor: ThreadPoolExecutor | None = None
+
+
+class JobQueueFull(RuntimeError):
+    status_code = 429
+    code = "JOB_QUEUE_FULL"
+
+    def __init__(self) -> None:
+        super().__init__("Too many background jobs are pending")
+        self.message = str(self)
+
+    def to_payload(self) -> dict[str, Any]:
+        return {"ok": False, "error": self.message, "code": self.code}
+
+
+def _format_timestamp() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix="schedgen-job")
+    return _executor
+
+
+def _prune_finished_unlocked(now: float) -> None:
+    expired = [
+        job_id
+        for job_id, job in _jobs.items()
+        if job["status"] in FINISHED_STATES and now - job["_finished_monotonic"] > JOB_RETENTION_SECONDS
+    ]
+    for job_id in expired:
+        del _jobs[job_id]
+
+
+def _public(job: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in job.items() if not key.startswith("_")}
+
+
+def _update(job_id: str, **changes: Any) -> None:
+    with _jobs_changed:
+        job = _jobs.get(job_id)
+        if job is None:
+            return
+        job.update(changes)
+        job["version"] += 1
+        if job["status"] in FINISHED_STATES:
+            job["_finished_monotonic"] = time.monotonic()
+        _jobs_changed.notify_all()
+
+
+def _run(job_id: str, func: Callable[..., tuple[dict[str, Any], int]]) -> None:
+    _update(job_id, status=JOB_RUNNING, stage="running", started_at=_format_timestamp())
+    try:
+        payload, status_code = func(lambda stage: _update(job_id, stage=stage))
+    except Exception as exc:
+        logger.exception("Background job %s failed", job_id)
+        payload = {"ok": False, "error": str(exc) or exc.__class__.__name__, "code": "JOB_FAILED"}
+        status_code = 500
+    succeeded = 200 <= int(status_code) < 300
+    _update(
+        job_id,
+        status=JOB_SUCCEEDED if succeeded else JOB_FAILED,
+        stage="completed" if succeeded else "failed",
+        finished_at=_format_timestamp(),
+        status_code=int(status_code),
+        result=payload,
+    )
+
+
+def submit_job(kind: str, owner: str, func: Callable[..., tuple[dict[str, Any], int]]) -> dict[str, Any]:
+    """Queue ``func`` on the worker pool and return the new job's status.
+
+    Raises :class:`JobQueueFull` when :data:`MAX_PENDING_JOBS` jobs are
+    already queued or running.
+    """
+
+    with _jobs_changed:
+        _prune_finished_unlocked(time.monotonic())
+        pending = sum(1 for job in _jobs.values() if job["status"] not in FINISHED_STATES)
+        if pending >= MAX_PENDING_JOBS:
+            raise JobQueueFull()
+        job_id = f"{next(_sequence)}-{secrets.token_hex(6)}"
+        _jobs[job_id] = {
+            "id": job_id,
+            "kind": kind,
+            "owner": owner,
+            "status": JOB_QUEUED,
+            "stage": "queued",
+            "created_at": _format_timestamp(),
+            "started_at": None,
+            "finished_at": None,
+            "status_code": None,
+            "result": None,
+            "version": 0,
+        }
+        snapshot = _public(_jobs[job_id])
+    _get_executor().submit(_run, job_id, func)
+    return snapshot
+
+
+def get_job(job_id: str) -> dict[str, Any] | None:
+    with _jobs_changed:
+        job = _jobs.get(job_id)
+        return _public(job) if job is not None else None
+
+
+def wait_for_change(job_id: str, seen_version: int, timeout: float) -> dict[str, Any] | None:
+    """Block until the job's version differs from ``seen_version`` or timeout.
+
+    Returns the current job status (possibly unchanged after a timeout), or
+    ``None`` if the job is unknown.
+    """
+
+    deadline = time.monotonic() + timeout
+    with _jobs_changed:
+        while True:
+            job = _jobs.get(job_id)
+            if job is None or job["version"] != seen_version or job["status"] in FINISHED_STATES:
+                return _public(job) if job is not None else None
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return _public(job)
+            _jobs_changed.wait(remaining)
+
+
+def wait_for_job(job_id: str, timeout: float) -> dict[str, Any] | None:
+    """Block until the job finishes or ``timeout`` seconds elapse."""
+
+    deadline = time.monotonic() + timeout
+    with _jobs_changed:
+        while True:
+            job = _jobs.get(job_id)
+            if job is None or job["status"] in FINISHED_STATES:
+                return _public(job) if job is not None else None
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return _public(job)
+            _jobs_changed.wait(remaining)
@@ -0,0 +1,176 @@
+"""Content-addressed storage for web editor backups.
+
+Every archive entry (``manifest.json``, state JSON, ``schedule.html``,
+spiski files) is written once to ``backups/blobs/<aa>/<sha256>``.  A backup is
+a small ``<backup_id>.cas.json`` record mapping archive paths to blob
+digests, so consecutive backups share everything that did not change.
+Deleting a record and running :func:`collect_garbage` frees blobs that no
+record references any more.
+
+This module only stores and verifies bytes; ``backup_manager`` still owns
+manifest and state validation and converts between records and the ZIP
+format used for download and upload.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Any
+
+
+BLOB_DIRNAME = "blobs"
+RECORD_SUFFIX = ".cas.json"
+RECORD_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+# Serialises blob writes against garbage collection within this process.
+_store_mutex = threading.Lock()
+
+
+class BlobStoreError(RuntimeError):
+    pass
+
+
+def record_filename(backup_id: str) -> str:
+    return f"{backup_id}{RECORD_SUFFIX}"
+
+
+def record_path(backup_dir: str, backup_id: str) -> str:
+    return os.path.join(backup_dir, record_filename(backup_id))
+
+
+def _blob_path(backup_dir: str, digest: str) -> str:
+    return os.path.join(backup_dir, BLOB_DIRNAME, digest[:2], digest)
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".blob_", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def store_entries(backup_dir: str, backup_id: str, entries: dict[str, bytes]) -> dict[str, Any]:
+    """Write missing blobs for ``entries`` and then the backup record."""
+
+    mapping = {}
+    with _store_mutex:
+        for archive_path, data in entries.items():
+            digest = hashlib.sha256(data).hexdigest()
+            blob = _blob_path(backup_dir, digest)
+            if not os.path.exists(blob) or os.path.getsize(blob) != len(data):
+                _atomic_write(blob, data)
+            mapping[archive_path] = {"sha256": digest, "size": len(data)}
+        record = {"version": RECORD_VERSION, "backup_id": backup_id, "entries": mapping}
+        _atomic_write(
+            record_path(backup_dir, backup_id),
+            json.dumps(record, ensure_ascii=False, indent=2, sort_keys=True).encode("utf-8"),
+        )
+    return record
+
+
+def read_record(backup_dir: str, backup_id: str) -> dict[str, Any]:
+    try:
+        with open(record_path(backup_dir, backup_id), "r", encoding="utf-8") as handle:
+            record = json.load(handle)
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise BlobStoreError("Backup record is not valid JSON") from exc
+    if not isinstance(record, dict) or record.get("version") != RECORD_VERSION:
+        raise BlobStoreError("Backup record has an unsupported format")
+    if not isinstance(record.get("entries"), dict):
+        raise BlobStoreError("Backup record has an unsupported format")
+    return record
+
+
+def load_entries(backup_dir: str, backup_id: str, *, max_entry_bytes: int) -> dict[str, bytes]:
+    """Read and checksum every blob referenced by one backup record."""
+
+    entries = {}
+    for archive_path, ref in read_record(backup_dir, backup_id)["entries"].items():
+        digest = ref.get("sha256") if isinstance(ref, dict) else None
+        if not isinstance(digest, str) or len(digest) != 64:
+            raise BlobStoreError(f"{archive_path} has an invalid blob reference")
+        path = _blob_path(backup_dir, digest)
+        try:
+            if os.path.getsize(path) > max_entry_bytes:
+                raise BlobStoreError(f"{archive_path} is too large")
+            with open(path, "rb") as handle:
+                data = handle.read()
+        except FileNotFoundError as exc:
+            raise BlobStoreError(f"{archive_path} blob is missing") from exc
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise BlobStoreError(f"{archive_path} blob checksum mismatch")
+        entries[archive_path] = data
+    return entries
+
+
+def delete_record(backup_dir: str, backup_id: str) -> bool:
+    try:
+        os.unlink(record_path(backup_dir, backup_id))
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def collect_garbage(backup_dir: str) -> int:
+    """Remove blobs no record references; return the number removed.
+
+    If any record cannot be read, its references are unknown and nothing is
+    removed: a transient read error must not delete the blobs of a valid
+    backup.
+    """
+
+    with _store_mutex:
+        return _collect_garbage(backup_dir)
+
+
+def _collect_garbage(backup_dir: str) -> int:
+    referenced = set()
+    for filename in os.listdir(backup_dir):
+        if not filename.endswith(RECORD_SUFFIX):
+            continue
+        try:
+            record = read_record(backup_dir, filename[: -len(RECORD_SUFFIX)])
+        except (OSError, BlobStoreError) as exc:
+            logger.warning("Skipping blob garbage collection: cannot read %s (%s)", filename, exc)
+            return 0
+        for ref in record["entries"].values():
+            if isinstance(ref, dict) and isinstance(ref.get("sha256"), str):
+                referenced.add(ref["sha256"])
+
+    removed = 0
+    blob_root = os.path.join(backup_dir, BLOB_DIRNAME)
+    if not os.path.isdir(blob_root):
+        return 0
+    for prefix in os.listdir(blob_root):
+        prefix_dir = os.path.join(blob_root, prefix)
+        if not os.path.isdir(prefix_dir):
+            continue
+        for digest in os.listdir(prefix_dir):
+            if digest in referenced:
+                continue
+            try:
+                os.unlink(os.path.join(prefix_dir, digest))
+                removed += 1
+            except OSError:
+                pass
+        try:
+            os.rmdir(prefix_dir)
+        except OSError:
+            pass
+    return removed
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
 import hashlib
+import io
 import json
 import os
 import re
 import stat
 import struct
 import tempfile
+import threading
 import uuid
 import zipfile
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable
 
 from gear_xls.runtime_paths import (
+    BACKUP_STORE_DEDUP,
     get_backup_dir,
     get_base_schedule_path,
     get_group_occupancy_snapshot_path,
@@ -20,7 +23,11 @@ from gear_xls.runtime_paths import (
     get_project_root_id,
     get_schedule_html_path,
     get_spiski_dir,
+    load_server_config,
 )
+from gear_xls import backup_blob_store
+from gear_xls import individual_journal
+from gear_xls import state_storage
 from gear_xls.schedule_mutation_coordinator import schedule_mutation
 from gear_xls.event_domain import (
     EVENT_OWNER_KINDS,
@@ -47,6 +54,8 @@ SUPPORTED_BACKUP_SCHEMA_VERSIONS = {1, 2}
 BACKUP_ID_RE = re.compile(r"^schedgen_backup_\d{8}_\d{6}_[0-9a-f]{8}$")
 BACKUP_FILENAME_RE = re.compile(r"^(schedgen_backup_\d{8}_\d{6}_[0-9a-f]{8})\.zip$")
 ALLOWED_BACKUP_KINDS = {"manual", "safety", "uploaded"}
+BACKUP_INDEX_FILENAME = "index.json"
+BACKUP_INDEX_VERSION = 1
 
 MAX_COMMENT_CHARS = 500
 MAX_UPLOAD_BYTES = 50 * 1024 * 1024
@@ -184,7 +193,8 @@ def _allocate_backup_destination(backup_dir: str, moment: datetime) -> tuple[str
     for _ in range(100):
         candidate_id = _generate_backup_id(moment)
         candidate_path = os.path.join(backup_dir, f"{candidate_id}.zip")
-        if not os.path.exists(candidate_path):
+        record_path = backup_blob_store.record_path(backup_dir, candidate_id)
+        if not os.path.exists(candidate_path) and not os.path.exists(record_path):
             return candidate_id, candidate_path
     raise BackupError(
         "Could not allocate backup filename",
@@ -233,7 +243,11 @@ def _read_state_json(
     default_state: dict[str, Any],
     validator,
 ) -> tuple[bytes, dict[str, Any]]:
-    if not os.path.exists(path):
+    stored = _read_stored_state(path)
+    if stored is not None:
+        validator(stored, label=label)
+        return _json_bytes(stored), stored
+    if state_storage.store_for_path(path) is not None or not os.path.exists(path):
         validator(default_state, label=label)
         return _json_bytes(default_state), dict(default_state)
 
@@ -243,6 +257,48 @@ def _read_state_json(
     return data, parsed
 
 
+def _read_stored_state(path: str) -> dict[str, Any] | None:
+    """Return the document exported from the SQLite store serving ``path``."""
+
+    stored = state_storage.store_for_path(path)
+    if stored is None:
+        return None
+    store, document = stored
+    return store.read_document(document)
+
+
+def _read_individual_state_json(project_root: str | None) -> tuple[bytes, dict[str, Any]]:
+    """Read individual state with any pending journal records folded in."""
+
+    path = get_individual_lessons_path(project_root)
+    data, state = _read_state_json(
+        path,
+        label="individual_lessons.json",
+        default_state=_empty_individual_state(),
+        validator=validate_individual_state,
+    )
+    journal_path = individual_journal.journal_path_for(path)
+    if state_storage.store_for_path(path) is not None or not os.path.exists(journal_path):
+        return data, state
+    snapshot_bytes = data if os.path.exists(path) else b""
+    try:
+        records = individual_journal.read_journal(
+            journal_path,
+            individual_journal.snapshot_sha256(snapshot_bytes),
+        )
+    except Exception as exc:
+        raise BackupValidationError(
+            "individual_lessons.json journal is invalid",
+            code="INVALID_JSON_STATE",
+            status_code=400,
+        ) from exc
+    if not records:
+        return data, state
+    state = individual_journal.apply_records(dict(state), records)
+    validate_individual_state(state, label="individual_lessons.json")
+    return _json_bytes(state), state
+
+
 def _time_minutes(value: str) -> int:
     hours, minutes = value.split(":", 1)
     return int(hours) * 60 + int(minutes)
@@ -594,7 +650,11 @@ def _read_or_build_snapshot_bytes(
     individual_state: dict[str, Any],
 ) -> tuple[bytes, dict[str, Any]]:
     path = get_group_occupancy_snapshot_path(project_root)
-    if os.path.exists(path):
+    stored = _read_stored_state(path)
+    if stored is not None:
+        validate_group_occupancy_snapshot_state(stored, label="group_occupancy_snapshot.json")
+        return _json_bytes(stored), stored
+    if state_storage.store_for_path(path) is None and os.path.exists(path):
         data = _read_limited_file(path, max_bytes=MAX_JSON_BYTES, label="group_occupancy_snapshot.json")
         parsed = _parse_json_bytes(data, label="group_occupancy_snapshot.json")
         validate_group_occupancy_snapshot_state(parsed, label="group_occupancy_snapshot.json")
@@ -622,12 +682,7 @@ def _collect_source_files(project_root: str | None) -> tuple[dict[str, bytes], d
         default_state=_empty_base_state(),
         validator=validate_base_state,
     )
-    individual_bytes, individual_state = _read_state_json(
-        get_individual_lessons_path(project_root),
-        label="individual_lessons.json",
-        default_state=_empty_individual_state(),
-        validator=validate_individual_state,
-    )
+    individual_bytes, individual_state = _read_individual_state_json(project_root)
     snapshot_bytes, snapshot_state = _read_or_build_snapshot_bytes(
         project_root,
         base_state=base_state,
@@ -707,6 +762,90 @@ def _write_zip(path: str, entries: dict[str, bytes]) -> None:
             archive.writestr(archive_path, entries[archive_path])
 
 
+def _zip_bytes(entries: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    _write_zip(buffer, entries)
+    return buffer.getvalue()
+
+
+def _uses_dedup_store(project_root: str | None) -> bool:
+    return load_server_config(project_root)["backup_store"] == BACKUP_STORE_DEDUP
+
+
+def _store_deduplicated_backup(
+    backup_dir: str,
+    backup_id: str,
+    entries: dict[str, bytes],
+) -> tuple[str, dict[str, Any]]:
+    """Validate ``entries`` and keep them as shared blobs plus a record."""
+
+    manifest = validate_backup_entries(entries, deep=True)
+    backup_blob_store.store_entries(backup_dir, backup_id, entries)
+    path = backup_blob_store.record_path(backup_dir, backup_id)
+    _record_backup_in_index(backup_dir, path, manifest)
+    return path, manifest
+
+
+def _load_deduplicated_entries(backup_dir: str, backup_id: str) -> dict[str, bytes]:
+    try:
+        return backup_blob_store.load_entries(
+            backup_dir,
+            backup_id,
+            max_entry_bytes=MAX_SINGLE_FILE_UNCOMPRESSED_BYTES,
+        )
+    except backup_blob_store.BlobStoreError as exc:
+        raise BackupValidationError(str(exc), code="INVALID_BACKUP_RECORD", status_code=400) from exc
+
+
+def load_backup_entries(backup_id: str, project_root: str | None = None) -> tuple[dict[str, Any], dict[str, bytes]]:
+    """Return the deep-validated manifest and entries of one stored backup."""
+
+    path = get_backup_path(backup_id, project_root)
+    if os.path.exists(path):
+        entries = _load_zip_entries(path)
+    else:
+        backup_dir = os.path.dirname(path)
+        if not os.path.exists(backup_blob_store.record_path(backup_dir, backup_id)):
+            raise BackupError("Backup not found", code="BACKUP_NOT_FOUND", status_code=404)
+        entries = _load_deduplicated_entries(backup_dir, backup_id)
+    return validate_backup_entries(entries, deep=True), entries
+
+
+def read_backup_zip_bytes(backup_id: str, project_root: str | None = None) -> bytes:
+    """Return a deduplicated backup rebuilt in the regular ZIP format."""
+
+    _manifest, entries = load_backup_entries(backup_id, project_root)
+    return _zip_bytes(entries)
+
+
+def backup_exists(backup_id: str, project_root: str | None = None) -> bool:
+    path = get_backup_path(backup_id, project_root)
+    return os.path.exists(path) or os.path.exists(
+        backup_blob_store.record_path(os.path.dirname(path), backup_id)
+    )
+
+
+def delete_backup(backup_id: str, project_root: str | None = None) -> dict[str, Any]:
+    """Delete one backup and free blobs no other backup references."""
+
+    path = get_backup_path(backup_id, project_root)
+    backup_dir = os.path.dirname(path)
+    removed = False
+    if os.path.exists(path):
+        os.unlink(path)
+        removed = True
+    if backup_blob_store.delete_record(backup_dir, backup_id):
+        removed = True
+    if not removed:
+        raise BackupError("Backup not found", code="BACKUP_NOT_FOUND", status_code=404)
+    with _backup_index_mutex:
+        entries = _read_backup_index(backup_dir)
+        entries.pop(os.path.basename(path), None)
+        entries.pop(backup_blob_store.record_filename(backup_id), None)
+        _write_backup_index(backup_dir, entries)
+    return {"id": backup_id, "blobs_removed": backup_blob_store.collect_garbage(backup_dir)}
+
+
 def _normalize_uploaded_original_filename(original_filename: object) -> str:
     value = str(original_filename or "").replace("\x00", "").strip()
     value = value.replace("\\", "/").split("/")[-1]
@@ -778,6 +917,26 @@ def _trusted_uploaded_manifest(
     return trusted
 
 
+def spool_uploaded_backup(file_stream, *, project_root: str | None = None) -> str:
+    """Copy an upload stream to a temporary file in the backup directory.
+
+    Lets a route release the request stream before validation runs in a
+    background job; pass the returned path to :func:`store_spooled_backup`.
+    """
+
+    backup_dir = get_backup_dir(project_root)
+    os.makedirs(backup_dir, exist_ok=True)
+    return _copy_upload_to_temp(file_stream, backup_dir)
+
+
+def discard_spooled_backup(source_tmp_path: str) -> None:
+    if source_tmp_path and os.path.exists(source_tmp_path):
+        try:
+            os.unlink(source_tmp_path)
+        except OSError:
+            pass
+
+
 def store_uploaded_backup(
     file_stream,
     original_filename: object,
@@ -786,12 +945,35 @@ def store_uploaded_backup(
     *,
     project_root: str | None = None,
 ) -> dict[str, Any]:
-    backup_dir = get_backup_dir(project_root)
-    os.makedirs(backup_dir, exist_ok=True)
+    source_tmp_path = spool_uploaded_backup(file_stream, project_root=project_root)
+    return store_spooled_backup(
+        source_tmp_path,
+        original_filename,
+        uploaded_by,
+        uploaded_by_display_name,
+        project_root=project_root,
+    )
+
+
+def store_spooled_backup(
+    source_tmp_path: str,
+    original_filename: object,
+    uploaded_by: str,
+    uploaded_by_display_name: str,
+    *,
+    project_root: str | None = None,
+    progress: Callable[[str], None] | None = None,
+) -> dict[str, Any]:
+    """Validate a spooled upload and store it as a server backup.
+
+    The spooled file is always removed.
+    """
 
-    source_tmp_path = _copy_upload_to_temp(file_stream, backup_dir)
+    backup_dir = get_backup_dir(project_root)
     rewritten_tmp_path = None
     try:
+        if progress is not None:
+            progress("validating")
         original_manifest = validate_backup_zip(source_tmp_path, deep=True)
         entries = _load_zip_entries(source_tmp_path)
 
@@ -805,7 +987,20 @@ def store_uploaded_backup(
         )
         entries["manifest.json"] = _json_bytes(trusted_manifest)
 
+        if progress is not None:
+            progress("storing")
         final_backup_id, final_path = _allocate_backup_destination(backup_dir, moment)
+        if _uses_dedup_store(project_root):
+            record_path, trusted_manifest = _store_deduplicated_backup(backup_dir, final_backup_id, entries)
+            return _metadata_from_manifest(
+                final_backup_id,
+                os.path.basename(final_path),
+                record_path,
+                trusted_manifest,
+                project_root=project_root,
+                valid=True,
+                invalid_reason=None,
+            )
 
         fd, rewritten_tmp_path = tempfile.mkstemp(
             prefix=".uploaded_backup_",
@@ -817,6 +1012,7 @@ def store_uploaded_backup(
         trusted_manifest = validate_backup_zip(rewritten_tmp_path, deep=True)
         os.replace(rewritten_tmp_path, final_path)
         rewritten_tmp_path = None
+        _record_backup_in_index(backup_dir, final_path, trusted_manifest)
 
         return _metadata_from_manifest(
             final_backup_id,
@@ -843,13 +1039,18 @@ def create_backup(
     backup_kind: str = "manual",
     *,
     project_root: str | None = None,
+    progress: Callable[[str], None] | None = None,
 ) -> dict[str, Any]:
     comment = normalize_comment(comment)
     if backup_kind not in ALLOWED_BACKUP_KINDS:
         raise BackupError("Invalid backup kind", code="INVALID_BACKUP_KIND", status_code=400)
 
+    if progress is not None:
+        progress("capturing")
     with schedule_mutation("backup_capture"):
         files, base_state, individual_state, snapshot_state = _collect_source_files(project_root)
+    if progress is not None:
+        progress("writing")
     moment = _utc_now()
     created_at = _format_created_at(moment)
     manifest = _build_manifest(
@@ -869,13 +1070,25 @@ def create_backup(
     backup_dir = get_backup_dir(project_root)
     os.makedirs(backup_dir, exist_ok=True)
     final_backup_id, final_path = _allocate_backup_destination(backup_dir, moment)
+    if _uses_dedup_store(project_root):
+        record_path, _verified = _store_deduplicated_backup(backup_dir, final_backup_id, entries)
+        return _metadata_from_manifest(
+            final_backup_id,
+            os.path.basename(final_path),
+            record_path,
+            manifest,
+            project_root=project_root,
+            valid=True,
+            invalid_reason=None,
+        )
 
     fd, tmp_path = tempfile.mkstemp(prefix=".backup_", suffix=".zip.tmp", dir=backup_dir)
     os.close(fd)
     try:
         _write_zip(tmp_path, entries)
-        validate_backup_zip(tmp_path, deep=True)
+        verified_manifest = validate_backup_zip(tmp_path, deep=True)
         os.replace(tmp_path, final_path)
+        _record_backup_in_index(backup_dir, final_path, verified_manifest)
     finally:
         if os.path.exists(tmp_path):
             try:
@@ -1112,7 +1325,10 @@ def read_manifest_from_zip(path: str) -> dict[str, Any]:
 
 
 def validate_backup_zip(path: str, *, deep: bool = True) -> dict[str, Any]:
-    entries = _load_zip_entries(path)
+    return validate_backup_entries(_load_zip_entries(path), deep=deep)
+
+
+def validate_backup_entries(entries: dict[str, bytes], *, deep: bool = True) -> dict[str, Any]:
     _validate_exact_archive_paths(entries)
     manifest = _parse_json_bytes(entries["manifest.json"], label="manifest.json")
     manifest = _validate_manifest(manifest, entries)
@@ -1184,35 +1400,128 @@ def _metadata_from_manifest(
     }
 
 
+_backup_index_mutex = threading.Lock()
+
+
+def _backup_fingerprint(path: str) -> dict[str, int]:
+    info = os.stat(path)
+    return {"size": info.st_size, "mtime_ns": info.st_mtime_ns}
+
+
+def _read_backup_index(backup_dir: str) -> dict[str, dict[str, Any]]:
+    path = os.path.join(backup_dir, BACKUP_INDEX_FILENAME)
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except FileNotFoundError:
+        return {}
+    except Exception:
+        # A damaged catalogue only costs one full re-validation.
+        return {}
+    if not isinstance(data, dict) or data.get("version") != BACKUP_INDEX_VERSION:
+        return {}
+    entries = data.get("backups")
+    return dict(entries) if isinstance(entries, dict) else {}
+
+
+def _write_backup_index(backup_dir: str, entries: dict[str, dict[str, Any]]) -> None:
+    payload = {"version": BACKUP_INDEX_VERSION, "backups": entries}
+    fd, tmp_path = tempfile.mkstemp(prefix=".index_", suffix=".json.tmp", dir=backup_dir)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(_json_bytes(payload))
+        os.replace(tmp_path, os.path.join(backup_dir, BACKUP_INDEX_FILENAME))
+    finally:
+        if os.path.exists(tmp_path):
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def _index_entry(path: str, manifest: dict[str, Any] | None, invalid_reason: str | None) -> dict[str, Any]:
+    return {
+        **_backup_fingerprint(path),
+        "verified_at": _format_created_at(_utc_now()),
+        "valid": invalid_reason is None,
+        "invalid_reason": invalid_reason,
+        "manifest": manifest,
+    }
+
+
+def _record_backup_in_index(backup_dir: str, path: str, manifest: dict[str, Any]) -> None:
+    """Catalogue a backup that was just written and deep-validated."""
+
+    with _backup_index_mutex:
+        entries = _read_backup_index(backup_dir)
+        entries[os.path.basename(path)] = _index_entry(path, manifest, None)
+        _write_backup_index(backup_dir, entries)
+
+
+def _catalogue_backup_id(filename: str) -> str | None:
+    if filename.endswith(backup_blob_store.RECORD_SUFFIX):
+        return filename[: -len(backup_blob_store.RECORD_SUFFIX)]
+    if filename.endswith(".zip"):
+        return filename[:-4]
+    return None
+
+
+def _verify_backup(backup_dir: str, filename: str) -> tuple[dict[str, Any] | None, str | None]:
+    try:
+        if filename.endswith(backup_blob_store.RECORD_SUFFIX):
+            entries = _load_deduplicated_entries(backup_dir, _catalogue_backup_id(filename))
+            return validate_backup_entries(entries, deep=True), None
+        return validate_backup_zip(os.path.join(backup_dir, filename), deep=True), None
+    except BackupError as exc:
+        return None, exc.message
+    except Exception as exc:
+        return None, str(exc)
+
+
 def list_backups(project_root: str | None = None) -> list[dict[str, Any]]:
+    """List backups from the catalogue, re-validating only changed archives.
+
+    ``index.json`` keeps the manifest and validation result of every archive
+    (or deduplicated backup record) together with its size and mtime.  A
+    backup is deep-validated again only when that fingerprint no longer
+    matches; restore always re-validates.
+    """
+
     backup_dir = get_backup_dir(project_root)
     os.makedirs(backup_dir, exist_ok=True)
     backups: list[dict[str, Any]] = []
-    for filename in os.listdir(backup_dir):
-        if not filename.endswith(".zip"):
-            continue
+    with _backup_index_mutex:
+        index = _read_backup_index(backup_dir)
+        catalogue: dict[str, dict[str, Any]] = {}
+        for filename in os.listdir(backup_dir):
+            if _catalogue_backup_id(filename) is None:
+                continue
+            path = os.path.join(backup_dir, filename)
+            if not os.path.isfile(path):
+                continue
+            entry = index.get(filename)
+            if not isinstance(entry, dict) or {
+                key: entry.get(key) for key in ("size", "mtime_ns")
+            } != _backup_fingerprint(path):
+                manifest, reason = _verify_backup(backup_dir, filename)
+                entry = _index_entry(path, manifest, reason)
+            catalogue[filename] = entry
+        if catalogue != index:
+            _write_backup_index(backup_dir, catalogue)
+
+    for filename, entry in catalogue.items():
         path = os.path.join(backup_dir, filename)
-        if not os.path.isfile(path):
-            continue
-        backup_id = filename[:-4]
-        manifest: dict[str, Any] | None = None
-        valid = True
-        invalid_reason = None
-        try:
-            manifest = validate_backup_zip(path, deep=True)
-        except BackupError as exc:
-            valid = False
-            invalid_reason = exc.message
-        except Exception as exc:
-            valid = False
-            invalid_reason = str(exc)
+        backup_id = _catalogue_backup_id(filename)
+        manifest = entry.get("manifest") if isinstance(entry.get("manifest"), dict) else None
+        valid = bool(entry.get("valid"))
+        invalid_reason = entry.get("invalid_reason")
         if not BACKUP_ID_RE.fullmatch(backup_id):
             valid = False
             invalid_reason = invalid_reason or "Invalid backup filename"
         backups.append(
             _metadata_from_manifest(
                 backup_id,
-                filename,
+                f"{backup_id}.zip",
                 path,
                 manifest,
                 project_root=project_root,
@@ -13,6 +13,7 @@ if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
 from gear_xls.runtime_paths import get_base_schedule_path
+from gear_xls import state_storage
 from gear_xls.room_name_utils import normalize_room_fields
 from gear_xls.day_constants import PUBLIC_SCHEDULE_DAY_SET
 from gear_xls.schedule_mutation_coordinator import schedule_mutation
@@ -96,6 +97,11 @@ def _locked_base_file():
 
 
 def _read_base():
+    stored = state_storage.store_for_path(BASE_SCHEDULE_PATH)
+    if stored is not None:
+        store, document = stored
+        data = store.read_document(document)
+        return _empty_base() if data is None else _validate_base_data(data)
     if not os.path.exists(BASE_SCHEDULE_PATH):
         return _empty_base()
     try:
@@ -107,7 +113,10 @@ def _read_base():
             "base_schedule.json is not valid JSON",
             "BASE_SCHEDULE_CORRUPT",
         ) from exc
+    return _validate_base_data(data)
 
+
+def _validate_base_data(data):
     if not isinstance(data, dict):
         raise ScheduleStateReadError(
             "base_schedule.json must be a JSON object",
@@ -196,6 +205,11 @@ def _base_blocks_signature(blocks):
 
 
 def _write_base_payload(payload):
+    stored = state_storage.store_for_path(BASE_SCHEDULE_PATH)
+    if stored is not None:
+        store, document = stored
+        store.write_document(document, payload)
+        return
     os.makedirs(os.path.dirname(BASE_SCHEDULE_PATH), exist_ok=True)
     tmp_path = None
     try:
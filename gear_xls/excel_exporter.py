@@ -7,16 +7,23 @@
 """
 
 import os
+import io
 import json
+import hashlib
 import logging
 import tempfile
+import threading
+from collections import OrderedDict
 from datetime import datetime, time
 import pandas as pd
 from openpyxl import Workbook
-from openpyxl.styles import PatternFill, Alignment, Border, Side, Font
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import PatternFill, Alignment, Border, Side, Font, NamedStyle
+from openpyxl.utils import get_column_letter
 from openpyxl.utils.dataframe import dataframe_to_rows
-from gear_xls.day_constants import TRIAL_ONLY_DAYS, WEB_EDITOR_DAY_SET
+from gear_xls.day_constants import TRIAL_ONLY_DAYS, WEB_EDITOR_DAYS, WEB_EDITOR_DAY_SET
 from gear_xls.event_domain import EVENT_SUBJECT, LESSON_TYPE_EVENT
+from gear_xls.time_utils import time_to_minutes
 
 # Настройка логирования
 logging.basicConfig(
@@ -75,6 +82,151 @@ def validate_schedule_data_for_export(schedule_data):
                 code="SUNDAY_REGULAR_FORBIDDEN",
             )
 
+EXPORT_HEADERS = [
+    "Занятие",
+    "Группа",
+    "Преподаватель",
+    "Кабинет",
+    "Здание",
+    "День",
+    "Начало",
+    "Конец",
+    "Продолжительность",
+    "Тип занятия",
+    "Даты (JSON)",
+]
+HEADER_STYLE_NAME = "schedgen_export_header"
+CELL_STYLE_NAME = "schedgen_export_cell"
+EXPORT_CACHE_SIZE = 8
+STATE_EXPORT_PREFIX = "schedule_state_"
+STATE_EXPORT_KEEP = 8
+
+# Готовые XLSX по SHA-256 исходных данных: повторный экспорт неизменённого
+# расписания отдаётся из памяти без разбора JSON и построения книги.
+_export_cache = OrderedDict()
+_export_cache_lock = threading.Lock()
+
+
+def _thin_border():
+    side = Side(style='thin')
+    return Border(left=side, right=side, top=side, bottom=side)
+
+
+def _export_named_styles():
+    """Общие именованные стили: один объект на книгу вместо стиля на каждую ячейку."""
+    header = NamedStyle(name=HEADER_STYLE_NAME)
+    header.font = Font(bold=True)
+    header.fill = PatternFill(start_color="E0E0E0", end_color="E0E0E0", fill_type="solid")
+    header.alignment = Alignment(horizontal='center', vertical='center')
+    header.border = _thin_border()
+
+    cell = NamedStyle(name=CELL_STYLE_NAME)
+    cell.alignment = Alignment(horizontal='center', vertical='center')
+    cell.border = _thin_border()
+    return header, cell
+
+
+def _format_export_time(value, row_idx, label):
+    """Приводит время начала/окончания к строке формата HH:MM."""
+    try:
+        # Если время является словарем с ключами hour и minute
+        if isinstance(value, dict):
+            if 'hour' in value and 'minute' in value:
+                hour = int(value.get('hour', 0))
+                minute = int(value.get('minute', 0))
+                return f"{hour:02d}:{minute:02d}"
+            # Для других форматов словаря, преобразуем в строку
+            return f"{value}"
+        # Если время уже строка с правильным форматом (HH:MM)
+        if isinstance(value, str) and ':' in value:
+            return value
+        # Преобразуем time object в строку
+        if hasattr(value, 'hour') and hasattr(value, 'minute'):
+            return f"{value.hour:02d}:{value.minute:02d}"
+        # Для всех других случаев, преобразуем в строку
+        return str(value)
+    except Exception as e:
+        logger.warning(f"Ошибка при обработке времени {label}: {e}, строка {row_idx}")
+        return str(value)
+
+
+def _export_row(activity, row_idx):
+    """Значения одной строки листа Schedule в порядке EXPORT_HEADERS."""
+    lesson_type = str(activity.get('lesson_type') or 'group').strip() or 'group'
+    trial_dates_json = activity.get('trial_dates_json', '')
+    if lesson_type != 'trial':
+        trial_dates_json = ''
+    elif isinstance(trial_dates_json, list):
+        trial_dates_json = json.dumps(trial_dates_json, ensure_ascii=False)
+    elif trial_dates_json is None:
+        trial_dates_json = ''
+    else:
+        trial_dates_json = str(trial_dates_json)
+
+    return [
+        activity.get('subject', ''),
+        activity.get('students', ''),
+        activity.get('teacher', ''),
+        activity.get('room', ''),
+        activity.get('building', ''),
+        activity.get('day', ''),
+        _format_export_time(activity.get('start_time', '00:00'), row_idx, "начала"),
+        _format_export_time(activity.get('end_time', '00:00'), row_idx, "окончания"),
+        activity.get('duration', 0),
+        lesson_type,
+        trial_dates_json,
+    ]
+
+
+def write_schedule_workbook(schedule_data, target):
+    """
+    Записывает лист Schedule в режиме write_only.
+
+    Ширина столбцов считается по значениям заранее (в write_only-книге
+    ячейки после записи недоступны), строки пишутся потоком с общими
+    именованными стилями.
+
+    Args:
+        schedule_data (list): Проверенные строки экспорта
+        target: Путь к файлу или файловый объект (например, BytesIO)
+    """
+    rows = [_export_row(activity, row_idx) for row_idx, activity in enumerate(schedule_data, 2)]
+    widths = [len(str(header)) for header in EXPORT_HEADERS]
+    for values in rows:
+        for col_idx, value in enumerate(values):
+            widths[col_idx] = max(widths[col_idx], len(str(value)))
+
+    wb = Workbook(write_only=True)
+    header_style, cell_style = _export_named_styles()
+    wb.add_named_style(header_style)
+    wb.add_named_style(cell_style)
+    ws = wb.create_sheet("Schedule")
+    for col_idx, width in enumerate(widths, 1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = width + 2
+
+    def styled(value, style_name):
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = style_name
+        return cell
+
+    ws.append([styled(header, HEADER_STYLE_NAME) for header in EXPORT_HEADERS])
+    for values in rows:
+        ws.append([styled(value, CELL_STYLE_NAME) for value in values])
+    wb.save(target)
+
+
+def _prepare_export_rows(schedule_data):
+    schedule_data = filter_exportable_schedule_data(schedule_data)
+    if not schedule_data:
+        logger.error("Нет данных для экспорта в Excel")
+        raise ExcelExportValidationError(
+            "No exportable schedule rows",
+            code="NO_EXPORTABLE_ROWS",
+        )
+    validate_schedule_data_for_export(schedule_data)
+    return schedule_data
+
+
 def create_excel_from_html_data(schedule_data, output_file=None):
     """
     Создает Excel-файл на основе данных расписания из HTML-версии.
@@ -87,14 +239,7 @@ def create_excel_from_html_data(schedule_data, output_file=None):
     Returns:
         str: Путь к созданному Excel-файлу
     """
-    schedule_data = filter_exportable_schedule_data(schedule_data)
-    if not schedule_data:
-        logger.error("Нет данных для экспорта в Excel")
-        raise ExcelExportValidationError(
-            "No exportable schedule rows",
-            code="NO_EXPORTABLE_ROWS",
-        )
-    validate_schedule_data_for_export(schedule_data)
+    schedule_data = _prepare_export_rows(schedule_data)
     
     # Если имя выходного файла не указано, создаем имя по умолчанию
     if not output_file:
@@ -110,159 +255,8 @@ def create_excel_from_html_data(schedule_data, output_file=None):
     logger.info(f"Количество записей для экспорта: {len(schedule_data)}")
     
     try:
-        # Создаем новую книгу Excel и активный лист
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Schedule"
-        
-        # Добавляем заголовки
-        headers = [
-            "Занятие",
-            "Группа",
-            "Преподаватель",
-            "Кабинет",
-            "Здание",
-            "День",
-            "Начало",
-            "Конец",
-            "Продолжительность",
-            "Тип занятия",
-            "Даты (JSON)",
-        ]
-        
-        for col_idx, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_idx)
-            cell.value = header
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="E0E0E0", end_color="E0E0E0", fill_type="solid")
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-            cell.border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-        
-        # Заполняем данными
-        for row_idx, activity in enumerate(schedule_data, 2):
-            # Предмет
-            ws.cell(row=row_idx, column=1).value = activity.get('subject', '')
-            # Группа
-            ws.cell(row=row_idx, column=2).value = activity.get('students', '')
-            # Преподаватель
-            ws.cell(row=row_idx, column=3).value = activity.get('teacher', '')
-            # Кабинет
-            ws.cell(row=row_idx, column=4).value = activity.get('room', '')
-            # Здание
-            ws.cell(row=row_idx, column=5).value = activity.get('building', '')
-            # День
-            ws.cell(row=row_idx, column=6).value = activity.get('day', '')
-            
-            # Время начала (преобразуем в строку формата HH:MM)
-            start_time = activity.get('start_time', '00:00')
-            try:
-                # Если start_time является словарем
-                if isinstance(start_time, dict):
-                    # Проверяем наличие ключей hour и minute
-                    if 'hour' in start_time and 'minute' in start_time:
-                        hour = int(start_time.get('hour', 0))
-                        minute = int(start_time.get('minute', 0))
-                        formatted_start_time = f"{hour:02d}:{minute:02d}"
-                    else:
-                        # Для других форматов словаря, преобразуем в строку
-                        formatted_start_time = f"{start_time}"
-                # Если start_time уже строка с правильным форматом (HH:MM)
-                elif isinstance(start_time, str) and ':' in start_time:
-                    # Оставляем как есть, это уже правильный формат
-                    formatted_start_time = start_time
-                # Преобразуем time object в строку
-                elif hasattr(start_time, 'hour') and hasattr(start_time, 'minute'):
-                    formatted_start_time = f"{start_time.hour:02d}:{start_time.minute:02d}"
-                # Для всех других случаев, преобразуем в строку
-                else:
-                    formatted_start_time = str(start_time)
-                
-                # Записываем отформатированное время в ячейку
-                ws.cell(row=row_idx, column=7).value = formatted_start_time
-            except Exception as e:
-                logger.warning(f"Ошибка при обработке времени начала: {e}, строка {row_idx}")
-                ws.cell(row=row_idx, column=7).value = str(start_time)
-            
-            # Время окончания (преобразуем в строку формата HH:MM)
-            end_time = activity.get('end_time', '00:00')
-            try:
-                # Если end_time является словарем
-                if isinstance(end_time, dict):
-                    # Проверяем наличие ключей hour и minute
-                    if 'hour' in end_time and 'minute' in end_time:
-                        hour = int(end_time.get('hour', 0))
-                        minute = int(end_time.get('minute', 0))
-                        formatted_end_time = f"{hour:02d}:{minute:02d}"
-                    else:
-                        # Для других форматов словаря, преобразуем в строку
-                        formatted_end_time = f"{end_time}"
-                # Если end_time уже строка с правильным форматом (HH:MM)
-                elif isinstance(end_time, str) and ':' in end_time:
-                    # Оставляем как есть, это уже правильный формат
-                    formatted_end_time = end_time
-                # Преобразуем time object в строку
-                elif hasattr(end_time, 'hour') and hasattr(end_time, 'minute'):
-                    formatted_end_time = f"{end_time.hour:02d}:{end_time.minute:02d}"
-                # Для всех других случаев, преобразуем в строку
-                else:
-                    formatted_end_time = str(end_time)
-                
-                # Записываем отформатированное время в ячейку
-                ws.cell(row=row_idx, column=8).value = formatted_end_time
-            except Exception as e:
-                logger.warning(f"Ошибка при обработке времени окончания: {e}, строка {row_idx}")
-                ws.cell(row=row_idx, column=8).value = str(end_time)
-            
-            # Продолжительность в минутах
-            ws.cell(row=row_idx, column=9).value = activity.get('duration', 0)
-
-            lesson_type = str(activity.get('lesson_type') or 'group').strip() or 'group'
-            trial_dates_json = activity.get('trial_dates_json', '')
-            if lesson_type != 'trial':
-                trial_dates_json = ''
-            elif isinstance(trial_dates_json, list):
-                trial_dates_json = json.dumps(trial_dates_json, ensure_ascii=False)
-            elif trial_dates_json is None:
-                trial_dates_json = ''
-            else:
-                trial_dates_json = str(trial_dates_json)
-
-            ws.cell(row=row_idx, column=10).value = lesson_type
-            ws.cell(row=row_idx, column=11).value = trial_dates_json
-            
-            # Применяем стили к ячейкам
-            for col_idx in range(1, len(headers) + 1):
-                cell = ws.cell(row=row_idx, column=col_idx)
-                cell.alignment = Alignment(horizontal='center', vertical='center')
-                cell.border = Border(
-                    left=Side(style='thin'),
-                    right=Side(style='thin'),
-                    top=Side(style='thin'),
-                    bottom=Side(style='thin')
-                )
-        
-        # Авто-ширина для столбцов
-        for col in ws.columns:
-            max_length = 0
-            column = col[0].column_letter
-            for cell in col:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = (max_length + 2)
-            ws.column_dimensions[column].width = adjusted_width
-        
-        # Сохраняем файл
-        wb.save(output_file)
+        write_schedule_workbook(schedule_data, output_file)
         logger.info(f"Excel-файл успешно создан: {output_file}")
-        
         return output_file
     
     except Exception as e:
@@ -271,6 +265,238 @@ def create_excel_from_html_data(schedule_data, output_file=None):
         traceback.print_exc()
         return None
 
+
+def create_excel_bytes(schedule_data):
+    """
+    Строит XLSX в памяти (без промежуточного файла на диске).
+
+    Returns:
+        bytes: Содержимое XLSX
+    """
+    schedule_data = _prepare_export_rows(schedule_data)
+    logger.info(f"Количество записей для экспорта: {len(schedule_data)}")
+    buffer = io.BytesIO()
+    write_schedule_workbook(schedule_data, buffer)
+    return buffer.getvalue()
+
+
+def clear_export_cache():
+    with _export_cache_lock:
+        _export_cache.clear()
+
+
+def export_schedule_bytes(request_data):
+    """
+    Экспорт для /export_to_excel: JSON-строка расписания -> содержимое XLSX.
+
+    Результат кэшируется по SHA-256 исходной строки, поэтому повторный
+    экспорт того же расписания не разбирает JSON и не строит книгу заново.
+
+    Returns:
+        bytes | None: Содержимое XLSX или None, если данные не удалось разобрать
+    """
+    raw = request_data if isinstance(request_data, (str, bytes)) else json.dumps(
+        request_data, ensure_ascii=False, sort_keys=True
+    )
+    digest = hashlib.sha256(raw.encode("utf-8") if isinstance(raw, str) else raw).hexdigest()
+    with _export_cache_lock:
+        cached = _export_cache.get(digest)
+        if cached is not None:
+            _export_cache.move_to_end(digest)
+            logger.info("Excel-экспорт взят из кэша (%s)", digest[:12])
+            return cached
+
+    schedule_data = _parse_export_request(request_data)
+    if schedule_data is None:
+        return None
+    data = create_excel_bytes(schedule_data)
+    with _export_cache_lock:
+        _export_cache[digest] = data
+        while len(_export_cache) > EXPORT_CACHE_SIZE:
+            _export_cache.popitem(last=False)
+    return data
+
+
+def save_export_bytes(data, output_dir):
+    """
+    Сохраняет книгу /export_to_excel в output_dir под именем schedule_export_<время>.xlsx.
+
+    GUI (newpref/xlsm) берёт самый свежий XLSX из excel_exports, поэтому
+    экспорт из браузера по-прежнему попадает туда, даже если книга взята из кэша.
+
+    Returns:
+        str: Путь к сохранённому файлу
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    current_date = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    output_file = os.path.join(output_dir, f"schedule_export_{current_date}.xlsx")
+    fd, tmp_path = tempfile.mkstemp(prefix=".schedule_export_", suffix=".xlsx.tmp", dir=output_dir)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_path, output_file)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+    return output_file
+
+
+def _state_block_to_export_row(block):
+    """Блок серверного состояния -> строка экспорта (как collectScheduleData в браузере)."""
+    start_time = str(block.get('start_time') or '').strip()
+    end_time = str(block.get('end_time') or '').strip()
+    duration = block.get('duration')
+    if not isinstance(duration, (int, float)) or duration <= 0:
+        duration = max(0, time_to_minutes(end_time) - time_to_minutes(start_time))
+
+    trial_dates_json = block.get('trial_dates_json') or ''
+    if isinstance(block.get('trial_dates'), list):
+        trial_dates_json = json.dumps(block['trial_dates'], ensure_ascii=False)
+
+    room = block.get('room', '')
+    return {
+        'subject': block.get('subject', ''),
+        'students': block.get('students', ''),
+        'teacher': block.get('teacher', ''),
+        'room': room,
+        'room_display': block.get('room_display') or room,
+        'building': block.get('building', ''),
+        'day': block.get('day', ''),
+        'start_time': start_time,
+        'end_time': end_time,
+        'duration': duration,
+        'lesson_type': str(block.get('lesson_type') or 'group').strip() or 'group',
+        'trial_dates_json': trial_dates_json,
+    }
+
+
+def schedule_rows_from_state(base_blocks, individual_blocks):
+    """
+    Строит строки экспорта из опубликованной базы и индивидуальных занятий.
+
+    Строки упорядочены по зданию, дню, кабинету и времени начала, поэтому
+    для одной и той же пары ревизий файл получается одинаковым.
+    """
+    day_order = {day: index for index, day in enumerate(WEB_EDITOR_DAYS)}
+    rows = [
+        _state_block_to_export_row(block)
+        for block in list(base_blocks or []) + list(individual_blocks or [])
+        if isinstance(block, dict)
+    ]
+    rows.sort(
+        key=lambda row: (
+            str(row['building']),
+            day_order.get(row['day'], len(day_order)),
+            str(row['room']),
+            time_to_minutes(row['start_time']),
+            str(row['subject']),
+        )
+    )
+    return rows
+
+
+def state_export_revision(base_revision, individual_revision):
+    return f"{base_revision or ''}|{individual_revision or ''}"
+
+
+def export_state_workbook(base_state, individual_state, output_dir):
+    """
+    XLSX из серверного состояния с файловым кэшем на пару ревизий.
+
+    Args:
+        base_state (dict): Опубликованная база (published_at, blocks)
+        individual_state (dict): Индивидуальные занятия (last_modified, blocks)
+        output_dir (str): Каталог кэша (excel_exports)
+
+    Returns:
+        tuple[str, str]: Путь к файлу и строка ревизии
+    """
+    revision = state_export_revision(base_state.get('published_at'), individual_state.get('last_modified'))
+    digest = hashlib.sha256(revision.encode('utf-8')).hexdigest()[:16]
+    output_file = os.path.join(output_dir, f"{STATE_EXPORT_PREFIX}{digest}.xlsx")
+    if os.path.exists(output_file):
+        logger.info("Excel-экспорт ревизии %s взят из кэша", revision)
+        return output_file, revision
+
+    rows = _prepare_export_rows(
+        schedule_rows_from_state(base_state.get('blocks'), individual_state.get('blocks'))
+    )
+    os.makedirs(output_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".state_export_", suffix=".xlsx.tmp", dir=output_dir)
+    os.close(fd)
+    try:
+        write_schedule_workbook(rows, tmp_path)
+        os.replace(tmp_path, output_file)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+    _prune_state_exports(output_dir, keep=output_file)
+    logger.info("Excel-экспорт ревизии %s создан: %s", revision, output_file)
+    return output_file, revision
+
+
+def _prune_state_exports(output_dir, keep):
+    cached = [
+        os.path.join(output_dir, name)
+        for name in os.listdir(output_dir)
+        if name.startswith(STATE_EXPORT_PREFIX) and name.endswith(".xlsx")
+    ]
+    cached.sort(key=os.path.getmtime, reverse=True)
+    for path in cached[STATE_EXPORT_KEEP:]:
+        if path == keep:
+            continue
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def _parse_export_request(request_data):
+    """
+    Разбирает и проверяет данные запроса на экспорт.
+
+    Returns:
+        list | None: Строки для экспорта или None, если данные непригодны
+    """
+    # Преобразуем JSON-строку в Python-объект
+    if isinstance(request_data, (str, bytes)):
+        try:
+            schedule_data = json.loads(request_data)
+            logger.info(f"JSON успешно распарсен, получен объект типа: {type(schedule_data)}")
+        except json.JSONDecodeError as json_err:
+            logger.error(f"Ошибка декодирования JSON: {json_err}")
+            logger.debug(f"Полученные данные: {request_data[:100]}...")
+            return None
+    else:
+        schedule_data = request_data
+        logger.info(f"Получены данные в формате {type(schedule_data)}")
+
+    schedule_data = filter_exportable_schedule_data(schedule_data)
+
+    # Проверяем валидность данных
+    validate_schedule_data_for_export(schedule_data)
+
+    if not schedule_data:
+        logger.error("Список занятий пуст")
+        raise ExcelExportValidationError(
+            "No exportable schedule rows",
+            code="NO_EXPORTABLE_ROWS",
+        )
+
+    # Проверяем наличие необходимых полей в первой записи
+    required_fields = ['subject', 'day', 'start_time', 'end_time']
+    first_record = schedule_data[0]
+
+    missing_fields = [field for field in required_fields if field not in first_record]
+
+    if missing_fields:
+        logger.error(f"В данных отсутствуют обязательные поля: {', '.join(missing_fields)}")
+        return None
+
+    logger.info(f"Валидация данных успешно пройдена. Получено {len(schedule_data)} записей")
+    return schedule_data
+
+
 def process_schedule_export_request(request_data, output_dir="excel_exports"):
     """
     Обрабатывает запрос на экспорт расписания в Excel.
@@ -287,53 +513,10 @@ def process_schedule_export_request(request_data, output_dir="excel_exports"):
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
         
-        # Преобразуем JSON-строку в Python-объект
-        if isinstance(request_data, str):
-            try:
-                schedule_data = json.loads(request_data)
-                logger.info(f"JSON успешно распарсен, получен объект типа: {type(schedule_data)}")
-            except json.JSONDecodeError as json_err:
-                logger.error(f"Ошибка декодирования JSON: {json_err}")
-                logger.debug(f"Полученные данные: {request_data[:100]}...")
-                return None
-        else:
-            schedule_data = request_data
-            logger.info(f"Получены данные в формате {type(schedule_data)}")
-        
-        schedule_data = filter_exportable_schedule_data(schedule_data)
-
-        # Проверяем валидность данных
-        validate_schedule_data_for_export(schedule_data)
-        
-        if not schedule_data:
-            logger.error("Список занятий пуст")
-            raise ExcelExportValidationError(
-                "No exportable schedule rows",
-                code="NO_EXPORTABLE_ROWS",
-            )
-        
-        # Проверяем наличие необходимых полей в первой записи
-        required_fields = ['subject', 'day', 'start_time', 'end_time']
-        first_record = schedule_data[0]
-        
-        # Выводим информацию о первой записи для отладки
-        logger.info(f"Первая запись: {first_record}")
-        
-        missing_fields = [field for field in required_fields if field not in first_record]
-        
-        if missing_fields:
-            logger.error(f"В данных отсутствуют обязательные поля: {', '.join(missing_fields)}")
+        schedule_data = _parse_export_request(request_data)
+        if schedule_data is None:
             return None
         
-        # Проверяем форматы полей времени в первой записи
-        start_time = first_record.get('start_time')
-        end_time = first_record.get('end_time')
-        
-        logger.info(f"Тип start_time: {type(start_time)}, значение: {start_time}")
-        logger.info(f"Тип end_time: {type(end_time)}, значение: {end_time}")
-        
-        logger.info(f"Валидация данных успешно пройдена. Получено {len(schedule_data)} записей")
-        
         # Формируем имя выходного файла
         current_date = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         output_file = os.path.join(output_dir, f"schedule_export_{current_date}.xlsx")
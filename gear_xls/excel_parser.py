@@ -7,11 +7,20 @@
 
 import json
 import logging
+import os
+import sys
 import pandas as pd
 import openpyxl
 from datetime import datetime
 from typing import Dict, Any
 
+THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(THIS_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from schedule_sidecar import open_sidecar
+
 # Настройка логирования
 logging.basicConfig(
     level=logging.INFO,
@@ -20,10 +29,36 @@ logging.basicConfig(
 logger = logging.getLogger('excel_parser')
 
 
-def _build_header_lookup(sheet):
+def _load_schedule_rows(excel_file):
+    """
+    Строки листа Schedule как кортежи значений (первая строка - заголовки).
+
+    Если рядом с книгой есть актуальная колоночная копия (schedule_sidecar),
+    строки берутся из неё без разбора XLSX.
+    """
+    sidecar = open_sidecar(excel_file)
+    if sidecar is not None:
+        with sidecar:
+            df = sidecar.parse('Schedule')
+        logger.info("Данные взяты из колоночной копии книги")
+        values = df.astype(object).where(df.notna(), None)
+        return [tuple(df.columns)] + list(values.itertuples(index=False, name=None))
+
+    # Загружаем Excel-файл с помощью openpyxl (для корректной работы с датами и временем)
+    workbook = openpyxl.load_workbook(excel_file, data_only=True)
+    return list(workbook['Schedule'].iter_rows(values_only=True))
+
+
+def _cell_value(row, col_idx):
+    """Значение столбца col_idx (нумерация с 1) строки; None вне строки."""
+    if col_idx is None or col_idx > len(row):
+        return None
+    return row[col_idx - 1]
+
+
+def _build_header_lookup(header_row):
     lookup = {}
-    for col_idx in range(1, sheet.max_column + 1):
-        value = sheet.cell(row=1, column=col_idx).value
+    for col_idx, value in enumerate(header_row, start=1):
         if value is None:
             continue
         lookup[str(value).strip().lower()] = col_idx
@@ -62,11 +97,11 @@ def parse_schedule(excel_file):
     activities = {}
     
     try:
-        # Загружаем Excel-файл с помощью openpyxl (для корректной работы с датами и временем)
-        workbook = openpyxl.load_workbook(excel_file, data_only=True)
-        sheet = workbook['Schedule']
-        
-        header_lookup = _build_header_lookup(sheet)
+        rows = _load_schedule_rows(excel_file)
+        header_row = rows[0] if rows else ()
+        column_count = len(header_row)
+
+        header_lookup = _build_header_lookup(header_row)
         subject_col = _resolve_column_index(header_lookup, 1, "subject")
         group_col = _resolve_column_index(header_lookup, 2, "group")
         teacher_col = _resolve_column_index(header_lookup, 3, "teacher")
@@ -78,12 +113,12 @@ def parse_schedule(excel_file):
         duration_col = _resolve_column_index(header_lookup, 9, "duration")
         lesson_type_col = _resolve_column_index(
             header_lookup,
-            10 if sheet.max_column >= 10 else None,
+            10 if column_count >= 10 else None,
             "lesson_type", "тип занятия",
         )
         trial_dates_col = _resolve_column_index(
             header_lookup,
-            11 if sheet.max_column >= 11 else None,
+            11 if column_count >= 11 else None,
             "trial_dates_json", "даты (json)",
         )
 
@@ -91,32 +126,31 @@ def parse_schedule(excel_file):
         row_idx = 2
         act_id = 1
         
-        while sheet.cell(row=row_idx, column=subject_col).value is not None:
-            subject = sheet.cell(row=row_idx, column=subject_col).value
-            group = sheet.cell(row=row_idx, column=group_col).value
-            teacher = sheet.cell(row=row_idx, column=teacher_col).value
-            room = sheet.cell(row=row_idx, column=room_col).value
-            building = sheet.cell(row=row_idx, column=building_col).value
-            day = sheet.cell(row=row_idx, column=day_col).value
+        while row_idx <= len(rows) and _cell_value(rows[row_idx - 1], subject_col) is not None:
+            row = rows[row_idx - 1]
+            subject = _cell_value(row, subject_col)
+            group = _cell_value(row, group_col)
+            teacher = _cell_value(row, teacher_col)
+            room = _cell_value(row, room_col)
+            building = _cell_value(row, building_col)
+            day = _cell_value(row, day_col)
             
             # Извлекаем время начала и окончания с корректной обработкой
-            start_time_cell = sheet.cell(row=row_idx, column=start_time_col)
-            end_time_cell = sheet.cell(row=row_idx, column=end_time_col)
-            start_time = extract_time_from_cell(start_time_cell)
-            end_time = extract_time_from_cell(end_time_cell)
+            start_time = extract_time_from_value(_cell_value(row, start_time_col))
+            end_time = extract_time_from_value(_cell_value(row, end_time_col))
             
             # Извлекаем продолжительность
-            duration = sheet.cell(row=row_idx, column=duration_col).value
+            duration = _cell_value(row, duration_col)
             lesson_type = None
             trial_dates = []
 
             if lesson_type_col is not None:
-                lesson_type_value = sheet.cell(row=row_idx, column=lesson_type_col).value
+                lesson_type_value = _cell_value(row, lesson_type_col)
                 if lesson_type_value is not None:
                     lesson_type = str(lesson_type_value).strip().lower() or None
 
             if lesson_type == "trial" and trial_dates_col is not None:
-                raw_trial_dates = sheet.cell(row=row_idx, column=trial_dates_col).value
+                raw_trial_dates = _cell_value(row, trial_dates_col)
                 if raw_trial_dates not in (None, ""):
                     try:
                         parsed_trial_dates = json.loads(raw_trial_dates)
@@ -178,7 +212,19 @@ def extract_time_from_cell(cell):
     Returns:
         str: Время в формате 'HH:MM'
     """
-    cell_value = cell.value
+    return extract_time_from_value(cell.value)
+
+
+def extract_time_from_value(cell_value):
+    """
+    Извлекает время из значения ячейки Excel в формате 'HH:MM'.
+    
+    Args:
+        cell_value: Значение ячейки (time, datetime, доля суток или строка)
+        
+    Returns:
+        str: Время в формате 'HH:MM'
+    """
     
     # Если это datetime.time объект
     if hasattr(cell_value, 'hour') and hasattr(cell_value, 'minute'):
@@ -7,6 +7,7 @@
 - html_structure_generator - генерация HTML структуры документа
 - html_table_generator - генерация таблиц расписания
 - html_block_generator - генерация блоков активностей
+- html_compact_grid_generator - компактная CSS-сетка без ячеек (режим просмотра)
 - html_coordinator - координация всех генераторов
 """
 
@@ -19,12 +20,14 @@ try:
     from .html_structure_generator import HTMLStructureGenerator as _HTMLStructureGenerator
     from .html_table_generator import HTMLTableGenerator as _HTMLTableGenerator
     from .html_block_generator import HTMLBlockGenerator as _HTMLBlockGenerator
+    from .html_compact_grid_generator import HTMLCompactGridGenerator as _HTMLCompactGridGenerator
     
     # Если прямые импорты работают, используем их
     HTMLCoordinator = _HTMLCoordinator
     HTMLStructureGenerator = _HTMLStructureGenerator
     HTMLTableGenerator = _HTMLTableGenerator
     HTMLBlockGenerator = _HTMLBlockGenerator
+    HTMLCompactGridGenerator = _HTMLCompactGridGenerator
     
     def get_html_coordinator():
         """Возвращает класс HTMLCoordinator."""
@@ -41,6 +44,10 @@ try:
     def get_block_generator():
         """Возвращает класс HTMLBlockGenerator."""
         return _HTMLBlockGenerator
+    
+    def get_compact_grid_generator():
+        """Возвращает класс HTMLCompactGridGenerator."""
+        return _HTMLCompactGridGenerator
 
 except ImportError:
     # Если прямые импорты не работают (циклические зависимости),
@@ -66,6 +73,11 @@ except ImportError:
         from .html_block_generator import HTMLBlockGenerator
         return HTMLBlockGenerator
     
+    def get_compact_grid_generator():
+        """Возвращает класс HTMLCompactGridGenerator."""
+        from .html_compact_grid_generator import HTMLCompactGridGenerator
+        return HTMLCompactGridGenerator
+    
     # Создаем wrapper классы/функции для обратной совместимости
     def HTMLCoordinator(*args, **kwargs):
         """Создает экземпляр HTMLCoordinator."""
@@ -86,6 +98,11 @@ except ImportError:
         """Создает экземпляр HTMLBlockGenerator."""
         GeneratorClass = get_block_generator()
         return GeneratorClass(*args, **kwargs)
+    
+    def HTMLCompactGridGenerator(*args, **kwargs):
+        """Создает экземпляр HTMLCompactGridGenerator."""
+        GeneratorClass = get_compact_grid_generator()
+        return GeneratorClass(*args, **kwargs)
 
 # Основная функция для обратной совместимости
 def generate_html_schedule(buildings, output_html="schedule.html", output_css="schedule.css", 
@@ -112,9 +129,11 @@ __all__ = [
     'HTMLStructureGenerator', 
     'HTMLTableGenerator',
     'HTMLBlockGenerator',
+    'HTMLCompactGridGenerator',
     'get_html_coordinator',
     'get_structure_generator', 
     'get_table_generator',
     'get_block_generator',
+    'get_compact_grid_generator',
     'generate_html_schedule'
 ]
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Компактный генератор сетки расписания на CSS.
+
+Вместо таблицы с ячейкой на каждые time_interval минут и каждую колонку
+кабинета фон сетки рисуется повторяющимися CSS-градиентами, а в разметке
+остаются только заголовки колонок, метки времени (раз в 15 минут) и по одному
+элементу на день. Блоки занятий позиционируются абсолютно теми же координатами,
+что и в табличном режиме (HTMLBlockGenerator), поэтому шаг строки сетки равен
+cell_height + border_width.
+
+Режим предназначен для просмотра: JS редактора (drag&drop, ресайз, быстрое
+добавление) опирается на ячейки td[data-row] табличной сетки.
+"""
+
+import logging
+from html import escape as html_escape
+
+try:
+    from ..utils import minutes_to_time
+except ImportError:
+    from utils import minutes_to_time
+
+# Настройка логирования
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('html_compact_grid_generator')
+
+GRID_LINE_COLOR = "#ddd"
+QUARTER_LINE_COLOR = "#c8c8c8"
+DAY_LINE_COLOR = "#999"
+
+
+class HTMLCompactGridGenerator:
+    """
+    Генератор компактной CSS-сетки расписания.
+
+    Отвечает за:
+    - Заголовки дней и кабинетов (CSS grid)
+    - Фон сетки с линиями строк и колонок (repeating-linear-gradient)
+    - Метки времени каждые 15 минут
+    """
+
+    def __init__(self, time_interval=5, cell_height=15, day_cell_width=100,
+                 time_col_width=80, header_height=45, border_width=0.5):
+        """
+        Инициализация компактного генератора.
+
+        Args:
+            time_interval (int): Интервал времени в минутах
+            cell_height (int): Высота строки сетки в пикселях
+            day_cell_width (int): Ширина колонки кабинета в пикселях
+            time_col_width (int): Ширина колонки времени в пикселях
+            header_height (int): Высота заголовка в пикселях
+            border_width (float): Толщина линий сетки в пикселях
+        """
+        self.time_interval = time_interval
+        self.cell_height = cell_height
+        self.day_cell_width = day_cell_width
+        self.time_col_width = time_col_width
+        self.header_height = header_height
+        self.border_width = border_width
+        logger.debug(f"Инициализирован HTMLCompactGridGenerator: interval={time_interval}")
+
+    @property
+    def row_pitch(self):
+        """Шаг строки сетки — совпадает с расчётом top в HTMLBlockGenerator."""
+        return self.cell_height + self.border_width
+
+    def generate_schedule_grid(self, building_data, days_order, grid_start, grid_end):
+        """
+        Генерирует компактную сетку расписания для здания.
+
+        Args:
+            building_data (dict): Данные расписания для конкретного здания
+            days_order (list): Порядок дней недели
+            grid_start (int): Начальное время сетки в минутах
+            grid_end (int): Конечное время сетки в минутах
+
+        Returns:
+            str: HTML-код сетки
+        """
+        num_rows = ((grid_end - grid_start) // self.time_interval) + 1
+        max_cols = building_data.get('_max_cols', {})
+        total_cols = sum(max_cols.get(day, 1) for day in days_order)
+        width = self.time_col_width + total_cols * self.day_cell_width
+        body_height = num_rows * self.row_pitch
+
+        grid_parts = [
+            f'<div class="compact-grid" data-grid-mode="compact" '
+            f'style="width:{width}px; height:{self.header_height + body_height:g}px;">',
+            self._generate_header(building_data, days_order, total_cols),
+            f'<div class="compact-body" style="top:{self.header_height}px; height:{body_height:g}px;">',
+        ]
+        grid_parts.extend(self._generate_day_columns(max_cols, days_order))
+        grid_parts.extend(self._generate_time_labels(grid_start, num_rows))
+        grid_parts.extend(['</div>', '</div>'])
+
+        logger.debug(f"Сгенерирована компактная сетка: {num_rows} строк, {total_cols} колонок")
+        return "\n".join(grid_parts)
+
+    def _generate_header(self, building_data, days_order, total_cols):
+        """Заголовок сетки: колонка времени и по ячейке на кабинет каждого дня."""
+        header_parts = [
+            f'<div class="compact-header" style="height:{self.header_height}px; '
+            f'grid-template-columns:{self.time_col_width}px repeat({total_cols}, {self.day_cell_width}px);">',
+            '<div class="compact-head time-cell">Время</div>',
+        ]
+        for day in days_order:
+            for col in range(building_data.get('_max_cols', {}).get(day, 1)):
+                cabinet = self._get_room_name(building_data, day, col)
+                header_parts.append(
+                    f'<div class="compact-head day-{day}" '
+                    f'data-day="{html_escape(day, quote=True)}" '
+                    f'data-col="{col}" '
+                    f'data-room="{html_escape(cabinet, quote=True)}">'
+                    f'{html_escape(day)}<br>{html_escape(cabinet)}'
+                    '</div>'
+                )
+        header_parts.append('</div>')
+        return "\n".join(header_parts)
+
+    def _generate_day_columns(self, max_cols, days_order):
+        """По одному элементу на день: линии колонок кабинетов рисует фон."""
+        columns = []
+        left = self.time_col_width
+        for day in days_order:
+            day_width = max_cols.get(day, 1) * self.day_cell_width
+            columns.append(
+                f'<div class="compact-day day-{day}" data-day="{html_escape(day, quote=True)}" '
+                f'style="left:{left}px; width:{day_width}px;"></div>'
+            )
+            left += day_width
+        return columns
+
+    def _generate_time_labels(self, grid_start, num_rows):
+        """Метки времени каждые 15 минут, как в табличном режиме."""
+        time_step = max(1, 15 // self.time_interval)
+        return [
+            f'<div class="compact-time" style="top:{row * self.row_pitch:g}px;">'
+            f'{minutes_to_time(grid_start + row * self.time_interval)}</div>'
+            for row in range(0, num_rows, time_step)
+        ]
+
+    def _get_room_name(self, building_data, day, col):
+        rooms = building_data.get('_rooms', {}).get(day, [])
+        if col < len(rooms):
+            return rooms[col]
+        return building_data.get('_default_room', "")
+
+    def get_css(self):
+        """
+        Возвращает стили компактной сетки (дополняют html_styles).
+
+        Returns:
+            str: HTML-тег <style>
+        """
+        pitch = self.row_pitch
+        bw = self.border_width
+        quarter = pitch * max(1, 15 // self.time_interval)
+        return f"""
+    <style>
+      .compact-grid {{
+         position: relative;
+         min-width: max-content;
+      }}
+      .compact-header {{
+         position: sticky;
+         top: 0;
+         z-index: 4;
+         display: grid;
+         background: #e9ecef;
+      }}
+      .compact-head {{
+         border: {bw}px solid {GRID_LINE_COLOR};
+         font-size: 14px;
+         text-align: center;
+         overflow: hidden;
+      }}
+      .compact-body {{
+         position: absolute;
+         left: 0;
+         right: 0;
+         background-image:
+           repeating-linear-gradient(to bottom, transparent 0, transparent {quarter - bw:g}px,
+             {QUARTER_LINE_COLOR} {quarter - bw:g}px, {QUARTER_LINE_COLOR} {quarter:g}px),
+           repeating-linear-gradient(to bottom, transparent 0, transparent {self.cell_height}px,
+             {GRID_LINE_COLOR} {self.cell_height}px, {GRID_LINE_COLOR} {pitch:g}px);
+      }}
+      .compact-day {{
+         position: absolute;
+         top: 0;
+         bottom: 0;
+         border-left: 1px solid {DAY_LINE_COLOR};
+         background-image: repeating-linear-gradient(to right, transparent 0,
+           transparent {self.day_cell_width - bw:g}px, {GRID_LINE_COLOR} {self.day_cell_width - bw:g}px,
+           {GRID_LINE_COLOR} {self.day_cell_width}px);
+      }}
+      .compact-time {{
+         position: absolute;
+         left: 0;
+         width: {self.time_col_width}px;
+         font-size: 11px;
+         line-height: {self.cell_height}px;
+         text-align: center;
+         color: #555;
+      }}
+      body.compact-schedule .activity-block {{
+         cursor: default;
+      }}
+    </style>"""
+
+    def calculate_element_count(self, building_data, days_order, grid_start, grid_end):
+        """
+        Считает элементы разметки сетки (без блоков) — для сравнения с таблицей.
+
+        Returns:
+            int: Количество HTML-элементов сетки
+        """
+        num_rows = ((grid_end - grid_start) // self.time_interval) + 1
+        total_cols = sum(building_data.get('_max_cols', {}).get(day, 1) for day in days_order)
+        time_labels = len(range(0, num_rows, max(1, 15 // self.time_interval)))
+        return 4 + total_cols + len(days_order) + time_labels
+
+    def get_generator_info(self):
+        """
+        Возвращает информацию о компактном генераторе.
+
+        Returns:
+            dict: Словарь с метаинформацией
+        """
+        return {
+            'generator': 'HTMLCompactGridGenerator',
+            'version': '1.0.0',
+            'time_interval': self.time_interval,
+            'row_pitch': self.row_pitch,
+            'features': [
+                'css_gradient_grid',
+                'time_labels',
+                'room_headers',
+                'absolute_blocks'
+            ]
+        }
@@ -11,6 +11,8 @@ import logging
 from .html_structure_generator import HTMLStructureGenerator
 from .html_table_generator import HTMLTableGenerator
 from .html_block_generator import HTMLBlockGenerator
+from .html_compact_grid_generator import HTMLCompactGridGenerator
+from html_bundle import BUNDLE_DIRNAME
 from gear_xls.day_constants import WEB_EDITOR_DAYS
 
 # Настройка логирования
@@ -20,6 +22,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger('html_coordinator')
 
+# Режимы отрисовки сетки: таблица для редактора, CSS-сетка для просмотра
+GRID_MODE_TABLE = "table"
+GRID_MODE_COMPACT = "compact"
+GRID_MODES = (GRID_MODE_TABLE, GRID_MODE_COMPACT)
+
 
 class HTMLCoordinator:
     """
@@ -29,14 +36,19 @@ class HTMLCoordinator:
     координируя работу всех специализированных генераторов.
     """
     
-    def __init__(self, time_interval=5, border_width=0.5):
+    def __init__(self, time_interval=5, border_width=0.5, grid_mode=GRID_MODE_TABLE):
         """
         Инициализация координатора с настройками.
         
         Args:
             time_interval (int): Интервал времени в минутах
             border_width (float): Толщина границ в пикселях
+            grid_mode (str): "table" — интерактивный редактор с ячейками сетки,
+                "compact" — CSS-сетка без ячеек, страница только для просмотра
         """
+        if grid_mode not in GRID_MODES:
+            raise ValueError(f"Неизвестный режим сетки: {grid_mode}")
+        self.grid_mode = grid_mode
         self.time_interval = time_interval
         self.border_width = border_width
         
@@ -44,15 +56,20 @@ class HTMLCoordinator:
         self.structure_generator = HTMLStructureGenerator(time_interval, border_width)
         self.table_generator = HTMLTableGenerator(time_interval)
         self.block_generator = HTMLBlockGenerator(time_interval=time_interval, border_width=border_width)
+        self.compact_generator = HTMLCompactGridGenerator(time_interval=time_interval, border_width=border_width)
         
         # Константы для расчетов
         self.days_order = list(WEB_EDITOR_DAYS)
         self.day_cell_width = 100
         self.time_col_width = 80
         
-        logger.info(f"Инициализирован HTMLCoordinator: interval={time_interval}, border={border_width}")
+        self.fragment_cache = None
+        
+        logger.info(f"Инициализирован HTMLCoordinator: interval={time_interval}, border={border_width}, "
+                    f"grid={grid_mode}")
     
-    def generate_complete_schedule(self, buildings, output_html="schedule.html", output_css="schedule.css", spiski_data=None):
+    def generate_complete_schedule(self, buildings, output_html="schedule.html", output_css="schedule.css",
+                                   spiski_data=None, fragment_cache=None, bundle_dir=None):
         """
         Генерирует полный HTML документ расписания.
         
@@ -60,11 +77,19 @@ class HTMLCoordinator:
             buildings (dict): Структура расписания по зданиям
             output_html (str): Путь для сохранения HTML-файла
             output_css (str): Путь для сохранения CSS-файла
+            fragment_cache (HTMLFragmentCache, optional): Кэш фрагментов;
+                если задан, перерисовываются только изменившиеся таблицы и дни
+            bundle_dir (str, optional): Каталог JS/CSS бандлов; по умолчанию
+                assets рядом с output_html. HTML ссылается на них как на assets/<имя>,
+                поэтому при сборке во временном каталоге сюда передаётся html_output/assets
             
         Returns:
             str: Путь к созданному HTML файлу
         """
         logger.info(f"Начинаем генерацию полного HTML расписания: {output_html}")
+        self.fragment_cache = fragment_cache
+        if fragment_cache is not None:
+            fragment_cache.configure(self.get_render_settings())
         
         # Валидация входных данных
         if not self._validate_buildings_data(buildings):
@@ -76,11 +101,21 @@ class HTMLCoordinator:
         html_parts = []
         
         # 1. Генерация структуры документа
-        html_parts.extend(self.structure_generator.generate_document_head(grid_start, spiski_data=spiski_data))
-        html_parts.append("<body>")
-        
-        # 2. Генерация панели управления
-        html_parts.extend(self.structure_generator.generate_control_panel())
+        # Бандлы кода и стилей кладутся рядом с HTML, в подкаталог assets
+        if bundle_dir is None:
+            bundle_dir = os.path.join(os.path.dirname(os.path.abspath(output_html)), BUNDLE_DIRNAME)
+        compact = self.grid_mode == GRID_MODE_COMPACT
+        head_parts = self.structure_generator.generate_document_head(
+            grid_start, spiski_data=spiski_data, bundle_dir=bundle_dir, include_editor=not compact)
+        if compact:
+            # Стили CSS-сетки добавляются перед закрывающим </head>
+            head_parts.insert(len(head_parts) - 1, self.compact_generator.get_css())
+        html_parts.extend(head_parts)
+        html_parts.append('<body class="compact-schedule">' if compact else "<body>")
+        
+        # 2. Генерация панели управления (кнопки работают только с JS редактора)
+        if not compact:
+            html_parts.extend(self.structure_generator.generate_control_panel())
         
         # 3. Генерация заголовка страницы
         html_parts.extend(self.structure_generator.generate_page_header())
@@ -99,6 +134,8 @@ class HTMLCoordinator:
         
         # Сохранение файла
         self._save_html_file(html_parts, output_html)
+        if fragment_cache is not None:
+            fragment_cache.save()
         
         logger.info(f"HTML расписание создано: {output_html} ({buildings_count} зданий)")
         return output_html
@@ -132,16 +169,10 @@ class HTMLCoordinator:
         )
         
         # Генерация таблицы-сетки
-        table_html = self.table_generator.generate_schedule_table(
-            building_data, self.days_order, grid_start, grid_end
-        )
-        section_parts.append(table_html)
+        section_parts.append(self._render_table(building_name, building_data, grid_start, grid_end))
         
         # Генерация блоков активностей
-        blocks_html = self.block_generator.generate_activity_blocks(
-            building_data, self.days_order, grid_start
-        )
-        section_parts.append(blocks_html)
+        section_parts.append(self._render_blocks(building_name, building_data, grid_start))
         
         # Закрытие контейнера
         section_parts.append(self.structure_generator.generate_container_end())
@@ -149,6 +180,88 @@ class HTMLCoordinator:
         logger.debug(f"Сгенерирована секция для здания: {building_name}")
         return section_parts
     
+    def get_render_settings(self):
+        """
+        Настройки, общие для всех фрагментов: входят в подпись кэша фрагментов.
+
+        Returns:
+            dict: Интервал, толщина границ, режим сетки и размеры ячеек генераторов
+        """
+        return {
+            'time_interval': self.time_interval,
+            'border_width': self.border_width,
+            'grid_mode': self.grid_mode,
+            'day_cell_width': self.day_cell_width,
+            'time_col_width': self.time_col_width,
+            'table': [self.table_generator.time_interval, self.table_generator.time_col_width],
+            'blocks': [
+                self.block_generator.day_cell_width, self.block_generator.cell_height,
+                self.block_generator.header_height, self.block_generator.time_col_width,
+                self.block_generator.time_interval, self.block_generator.border_width,
+            ],
+            'compact': [
+                self.compact_generator.time_interval, self.compact_generator.cell_height,
+                self.compact_generator.day_cell_width, self.compact_generator.time_col_width,
+                self.compact_generator.header_height, self.compact_generator.border_width,
+            ],
+        }
+
+    def _render_table(self, building_name, building_data, grid_start, grid_end):
+        """Таблица-сетка здания; зависит только от колонок, кабинетов и границ сетки."""
+        if self.grid_mode == GRID_MODE_COMPACT:
+            render_grid = self.compact_generator.generate_schedule_grid
+        else:
+            render_grid = self.table_generator.generate_schedule_table
+
+        def render():
+            return render_grid(building_data, self.days_order, grid_start, grid_end)
+
+        cache = getattr(self, 'fragment_cache', None)
+        if cache is None:
+            return render()
+        payload = {
+            'max_cols': building_data.get('_max_cols', {}),
+            'rooms': building_data.get('_rooms', {}),
+            'default_room': building_data.get('_default_room', ''),
+            'grid': [grid_start, grid_end],
+            'days': self.days_order,
+            'interval': self.time_interval,
+        }
+        return cache.render(f"{self.grid_mode}:{building_name}", payload, render)
+
+    def _render_blocks(self, building_name, building_data, grid_start):
+        """Блоки здания по дням; каждый день — отдельный кэшируемый фрагмент."""
+        cache = getattr(self, 'fragment_cache', None)
+        if cache is None:
+            return self.block_generator.generate_activity_blocks(
+                building_data, self.days_order, grid_start
+            )
+
+        max_cols = building_data.get('_max_cols', {})
+        html_blocks = []
+        for day_index, day in enumerate(self.days_order):
+            payload = {
+                # id не попадает в HTML блока, поэтому не влияет на фрагмент
+                'intervals': [
+                    {key: value for key, value in interval.items() if key != 'id'}
+                    for interval in building_data.get(day, [])
+                ],
+                'prev_cols': [max_cols.get(d, 1) for d in self.days_order[:day_index]],
+                'grid_start': grid_start,
+                'interval': self.time_interval,
+                'border': self.border_width,
+            }
+            day_html = cache.render(
+                f"blocks:{building_name}:{day}",
+                payload,
+                lambda day=day: "\n".join(
+                    self.block_generator._generate_day_blocks(building_data, day, self.days_order, grid_start)
+                ),
+            )
+            if day_html:
+                html_blocks.append(day_html)
+        return "\n".join(html_blocks)
+
     def _validate_buildings_data(self, buildings):
         """
         Проверяет валидность данных зданий.
@@ -261,9 +374,11 @@ class HTMLCoordinator:
             'version': '1.0.0',
             'time_interval': self.time_interval,
             'border_width': self.border_width,
+            'grid_mode': self.grid_mode,
             'generators': {
                 'structure': self.structure_generator.get_generator_info(),
                 'table': self.table_generator.get_generator_info(),
+                'compact_grid': self.compact_generator.get_generator_info(),
                 'blocks': self.block_generator.get_generator_info()
             },
             'constants': {
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Кэш HTML-фрагментов расписания между запусками генерации.
+
+Фрагменты (таблица-сетка здания, блоки одного дня здания) хранятся в JSON-файле
+в html_output вместе с хэшем входных данных. При повторной генерации
+фрагмент перерисовывается только если изменились его данные, параметры
+координатора (интервал, границы, размеры ячеек) или исходный код генераторов
+и вспомогательных модулей.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+# Настройка логирования
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('html_fragment_cache')
+
+FRAGMENT_CACHE_VERSION = 1
+
+_GENERATORS_DIR = os.path.dirname(os.path.abspath(__file__))
+_GEAR_XLS_DIR = os.path.dirname(_GENERATORS_DIR)
+_RENDERER_SOURCES = (
+    os.path.join(_GENERATORS_DIR, "html_coordinator.py"),
+    os.path.join(_GENERATORS_DIR, "html_table_generator.py"),
+    os.path.join(_GENERATORS_DIR, "html_compact_grid_generator.py"),
+    os.path.join(_GENERATORS_DIR, "html_block_generator.py"),
+    os.path.join(_GEAR_XLS_DIR, "services", "color_service.py"),
+    os.path.join(_GEAR_XLS_DIR, "time_utils.py"),
+    os.path.join(_GEAR_XLS_DIR, "room_name_utils.py"),
+    os.path.join(_GEAR_XLS_DIR, "lesson_type_utils.py"),
+)
+
+
+def _renderer_signature(settings=None):
+    """Хэш исходников генераторов и настроек отрисовки: их правка сбрасывает весь кэш."""
+    digest = hashlib.sha256(str(FRAGMENT_CACHE_VERSION).encode("utf-8"))
+    for path in _RENDERER_SOURCES:
+        try:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(path.encode("utf-8"))
+    digest.update(json.dumps(settings, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def fragment_digest(payload):
+    """Хэш входных данных фрагмента (любые JSON-совместимые значения)."""
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class HTMLFragmentCache:
+    """
+    Файловый кэш отрисованных фрагментов.
+
+    Сохраняются только фрагменты, использованные в последней генерации,
+    поэтому файл не растёт при удалении зданий или дней.
+    """
+
+    def __init__(self, path, settings=None):
+        self.path = path
+        self._stored = self._load()
+        self._used = {}
+        self.rendered = 0
+        self.reused = 0
+        self.configure(settings)
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Кэш фрагментов не прочитан ({self.path}): {e}")
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def configure(self, settings):
+        """
+        Задаёт настройки отрисовки, от которых зависят все фрагменты.
+
+        Сохранённые фрагменты используются, только если они отрисованы
+        с теми же настройками и тем же кодом генераторов.
+        """
+        self.signature = _renderer_signature(settings)
+        entries = self._stored.get("fragments") if self._stored.get("signature") == self.signature else None
+        self._entries = entries if isinstance(entries, dict) else {}
+
+    def render(self, key, payload, render_func):
+        """
+        Возвращает HTML фрагмента из кэша или отрисовывает его заново.
+
+        Args:
+            key (str): Идентификатор фрагмента (например, "blocks:Villa:Mo")
+            payload: Данные, от которых зависит фрагмент
+            render_func (callable): Функция без аргументов, возвращающая HTML
+
+        Returns:
+            str: HTML фрагмента
+        """
+        digest = fragment_digest(payload)
+        entry = self._entries.get(key)
+        if isinstance(entry, dict) and entry.get("digest") == digest and isinstance(entry.get("html"), str):
+            html = entry["html"]
+            self.reused += 1
+        else:
+            html = render_func()
+            self.rendered += 1
+        self._used[key] = {"digest": digest, "html": html}
+        return html
+
+    def save(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".fragments_", suffix=".json.tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"signature": self.signature, "fragments": self._used},
+                    f,
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                )
+            os.replace(tmp_path, self.path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+        logger.info(
+            f"Кэш фрагментов сохранён: перерисовано {self.rendered}, из кэша {self.reused}"
+        )
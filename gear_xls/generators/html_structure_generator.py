@@ -10,7 +10,8 @@ import os
 import uuid
 import logging
 from html_styles import get_css_styles
-from html_javascript import get_javascript
+from html_javascript import get_javascript, get_javascript_config
+from html_bundle import build_bundles, bundle_tags
 from gear_xls.day_constants import WEB_EDITOR_DAYS
 
 # Настройка логирования
@@ -32,24 +33,28 @@ class HTMLStructureGenerator:
     - Создание панели управления с кнопками
     """
     
-    def __init__(self, time_interval=5, border_width=0.5):
+    def __init__(self, time_interval=5, border_width=0.5, external_assets=True):
         """
         Инициализация генератора структуры.
         
         Args:
             time_interval (int): Интервал времени в минутах
             border_width (float): Толщина границ в пикселях
+            external_assets (bool): Подключать JS/CSS внешними бандлами вместо встраивания
         """
         self.time_interval = time_interval
         self.border_width = border_width
+        self.external_assets = external_assets
         logger.debug(f"Инициализирован HTMLStructureGenerator: interval={time_interval}, border={border_width}")
     
-    def generate_document_head(self, grid_start=9*60, spiski_data=None):
+    def generate_document_head(self, grid_start=9*60, spiski_data=None, bundle_dir=None, include_editor=True):
         """
         Генерирует head секцию HTML документа.
 
         Args:
             grid_start (int): Начало сетки в минутах (передаётся в JS как глобал gridStart)
+            bundle_dir (str): Каталог для JS/CSS бандлов (по умолчанию html_output/assets)
+            include_editor (bool): Подключать JS редактора (False — страница только для просмотра)
 
         Returns:
             list: Список строк HTML для head секции
@@ -69,13 +74,32 @@ class HTMLStructureGenerator:
             "  <title>Расписание занятий</title>"
         ]
 
-        # Встроенные стили
-        head_parts.append(get_css_styles(cellHeight, dayCellWidth, timeColWidth, self.border_width))
+        bundle_names = None
+        if self.external_assets:
+            try:
+                bundle_names = build_bundles(cellHeight, dayCellWidth, timeColWidth, self.border_width,
+                                             bundle_dir=bundle_dir)
+            except OSError as e:
+                logger.warning(f"Не удалось записать бандлы, код будет встроен в HTML: {e}")
 
-        # Встроенный JavaScript
-        head_parts.append(get_javascript(cellHeight, dayCellWidth, headerHeight, days_order,
-                                       self.time_interval, self.border_width, grid_start,
-                                       spiski_data=spiski_data))
+        if bundle_names:
+            # В HTML остаются только данные; код и стили — во внешних кэшируемых файлах
+            css_tag, js_tag = bundle_tags(bundle_names)
+            head_parts.append(css_tag)
+            if include_editor:
+                head_parts.append(get_javascript_config(cellHeight, dayCellWidth, headerHeight, days_order,
+                                                        self.time_interval, self.border_width, grid_start,
+                                                        spiski_data=spiski_data))
+                head_parts.append(js_tag)
+        else:
+            # Встроенные стили
+            head_parts.append(get_css_styles(cellHeight, dayCellWidth, timeColWidth, self.border_width))
+
+            # Встроенный JavaScript
+            if include_editor:
+                head_parts.append(get_javascript(cellHeight, dayCellWidth, headerHeight, days_order,
+                                               self.time_interval, self.border_width, grid_start,
+                                               spiski_data=spiski_data))
 
         head_parts.append("</head>")
         
@@ -206,7 +230,9 @@ class HTMLStructureGenerator:
                 'document_structure',
                 'control_panel',
                 'responsive_headers',
-                'csrf_protection'
-            ]
+                'csrf_protection',
+                'external_asset_bundles'
+            ],
+            'external_assets': self.external_assets
         }
     
@@ -8,6 +8,7 @@ import tempfile
 from datetime import datetime, timezone
 from typing import Any
 
+from gear_xls import state_storage
 from gear_xls.runtime_paths import get_group_occupancy_snapshot_path
 from gear_xls.room_name_utils import normalize_room_fields
 from gear_xls.schedule_mutation_coordinator import schedule_mutation
@@ -139,6 +140,15 @@ def validate_group_occupancy_snapshot(data: Any) -> dict[str, Any]:
 
 
 def read_group_occupancy_snapshot(*, required: bool = False) -> dict[str, Any] | None:
+    stored = state_storage.store_for_path(GROUP_OCCUPANCY_SNAPSHOT_PATH)
+    if stored is not None:
+        store, document = stored
+        data = store.read_document(document)
+        if data is None:
+            if required:
+                raise OccupancyUnavailable()
+            return None
+        return _validate_snapshot(data)
     if not os.path.exists(GROUP_OCCUPANCY_SNAPSHOT_PATH):
         if required:
             raise OccupancyUnavailable()
@@ -254,6 +264,11 @@ def replace_group_occupancy_snapshot(
     validated = _validate_snapshot(snapshot)
     target_path = path or GROUP_OCCUPANCY_SNAPSHOT_PATH
     with schedule_mutation("occupancy_snapshot_replace"):
+        stored = state_storage.store_for_path(target_path)
+        if stored is not None:
+            store, document = stored
+            store.write_document(document, validated)
+            return validated
         os.makedirs(os.path.dirname(target_path), exist_ok=True)
         tmp_path = None
         try:
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Сборка внешних JS/CSS бандлов для schedule.html.
+
+Код редактора (все js_modules) и стили собираются в файлы с хэшем содержимого
+в имени — bundle.<hash>.js и bundle.<hash>.css — и лежат в html_output/assets.
+Ссылки в HTML относительные (assets/<имя>): страница работает и из файла
+(file://), и с сервера, который отдаёт /assets/<имя> (и /js_modules/<имя> для
+HTML старых версий) с долгоживущими immutable-заголовками кэша. В самом HTML
+остаются только данные страницы и ссылки на бандлы, поэтому браузер скачивает
+код один раз и повторно — лишь после изменения исходников.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import tempfile
+
+from html_javascript import get_javascript_bundle, load_js_modules
+from html_styles import get_css_text
+from gear_xls.runtime_paths import get_asset_bundle_dir
+
+# Настройка логирования
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('html_bundle')
+
+BUNDLE_DIRNAME = "assets"
+BUNDLE_URL_PREFIX = BUNDLE_DIRNAME + "/"
+BUNDLE_HASH_LENGTH = 16
+BUNDLE_FILENAME_RE = re.compile(r"bundle\.([0-9a-f]{%d})\.(js|css)" % BUNDLE_HASH_LENGTH)
+BUNDLE_KEEP = 16
+BUNDLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+
+
+def minify_css(css):
+    """Убирает комментарии, отступы и пустые строки из CSS."""
+    css = _CSS_COMMENT_RE.sub("", css)
+    return "\n".join(line.strip() for line in css.splitlines() if line.strip()) + "\n"
+
+
+def bundle_filename(content, extension):
+    """Имя файла бандла по хэшу его содержимого."""
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:BUNDLE_HASH_LENGTH]
+    return f"bundle.{digest}.{extension}"
+
+
+def is_bundle_filename(filename):
+    return BUNDLE_FILENAME_RE.fullmatch(filename or "") is not None
+
+
+def _write_bundle(bundle_dir, content, extension):
+    filename = bundle_filename(content, extension)
+    path = os.path.join(bundle_dir, filename)
+    if os.path.exists(path):
+        # Обновляем mtime, чтобы используемый бандл не попал под очистку
+        os.utime(path)
+        return filename
+    os.makedirs(bundle_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".bundle_", suffix=".tmp", dir=bundle_dir)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+    logger.info(f"Записан бандл {filename} ({len(content)} символов)")
+    return filename
+
+
+def _prune_bundles(bundle_dir, keep=BUNDLE_KEEP):
+    """Оставляет keep последних бандлов каждого типа (по времени изменения)."""
+    by_extension = {}
+    for filename in os.listdir(bundle_dir):
+        match = BUNDLE_FILENAME_RE.fullmatch(filename)
+        if match:
+            by_extension.setdefault(match.group(2), []).append(filename)
+    for filenames in by_extension.values():
+        filenames.sort(key=lambda name: os.path.getmtime(os.path.join(bundle_dir, name)), reverse=True)
+        for filename in filenames[keep:]:
+            try:
+                os.unlink(os.path.join(bundle_dir, filename))
+            except OSError:
+                pass
+
+
+def build_bundles(cellHeight, dayCellWidth, timeColWidth, borderWidth=1, bundle_dir=None, minify=True):
+    """
+    Собирает JS и CSS бандлы редактора и записывает их, если таких ещё нет.
+
+    Args:
+        cellHeight, dayCellWidth, timeColWidth, borderWidth: Параметры сетки для CSS
+        bundle_dir (str): Каталог бандлов (по умолчанию html_output/assets)
+        minify (bool): Сжимать CSS (JS отдаётся как есть)
+
+    Returns:
+        dict: {'js': имя файла, 'css': имя файла}
+    """
+    if bundle_dir is None:
+        bundle_dir = get_asset_bundle_dir()
+    js_content = get_javascript_bundle(load_js_modules())
+    css_content = get_css_text(cellHeight, dayCellWidth, timeColWidth, borderWidth)
+    if minify:
+        css_content = minify_css(css_content)
+    names = {
+        "js": _write_bundle(bundle_dir, js_content, "js"),
+        "css": _write_bundle(bundle_dir, css_content, "css"),
+    }
+    _prune_bundles(bundle_dir)
+    return names
+
+
+def bundle_tags(names):
+    """HTML-теги подключения собранных бандлов."""
+    return [
+        f'  <link rel="stylesheet" href="{BUNDLE_URL_PREFIX}{names["css"]}">',
+        f'  <script src="{BUNDLE_URL_PREFIX}{names["js"]}"></script>',
+    ]
+
+
+def resolve_bundle_path(filename, bundle_dir=None):
+    """
+    Возвращает (путь, точное_совпадение) для запрошенного бандла.
+
+    Если файла с таким хэшем нет (например, schedule.html восстановлен из
+    резервной копии более старой версии), возвращается самый свежий бандл того
+    же типа с признаком False — его нельзя кэшировать как immutable.
+    """
+    match = BUNDLE_FILENAME_RE.fullmatch(filename or "")
+    if match is None:
+        return None, False
+    if bundle_dir is None:
+        bundle_dir = get_asset_bundle_dir()
+    path = os.path.join(bundle_dir, filename)
+    if os.path.isfile(path):
+        return path, True
+    try:
+        candidates = [
+            os.path.join(bundle_dir, name)
+            for name in os.listdir(bundle_dir)
+            if is_bundle_filename(name) and name.endswith("." + match.group(2))
+        ]
+    except FileNotFoundError:
+        return None, False
+    if not candidates:
+        return None, False
+    return max(candidates, key=os.path.getmtime), False
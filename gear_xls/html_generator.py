@@ -32,7 +32,8 @@ logger = logging.getLogger('html_generator')
 
 
 def generate_html_schedule(buildings, output_html="schedule.html", output_css="schedule.css", 
-                          time_interval=5, borderWidth=0.5, spiski_data=None):
+                          time_interval=5, borderWidth=0.5, spiski_data=None, fragment_cache=None,
+                          grid_mode="table", bundle_dir=None):
     """
     Генерирует HTML-страницу с интерактивным расписанием.
     
@@ -45,6 +46,10 @@ def generate_html_schedule(buildings, output_html="schedule.html", output_css="s
         output_css (str): Путь для сохранения CSS-файла (совместимость)
         time_interval (int): Интервал времени в минутах для отображения в сетке
         borderWidth (float): Толщина границы ячейки в пикселях
+        fragment_cache (HTMLFragmentCache, optional): Кэш HTML-фрагментов
+            для инкрементальной перегенерации
+        grid_mode (str): "table" — редактор; "compact" — CSS-сетка только для просмотра
+        bundle_dir (str, optional): Каталог JS/CSS бандлов (по умолчанию assets рядом с HTML)
         
     Returns:
         str: Путь к созданному HTML файлу
@@ -63,11 +68,15 @@ def generate_html_schedule(buildings, output_html="schedule.html", output_css="s
         # Создание координатора с настройками
         coordinator = HTMLCoordinator(
             time_interval=time_interval,
-            border_width=borderWidth
+            border_width=borderWidth,
+            grid_mode=grid_mode
         )
         
         # Генерация полного расписания
-        result_path = coordinator.generate_complete_schedule(buildings, output_html, output_css, spiski_data=spiski_data)
+        result_path = coordinator.generate_complete_schedule(
+            buildings, output_html, output_css, spiski_data=spiski_data, fragment_cache=fragment_cache,
+            bundle_dir=bundle_dir
+        )
         
         # Сбор статистики генерации
         stats = coordinator.get_generation_statistics(buildings)
@@ -19,6 +19,19 @@ def get_css_styles(cellHeight, dayCellWidth, timeColWidth, borderWidth=1):
     """
     return f"""
     <style>
+{get_css_text(cellHeight, dayCellWidth, timeColWidth, borderWidth)}
+    </style>
+    """
+
+
+def get_css_text(cellHeight, dayCellWidth, timeColWidth, borderWidth=1):
+    """
+    Возвращает CSS-стили без тега <style> (для встраивания или отдельного файла).
+
+    Returns:
+        str: CSS-код
+    """
+    return f"""
       /* Задаём box-sizing для всех элементов */
       * {{
         box-sizing: border-box;
@@ -469,5 +482,4 @@ def get_css_styles(cellHeight, dayCellWidth, timeColWidth, borderWidth=1):
          width: 100%;
          margin-bottom: 2px;
       }}
-    </style>
     """
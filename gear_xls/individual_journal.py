@@ -0,0 +1,223 @@
+"""Append-only mutation journal for ``individual_lessons.json``.
+
+In journal mode a mutation appends one compact JSON line describing the
+changed blocks instead of rewriting the whole snapshot.  Readers fold the
+journal over the snapshot; the compactor later rewrites the snapshot and
+drops the journal.
+
+The first journal line is a header carrying the SHA-256 of the snapshot bytes
+the journal was started on.  Any full snapshot rewrite changes those bytes,
+so a journal left behind by a crash between the rewrite and the journal
+removal is recognised as stale and ignored instead of being replayed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from typing import Any
+
+from gear_xls.schedule_state_errors import ScheduleStateReadError
+
+
+JOURNAL_SUFFIX = ".journal"
+JOURNAL_RECORD_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+
+def journal_path_for(snapshot_path: str) -> str:
+    return snapshot_path + JOURNAL_SUFFIX
+
+
+def snapshot_sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _line(record: dict[str, Any]) -> bytes:
+    return (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _corrupt(message: str) -> ScheduleStateReadError:
+    return ScheduleStateReadError(message, "INDIVIDUAL_STATE_CORRUPT")
+
+
+def read_journal(path: str, snapshot_digest: str) -> list[dict[str, Any]] | None:
+    """Return journal records for the snapshot with ``snapshot_digest``.
+
+    ``None`` means there is no journal that applies to this snapshot (missing
+    or stale).  A torn final line left by a crash mid-append is ignored.
+    """
+
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as handle:
+        lines = [line for line in handle.read().split(b"\n") if line.strip()]
+    parsed = []
+    for index, raw in enumerate(lines):
+        try:
+            record = json.loads(raw.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            if index == len(lines) - 1:
+                logger.warning("Ignoring torn trailing record in %s", path)
+                break
+            raise _corrupt("individual_lessons.json journal is not valid JSON lines") from exc
+        if not isinstance(record, dict) or record.get("v") != JOURNAL_RECORD_VERSION:
+            raise _corrupt("individual_lessons.json journal record is invalid")
+        parsed.append(record)
+    if not parsed or "snapshot_sha256" not in parsed[0]:
+        raise _corrupt("individual_lessons.json journal header is missing")
+    if parsed[0]["snapshot_sha256"] != snapshot_digest:
+        logger.info("Ignoring stale individual journal %s", path)
+        return None
+    return parsed[1:]
+
+
+def apply_records(state: dict[str, Any], records: list[dict[str, Any]]) -> dict[str, Any]:
+    """Fold ``records`` over ``state`` in place and return it."""
+
+    blocks = list(state.get("blocks", []))
+    for record in records:
+        deleted = set(record.get("delete") or [])
+        if deleted:
+            blocks = [
+                block
+                for block in blocks
+                if not (isinstance(block, dict) and block.get("id") in deleted)
+            ]
+        upserts = record.get("upsert") or []
+        if upserts:
+            positions = {
+                block.get("id"): index
+                for index, block in enumerate(blocks)
+                if isinstance(block, dict) and block.get("id") is not None
+            }
+            for block in upserts:
+                position = positions.get(block.get("id"))
+                if position is None:
+                    positions[block.get("id")] = len(blocks)
+                    blocks.append(block)
+                else:
+                    blocks[position] = block
+        if "last_modified" in record:
+            state["last_modified"] = record.get("last_modified")
+    state["blocks"] = blocks
+    return state
+
+
+def baseline_blocks(blocks: list[Any]) -> list[tuple[Any, dict[str, Any]]] | None:
+    """Return ``(id, shallow copy)`` pairs, or ``None`` when ids are unusable."""
+
+    baseline = []
+    seen = set()
+    for block in blocks:
+        block_id = block.get("id") if isinstance(block, dict) else None
+        if block_id is None or block_id in seen:
+            return None
+        seen.add(block_id)
+        baseline.append((block_id, dict(block)))
+    return baseline
+
+
+def build_record(
+    baseline: list[tuple[Any, dict[str, Any]]] | None,
+    blocks: list[Any],
+    last_modified: str | None,
+) -> dict[str, Any] | None:
+    """Diff ``blocks`` against ``baseline`` as id-keyed upserts and deletes.
+
+    Returns ``None`` when the change cannot be replayed to the exact same
+    block order; callers then fall back to a full snapshot rewrite.
+    """
+
+    current = baseline_blocks(blocks)
+    if baseline is None or current is None:
+        return None
+    previous = dict(baseline)
+    current_ids = [block_id for block_id, _ in current]
+    current_id_set = set(current_ids)
+    deleted = [block_id for block_id, _ in baseline if block_id not in current_id_set]
+    surviving = [block_id for block_id, _ in baseline if block_id in current_id_set]
+    appended = [block_id for block_id in current_ids if block_id not in previous]
+    if surviving + appended != current_ids:
+        return None
+    upsert = [block for block_id, block in current if previous.get(block_id) != block]
+    return {
+        "v": JOURNAL_RECORD_VERSION,
+        "last_modified": last_modified,
+        "upsert": upsert,
+        "delete": deleted,
+    }
+
+
+def _repair_tail(handle) -> bool:
+    """Make the journal end on a line boundary before appending.
+
+    A final line without ``\n`` is either a complete record whose newline was
+    lost (readers accept it, so only the newline is added) or a torn record
+    (readers skip it, so it is cut off).  Otherwise the next append would be
+    glued onto it and both records would become unreadable.  Returns
+    ``False`` when nothing remains, so the caller writes a fresh header.
+    """
+
+    end = handle.seek(0, os.SEEK_END)
+    if end == 0:
+        return False
+    handle.seek(end - 1)
+    if handle.read(1) == b"\n":
+        return True
+    handle.seek(0)
+    data = handle.read()
+    cut = data.rfind(b"\n") + 1
+    try:
+        record = json.loads(data[cut:].decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        record = None
+    if isinstance(record, dict):
+        handle.write(b"\n")
+        return True
+    logger.warning("Truncating torn trailing record in %s before append", handle.name)
+    handle.truncate(cut)
+    handle.seek(cut)
+    return cut > 0
+
+
+def append_record(path: str, record: dict[str, Any], *, snapshot_digest: str, start_new: bool) -> int:
+    """Append one record with fsync and return the journal size in bytes.
+
+    ``start_new`` truncates any stale journal and writes a fresh header for
+    the snapshot identified by ``snapshot_digest``.  A torn trailing record
+    left by a crash mid-append is dropped first.
+    """
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    payload = _line(record)
+    header = _line({"v": JOURNAL_RECORD_VERSION, "snapshot_sha256": snapshot_digest})
+    if start_new or not os.path.exists(path):
+        mode = "wb"
+        payload = header + payload
+    else:
+        mode = "r+b"
+    with open(path, mode) as handle:
+        if mode == "r+b" and not _repair_tail(handle):
+            payload = header + payload
+        handle.write(payload)
+        handle.flush()
+        os.fsync(handle.fileno())
+        return handle.tell()
+
+
+def remove_journal(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        return
+
+
+def journal_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
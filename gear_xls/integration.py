@@ -47,6 +47,7 @@ from gear_xls.group_occupancy_snapshot import (
 )
 from gear_xls.schedule_mutation_coordinator import schedule_mutation
 from gear_xls import state_manager
+from gear_xls import state_storage
 
 # Настройка логирования
 logging.basicConfig(
@@ -161,6 +162,16 @@ def _write_json_atomic(path: str, payload: dict) -> None:
                 pass
 
 
+def _write_state_document(path: str, payload: dict) -> None:
+    """Write a state document through the SQLite store when it serves ``path``."""
+    stored = state_storage.store_for_path(path)
+    if stored is not None:
+        store, document = stored
+        store.write_document(document, payload)
+        return
+    _write_json_atomic(path, payload)
+
+
 def _replace_file_atomic(source_path: str, target_path: str) -> None:
     os.makedirs(os.path.dirname(target_path), exist_ok=True)
     tmp_path = None
@@ -195,6 +206,8 @@ def reset_web_editor_state(
     from the current Excel/HTML outputs instead of stale persisted JSON state.
     """
     state_dir = get_schedule_state_dir()
+    # Регенерация идёт в отдельном процессе: в режиме SQLite состояние пишется в БД сервера
+    state_storage.ensure_state_storage()
 
     individual_blocks = list(individual_blocks or [])
     revision = datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
@@ -223,7 +236,7 @@ def reset_web_editor_state(
                     raise RegenerationEventConflict(conflict)
 
             state_manager.write_regeneration_individual_state(prepared["state"])
-            _write_json_atomic(
+            _write_state_document(
                 os.path.join(state_dir, "base_schedule.json"),
                 {"published_at": None, "published_by": None, "blocks": []},
             )
@@ -237,7 +250,7 @@ def reset_web_editor_state(
                     html_source_path,
                     os.path.join(get_html_output_dir(), "schedule.html"),
                 )
-            _write_json_atomic(
+            _write_state_document(
                 os.path.join(state_dir, "lock.json"),
                 {
                     "holder": None,
@@ -11,6 +11,7 @@ PROJECT_ROOT = os.path.dirname(THIS_DIR)
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
+from gear_xls import state_storage
 from gear_xls.runtime_paths import get_lock_json_path
 
 
@@ -38,11 +39,16 @@ def _empty_lock_state():
 
 def _read_lock(project_root=None):
     lock_json_path = _lock_json_path(project_root)
-    if not os.path.exists(lock_json_path):
+    stored = state_storage.store_for_path(lock_json_path)
+    if stored is None and not os.path.exists(lock_json_path):
         return _empty_lock_state()
     try:
-        with open(lock_json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if stored is not None:
+            store, document = stored
+            data = store.read_document(document)
+        else:
+            with open(lock_json_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
         state = _empty_lock_state()
         if isinstance(data, dict):
             state.update({key: data.get(key) for key in state})
@@ -55,6 +61,11 @@ def _read_lock(project_root=None):
 
 def _write_lock(state, project_root=None):
     lock_json_path = _lock_json_path(project_root)
+    stored = state_storage.store_for_path(lock_json_path)
+    if stored is not None:
+        store, document = stored
+        store.write_document(document, state)
+        return
     directory = os.path.dirname(lock_json_path)
     os.makedirs(directory, exist_ok=True)
     tmp_path = None
@@ -6,9 +6,9 @@ import os
 import tempfile
 import threading
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Callable
 
-from gear_xls import backup_manager, lock_manager
+from gear_xls import backup_manager, individual_journal, lock_manager, state_storage
 from gear_xls.runtime_paths import (
     get_base_schedule_path,
     get_group_occupancy_snapshot_path,
@@ -472,12 +472,11 @@ def _load_validated_backup(
     except backup_manager.BackupError as exc:
         raise RestoreError(exc.message, code=exc.code, status_code=exc.status_code) from exc
 
-    if not os.path.exists(path):
+    if not backup_manager.backup_exists(backup_id, project_root):
         raise RestoreError("Backup not found", code="BACKUP_NOT_FOUND", status_code=404)
 
     try:
-        manifest = backup_manager.validate_backup_zip(path, deep=True)
-        entries = backup_manager._load_zip_entries(path)
+        manifest, entries = backup_manager.load_backup_entries(backup_id, project_root)
     except backup_manager.BackupError as exc:
         raise RestoreError(exc.message, code=exc.code, status_code=exc.status_code) from exc
 
@@ -558,9 +557,12 @@ def _prepare_restore_payload(
 
 
 def _restore_operations(payload: dict[str, Any], project_root: str | None = None) -> list[tuple[str, bytes | None]]:
+    individual_path = get_individual_lessons_path(project_root)
     operations: list[tuple[str, bytes | None]] = [
         (get_base_schedule_path(project_root), payload["base"]),
-        (get_individual_lessons_path(project_root), payload["individual"]),
+        (individual_path, payload["individual"]),
+        # The restored snapshot supersedes any pending journal records.
+        (individual_journal.journal_path_for(individual_path), None),
         (get_group_occupancy_snapshot_path(project_root), payload.get("occupancy_snapshot")),
     ]
     spiski_dir = get_spiski_dir(project_root)
@@ -571,6 +573,11 @@ def _restore_operations(payload: dict[str, Any], project_root: str | None = None
 
 
 def _delete_file_if_exists(path: str) -> None:
+    stored = state_storage.store_for_path(path)
+    if stored is not None:
+        store, document = stored
+        store.delete_document(document)
+        return
     try:
         os.unlink(path)
     except FileNotFoundError:
@@ -578,6 +585,11 @@ def _delete_file_if_exists(path: str) -> None:
 
 
 def _replace_file(path: str, data: bytes) -> None:
+    stored = state_storage.store_for_path(path)
+    if stored is not None:
+        store, document = stored
+        store.write_document(document, json.loads(data.decode("utf-8")))
+        return
     directory = os.path.dirname(path)
     os.makedirs(directory, exist_ok=True)
     tmp_path = None
@@ -675,8 +687,11 @@ def restore_backup(
     allow_foreign_project: bool = False,
     *,
     project_root: str | None = None,
+    progress: Callable[[str], None] | None = None,
 ) -> dict[str, Any]:
     _require_active_lock(login, project_root=project_root)
+    if progress is not None:
+        progress("validating")
     try:
         backup_id = backup_manager.validate_backup_id(backup_id)
     except backup_manager.BackupError as exc:
@@ -713,6 +728,8 @@ def restore_backup(
                     project_root=project_root,
                 )
                 restore_started = True
+                if progress is not None:
+                    progress("safety_backup")
                 safety_backup = _create_safety_backup(
                     backup_id,
                     login,
@@ -724,6 +741,8 @@ def restore_backup(
                     status["safety_backup_id"] = safety_backup["id"]
                     _write_status_unlocked(status, project_root)
 
+                if progress is not None:
+                    progress("applying")
                 replaced_paths = _apply_restore_payload(payload, project_root=project_root)
                 lock_manager.clear_for_restore(login, project_root=project_root)
                 status = complete_restore(
@@ -0,0 +1,144 @@
+"""Sorted per-room interval index for room/time conflict checks.
+
+Blocks are bucketed by normalized ``(building, day, room)`` and kept sorted by
+start minute together with a running maximum of end minutes, so an overlap
+query bisects to the last interval that starts before the candidate ends and
+walks back only while earlier intervals can still reach the candidate start.
+
+Building the index sorts every bucket, so it only pays off when several
+queries share one snapshot (e.g. checking all publish candidates against the
+stored events). Single-query paths keep the linear scan in state_manager.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from typing import Any, Iterable
+
+from gear_xls.room_name_utils import normalize_room_fields
+from gear_xls.schedule_state_errors import ScheduleStateReadError
+
+
+# "H:MM"/"HH:MM" within one day; state_manager validates stored times with it too
+TIME_PATTERN = re.compile(r"^(?:[01]?\d|2[0-3]):[0-5]\d$")
+
+
+def room_day_key(block: dict[str, Any]) -> tuple[str, str, str]:
+    normalized = normalize_room_fields(block)
+    return (
+        str(normalized.get("building") or "").strip(),
+        str(normalized.get("day") or "").strip(),
+        str(normalized.get("room") or "").strip(),
+    )
+
+
+def block_interval(block: dict[str, Any]) -> tuple[int, int] | None:
+    """Return ``(start, end)`` minutes or ``None`` for a missing/invalid range."""
+
+    start = _parse_minutes(block.get("start_time"))
+    end = _parse_minutes(block.get("end_time"))
+    if start is None or end is None or start >= end:
+        return None
+    return start, end
+
+
+def _parse_minutes(value: object) -> int | None:
+    text = str(value if value is not None else "").strip()
+    if not TIME_PATTERN.fullmatch(text):
+        return None
+    hours, minutes = text.split(":", 1)
+    return int(hours) * 60 + int(minutes)
+
+
+class _Bucket:
+    __slots__ = ("entries", "starts", "max_ends", "invalid")
+
+    def __init__(self) -> None:
+        # entries: (start, end, position, lesson_type, block)
+        self.entries: list[tuple[int, int, int, str, dict[str, Any]]] = []
+        self.starts: list[int] = []
+        self.max_ends: list[int] = []
+        self.invalid: list[tuple[int, str, dict[str, Any]]] = []
+
+    def seal(self) -> None:
+        self.entries.sort(key=lambda entry: (entry[0], entry[2]))
+        self.starts = [entry[0] for entry in self.entries]
+        running = -1
+        self.max_ends = []
+        for entry in self.entries:
+            running = max(running, entry[1])
+            self.max_ends.append(running)
+
+
+class RoomIntervalIndex:
+    """Immutable overlap index built once from one state snapshot.
+
+    ``state_code`` is the error code raised when a stored block that takes
+    part in a query has an invalid time range, matching the linear scan it
+    replaces.
+    """
+
+    def __init__(self, blocks: Iterable[Any] | None = None, *, state_code: str = "INDIVIDUAL_STATE_CORRUPT"):
+        self.state_code = state_code
+        self._buckets: dict[tuple[str, str, str], _Bucket] = {}
+        for position, block in enumerate(blocks or []):
+            if not isinstance(block, dict):
+                continue
+            bucket = self._buckets.setdefault(room_day_key(block), _Bucket())
+            lesson_type = block.get("lesson_type") or "group"
+            interval = block_interval(block)
+            if interval is None:
+                bucket.invalid.append((position, lesson_type, block))
+            else:
+                bucket.entries.append((interval[0], interval[1], position, lesson_type, block))
+        for bucket in self._buckets.values():
+            bucket.seal()
+
+    @staticmethod
+    def _accepts(block, lesson_type, exclude_id, allowed_types) -> bool:
+        if exclude_id is not None and block.get("id") == exclude_id:
+            return False
+        return allowed_types is None or lesson_type in allowed_types
+
+    def find_conflict(
+        self,
+        candidate: dict[str, Any],
+        *,
+        exclude_id: Any = None,
+        allowed_types: set[str] | None = None,
+    ) -> dict[str, Any] | None:
+        """Return the earliest stored block overlapping ``candidate`` (half-open)."""
+
+        bucket = self._buckets.get(room_day_key(candidate))
+        if bucket is None:
+            return None
+        if any(self._accepts(block, lesson_type, exclude_id, allowed_types) for _pos, lesson_type, block in bucket.invalid):
+            raise ScheduleStateReadError("Stored schedule block has invalid time range", self.state_code)
+        interval = block_interval(candidate)
+        if interval is None:
+            if any(self._accepts(entry[4], entry[3], exclude_id, allowed_types) for entry in bucket.entries):
+                raise ScheduleStateReadError("Stored schedule block has invalid time range", self.state_code)
+            return None
+        start, end = interval
+
+        best = None
+        index = bisect_left(bucket.starts, end) - 1
+        while index >= 0 and bucket.max_ends[index] > start:
+            _start, entry_end, position, lesson_type, block = bucket.entries[index]
+            if entry_end > start and self._accepts(block, lesson_type, exclude_id, allowed_types):
+                if best is None or position < best[0]:
+                    best = (position, lesson_type, block)
+            index -= 1
+        if best is None:
+            return None
+        _position, lesson_type, block = best
+        return {
+            "id": block.get("id"),
+            "lesson_type": lesson_type,
+            "day": block.get("day"),
+            "building": block.get("building"),
+            "room": block.get("room"),
+            "start_time": block.get("start_time"),
+            "end_time": block.get("end_time"),
+        }
@@ -0,0 +1,103 @@
+"""Per-room occupancy bitmaps for free-room queries.
+
+Each ``(building, day, room)`` gets an integer bitmask with one bit per
+5-minute slot of the day.  A block marks every slot it touches, so blocks
+that do not start or end on a slot boundary are treated conservatively.
+Checking whether a room is free in a window is then a single AND against the
+window mask, and free runs inside the window come from scanning set bits.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+
+SLOT_MINUTES = 5
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+
+
+def _format_time(minutes: int) -> str:
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def interval_mask(start_min: int, end_min: int) -> int:
+    """Return the bitmask of every slot overlapping ``[start_min, end_min)``."""
+
+    first = max(0, start_min // SLOT_MINUTES)
+    last = min(SLOTS_PER_DAY, -(-end_min // SLOT_MINUTES))
+    if last <= first:
+        return 0
+    return ((1 << (last - first)) - 1) << first
+
+
+def _free_runs(free: int) -> Iterable[tuple[int, int]]:
+    """Yield ``(first_slot, slot_count)`` for each run of set bits."""
+
+    while free:
+        first = (free & -free).bit_length() - 1
+        shifted = free >> first
+        length = (~shifted & (shifted + 1)).bit_length() - 1
+        yield first, length
+        free &= ~(((1 << length) - 1) << first)
+
+
+class RoomOccupancy:
+    """Immutable occupancy bitmaps built from one availability report."""
+
+    def __init__(self) -> None:
+        self._masks: dict[tuple[str, str], dict[str, int]] = {}
+        self._rooms: dict[str, list[str]] = {}
+        self.building_order: list[str] = []
+
+    @classmethod
+    def from_report(cls, report: dict[str, Any], parse_time) -> "RoomOccupancy":
+        occupancy = cls()
+        occupancy.building_order = list(report.get("building_order") or [])
+        for building, data in (report.get("buildings") or {}).items():
+            occupancy._rooms[building] = list(data.get("rooms") or [])
+            for day, rooms in (data.get("days") or {}).items():
+                day_masks = occupancy._masks.setdefault((building, day), {})
+                for room, slots in rooms.items():
+                    mask = day_masks.get(room, 0)
+                    for slot in slots:
+                        start, end = parse_time(slot.get("start")), parse_time(slot.get("end"))
+                        if start >= 0 and end > start:
+                            mask |= interval_mask(start, end)
+                    day_masks[room] = mask
+        return occupancy
+
+    def room_mask(self, building: str, day: str, room: str) -> int:
+        return self._masks.get((building, day), {}).get(room, 0)
+
+    def find_free(
+        self,
+        day: str,
+        start_min: int,
+        end_min: int,
+        *,
+        building: str | None = None,
+        min_minutes: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return rooms with a free run of ``min_minutes`` inside the window.
+
+        Without ``min_minutes`` the whole window must be free.  Each result
+        lists the free windows of that room clipped to the query window.
+        """
+
+        window = interval_mask(start_min, end_min)
+        required = end_min - start_min if min_minutes is None else min_minutes
+        buildings = [building] if building is not None else self.building_order
+        results = []
+        for name in buildings:
+            day_masks = self._masks.get((name, day), {})
+            for room in self._rooms.get(name, []):
+                free = window & ~day_masks.get(room, 0)
+                windows = []
+                for first, length in _free_runs(free):
+                    run_start = max(start_min, first * SLOT_MINUTES)
+                    run_end = min(end_min, (first + length) * SLOT_MINUTES)
+                    if run_end - run_start >= required:
+                        windows.append({"start": _format_time(run_start), "end": _format_time(run_end)})
+                if windows:
+                    results.append({"building": name, "room": room, "free_windows": windows})
+        return results
@@ -3,6 +3,7 @@ import logging
 import os
 import re
 import sys
+import threading
 from html import unescape
 
 THIS_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -17,6 +18,9 @@ from gear_xls.runtime_paths import (
     get_spiski_dir,
 )
 from gear_xls.day_constants import DAY_TO_WEEKDAY
+from gear_xls import individual_journal
+from gear_xls import state_storage
+from gear_xls.room_occupancy import RoomOccupancy
 
 try:
     from . import state_manager
@@ -34,6 +38,11 @@ SPISKI_ROOM_FILE_MAP = {
 }
 BUILDING_ORDER = ["Villa", "Kolibri"]
 DAY_ORDER = dict(DAY_TO_WEEKDAY)
+# Last computed report and the source signature it was computed from.
+_availability_cache = {"key": None, "value": None}
+_availability_cache_mutex = threading.Lock()
+# Occupancy bitmaps derived from the cached report object they were built from.
+_occupancy_cache = {"report": None, "value": None}
 
 
 def _load_json_safe(path: str) -> dict:
@@ -166,8 +175,20 @@ def _parse_html_block(attrs_text: str, body: str) -> dict | None:
     }
 
 
+def _load_base_data() -> dict:
+    stored = state_storage.store_for_path(BASE_SCHEDULE_PATH)
+    if stored is None:
+        return _load_json_safe(BASE_SCHEDULE_PATH)
+    store, document = stored
+    try:
+        return store.read_document(document) or {}
+    except Exception as exc:
+        logging.warning("Failed to read base schedule from state store: %s", exc)
+        return {}
+
+
 def _load_base_blocks() -> list[dict]:
-    base_data = _load_json_safe(BASE_SCHEDULE_PATH)
+    base_data = _load_base_data()
     blocks = base_data.get("blocks", [])
     if base_data.get("published_at") is not None:
         return blocks if isinstance(blocks, list) else []
@@ -194,7 +215,115 @@ def _load_base_blocks() -> list[dict]:
     return found
 
 
+def _source_token(path: str):
+    """Cheap change token for one source: store metadata or file stat."""
+
+    stored = state_storage.store_for_path(path)
+    if stored is not None:
+        store, document = stored
+        return ("store", document, store.document_meta(document))
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return (path, None)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+def _availability_cache_key() -> tuple:
+    individual_path = state_manager.INDIVIDUAL_LESSONS_PATH
+    return (
+        _source_token(BASE_SCHEDULE_PATH),
+        _source_token(individual_path),
+        _source_token(individual_journal.journal_path_for(individual_path)),
+        tuple(_source_token(os.path.join(SPISKI_DIR, name)) for name in SPISKI_ROOM_FILE_MAP.values()),
+        _source_token(SCHEDULE_HTML_PATH),
+        # Trial and event blocks expire by date without any file changing.
+        state_manager._today_local_date().isoformat(),
+    )
+
+
+def clear_availability_cache() -> None:
+    with _availability_cache_mutex:
+        _availability_cache.update(key=None, value=None)
+        _occupancy_cache.update(report=None, value=None)
+
+
 def compute_availability() -> dict:
+    """Return the rooms availability report, served from memory when unchanged.
+
+    The cached report is keyed by the base schedule, individual lessons,
+    room lists and fallback HTML sources, so it is recomputed only after one
+    of them changes.  Callers must treat the returned dict as read-only.
+    """
+
+    key = _availability_cache_key()
+    with _availability_cache_mutex:
+        if _availability_cache["key"] == key:
+            return _availability_cache["value"]
+    value = _compute_availability()
+    with _availability_cache_mutex:
+        _availability_cache.update(key=key, value=value)
+    return value
+
+
+def get_room_occupancy() -> RoomOccupancy:
+    """Return 5-minute occupancy bitmaps for the current availability report."""
+
+    report = compute_availability()
+    with _availability_cache_mutex:
+        if _occupancy_cache["report"] is report:
+            return _occupancy_cache["value"]
+    occupancy = RoomOccupancy.from_report(report, _parse_time)
+    with _availability_cache_mutex:
+        _occupancy_cache.update(report=report, value=occupancy)
+    return occupancy
+
+
+def find_free_rooms(day: str, start_text: str, end_text: str, *, building=None, min_minutes=None) -> dict:
+    """Return rooms free in ``[start_text, end_text)`` on ``day``.
+
+    Raises ``ValueError`` for an unknown day, invalid times or ``min_minutes``.
+    """
+
+    day = (day or "").strip()
+    if day not in DAY_ORDER:
+        raise ValueError("day is invalid")
+    start_min, end_min = _parse_time(start_text), _parse_time(end_text)
+    if start_min < 0 or end_min < 0 or end_min <= start_min:
+        raise ValueError("from/to must be HH:MM with from before to")
+    if min_minutes is not None and (min_minutes <= 0 or min_minutes > end_min - start_min):
+        raise ValueError("min_minutes must be between 1 and the window length")
+    building = (building or "").strip() or None
+    rooms = get_room_occupancy().find_free(
+        day,
+        start_min,
+        end_min,
+        building=building,
+        min_minutes=min_minutes,
+    )
+    return {
+        "day": day,
+        "from": _format_time(start_min),
+        "to": _format_time(end_min),
+        "building": building,
+        "min_minutes": min_minutes,
+        "rooms": rooms,
+    }
+
+
+def prewarm_availability() -> None:
+    """Recompute the cached report in the background (e.g. after publish)."""
+
+    def _run():
+        try:
+            compute_availability()
+        except Exception as exc:
+            logging.warning("Rooms availability pre-warm skipped: %s", exc)
+
+    threading.Thread(target=_run, name="rooms-availability-prewarm", daemon=True).start()
+
+
+def _compute_availability() -> dict:
     base_blocks = _load_base_blocks()
     ind_data = state_manager.get_individual_lessons()
     ind_blocks = ind_data.get("blocks", []) if isinstance(ind_data.get("blocks"), list) else []
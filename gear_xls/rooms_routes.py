@@ -1,6 +1,6 @@
 import json
 
-from flask import Blueprint, jsonify, make_response
+from flask import Blueprint, jsonify, make_response, request
 
 
 ROOMS_PAGE_TEMPLATE = """<!DOCTYPE html>
@@ -156,6 +156,24 @@ def configure(login_required, current_user, rooms_report, page_template=None):
     def api_rooms_availability():
         return jsonify(_rooms_report.compute_availability())
 
+    @bp.route("/api/rooms/free")
+    @_login_required
+    def api_rooms_free():
+        min_minutes = request.args.get("min_minutes", "").strip()
+        try:
+            if min_minutes and not min_minutes.isdigit():
+                raise ValueError("min_minutes must be an integer")
+            result = _rooms_report.find_free_rooms(
+                request.args.get("day", ""),
+                request.args.get("from", ""),
+                request.args.get("to", ""),
+                building=request.args.get("building"),
+                min_minutes=int(min_minutes) if min_minutes else None,
+            )
+        except ValueError as exc:
+            return jsonify({"ok": False, "error": str(exc), "code": "VALIDATION_ERROR"}), 400
+        return jsonify({"ok": True, **result})
+
     @bp.route("/rooms")
     @_login_required
     def rooms():
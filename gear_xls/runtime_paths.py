@@ -18,6 +18,24 @@ HOST_ENV = "HOST"
 PORT_ENV = "PORT"
 DEFAULT_HOST = "0.0.0.0"
 DEFAULT_PORT = 5000
+SERVER_MODE_ENV = "SCHEDGEN_SERVER_MODE"
+SERVER_MODE_PRODUCTION = "production"
+SERVER_MODE_DEVELOPMENT = "development"
+SERVER_MODES = (SERVER_MODE_PRODUCTION, SERVER_MODE_DEVELOPMENT)
+DEFAULT_SERVER_MODE = SERVER_MODE_PRODUCTION
+DEFAULT_SERVER_THREADS = 8
+DEFAULT_SERVER_CONNECTION_LIMIT = 100
+DEFAULT_SERVER_CHANNEL_TIMEOUT = 120
+DEFAULT_SERVER_TV_STREAMS = 4
+DEFAULT_INDIVIDUAL_JOURNAL = False
+STORAGE_BACKEND_JSON = "json"
+STORAGE_BACKEND_SQLITE = "sqlite"
+STORAGE_BACKENDS = (STORAGE_BACKEND_JSON, STORAGE_BACKEND_SQLITE)
+DEFAULT_STORAGE_BACKEND = STORAGE_BACKEND_JSON
+BACKUP_STORE_ZIP = "zip"
+BACKUP_STORE_DEDUP = "dedup"
+BACKUP_STORES = (BACKUP_STORE_ZIP, BACKUP_STORE_DEDUP)
+DEFAULT_BACKUP_STORE = BACKUP_STORE_ZIP
 HEALTH_PATH = "/health"
 HEALTH_MARKER = "Excel Export Server is running!"
 
@@ -123,17 +141,75 @@ def _normalize_server_port(value: object) -> int:
     return DEFAULT_PORT
 
 
+def _normalize_server_mode(value: object) -> str:
+    if isinstance(value, str):
+        mode = value.strip().lower()
+        if mode in SERVER_MODES:
+            return mode
+    return DEFAULT_SERVER_MODE
+
+
+def _normalize_storage_backend(value: object) -> str:
+    if isinstance(value, str):
+        backend = value.strip().lower()
+        if backend in STORAGE_BACKENDS:
+            return backend
+    return DEFAULT_STORAGE_BACKEND
+
+
+def _normalize_backup_store(value: object) -> str:
+    if isinstance(value, str):
+        store = value.strip().lower()
+        if store in BACKUP_STORES:
+            return store
+    return DEFAULT_BACKUP_STORE
+
+
+def _normalize_positive_int(value: object, default: int, maximum: int) -> int:
+    if isinstance(value, bool):
+        return default
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return default
+    if 1 <= number <= maximum:
+        return number
+    return default
+
+
+def _default_server_config() -> dict[str, object]:
+    return {
+        "host": DEFAULT_HOST,
+        "port": DEFAULT_PORT,
+        "mode": DEFAULT_SERVER_MODE,
+        "threads": DEFAULT_SERVER_THREADS,
+        "connection_limit": DEFAULT_SERVER_CONNECTION_LIMIT,
+        "channel_timeout": DEFAULT_SERVER_CHANNEL_TIMEOUT,
+        "tv_streams": DEFAULT_SERVER_TV_STREAMS,
+        "individual_journal": DEFAULT_INDIVIDUAL_JOURNAL,
+        "storage_backend": DEFAULT_STORAGE_BACKEND,
+        "backup_store": DEFAULT_BACKUP_STORE,
+    }
+
+
 def load_server_config(
     project_root: str | None = None,
     *,
     include_env: bool = False,
 ) -> dict[str, object]:
-    """Load the per-project Flask bind settings.
+    """Load the per-project Flask bind and serving settings.
 
     Missing or invalid config values intentionally fall back to the current
     public default so existing installations keep working without a config file.
+    ``threads``, ``connection_limit`` and ``channel_timeout`` (keep-alive idle
+    seconds) only apply to the production WSGI server.  ``tv_streams`` caps the
+    concurrent TV push streams; each holds a server thread, so the production
+    server runs ``threads + tv_streams`` threads.  ``individual_journal``
+    switches non-group lesson writes to the append-only journal.
+    ``storage_backend`` selects ``"json"`` files or the ``"sqlite"`` database.
+    ``backup_store`` selects full ``"zip"`` archives or the ``"dedup"`` blob store.
     """
-    config: dict[str, object] = {"host": DEFAULT_HOST, "port": DEFAULT_PORT}
+    config = _default_server_config()
     path = get_server_config_path(project_root)
     if os.path.exists(path):
         try:
@@ -142,12 +218,29 @@ def load_server_config(
             if isinstance(data, dict):
                 config["host"] = _normalize_server_host(data.get("host", config["host"]))
                 config["port"] = _normalize_server_port(data.get("port", config["port"]))
+                config["mode"] = _normalize_server_mode(data.get("mode", config["mode"]))
+                config["threads"] = _normalize_positive_int(
+                    data.get("threads"), DEFAULT_SERVER_THREADS, 64
+                )
+                config["connection_limit"] = _normalize_positive_int(
+                    data.get("connection_limit"), DEFAULT_SERVER_CONNECTION_LIMIT, 10000
+                )
+                config["channel_timeout"] = _normalize_positive_int(
+                    data.get("channel_timeout"), DEFAULT_SERVER_CHANNEL_TIMEOUT, 3600
+                )
+                config["tv_streams"] = _normalize_positive_int(
+                    data.get("tv_streams"), DEFAULT_SERVER_TV_STREAMS, 64
+                )
+                config["individual_journal"] = data.get("individual_journal") is True
+                config["storage_backend"] = _normalize_storage_backend(data.get("storage_backend"))
+                config["backup_store"] = _normalize_backup_store(data.get("backup_store"))
         except Exception:
-            config = {"host": DEFAULT_HOST, "port": DEFAULT_PORT}
+            config = _default_server_config()
 
     if include_env:
         config["host"] = _normalize_server_host(os.environ.get(HOST_ENV, config["host"]))
         config["port"] = _normalize_server_port(os.environ.get(PORT_ENV, config["port"]))
+        config["mode"] = _normalize_server_mode(os.environ.get(SERVER_MODE_ENV, config["mode"]))
 
     return config
 
@@ -202,6 +295,10 @@ def get_html_output_dir(project_root: str | None = None) -> str:
     return os.path.join(get_gear_xls_dir(project_root), "html_output")
 
 
+def get_asset_bundle_dir(project_root: str | None = None) -> str:
+    return os.path.join(get_html_output_dir(project_root), "assets")
+
+
 def get_excel_exports_dir(project_root: str | None = None) -> str:
     return os.path.join(get_gear_xls_dir(project_root), "excel_exports")
 
@@ -246,6 +343,10 @@ def get_lock_json_path(project_root: str | None = None) -> str:
     return os.path.join(get_schedule_state_dir(project_root), "lock.json")
 
 
+def get_state_db_path(project_root: str | None = None) -> str:
+    return os.path.join(get_schedule_state_dir(project_root), "schedule_state.sqlite3")
+
+
 def get_schedule_html_path(project_root: str | None = None) -> str:
     return os.path.join(get_html_output_dir(project_root), "schedule.html")
 
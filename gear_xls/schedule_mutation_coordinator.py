@@ -16,6 +16,10 @@ DEFAULT_COORDINATOR_RETRY_SECONDS = 0.025
 logger = logging.getLogger(__name__)
 _process_mutex = threading.RLock()
 _local = threading.local()
+# Counts finished outermost mutations so in-process readers (the TV push
+# channel) wake up right after a write instead of re-reading state files.
+_mutations_finished = threading.Condition()
+_mutation_count = 0
 
 
 class ScheduleMutationBusy(RuntimeError):
@@ -78,6 +82,26 @@ def _release_file_lock(fp, backend: str | None) -> None:
             logger.warning("Failed to release schedule mutation lock: %s", exc)
 
 
+def mutation_count() -> int:
+    with _mutations_finished:
+        return _mutation_count
+
+
+def wait_for_mutation(seen: int, timeout: float) -> int:
+    """Block until a mutation finishes after ``seen`` or ``timeout`` passes."""
+
+    with _mutations_finished:
+        _mutations_finished.wait_for(lambda: _mutation_count != seen, max(0.0, timeout))
+        return _mutation_count
+
+
+def _mutation_finished() -> None:
+    global _mutation_count
+    with _mutations_finished:
+        _mutation_count += 1
+        _mutations_finished.notify_all()
+
+
 def _acquire_process_mutex(timeout_seconds: float) -> bool:
     deadline = time.monotonic() + max(0.0, timeout_seconds)
     while True:
@@ -128,6 +152,7 @@ def schedule_mutation(
         finally:
             _local.depth = 0
             _local.reason = None
+            _mutation_finished()
     finally:
         if lock_fp is not None:
             _release_file_lock(lock_fp, backend)
@@ -0,0 +1,112 @@
+"""Read-only compact schedule page built from the shared schedule state.
+
+The editor page (``schedule.html``) draws a table cell for every 5-minute slot
+of every room column so the editor scripts can address them.  Users who only
+read the schedule get the compact CSS-grid variant of the same page instead:
+no cells and no editor JS.  It is built from the published base plus the
+individual lessons, so it shows what the editor shows once its scripts load.
+
+The page is rendered once per state revision into ``html_output``; unchanged
+buildings and days come from a fragment cache kept next to it.
+"""
+
+import hashlib
+import os
+import sys
+import threading
+
+THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(THIS_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+if THIS_DIR not in sys.path:
+    sys.path.insert(0, THIS_DIR)
+
+from gear_xls.room_name_utils import normalize_room_fields
+from gear_xls.runtime_paths import get_asset_bundle_dir, get_html_output_dir
+from gear_xls.schedule_structure import build_schedule_structure
+
+try:
+    from . import state_manager
+except ImportError:
+    import state_manager
+
+
+VIEW_HTML_FILENAME = "schedule_view.html"
+VIEW_FRAGMENT_CACHE_FILENAME = ".schedule_view_fragments.json"
+_ACTIVITY_FIELDS = ("subject", "teacher", "students", "start_time", "end_time", "lesson_type", "trial_dates", "color")
+
+_view_cache_mutex = threading.Lock()
+_view_cache = {"key": None, "value": None}
+
+
+def view_revision() -> str:
+    """Revision token of the view; the date is included because trial lessons expire."""
+
+    raw = "|".join(
+        [
+            str(state_manager.get_base_revision()),
+            str(state_manager.get_individual_revision(prune_expired=False)),
+            state_manager._today_local_date().isoformat(),
+        ]
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def _state_activities() -> dict:
+    base = state_manager.get_base_schedule()
+    individual = state_manager.get_individual_lessons()
+    base_blocks = base.get("blocks", []) if base.get("published_at") is not None else []
+    individual_blocks = individual.get("blocks", [])
+    blocks = list(base_blocks or []) + list(individual_blocks if isinstance(individual_blocks, list) else [])
+
+    activities = {}
+    for index, block in enumerate(blocks):
+        if not isinstance(block, dict):
+            continue
+        normalized = normalize_room_fields(dict(block, room_display=block.get("room_display") or ""))
+        activity = {field: normalized.get(field) for field in _ACTIVITY_FIELDS}
+        activity.update(
+            building=normalized.get("building"),
+            day=normalized.get("day"),
+            room=normalized.get("room"),
+            room_display=normalized.get("room_display"),
+        )
+        activities[block.get("id") or f"block-{index}"] = activity
+    return activities
+
+
+def render_view() -> str | None:
+    """Return the compact page HTML, or ``None`` while the schedule is empty."""
+
+    revision = view_revision()
+    with _view_cache_mutex:
+        if _view_cache["key"] == revision:
+            return _view_cache["value"]
+        html = _render()
+        _view_cache.update(key=revision, value=html)
+        return html
+
+
+def clear_view_cache() -> None:
+    with _view_cache_mutex:
+        _view_cache.update(key=None, value=None)
+
+
+def _render() -> str | None:
+    from generators.html_coordinator import GRID_MODE_COMPACT, HTMLCoordinator
+    from generators.html_fragment_cache import HTMLFragmentCache
+
+    buildings = build_schedule_structure(_state_activities())
+    if not any(not name.startswith("_") for name in buildings):
+        return None
+    output_dir = get_html_output_dir()
+    output_html = os.path.join(output_dir, VIEW_HTML_FILENAME)
+    HTMLCoordinator(grid_mode=GRID_MODE_COMPACT).generate_complete_schedule(
+        buildings,
+        output_html,
+        fragment_cache=HTMLFragmentCache(os.path.join(output_dir, VIEW_FRAGMENT_CACHE_FILENAME)),
+        bundle_dir=get_asset_bundle_dir(),
+    )
+    with open(output_html, "r", encoding="utf-8") as handle:
+        return handle.read()
@@ -4,12 +4,13 @@
 Модуль с маршрутами для веб-сервера Flask.
 """
 
+import io
 import json
 import logging
 import os
 import re
 import sys
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 from flask import (
     Flask,
@@ -33,6 +34,7 @@ if THIS_DIR not in sys.path:
 
 from gear_xls.runtime_paths import (
     HEALTH_MARKER,
+    SERVER_MODE_DEVELOPMENT,
     ensure_runtime_dirs,
     get_excel_exports_dir,
     get_js_modules_dir,
@@ -47,16 +49,28 @@ from gear_xls.runtime_paths import (
 )
 
 from auth import authenticate, current_user, get_or_create_secret_key, load_users, login_required, role_required
+import background_jobs
 import backup_manager
-from excel_exporter import ExcelExportValidationError, process_schedule_export_request
+from html_bundle import BUNDLE_CACHE_CONTROL, resolve_bundle_path
+from excel_exporter import (
+    ExcelExportValidationError,
+    export_schedule_bytes,
+    export_state_workbook,
+    save_export_bytes,
+    state_export_revision,
+)
 import lock_manager
 import restore_manager
 import rooms_report
 import rooms_routes
+import schedule_view
 import state_manager
+import tv_display
+import tv_routes
 from base_schedule_manager import BaseRevisionConflict, BaseScheduleValidationError
 from gear_xls.event_domain import EVENT_OWNER_ADMIN, EVENT_OWNER_EVENT_MANAGER, ROLE_EVENT_MANAGER
 from gear_xls.event_room_config import get_event_room_config
+from gear_xls import state_storage
 from gear_xls.schedule_mutation_coordinator import ScheduleMutationBusy, schedule_mutation
 from gear_xls.schedule_state_errors import ScheduleStateError
 
@@ -119,10 +133,15 @@ JSON_AUTH_PATHS = {
     "/api/schedule/publish",
     "/api/users/event_managers",
     "/api/rooms/availability",
+    "/api/rooms/free",
+    "/api/tv/schedule",
+    "/api/tv/events",
+    "/api/export/xlsx",
     "/api/backups",
     "/api/restore/status",
     "/api/restore/status/clear",
 }
+JOB_EVENTS_KEEPALIVE_SECONDS = 15
 RESTORE_LOCKED_STATUS = 423
 RESTORE_BLOCK_MESSAGE = (
     "\u0410\u0434\u043c\u0438\u043d\u0438\u0441\u0442\u0440\u0430\u0442\u043e\u0440 "
@@ -154,6 +173,7 @@ def _json_auth_path(path):
         or path.startswith("/api/events/")
         or path.startswith("/api/backups/")
         or path.startswith("/api/restore/")
+        or path.startswith("/api/jobs/")
     )
 
 
@@ -350,12 +370,16 @@ def _is_backup_restore_path(path):
     return re.fullmatch(r"/api/backups/[^/]+/restore", path or "") is not None
 
 
+def _is_job_status_path(path):
+    return re.fullmatch(r"/api/jobs/[^/]+(/events)?", path or "") is not None
+
+
 def _restore_request_allowed():
     path = request.path
     method = request.method
     role = session.get("role")
 
-    if path.startswith("/static/") or path.startswith("/js_modules/"):
+    if path.startswith(("/static/", "/js_modules/", "/assets/")):
         return True
     if path in ("/login", "/logout", "/health"):
         return True
@@ -369,6 +393,8 @@ def _restore_request_allowed():
         return True
     if role == "admin" and method == "POST" and _is_backup_restore_path(path):
         return True
+    if role == "admin" and method == "GET" and _is_job_status_path(path):
+        return True
     return False
 
 
@@ -475,6 +501,8 @@ SPISKI_FILE_MAP = {
 
 rooms_routes.configure(login_required, current_user, rooms_report, ROOMS_PAGE_TEMPLATE)
 app.register_blueprint(rooms_routes.bp)
+tv_routes.configure(login_required, tv_display)
+app.register_blueprint(tv_routes.bp)
 
 
 def _spiski_sort_key(value):
@@ -546,8 +574,31 @@ os.makedirs(EXCEL_EXPORTS_DIR, exist_ok=True)
 logger.info("Excel export directory ready: %s", EXCEL_EXPORTS_DIR)
 
 
+def _bundle_response(filename):
+    bundle_path, exact = resolve_bundle_path(filename)
+    if bundle_path is None:
+        return None
+    response = send_file(bundle_path, conditional=True)
+    # A hashed name never changes content; a fallback to the newest
+    # bundle must be revalidated because its hash differs from the URL.
+    response.headers["Cache-Control"] = BUNDLE_CACHE_CONTROL if exact else "no-cache"
+    return response
+
+
+@app.route("/assets/<path:filename>")
+def serve_assets(filename):
+    response = _bundle_response(filename)
+    if response is None:
+        return "Not Found", 404
+    return response
+
+
 @app.route("/js_modules/<path:filename>")
 def serve_js_modules(filename):
+    # schedule.html older than the assets/ links still requests bundles here
+    response = _bundle_response(filename)
+    if response is not None:
+        return response
     return send_from_directory(get_js_modules_dir(), filename)
 
 
@@ -637,6 +688,18 @@ def schedule():
     return response
 
 
+@app.route("/schedule_view")
+@login_required
+def schedule_view_page():
+    """Compact read-only schedule: CSS grid without cells and without editor JS."""
+    html = schedule_view.render_view()
+    if html is None:
+        html = "<html><body><p>Расписание ещё не опубликовано.</p></body></html>"
+    response = app.make_response(html)
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
+
 def _require_lock(login):
     state = lock_manager.get_lock_status()
     if state.get("holder") != login:
@@ -644,21 +707,24 @@ def _require_lock(login):
     return None
 
 
-def _backup_error_response(exc):
+def _backup_error_payload(exc):
     status = getattr(exc, "status_code", 400)
     return (
-        jsonify(
-            {
-                "ok": False,
-                "error": getattr(exc, "message", str(exc)),
-                "code": getattr(exc, "code", "BACKUP_ERROR"),
-            }
-        ),
+        {
+            "ok": False,
+            "error": getattr(exc, "message", str(exc)),
+            "code": getattr(exc, "code", "BACKUP_ERROR"),
+        },
         status,
     )
 
 
-def _restore_manager_error_response(exc):
+def _backup_error_response(exc):
+    payload, status = _backup_error_payload(exc)
+    return jsonify(payload), status
+
+
+def _restore_manager_error_payload(exc):
     status = getattr(exc, "status_code", 400)
     payload = {
         "ok": False,
@@ -666,9 +732,40 @@ def _restore_manager_error_response(exc):
         "code": getattr(exc, "code", "RESTORE_ERROR"),
     }
     payload.update(getattr(exc, "payload", {}) or {})
+    return payload, status
+
+
+def _restore_manager_error_response(exc):
+    payload, status = _restore_manager_error_payload(exc)
     return jsonify(payload), status
 
 
+def _wants_background_job(data=None):
+    """Backup/restore routes run as background jobs on ``?async=1`` or ``"async": true``."""
+    if str(request.args.get("async", "")).lower() in ("1", "true"):
+        return True
+    return isinstance(data, dict) and data.get("async") is True
+
+
+def _job_payload(job):
+    return {
+        **job,
+        "status_url": f"/api/jobs/{job['id']}",
+        "events_url": f"/api/jobs/{job['id']}/events",
+    }
+
+
+def _submit_job_response(kind, user, func, on_reject=None):
+    try:
+        job = background_jobs.submit_job(kind, user["login"], func)
+    except background_jobs.JobQueueFull as exc:
+        if on_reject is not None:
+            on_reject()
+        return jsonify(exc.to_payload()), exc.status_code
+    logger.info("Background job queued: id=%s kind=%s login=%s", job["id"], kind, user["login"])
+    return jsonify({"ok": True, "job": _job_payload(job)}), 202
+
+
 def _restore_in_progress():
     return restore_manager.is_restore_active()
 
@@ -810,21 +907,34 @@ def api_backups_create():
         return _restore_block_response(restore_manager.get_restore_status())
     data = request.get_json(force=True, silent=True) or {}
     user = current_user()
+    comment = data.get("comment", "")
+    if _wants_background_job(data):
+        return _submit_job_response(
+            "backup_create",
+            user,
+            lambda progress: _create_backup_result(user, comment, progress),
+        )
+    payload, status = _create_backup_result(user, comment)
+    return jsonify(payload), status
+
+
+def _create_backup_result(user, comment, progress=None):
     try:
         backup = backup_manager.create_backup(
             user["login"],
             user.get("display_name") or user["login"],
-            comment=data.get("comment", ""),
+            comment=comment,
             backup_kind="manual",
+            progress=progress,
         )
     except backup_manager.BackupError as exc:
-        return _backup_error_response(exc)
+        return _backup_error_payload(exc)
     except ScheduleMutationBusy as exc:
-        return jsonify(exc.to_payload()), exc.status_code
+        return exc.to_payload(), exc.status_code
     except Exception as exc:
         logger.exception("Unexpected backup creation error")
-        return jsonify({"ok": False, "error": str(exc), "code": "BACKUP_CREATE_FAILED"}), 500
-    return jsonify(
+        return {"ok": False, "error": str(exc), "code": "BACKUP_CREATE_FAILED"}, 500
+    return (
         {
             "ok": True,
             "backup": {
@@ -833,7 +943,8 @@ def api_backups_create():
                 "backup_kind": backup["backup_kind"],
                 "download_url": backup["download_url"],
             },
-        }
+        },
+        200,
     )
 
 
@@ -845,25 +956,48 @@ def api_backups_upload():
         return _restore_block_response(restore_manager.get_restore_status())
 
     uploaded_file = request.files.get("file")
+    stream = uploaded_file.stream if uploaded_file is not None else None
+    filename = uploaded_file.filename if uploaded_file is not None else ""
     user = current_user()
-    try:
-        backup = backup_manager.store_uploaded_backup(
-            uploaded_file.stream if uploaded_file is not None else None,
-            uploaded_file.filename if uploaded_file is not None else "",
-            user["login"],
-            user.get("display_name") or user["login"],
+    display_name = user.get("display_name") or user["login"]
+
+    if _wants_background_job():
+        # The request stream is only readable here; validation runs in the job.
+        try:
+            spooled_path = backup_manager.spool_uploaded_backup(stream)
+        except backup_manager.BackupError as exc:
+            return _backup_error_response(exc)
+        return _submit_job_response(
+            "backup_upload",
+            user,
+            lambda progress: _uploaded_backup_result(
+                lambda: backup_manager.store_spooled_backup(
+                    spooled_path, filename, user["login"], display_name, progress=progress
+                )
+            ),
+            on_reject=lambda: backup_manager.discard_spooled_backup(spooled_path),
         )
+
+    payload, status = _uploaded_backup_result(
+        lambda: backup_manager.store_uploaded_backup(stream, filename, user["login"], display_name)
+    )
+    return jsonify(payload), status
+
+
+def _uploaded_backup_result(store):
+    try:
+        backup = store()
     except backup_manager.BackupError as exc:
-        return _backup_error_response(exc)
+        return _backup_error_payload(exc)
     except Exception as exc:
         logger.exception("Unexpected backup upload error")
-        return jsonify({"ok": False, "error": str(exc), "code": "BACKUP_UPLOAD_FAILED"}), 500
+        return {"ok": False, "error": str(exc), "code": "BACKUP_UPLOAD_FAILED"}, 500
 
     warnings = []
     if backup.get("project_root_matches") is False:
         warnings.append("PROJECT_ROOT_MISMATCH")
 
-    return jsonify(
+    return (
         {
             "ok": True,
             "backup": {
@@ -874,7 +1008,8 @@ def api_backups_upload():
                 "download_url": backup["download_url"],
             },
             "warnings": warnings,
-        }
+        },
+        200,
     )
 
 
@@ -886,7 +1021,7 @@ def api_backup_download(backup_id):
         path = backup_manager.get_backup_path(backup_id)
     except backup_manager.BackupError as exc:
         return _backup_error_response(exc)
-    if not os.path.exists(path):
+    if not backup_manager.backup_exists(backup_id):
         return (
             jsonify(
                 {
@@ -898,6 +1033,12 @@ def api_backup_download(backup_id):
             404,
         )
     filename = os.path.basename(path)
+    if not os.path.exists(path):
+        # Deduplicated backups are rebuilt into the regular ZIP format.
+        try:
+            path = io.BytesIO(backup_manager.read_backup_zip_bytes(backup_id))
+        except backup_manager.BackupError as exc:
+            return _backup_error_response(exc)
     return send_file(
         path,
         as_attachment=True,
@@ -906,6 +1047,18 @@ def api_backup_download(backup_id):
     )
 
 
+@app.route("/api/backups/<backup_id>", methods=["DELETE"])
+@login_required
+@role_required("admin")
+def api_backup_delete(backup_id):
+    try:
+        result = backup_manager.delete_backup(backup_id)
+    except backup_manager.BackupError as exc:
+        return _backup_error_response(exc)
+    logger.info("Backup deleted: id=%s blobs_removed=%s", backup_id, result["blobs_removed"])
+    return jsonify({"ok": True, **result})
+
+
 @app.route("/api/backups/<backup_id>/restore", methods=["POST"])
 @login_required
 @role_required("admin")
@@ -940,21 +1093,71 @@ def api_backup_restore(backup_id):
             403,
         )
 
+    allow_foreign_project = data.get("allow_foreign_project") is True
+    if _wants_background_job(data):
+        return _submit_job_response(
+            "restore",
+            user,
+            lambda progress: _restore_backup_result(backup_id, user, allow_foreign_project, progress),
+        )
+    payload, status = _restore_backup_result(backup_id, user, allow_foreign_project)
+    return jsonify(payload), status
+
+
+def _restore_backup_result(backup_id, user, allow_foreign_project, progress=None):
     try:
         result = restore_manager.restore_backup(
             backup_id,
             user["login"],
             user.get("display_name") or user["login"],
-            allow_foreign_project=data.get("allow_foreign_project") is True,
+            allow_foreign_project=allow_foreign_project,
+            progress=progress,
         )
     except restore_manager.RestoreError as exc:
-        return _restore_manager_error_response(exc)
+        return _restore_manager_error_payload(exc)
     except backup_manager.BackupError as exc:
-        return _backup_error_response(exc)
+        return _backup_error_payload(exc)
     except Exception as exc:
         logger.exception("Unexpected restore error")
-        return jsonify({"ok": False, "error": str(exc), "code": "RESTORE_FAILED"}), 500
-    return jsonify(result)
+        return {"ok": False, "error": str(exc), "code": "RESTORE_FAILED"}, 500
+    return result, 200
+
+
+@app.route("/api/jobs/<job_id>", methods=["GET"])
+@login_required
+@role_required("admin")
+def api_job_status(job_id):
+    job = background_jobs.get_job(job_id)
+    if job is None:
+        return jsonify({"ok": False, "error": "Job not found", "code": "JOB_NOT_FOUND"}), 404
+    return jsonify({"ok": True, "job": _job_payload(job)})
+
+
+@app.route("/api/jobs/<job_id>/events", methods=["GET"])
+@login_required
+@role_required("admin")
+def api_job_events(job_id):
+    job = background_jobs.get_job(job_id)
+    if job is None:
+        return jsonify({"ok": False, "error": "Job not found", "code": "JOB_NOT_FOUND"}), 404
+
+    def _stream(current):
+        while True:
+            yield f"event: job\ndata: {json.dumps(_job_payload(current), ensure_ascii=False)}\n\n"
+            if current["status"] in background_jobs.FINISHED_STATES:
+                return
+            seen_version = current["version"]
+            while True:
+                current = background_jobs.wait_for_change(job_id, seen_version, JOB_EVENTS_KEEPALIVE_SECONDS)
+                if current is None:
+                    return
+                if current["version"] != seen_version:
+                    break
+                yield ": keepalive\n\n"
+
+    response = app.response_class(_stream(job), mimetype="text/event-stream")
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
 
 
 @app.route("/api/individual_lessons")
@@ -1054,6 +1257,8 @@ def api_publish_schedule():
                 "code": exc.code,
             }
         ), 400
+    if result.get("changed", True):
+        rooms_report.prewarm_availability()
     return jsonify(
         {
             "ok": True,
@@ -1209,6 +1414,64 @@ def api_delete_block(block_id):
     )
 
 
+_BLOCK_BATCH_ERRORS = {
+    "EXPIRED_TRIAL_PRUNED": ("Block expired and was pruned", "EXPIRED_TRIAL_PRUNED", 404),
+    "NOT_FOUND": ("Block not found", "NOT_FOUND", 404),
+    "FORBIDDEN": ("Forbidden lesson_type", "FORBIDDEN", 403),
+    "FORBIDDEN_EVENT_LEGACY": ("Use /api/events for Veranstaltung blocks", "FORBIDDEN", 403),
+    "EVENT_ROOM_CONFLICT": ("Event room conflict", "EVENT_ROOM_CONFLICT", 409),
+}
+
+
+@app.route("/api/blocks/batch", methods=["POST"])
+@login_required
+def api_block_batch():
+    user = current_user()
+    if user["role"] not in ("admin", "editor", "organizer"):
+        return jsonify({"ok": False, "error": "Forbidden", "code": "FORBIDDEN"}), 403
+    err = _require_lock(user["login"])
+    if err:
+        return jsonify(err), 403
+    data = request.get_json(force=True, silent=True) or {}
+    result = state_manager.apply_block_batch(data.get("operations"), user["role"])
+    results, error = result
+    operations = []
+    for item in results or []:
+        entry = {"index": item["index"], "op": item["op"], "ok": item["ok"]}
+        if item["error"] is not None:
+            message, code, _status = _BLOCK_BATCH_ERRORS.get(
+                item["error"], (item["error"], "VALIDATION_ERROR", 400)
+            )
+            entry.update(error=message, code=code)
+        elif error:
+            # The batch was rolled back: earlier operations succeeded in the
+            # working copy only and nothing they produced was persisted.
+            entry.update(ok=False, code="ROLLED_BACK")
+        elif item["op"] == "delete":
+            entry["deleted"] = True
+        else:
+            entry["block"] = item["value"]
+        operations.append(entry)
+    if error:
+        message, code, status = _BLOCK_BATCH_ERRORS.get(error, (error, "VALIDATION_ERROR", 400))
+        payload = {
+            "ok": False,
+            "error": message,
+            "code": code,
+            "failed_index": results[-1]["index"] if results else None,
+            "operations": operations,
+        }
+        payload.update(_individual_mutation_payload(result))
+        return jsonify(payload), status
+    return jsonify(
+        {
+            "ok": True,
+            "operations": operations,
+            **_individual_mutation_payload(result, include_revision=True),
+        }
+    )
+
+
 @app.route("/api/blocks/<block_id>/convert", methods=["POST"])
 @login_required
 def api_convert_block(block_id):
@@ -1342,6 +1605,7 @@ def health():
             "project_root_id": get_project_root_id(root),
             "host": config["host"],
             "port": config["port"],
+            "server_backend": app.config.get("SCHEDGEN_SERVER_BACKEND"),
         }
     )
 
@@ -1364,19 +1628,21 @@ def export_to_excel():
         )
         logger.info("Размер данных: %s байт", len(schedule_data_json))
 
-        output_file = process_schedule_export_request(schedule_data_json, EXCEL_EXPORTS_DIR)
-        if not output_file or not os.path.exists(output_file):
+        workbook_bytes = export_schedule_bytes(schedule_data_json)
+        if not workbook_bytes:
             logger.error("Не удалось создать Excel-файл")
             return jsonify({"error": "Не удалось создать Excel-файл"}), 500
 
-        logger.info("Файл готов к отправке: %s", output_file)
+        # Книга собирается в памяти (с кэшем), копия сохраняется в excel_exports для GUI.
+        output_file = save_export_bytes(workbook_bytes, EXCEL_EXPORTS_DIR)
+        download_name = os.path.basename(output_file)
         response = send_file(
-            output_file,
+            io.BytesIO(workbook_bytes),
             as_attachment=True,
-            download_name=os.path.basename(output_file),
+            download_name=download_name,
             mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         )
-        logger.info("Excel-файл успешно отправлен: %s", output_file)
+        logger.info("Excel-файл успешно отправлен: %s (%s байт)", download_name, len(workbook_bytes))
         return response
 
     except ExcelExportValidationError as e:
@@ -1454,6 +1720,57 @@ def add_spiski_item_options():
     return response
 
 
+@app.route("/api/export/xlsx", methods=["GET"])
+@login_required
+@role_required("admin")
+def api_export_xlsx():
+    """Excel из опубликованной базы и individual_lessons.json без выгрузки DOM браузером."""
+    base = state_manager.get_base_schedule()
+    if base.get("published_at") is None:
+        # Без опубликованной базы в книге не было бы групповых занятий.
+        return (
+            jsonify(
+                {
+                    "ok": False,
+                    "error": "Base schedule has not been published yet",
+                    "code": "BASE_NOT_PUBLISHED",
+                }
+            ),
+            409,
+        )
+    ind = state_manager.get_individual_lessons()
+    current_revision = state_export_revision(base.get("published_at"), ind.get("last_modified"))
+    expected_revision = request.args.get("revision")
+    if expected_revision is not None and expected_revision != current_revision:
+        return (
+            jsonify(
+                {
+                    "ok": False,
+                    "error": "Schedule revision has changed",
+                    "code": "EXPORT_REVISION_CONFLICT",
+                    "current_revision": current_revision,
+                }
+            ),
+            409,
+        )
+
+    try:
+        output_file, revision = export_state_workbook(base, ind, EXCEL_EXPORTS_DIR)
+    except ExcelExportValidationError as e:
+        logger.warning("Excel export validation failed: %s", e.message)
+        status_code = 422 if e.code == "NO_EXPORTABLE_ROWS" else 400
+        return jsonify({"ok": False, "error": e.message, "code": e.code}), status_code
+
+    response = send_file(
+        output_file,
+        as_attachment=True,
+        download_name=f"schedule_export_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.xlsx",
+        mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    )
+    response.headers["X-Schedule-Revision"] = revision
+    return response
+
+
 @app.route("/export_to_excel", methods=["OPTIONS"])
 def export_to_excel_options():
     return app.make_default_options_response()
@@ -1468,11 +1785,56 @@ def run_server(host=None, port=None, project_root=None):
     port = int(port or config["port"])
     os.environ["HOST"] = str(host)
     os.environ["PORT"] = str(port)
+    state_storage.configure_state_storage(config["storage_backend"], root)
+    state_manager.configure_individual_journal(config["individual_journal"])
+    tv_routes.set_stream_limit(config["tv_streams"])
     logger.info("Запуск Flask-сервера на %s:%s (project_root=%s)", host, port, root)
     if getattr(sys, "stdout", None) is not None:
         print(f"=== Flask export server starting on {host}:{port} ===")
         print(f"=== Log file: {get_server_log_path(root)} ===")
-    app.run(debug=False, host=host, port=port)
+    if config["mode"] == SERVER_MODE_DEVELOPMENT:
+        app.config["SCHEDGEN_SERVER_BACKEND"] = "werkzeug"
+        app.run(debug=False, host=host, port=port)
+        return
+    _serve_production(host, port, config)
+
+
+def _serve_production(host, port, config):
+    """Serve the app through a multithreaded WSGI server.
+
+    Waitress is preferred; without it the Werkzeug server still runs threaded
+    so concurrent browser sessions do not queue behind a single request.
+    TV push streams get their own ``tv_streams`` threads on top of ``threads``
+    so connected screens never starve regular requests.
+    """
+    threads = int(config["threads"]) + int(config["tv_streams"])
+    try:
+        from waitress import serve
+    except ImportError:
+        logger.warning("waitress is not installed; falling back to threaded Werkzeug server")
+        from werkzeug.serving import make_server
+
+        app.config["SCHEDGEN_SERVER_BACKEND"] = "werkzeug-threaded"
+        make_server(host, port, app, threaded=True).serve_forever()
+        return
+
+    app.config["SCHEDGEN_SERVER_BACKEND"] = "waitress"
+    logger.info(
+        "waitress: threads=%s (tv_streams=%s) connection_limit=%s channel_timeout=%s",
+        threads,
+        config["tv_streams"],
+        config["connection_limit"],
+        config["channel_timeout"],
+    )
+    serve(
+        app,
+        host=host,
+        port=port,
+        threads=threads,
+        connection_limit=int(config["connection_limit"]),
+        channel_timeout=int(config["channel_timeout"]),
+        ident="SchedGen",
+    )
 
 
 if __name__ == "__main__":
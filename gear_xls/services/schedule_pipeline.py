@@ -7,7 +7,6 @@
 
 import os
 import logging
-import re
 import uuid
 from typing import Dict, Any, Optional
 
@@ -17,11 +16,13 @@ try:
     from ..schedule_structure import build_schedule_structure
     from ..html_generator import generate_html_schedule
     from ..time_utils import minutes_to_time
+    from ..generators.html_fragment_cache import HTMLFragmentCache
 except ImportError:
     from excel_parser import parse_schedule
     from schedule_structure import build_schedule_structure
     from html_generator import generate_html_schedule
     from time_utils import minutes_to_time
+    from generators.html_fragment_cache import HTMLFragmentCache
 
 
 # Настройка логирования
@@ -31,11 +32,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger('schedule_pipeline')
 
-_HTML_ACTIVITY_BLOCK_PATTERN = re.compile(
-    r"<div(?P<attrs>[^>]*class=['\"][^'\"]*activity-block[^'\"]*['\"][^>]*)>"
-    r"(?P<body>.*?)</div>",
-    re.I | re.S,
-)
+FRAGMENT_CACHE_FILENAME = ".schedule_fragments.json"
 
 
 class SchedulePipelineError(Exception):
@@ -48,40 +45,30 @@ def _resolve_lesson_type(interval: dict) -> str:
     return lesson_type or "group"
 
 
-def _is_embedded_non_group_block(attrs_text: str) -> bool:
-    match = re.search(r"data-lesson-type=['\"]([^'\"]*)['\"]", attrs_text, re.I)
-    lesson_type = (match.group(1).strip().lower() if match else "")
-    if lesson_type and lesson_type != "group":
-        return True
-    class_match = re.search(r"class=['\"]([^'\"]*)['\"]", attrs_text, re.I)
-    classes = class_match.group(1).lower().split() if class_match else []
-    return any(
-        cls in ("lesson-type-individual", "lesson-type-nachhilfe", "lesson-type-trial")
-        for cls in classes
-    )
-
+def group_only_buildings(buildings: dict) -> tuple[dict, int]:
+    """
+    Копия структуры зданий только с групповыми занятиями для отрисовки HTML.
 
-def strip_non_group_activity_blocks_from_html(html: str) -> tuple[str, int]:
+    Колонки и кабинеты (_max_cols, _rooms) остаются рассчитанными по всем
+    занятиям, поэтому сетка совпадает с прежней; индивидуальные блоки
+    подгружаются в браузере из individual_lessons.json.
+    """
+    filtered = {}
     removed_count = 0
-
-    def replace(match):
-        nonlocal removed_count
-        if _is_embedded_non_group_block(match.group("attrs")):
-            removed_count += 1
-            return ""
-        return match.group(0)
-
-    return _HTML_ACTIVITY_BLOCK_PATTERN.sub(replace, html), removed_count
-
-
-def strip_non_group_activity_blocks_from_file(path: str) -> int:
-    with open(path, "r", encoding="utf-8") as f:
-        html = f.read()
-    stripped, removed_count = strip_non_group_activity_blocks_from_html(html)
-    if removed_count:
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(stripped)
-    return removed_count
+    for building, building_data in buildings.items():
+        if str(building).startswith("_") or not isinstance(building_data, dict):
+            filtered[building] = building_data
+            continue
+        building_copy = {}
+        for key, value in building_data.items():
+            if str(key).startswith("_") or not isinstance(value, list):
+                building_copy[key] = value
+                continue
+            group_intervals = [interval for interval in value if _resolve_lesson_type(interval) == "group"]
+            removed_count += len(value) - len(group_intervals)
+            building_copy[key] = group_intervals
+        filtered[building] = building_copy
+    return filtered, removed_count
 
 
 def collect_individual_blocks_from_buildings(buildings: dict) -> list[dict]:
@@ -171,7 +158,10 @@ class SchedulePipeline:
         Args:
             excel_file_path (str): Путь к исходному Excel файлу
             output_dirs (Dict[str, str]): Словарь с путями к директориям вывода
-                                        (должен содержать ключ 'html')
+                                        (должен содержать ключ 'html'; 'cache' —
+                                        каталог кэша фрагментов, по умолчанию 'html';
+                                        'assets' — каталог JS/CSS бандлов, по умолчанию
+                                        assets внутри 'html')
         
         Returns:
             Dict[str, Any]: Словарь с результатами обработки:
@@ -219,12 +209,24 @@ class SchedulePipeline:
             # Этап 3: Генерация HTML
             logger.info("Этап 3: Генерация HTML файла...")
             html_file = os.path.join(output_dirs["html"], "schedule.html")
+            render_buildings, removed_embedded_blocks = group_only_buildings(buildings)
+            if removed_embedded_blocks:
+                logger.info(
+                    "Skipped %d non-group blocks while rendering HTML; "
+                    "they will be initialized from individual_lessons.json",
+                    removed_embedded_blocks,
+                )
+            # Кэш живёт в постоянном каталоге: HTML может собираться во временном
+            cache_dir = output_dirs.get("cache", output_dirs["html"])
+            fragment_cache = HTMLFragmentCache(os.path.join(cache_dir, FRAGMENT_CACHE_FILENAME))
             generate_html_schedule(
-                buildings, 
+                render_buildings, 
                 output_html=html_file, 
                 time_interval=self.time_interval,
                 borderWidth=self.border_width,
-                spiski_data=spiski_data
+                spiski_data=spiski_data,
+                fragment_cache=fragment_cache,
+                bundle_dir=output_dirs.get("assets")
             )
             
             if not os.path.exists(html_file):
@@ -232,20 +234,15 @@ class SchedulePipeline:
             logger.info(f"HTML файл создан: {html_file}")
             
             # Формируем результат
-            removed_embedded_blocks = strip_non_group_activity_blocks_from_file(html_file)
-            if removed_embedded_blocks:
-                logger.info(
-                    "Removed %d embedded non-group blocks from generated HTML; "
-                    "they will be initialized from individual_lessons.json",
-                    removed_embedded_blocks,
-                )
 
             result = {
                 'html_file': html_file,
                 'buildings': buildings,
                 'individual_blocks': individual_blocks,
                 'activities_count': activities_count,
-                'buildings_count': buildings_count
+                'buildings_count': buildings_count,
+                'fragments_rendered': fragment_cache.rendered,
+                'fragments_reused': fragment_cache.reused
             }
             
             logger.info(f"Обработка завершена успешно. Обработано {activities_count} занятий, "
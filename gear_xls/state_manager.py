@@ -31,6 +31,9 @@ from gear_xls.event_domain import (
     ROLE_EVENT_MANAGER,
 )
 from gear_xls.event_room_config import is_event_room
+from gear_xls import individual_journal
+from gear_xls import state_storage
+from gear_xls.room_interval_index import TIME_PATTERN, RoomIntervalIndex
 from gear_xls.room_name_utils import normalize_room_fields
 from gear_xls.schedule_mutation_coordinator import schedule_mutation
 from gear_xls.schedule_state_errors import OccupancyUnavailable, ScheduleStateReadError
@@ -59,12 +62,20 @@ SCHEDULE_HTML_PATH = get_schedule_html_path()
 VALID_DAYS = WEB_EDITOR_DAY_SET
 _DAY_TO_WEEKDAY = DAY_TO_WEEKDAY
 _ISO_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
-_TIME_PATTERN = re.compile(r"^(?:[01]?\d|2[0-3]):[0-5]\d$")
 _EVENT_TARGET_MAX_LENGTH = 500
 _EVENT_GRID_START_MINUTES = 9 * 60
 _EVENT_GRID_END_MINUTES = 20 * 60
 _ind_mutex = threading.Lock()
 logger = logging.getLogger(__name__)
+INDIVIDUAL_JOURNAL_COMPACT_BYTES = 256 * 1024
+DEFAULT_JOURNAL_COMPACT_INTERVAL_SECONDS = 60.0
+MAX_BLOCK_BATCH_OPERATIONS = 500
+_journal_enabled = False
+# Snapshot digest, journal presence and block baseline from the last read made
+# under the individual file lock; the next journal append diffs against it.
+_journal_baseline = {"digest": None, "active": False, "blocks": None}
+_journal_compact_wakeup = threading.Event()
+_journal_compactor = None
 _HTML_BLOCK_PATTERN = re.compile(
     r"<div(?P<attrs>[^>]*class=['\"][^'\"]*activity-block[^'\"]*['\"][^>]*)>(?P<body>.*?)</div>",
     re.I | re.S,
@@ -134,19 +145,55 @@ def _locked_individual_file():
             _release_file_lock(lock_fp, backend)
 
 
+def _individual_journal_path():
+    return individual_journal.journal_path_for(INDIVIDUAL_LESSONS_PATH)
+
+
+def _individual_store():
+    return state_storage.store_for_path(INDIVIDUAL_LESSONS_PATH)
+
+
 def _read_individual():
+    stored = _individual_store()
+    if stored is not None:
+        _journal_baseline.update(active=False, blocks=None)
+        store, document = stored
+        data = store.read_document(document)
+        return _empty_state() if data is None else _validate_individual_data(data)
+    journal_path = _individual_journal_path()
+    track_journal = _journal_enabled or os.path.exists(journal_path)
+    state = _read_individual_snapshot(track_journal)
+    if not track_journal:
+        return state
+    records = individual_journal.read_journal(journal_path, _journal_baseline["digest"])
+    _journal_baseline["active"] = records is not None
+    if records:
+        individual_journal.apply_records(state, records)
+    if _journal_enabled:
+        _journal_baseline["blocks"] = individual_journal.baseline_blocks(state["blocks"])
+    return state
+
+
+def _read_individual_snapshot(track_journal=False):
+    _journal_baseline.update(digest=individual_journal.snapshot_sha256(b""), active=False, blocks=None)
     if not os.path.exists(INDIVIDUAL_LESSONS_PATH):
         return _empty_state()
     try:
-        with open(INDIVIDUAL_LESSONS_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(INDIVIDUAL_LESSONS_PATH, "rb") as f:
+            raw = f.read()
+        if track_journal:
+            _journal_baseline["digest"] = individual_journal.snapshot_sha256(raw)
+        data = json.loads(raw.decode("utf-8"))
     except Exception as exc:
         logger.warning("Failed to read individual lessons: %s", exc)
         raise ScheduleStateReadError(
             "individual_lessons.json is not valid JSON",
             "INDIVIDUAL_STATE_CORRUPT",
         ) from exc
+    return _validate_individual_data(data)
 
+
+def _validate_individual_data(data):
     if not isinstance(data, dict):
         raise ScheduleStateReadError(
             "individual_lessons.json must be a JSON object",
@@ -177,6 +224,11 @@ def get_individual_lessons_strict():
 
 
 def _write_individual_payload(payload):
+    stored = _individual_store()
+    if stored is not None:
+        store, document = stored
+        store.write_document(document, payload)
+        return
     os.makedirs(os.path.dirname(INDIVIDUAL_LESSONS_PATH), exist_ok=True)
     tmp_path = None
     try:
@@ -190,6 +242,8 @@ def _write_individual_payload(payload):
             json.dump(payload, tmp, ensure_ascii=False, indent=2)
             tmp_path = tmp.name
         os.replace(tmp_path, INDIVIDUAL_LESSONS_PATH)
+        individual_journal.remove_journal(_individual_journal_path())
+        _journal_baseline.update(active=False, blocks=None)
     finally:
         if tmp_path and os.path.exists(tmp_path):
             try:
@@ -224,10 +278,73 @@ def _write_individual(state):
         "last_modified": datetime.utcnow().isoformat(),
         "blocks": state.get("blocks", []),
     }
-    _write_individual_payload(payload)
+    journal = _journal_enabled and _individual_store() is None
+    if not (journal and _append_individual_journal(payload)):
+        _write_individual_payload(payload)
     state["last_modified"] = payload["last_modified"]
 
 
+def _append_individual_journal(payload):
+    record = individual_journal.build_record(
+        _journal_baseline["blocks"],
+        payload["blocks"],
+        payload["last_modified"],
+    )
+    if record is None:
+        return False
+    size = individual_journal.append_record(
+        _individual_journal_path(),
+        record,
+        snapshot_digest=_journal_baseline["digest"],
+        start_new=not _journal_baseline["active"],
+    )
+    _journal_baseline.update(active=True, blocks=individual_journal.baseline_blocks(payload["blocks"]))
+    if size >= INDIVIDUAL_JOURNAL_COMPACT_BYTES:
+        _journal_compact_wakeup.set()
+    return True
+
+
+def compact_individual_journal():
+    """Fold the journal into ``individual_lessons.json``; return True if it ran."""
+
+    with schedule_mutation("individual_journal_compact"):
+        with _ind_mutex:
+            with _locked_individual_file():
+                state = _read_individual()
+                if not _journal_baseline["active"]:
+                    return False
+                _write_individual_payload(
+                    {"last_modified": state.get("last_modified"), "blocks": state.get("blocks", [])}
+                )
+                return True
+
+
+def _journal_compactor_loop(interval_seconds):
+    while True:
+        _journal_compact_wakeup.wait(interval_seconds)
+        _journal_compact_wakeup.clear()
+        try:
+            if compact_individual_journal():
+                logger.info("Compacted individual lessons journal")
+        except Exception as exc:
+            logger.warning("Individual journal compaction skipped: %s", exc)
+
+
+def configure_individual_journal(enabled, compact_interval_seconds=DEFAULT_JOURNAL_COMPACT_INTERVAL_SECONDS):
+    """Switch journal mode and start the background compactor once."""
+
+    global _journal_enabled, _journal_compactor
+    _journal_enabled = bool(enabled)
+    if _journal_enabled and _journal_compactor is None:
+        _journal_compactor = threading.Thread(
+            target=_journal_compactor_loop,
+            args=(float(compact_interval_seconds),),
+            name="individual-journal-compactor",
+            daemon=True,
+        )
+        _journal_compactor.start()
+
+
 def _pristine_individual_state(state):
     return state.get("last_modified") is None and not state.get("blocks")
 
@@ -419,7 +536,7 @@ def _parse_iso_date_or_none(value):
 
 
 def _parse_time_minutes(value):
-    if not isinstance(value, str) or not _TIME_PATTERN.fullmatch(value.strip()):
+    if not isinstance(value, str) or not TIME_PATTERN.fullmatch(value.strip()):
         return None
     hours, minutes = value.strip().split(":", 1)
     return int(hours) * 60 + int(minutes)
@@ -794,12 +911,6 @@ def _block_time_interval(block, *, state_code):
     return start, end
 
 
-def _half_open_overlap(candidate, existing):
-    candidate_start, candidate_end = _block_time_interval(candidate, state_code="INDIVIDUAL_STATE_CORRUPT")
-    existing_start, existing_end = _block_time_interval(existing, state_code="INDIVIDUAL_STATE_CORRUPT")
-    return candidate_start < existing_end and existing_start < candidate_end
-
-
 def _same_room_day(left, right):
     left_norm = normalize_room_fields(left)
     right_norm = normalize_room_fields(right)
@@ -811,6 +922,8 @@ def _same_room_day(left, right):
 
 
 def _find_room_time_conflict(candidate, blocks, *, exclude_id=None, allowed_types=None, state_code="INDIVIDUAL_STATE_CORRUPT"):
+    # Single query against one snapshot: a linear scan is cheaper than building
+    # a RoomIntervalIndex that would be used once and thrown away.
     for block in blocks or []:
         if not isinstance(block, dict):
             continue
@@ -851,6 +964,23 @@ def _validate_saved_event_conflict_for_legacy(block, state, *, exclude_id=None):
     return "EVENT_ROOM_CONFLICT" if conflict else None
 
 
+def _find_event_mutation_conflict(event, state, group_blocks, *, exclude_id=None):
+    conflict = _find_room_time_conflict(
+        event,
+        state.get("blocks", []),
+        exclude_id=exclude_id,
+        allowed_types={"individual", "nachhilfe", "trial", LESSON_TYPE_EVENT},
+    )
+    if conflict:
+        return conflict
+    return _find_room_time_conflict(
+        event,
+        group_blocks,
+        allowed_types={"group"},
+        state_code="BASE_SCHEDULE_CORRUPT",
+    )
+
+
 def _read_group_occupancy_blocks_for_event_mutation():
     from gear_xls.base_schedule_manager import get_base_schedule_strict
     from gear_xls.group_occupancy_snapshot import get_occupancy_readiness
@@ -1007,18 +1137,7 @@ def create_event(payload, actor, author):
                     return _validation_event_result(error, state=state)
 
                 group_blocks, _source = _read_group_occupancy_blocks_for_event_mutation()
-                conflict = _find_room_time_conflict(
-                    event,
-                    state.get("blocks", []),
-                    allowed_types={"individual", "nachhilfe", "trial", LESSON_TYPE_EVENT},
-                )
-                if not conflict:
-                    conflict = _find_room_time_conflict(
-                        event,
-                        group_blocks,
-                        allowed_types={"group"},
-                        state_code="BASE_SCHEDULE_CORRUPT",
-                    )
+                conflict = _find_event_mutation_conflict(event, state, group_blocks)
                 if conflict:
                     return _event_room_conflict_result(conflict, state=state)
 
@@ -1066,19 +1185,12 @@ def update_event(block_id, payload, actor):
                         return _validation_event_result(error, state=state)
 
                     group_blocks, _source = _read_group_occupancy_blocks_for_event_mutation()
-                    conflict = _find_room_time_conflict(
+                    conflict = _find_event_mutation_conflict(
                         event,
-                        state.get("blocks", []),
+                        state,
+                        group_blocks,
                         exclude_id=block_id,
-                        allowed_types={"individual", "nachhilfe", "trial", LESSON_TYPE_EVENT},
                     )
-                    if not conflict:
-                        conflict = _find_room_time_conflict(
-                            event,
-                            group_blocks,
-                            allowed_types={"group"},
-                            state_code="BASE_SCHEDULE_CORRUPT",
-                        )
                     if conflict:
                         return _event_room_conflict_result(conflict, state=state)
 
@@ -1134,17 +1246,13 @@ def _clone_event_blocks(blocks):
 
 
 def find_room_time_conflict_with_events(candidate_blocks, event_blocks):
-    events = _clone_event_blocks(event_blocks)
+    events = RoomIntervalIndex(_clone_event_blocks(event_blocks))
     for candidate in candidate_blocks or []:
         if not isinstance(candidate, dict):
             continue
         if (candidate.get("lesson_type") or "group") != "group":
             continue
-        conflict = _find_room_time_conflict(
-            normalize_room_fields(candidate),
-            events,
-            allowed_types={LESSON_TYPE_EVENT},
-        )
+        conflict = events.find_conflict(candidate, allowed_types={LESSON_TYPE_EVENT})
         if conflict:
             return {
                 "candidate": {
@@ -1225,25 +1333,61 @@ def get_individual_revision(prune_expired=True):
             return _read_individual().get("last_modified")
 
 
+def _apply_block_add(state, block, role):
+    new_block = _normalize_block(block)
+    error = (
+        _validate_block(new_block, role)
+        or _validate_trial_not_expired_for_write(new_block)
+        or _validate_saved_event_conflict_for_legacy(new_block, state)
+    )
+    if error:
+        return None, error
+    new_block["id"] = str(uuid.uuid4())
+    state["blocks"].append(new_block)
+    return new_block, None
+
+
+def _apply_block_update(state, block_id, updates, role, cleanup):
+    for index, block in enumerate(state["blocks"]):
+        if block.get("id") != block_id:
+            continue
+        if block.get("lesson_type") == LESSON_TYPE_EVENT:
+            return None, "FORBIDDEN_EVENT_LEGACY"
+        merged = dict(block)
+        merged.update(_normalize_block(updates))
+        merged["id"] = block_id
+        error = (
+            _validate_block(merged, role)
+            or _validate_trial_not_expired_for_write(merged)
+            or _validate_saved_event_conflict_for_legacy(merged, state, exclude_id=block_id)
+        )
+        if error:
+            return None, error
+        state["blocks"][index] = merged
+        return merged, None
+    return None, "EXPIRED_TRIAL_PRUNED" if block_id in cleanup.get("removed_ids", []) else "NOT_FOUND"
+
+
+def _apply_block_delete(state, block_id, role, cleanup):
+    target = next((b for b in state["blocks"] if b.get("id") == block_id), None)
+    if target is None:
+        return False, "EXPIRED_TRIAL_PRUNED" if block_id in cleanup.get("removed_ids", []) else None
+    if target.get("lesson_type") == LESSON_TYPE_EVENT:
+        return False, "FORBIDDEN_EVENT_LEGACY"
+    if role == "organizer" and target.get("lesson_type") != "trial":
+        return False, "FORBIDDEN"
+    state["blocks"] = [b for b in state["blocks"] if b.get("id") != block_id]
+    return True, None
+
+
 def add_block(block, role):
     with schedule_mutation("individual_block_add"):
         with _ind_mutex:
             with _locked_individual_file():
                 state = _read_individual()
                 cleanup = _prepare_individual_state_for_lifecycle(state)
-                new_block = _normalize_block(block)
-                error = _validate_block(new_block, role)
-                if error:
-                    return _finish_mutation(None, error, state, cleanup, cleanup["changed"])
-                error = _validate_trial_not_expired_for_write(new_block)
-                if error:
-                    return _finish_mutation(None, error, state, cleanup, cleanup["changed"])
-                error = _validate_saved_event_conflict_for_legacy(new_block, state)
-                if error:
-                    return _finish_mutation(None, error, state, cleanup, cleanup["changed"])
-                new_block["id"] = str(uuid.uuid4())
-                state["blocks"].append(new_block)
-                return _finish_mutation(new_block, None, state, cleanup, True)
+                new_block, error = _apply_block_add(state, block, role)
+                return _finish_mutation(new_block, error, state, cleanup, error is None or cleanup["changed"])
 
 
 def update_block(block_id, updates, role):
@@ -1252,27 +1396,12 @@ def update_block(block_id, updates, role):
             with _locked_individual_file():
                 state = _read_individual()
                 cleanup = _prepare_individual_state_for_lifecycle(state)
-                for index, block in enumerate(state["blocks"]):
-                    if block.get("id") != block_id:
-                        continue
-                    if block.get("lesson_type") == LESSON_TYPE_EVENT:
-                        return _finish_mutation(None, "FORBIDDEN_EVENT_LEGACY", state, cleanup, cleanup["changed"])
-                    merged = dict(block)
-                    merged.update(_normalize_block(updates))
-                    merged["id"] = block_id
-                    error = _validate_block(merged, role)
-                    if error:
-                        return _finish_mutation(None, error, state, cleanup, cleanup["changed"])
-                    error = _validate_trial_not_expired_for_write(merged)
-                    if error:
-                        return _finish_mutation(None, error, state, cleanup, cleanup["changed"])
-                    error = _validate_saved_event_conflict_for_legacy(merged, state, exclude_id=block_id)
-                    if error:
-                        return _finish_mutation(None, error, state, cleanup, cleanup["changed"])
-                    state["blocks"][index] = merged
-                    return _finish_mutation(merged, None, state, cleanup, True)
-                error = "EXPIRED_TRIAL_PRUNED" if block_id in cleanup.get("removed_ids", []) else "NOT_FOUND"
-                return _finish_mutation(None, error, state, cleanup, cleanup["removed"] > 0)
+                merged, error = _apply_block_update(state, block_id, updates, role, cleanup)
+                if error in ("EXPIRED_TRIAL_PRUNED", "NOT_FOUND"):
+                    should_write = cleanup["removed"] > 0
+                else:
+                    should_write = error is None or cleanup["changed"]
+                return _finish_mutation(merged, error, state, cleanup, should_write)
 
 
 def delete_block(block_id, role=None):
@@ -1281,16 +1410,65 @@ def delete_block(block_id, role=None):
             with _locked_individual_file():
                 state = _read_individual()
                 cleanup = _prepare_individual_state_for_lifecycle(state)
-                target = next((b for b in state["blocks"] if b.get("id") == block_id), None)
-                if target is None:
-                    error = "EXPIRED_TRIAL_PRUNED" if block_id in cleanup.get("removed_ids", []) else None
-                    return _finish_mutation(False, error, state, cleanup, cleanup["changed"])
-                if target.get("lesson_type") == LESSON_TYPE_EVENT:
-                    return _finish_mutation(False, "FORBIDDEN_EVENT_LEGACY", state, cleanup, cleanup["changed"])
-                if role == "organizer" and target.get("lesson_type") != "trial":
-                    return _finish_mutation(False, "FORBIDDEN", state, cleanup, cleanup["changed"])
-                state["blocks"] = [b for b in state["blocks"] if b.get("id") != block_id]
-                return _finish_mutation(True, None, state, cleanup, True)
+                deleted, error = _apply_block_delete(state, block_id, role, cleanup)
+                return _finish_mutation(deleted, error, state, cleanup, deleted or cleanup["changed"])
+
+
+def _apply_block_operation(state, operation, role, cleanup):
+    if not isinstance(operation, dict):
+        return None, "operation must be an object"
+    op = operation.get("op")
+    block_id = operation.get("id")
+    if op == "add":
+        block = operation.get("block")
+        if not isinstance(block, dict):
+            return None, "block must be an object"
+        return _apply_block_add(state, block, role)
+    if op not in ("update", "delete"):
+        return None, "op must be add, update or delete"
+    if not isinstance(block_id, str) or not block_id:
+        return None, "id required"
+    if op == "update":
+        updates = operation.get("block")
+        if not isinstance(updates, dict):
+            return None, "block must be an object"
+        return _apply_block_update(state, block_id, updates, role, cleanup)
+    deleted, error = _apply_block_delete(state, block_id, role, cleanup)
+    if not deleted and error is None:
+        error = "NOT_FOUND"
+    return deleted, error
+
+
+def apply_block_batch(operations, role):
+    """Apply add/update/delete operations atomically with a single write.
+
+    ``operations`` is a list of ``{"op": "add", "block": {...}}``,
+    ``{"op": "update", "id": ..., "block": {...}}`` or
+    ``{"op": "delete", "id": ...}``.  Each operation sees the effects of the
+    previous ones.  The first failing operation aborts the batch: nothing but
+    lifecycle cleanup is written and ``error`` carries that operation's error.
+    ``value`` is the list of per-operation results up to and including it.
+    """
+
+    if not isinstance(operations, list) or not operations:
+        return _mutation_result([], "operations must be a non-empty list", None, None)
+    if len(operations) > MAX_BLOCK_BATCH_OPERATIONS:
+        return _mutation_result([], f"at most {MAX_BLOCK_BATCH_OPERATIONS} operations per batch", None, None)
+    with schedule_mutation("individual_block_batch"):
+        with _ind_mutex:
+            with _locked_individual_file():
+                state = _read_individual()
+                cleanup = _prepare_individual_state_for_lifecycle(state)
+                working = {"last_modified": state.get("last_modified"), "blocks": list(state["blocks"])}
+                results = []
+                for index, operation in enumerate(operations):
+                    value, error = _apply_block_operation(working, operation, role, cleanup)
+                    op = operation.get("op") if isinstance(operation, dict) else None
+                    results.append({"index": index, "op": op, "ok": error is None, "value": value, "error": error})
+                    if error is not None:
+                        return _finish_mutation(results, error, state, cleanup, cleanup["changed"])
+                state["blocks"] = working["blocks"]
+                return _finish_mutation(results, None, state, cleanup, True)
 
 
 def convert_block_to_regular(block_id, role):
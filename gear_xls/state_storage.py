@@ -0,0 +1,345 @@
+"""Optional SQLite storage backend for the web editor state documents.
+
+The JSON files under ``schedule_state`` remain the default.  With
+``"storage_backend": "sqlite"`` in ``server.json`` the base schedule,
+individual lessons, edit lock and group occupancy snapshot live in one SQLite
+database in WAL mode instead:
+
+- every block is a row keyed by its block id (blocks without a unique id
+  fall back to their position), with its normalized building, day, room and
+  start time in indexed columns next to the JSON payload;
+- a write only touches rows whose payload changed, inside one transaction;
+  deleting or appending blocks leaves the other rows untouched, positions are
+  renumbered only when the block order itself changes;
+- readers never wait for writers.
+
+The state managers keep their public APIs and their JSON document shapes;
+they consult :func:`store_for_path` and fall back to the JSON files whenever
+the path they were asked to use is not the one the store was configured for
+(tests and regeneration into another state directory rely on that).
+Regeneration runs in its own process and calls :func:`ensure_state_storage`
+first, so a SQLite-mode install receives the regenerated state in the database.
+``export_json_documents``/``import_json_documents`` convert between both
+formats, so backups keep the existing ZIP layout.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any
+
+from gear_xls import individual_journal
+from gear_xls.room_interval_index import room_day_key
+from gear_xls.runtime_paths import (
+    STORAGE_BACKEND_SQLITE,
+    get_base_schedule_path,
+    get_group_occupancy_snapshot_path,
+    get_individual_lessons_path,
+    get_lock_json_path,
+    get_state_db_path,
+)
+
+
+DOC_BASE_SCHEDULE = "base_schedule"
+DOC_INDIVIDUAL_LESSONS = "individual_lessons"
+DOC_LOCK = "lock"
+DOC_GROUP_OCCUPANCY = "group_occupancy_snapshot"
+# Documents whose "blocks" list is stored row by row; the lock has no blocks.
+BLOCK_DOCUMENTS = (DOC_BASE_SCHEDULE, DOC_INDIVIDUAL_LESSONS, DOC_GROUP_OCCUPANCY)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    name TEXT PRIMARY KEY,
+    meta TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS document_blocks (
+    document TEXT NOT NULL,
+    row_key TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    building TEXT NOT NULL,
+    day TEXT NOT NULL,
+    room TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (document, row_key)
+);
+CREATE INDEX IF NOT EXISTS document_blocks_position
+    ON document_blocks (document, position);
+CREATE INDEX IF NOT EXISTS document_blocks_room_time
+    ON document_blocks (document, building, day, room, start_time);
+"""
+
+logger = logging.getLogger(__name__)
+_store_mutex = threading.Lock()
+_active_store: "SQLiteStateStore | None" = None
+
+
+def _payload(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def _room_time(block: Any) -> tuple[str, str, str, str]:
+    """Indexed columns of one block: normalized building, day, room and start."""
+
+    if not isinstance(block, dict):
+        return "", "", "", ""
+    building, day, room = room_day_key(block)
+    return building, day, room, str(block.get("start_time") or "").strip()
+
+
+def _row_keys(blocks: list[Any]) -> list[str]:
+    """Row key per block: its id when unique in the document, else its position."""
+
+    ids = [block.get("id") if isinstance(block, dict) else None for block in blocks]
+    counts: dict[str, int] = {}
+    for block_id in ids:
+        if block_id is not None:
+            counts[str(block_id)] = counts.get(str(block_id), 0) + 1
+    return [
+        f"id:{block_id}" if block_id is not None and counts[str(block_id)] == 1 else f"pos:{position}"
+        for position, block_id in enumerate(ids)
+    ]
+
+
+class SQLiteStateStore:
+    """Document store over one SQLite database with per-thread connections."""
+
+    def __init__(self, db_path: str, document_paths: dict[str, str]):
+        self.db_path = db_path
+        self._document_paths = {
+            os.path.normcase(os.path.abspath(path)): name
+            for name, path in document_paths.items()
+        }
+        self._json_paths = dict(document_paths)
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._connection().executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+        return conn
+
+    def _transaction(self):
+        store = self
+
+        class _Tx:
+            def __enter__(self_inner):
+                self_inner.conn = store._connection()
+                self_inner.conn.execute("BEGIN IMMEDIATE")
+                return self_inner.conn
+
+            def __exit__(self_inner, exc_type, exc, tb):
+                if exc_type is None:
+                    self_inner.conn.execute("COMMIT")
+                else:
+                    self_inner.conn.execute("ROLLBACK")
+                return False
+
+        return _Tx()
+
+    def document_for_path(self, path: str | None) -> str | None:
+        if not path:
+            return None
+        return self._document_paths.get(os.path.normcase(os.path.abspath(path)))
+
+    def has_document(self, name: str) -> bool:
+        row = self._connection().execute("SELECT 1 FROM documents WHERE name = ?", (name,)).fetchone()
+        return row is not None
+
+    def document_meta(self, name: str) -> str | None:
+        """Return the stored non-block fields (revision, timestamps) as JSON text."""
+
+        row = self._connection().execute("SELECT meta FROM documents WHERE name = ?", (name,)).fetchone()
+        return None if row is None else row[0]
+
+    def read_document(self, name: str) -> dict[str, Any] | None:
+        """Return the JSON-shaped document, or ``None`` when it was never written."""
+
+        conn = self._connection()
+        conn.execute("BEGIN")
+        try:
+            row = conn.execute("SELECT meta FROM documents WHERE name = ?", (name,)).fetchone()
+            if row is None:
+                return None
+            document = json.loads(row[0])
+            if name in BLOCK_DOCUMENTS:
+                document["blocks"] = [
+                    json.loads(payload)
+                    for (payload,) in conn.execute(
+                        "SELECT payload FROM document_blocks WHERE document = ? ORDER BY position",
+                        (name,),
+                    )
+                ]
+            return document
+        finally:
+            conn.execute("COMMIT")
+
+    def write_document(self, name: str, document: dict[str, Any]) -> None:
+        with self._transaction() as conn:
+            self._write_document(conn, name, document)
+
+    def delete_document(self, name: str) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM documents WHERE name = ?", (name,))
+            conn.execute("DELETE FROM document_blocks WHERE document = ?", (name,))
+
+    @staticmethod
+    def _write_document(conn: sqlite3.Connection, name: str, document: dict[str, Any]) -> None:
+        meta = {key: value for key, value in document.items() if key != "blocks"}
+        conn.execute(
+            "INSERT INTO documents (name, meta) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET meta = excluded.meta",
+            (name, _payload(meta)),
+        )
+        if name not in BLOCK_DOCUMENTS:
+            return
+        blocks = list(document.get("blocks") or [])
+        keys = _row_keys(blocks)
+        existing = {
+            row_key: (position, payload)
+            for row_key, position, payload in conn.execute(
+                "SELECT row_key, position, payload FROM document_blocks WHERE document = ?",
+                (name,),
+            )
+        }
+        stale = set(existing) - set(keys)
+        if stale:
+            conn.executemany(
+                "DELETE FROM document_blocks WHERE document = ? AND row_key = ?",
+                [(name, row_key) for row_key in stale],
+            )
+
+        # Keep stored positions while surviving rows stay in order and new rows
+        # are only appended; renumber everything when the order itself changed.
+        last_stored = max((existing[row_key][0] for row_key in keys if row_key in existing), default=-1)
+        positions = []
+        previous = -1
+        appending = False
+        for row_key in keys:
+            stored = existing.get(row_key)
+            if stored is None:
+                appending = True
+                previous = max(previous, last_stored) + 1
+            elif appending or stored[0] <= previous:
+                positions = list(range(len(keys)))
+                break
+            else:
+                previous = stored[0]
+            positions.append(previous)
+
+        for row_key, position, block in zip(keys, positions, blocks):
+            payload = _payload(block)
+            if existing.get(row_key) == (position, payload):
+                continue
+            conn.execute(
+                "INSERT OR REPLACE INTO document_blocks "
+                "(document, row_key, position, building, day, room, start_time, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (name, row_key, position, *_room_time(block), payload),
+            )
+
+    def import_json_documents(self, *, overwrite: bool = False) -> list[str]:
+        """Load the existing JSON files into the database; return imported names."""
+
+        imported = []
+        for name, path in self._json_paths.items():
+            if not os.path.exists(path) or (not overwrite and self.has_document(name)):
+                continue
+            with open(path, "rb") as handle:
+                raw = handle.read()
+            data = json.loads(raw.decode("utf-8"))
+            if not isinstance(data, dict):
+                logger.warning("Skipping SQLite import of %s: not a JSON object", path)
+                continue
+            if name == DOC_INDIVIDUAL_LESSONS:
+                records = individual_journal.read_journal(
+                    individual_journal.journal_path_for(path),
+                    individual_journal.snapshot_sha256(raw),
+                )
+                if records:
+                    individual_journal.apply_records(data, records)
+            self.write_document(name, data)
+            imported.append(name)
+        return imported
+
+    def export_json_documents(self, target_dir: str | None = None) -> list[str]:
+        """Write every stored document back to its JSON file (or into ``target_dir``)."""
+
+        written = []
+        for name, path in self._json_paths.items():
+            document = self.read_document(name)
+            if document is None:
+                continue
+            target = os.path.join(target_dir, os.path.basename(path)) if target_dir else path
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            tmp_path = target + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(document, handle, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, target)
+            written.append(target)
+        return written
+
+
+def _document_paths(project_root: str | None = None) -> dict[str, str]:
+    return {
+        DOC_BASE_SCHEDULE: get_base_schedule_path(project_root),
+        DOC_INDIVIDUAL_LESSONS: get_individual_lessons_path(project_root),
+        DOC_LOCK: get_lock_json_path(project_root),
+        DOC_GROUP_OCCUPANCY: get_group_occupancy_snapshot_path(project_root),
+    }
+
+
+def configure_state_storage(backend: str, project_root: str | None = None) -> SQLiteStateStore | None:
+    """Select the storage backend; the first SQLite start migrates the JSON files."""
+
+    global _active_store
+    with _store_mutex:
+        if backend != STORAGE_BACKEND_SQLITE:
+            _active_store = None
+            return None
+        store = SQLiteStateStore(get_state_db_path(project_root), _document_paths(project_root))
+        imported = store.import_json_documents()
+        if imported:
+            logger.info("Imported JSON state into SQLite: %s", ", ".join(imported))
+        _active_store = store
+        return store
+
+
+def ensure_state_storage(project_root: str | None = None) -> SQLiteStateStore | None:
+    """Configure the backend from ``server.json`` unless this process already did.
+
+    Used by processes other than the server (regeneration), so their writes
+    land in the same backend the server reads.
+    """
+
+    if _active_store is not None:
+        return _active_store
+    from gear_xls.runtime_paths import load_server_config
+
+    return configure_state_storage(load_server_config(project_root)["storage_backend"], project_root)
+
+
+def get_state_store() -> SQLiteStateStore | None:
+    return _active_store
+
+
+def store_for_path(path: str | None) -> tuple[SQLiteStateStore, str] | None:
+    """Return ``(store, document)`` when ``path`` is served by the SQLite store."""
+
+    store = _active_store
+    if store is None:
+        return None
+    name = store.document_for_path(path)
+    if name is None:
+        return None
+    return store, name
@@ -8,6 +8,7 @@
   var RESTORE_EDIT_MODE_MESSAGE =
     "Для восстановления сначала нажмите «Начать редактирование».";
   var STATUS_POLL_MS = 5000;
+  var JOB_POLL_MS = 1000;
 
   var restorePollTimer = null;
   var knownRestoreGeneration = null;
@@ -185,8 +186,8 @@
 
     requestJson("/api/backups", {
       method: "POST",
-      body: { comment: comment || "", download: !!download },
-    }).then(function (result) {
+      body: { comment: comment || "", download: !!download, async: true },
+    }).then(awaitJobResult).then(function (result) {
       var backup;
 
       setButtonBusy(createButton, false);
@@ -420,10 +421,10 @@
     uploadButton.disabled = true;
     modal.setStatus("Загрузка ZIP...");
 
-    requestJson("/api/backups/upload", {
+    requestJson("/api/backups/upload?async=1", {
       method: "POST",
       formData: formData,
-    }).then(function (result) {
+    }).then(awaitJobResult).then(function (result) {
       var backupId = null;
 
       state.uploading = false;
@@ -482,8 +483,9 @@
       body: {
         confirm: true,
         allow_foreign_project: allowForeign === true,
+        async: true,
       },
-    }).then(function (result) {
+    }).then(awaitJobResult).then(function (result) {
       state.restoring = false;
       updateRestoreButton();
 
@@ -875,6 +877,73 @@
       });
   }
 
+  function awaitJobResult(result) {
+    if (!result || result.response.status !== 202 || !result.data || !result.data.job) {
+      return Promise.resolve(result);
+    }
+    return followJob(result.data.job);
+  }
+
+  function jobResult(job) {
+    var statusCode = job.status_code || 500;
+
+    return {
+      response: { ok: statusCode >= 200 && statusCode < 300, status: statusCode },
+      data: job.result || {},
+    };
+  }
+
+  function isJobFinished(job) {
+    return job && (job.status === "succeeded" || job.status === "failed");
+  }
+
+  function followJob(job) {
+    return new Promise(function (resolve) {
+      var source;
+
+      function poll() {
+        requestJson(job.status_url, {
+          method: "GET",
+          suppressRestoreHandling: true,
+        }).then(function (result) {
+          if (!result || !result.response.ok || !result.data.job) {
+            resolve(null);
+            return;
+          }
+          if (isJobFinished(result.data.job)) {
+            resolve(jobResult(result.data.job));
+            return;
+          }
+          window.setTimeout(poll, JOB_POLL_MS);
+        });
+      }
+
+      if (typeof window.EventSource !== "function" || !job.events_url) {
+        poll();
+        return;
+      }
+
+      source = new window.EventSource(job.events_url);
+      source.addEventListener("job", function (event) {
+        var current;
+
+        try {
+          current = JSON.parse(event.data);
+        } catch (error) {
+          return;
+        }
+        if (isJobFinished(current)) {
+          source.close();
+          resolve(jobResult(current));
+        }
+      });
+      source.onerror = function () {
+        source.close();
+        poll();
+      };
+    });
+  }
+
   function errorMessage(data, fallback) {
     if (!data) {
       return fallback;
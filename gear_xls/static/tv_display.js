@@ -0,0 +1,130 @@
+var TV_DEFAULT_INTERVAL_SECONDS = 20;
+var TV_RECONNECT_SECONDS = 10;
+
+var _tvModel = null;
+var _tvPageIndex = 0;
+var _tvRotateTimer = null;
+var _tvRevision = "";
+var _tvParams = new URLSearchParams(window.location.search);
+
+function escapeHtml(value) {
+  return String(value || "")
+    .replace(/&/g, "&amp;")
+    .replace(/</g, "&lt;")
+    .replace(/>/g, "&gt;")
+    .replace(/"/g, "&quot;")
+    .replace(/'/g, "&#39;");
+}
+
+function tvIntervalMs() {
+  var seconds = parseInt(_tvParams.get("interval") || "", 10);
+  if (!(seconds > 0)) seconds = TV_DEFAULT_INTERVAL_SECONDS;
+  return seconds * 1000;
+}
+
+function tvScheduleUrl() {
+  var query = new URLSearchParams();
+  query.set("lesson_type", _tvParams.get("lesson_type") || "group");
+  if (_tvParams.get("building")) query.set("building", _tvParams.get("building"));
+  return "/api/tv/schedule?" + query.toString();
+}
+
+function renderLesson(lesson) {
+  return (
+    '<div class="tv-lesson" style="background:' + escapeHtml(lesson.fill) +
+    ";border-color:" + escapeHtml(lesson.border) + '">' +
+    "<div>" + escapeHtml(lesson.time) + "</div>" +
+    '<div class="tv-group">' + escapeHtml(lesson.group) + "</div>" +
+    "<div>" + escapeHtml(lesson.teacher) + "</div>" +
+    "<div>" + escapeHtml(lesson.location) + "</div>" +
+    "</div>"
+  );
+}
+
+function renderPage() {
+  var pageEl = document.getElementById("tv-page");
+  var emptyEl = document.getElementById("tv-empty");
+  var pages = (_tvModel && _tvModel.pages) || [];
+  var page;
+
+  if (!pages.length) {
+    pageEl.innerHTML = "";
+    emptyEl.hidden = false;
+    document.getElementById("tv-title").textContent = "Stundenplan";
+    return;
+  }
+  emptyEl.hidden = true;
+  _tvPageIndex = _tvPageIndex % pages.length;
+  page = pages[_tvPageIndex];
+  document.getElementById("tv-title").textContent = page.title;
+  pageEl.innerHTML = page.columns
+    .map(function (column) {
+      return (
+        '<div class="tv-column" style="--tv-rows:' + Math.max(page.rows, 1) + '">' +
+        '<div class="tv-day">' + escapeHtml(column.label) + "</div>" +
+        column.lessons.map(renderLesson).join("") +
+        "</div>"
+      );
+    })
+    .join("");
+}
+
+function setStatus(text) {
+  document.getElementById("tv-status").textContent = text;
+}
+
+function loadSchedule() {
+  return fetch(tvScheduleUrl(), { credentials: "same-origin", cache: "no-store" })
+    .then(function (response) {
+      if (response.status === 401) {
+        window.location.href = "/login";
+        return null;
+      }
+      return response.json();
+    })
+    .then(function (data) {
+      if (!data || !data.ok) return;
+      _tvModel = data;
+      _tvRevision = data.revision;
+      renderPage();
+      setStatus("Stand: " + data.generated_at.replace("T", " "));
+    })
+    .catch(function () {
+      setStatus("Verbindung unterbrochen");
+    });
+}
+
+function startRotation() {
+  if (_tvRotateTimer) window.clearInterval(_tvRotateTimer);
+  _tvRotateTimer = window.setInterval(function () {
+    _tvPageIndex += 1;
+    renderPage();
+  }, tvIntervalMs());
+}
+
+function connectEvents() {
+  var source;
+
+  if (typeof window.EventSource !== "function") {
+    // Без SSE просто перечитываем расписание при каждом круге страниц
+    window.setInterval(loadSchedule, tvIntervalMs() * 3);
+    return;
+  }
+  source = new window.EventSource("/api/tv/events");
+  source.addEventListener("revision", function (event) {
+    var payload = JSON.parse(event.data);
+    if (payload.revision !== _tvRevision) loadSchedule();
+  });
+  source.onerror = function () {
+    source.close();
+    setStatus("Verbindung unterbrochen");
+    window.setTimeout(connectEvents, TV_RECONNECT_SECONDS * 1000);
+  };
+}
+
+document.addEventListener("DOMContentLoaded", function () {
+  loadSchedule().then(function () {
+    startRotation();
+    connectEvents();
+  });
+});
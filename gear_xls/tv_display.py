@@ -0,0 +1,310 @@
+"""Live TV display model built from the shared schedule state.
+
+The lobby screen used to show a PDF rendered by ``visualiserTV`` from the
+exported workbook.  This module builds the same picture directly from the
+published base schedule plus the individual lessons, applying the
+``visualiserTV`` layout rules: public days only, lessons sorted by start time,
+one column per weekday (Mo-Fr) and the Saturday split into sub-columns, block
+colours from the visualiser colour rules and the PDF group labels.
+
+Pages are produced per building and day group so the screen can rotate
+between them.  ``display_revision`` changes whenever one of the sources
+changes.  The push channel watches it through ``shared_revision``: all
+connected screens share one value that is recomputed after a schedule
+mutation in this process, and otherwise at most every ``TV_POLL_SECONDS``
+(changes written by other processes, trial expiry).
+"""
+
+import colorsys
+import hashlib
+import math
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(THIS_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from gear_xls import schedule_mutation_coordinator
+from gear_xls.day_constants import DAY_TO_WEEKDAY, PUBLIC_SCHEDULE_DAYS
+from visualiserTV.lesson_label_utils import format_pdf_group_label, label_text_or_empty
+
+try:
+    from visualiserTV.color_manager import generate_color_from_string
+except ImportError:  # reportlab is optional for the web server
+    generate_color_from_string = None
+
+try:
+    from . import state_manager
+except ImportError:
+    import state_manager
+
+
+TV_LESSON_TYPE_FILTERS = ("all", "group", "individual", "nachhilfe", "trial", "non-group")
+TV_DEFAULT_LESSON_TYPE = "group"
+TV_WEEKDAYS = ("Mo", "Di", "Mi", "Do", "Fr")
+TV_WEEKEND_DAYS = ("Sa",)
+# Saturday canvas rules from visualiserTV (portrait A4, 55pt blocks, 4pt spacing)
+TV_WEEKEND_BLOCKS_PER_COLUMN = 13
+TV_WEEKEND_MAX_COLUMNS = 5
+TV_DAY_LABELS = {
+    "Mo": "Montag",
+    "Di": "Dienstag",
+    "Mi": "Mittwoch",
+    "Do": "Donnerstag",
+    "Fr": "Freitag",
+    "Sa": "Samstag",
+    "So": "Sonntag",
+}
+TV_BUILDING_ORDER = ("Villa", "Kolibri")
+TV_POLL_SECONDS = 5.0
+_NON_GROUP_TYPES = frozenset({"individual", "nachhilfe", "trial"})
+
+# Display model for the last revision, shared by every connected screen.
+_display_cache = {"key": None, "value": None}
+_display_cache_mutex = threading.Lock()
+_revision_watch = {"revision": None, "checked": None, "mutations": None}
+_revision_watch_mutex = threading.Lock()
+
+
+def _parse_time(value) -> int:
+    text = str(value or "").strip()
+    hours, _, minutes = text.partition(":")
+    if not (hours.isdigit() and minutes.isdigit()):
+        return -1
+    return int(hours) * 60 + int(minutes)
+
+
+def _lesson_type(block: dict) -> str:
+    return str(block.get("lesson_type") or "").strip().lower() or "group"
+
+
+def _matches_lesson_type(block: dict, lesson_type: str) -> bool:
+    if lesson_type == "all":
+        return True
+    if lesson_type == "non-group":
+        return _lesson_type(block) in _NON_GROUP_TYPES
+    return _lesson_type(block) == lesson_type
+
+
+def _css_color(color) -> str:
+    red, green, blue = (int(round(255 * component)) for component in color)
+    return f"#{red:02x}{green:02x}{blue:02x}"
+
+
+def _group_fill(group: str) -> str:
+    if generate_color_from_string is None:
+        return "#ffffff"
+    color = generate_color_from_string(group)
+    return _css_color((color.red, color.green, color.blue))
+
+
+def _building_borders(buildings) -> dict[str, str]:
+    """HSV palette over the sorted buildings; Villa is darkened by 20% as on TV."""
+
+    unique = sorted(set(buildings))
+    borders = {}
+    for index, building in enumerate(unique):
+        rgb = colorsys.hsv_to_rgb(index / len(unique), 0.9, 0.9)
+        if building == "Villa":
+            rgb = tuple(component * 0.8 for component in rgb)
+        borders[building] = _css_color(rgb)
+    return borders
+
+
+def _sort_buildings(buildings) -> list[str]:
+    order = {name: index for index, name in enumerate(TV_BUILDING_ORDER)}
+    return sorted(buildings, key=lambda name: (order.get(name, len(order)), name.casefold()))
+
+
+def _lesson_entry(block: dict, borders: dict) -> dict:
+    building = label_text_or_empty(block.get("building"))
+    room = label_text_or_empty(block.get("room_display") or block.get("room"))
+    group_label = format_pdf_group_label(
+        {
+            "subject": block.get("subject"),
+            "group": block.get("students"),
+            "lesson_type": _lesson_type(block),
+        }
+    )
+    start_time = label_text_or_empty(block.get("start_time"))
+    end_time = label_text_or_empty(block.get("end_time"))
+    return {
+        "time": f"{start_time}-{end_time}",
+        "group": group_label,
+        "teacher": label_text_or_empty(block.get("teacher")),
+        "location": f"{room}, {building}",
+        "lesson_type": _lesson_type(block),
+        "fill": _group_fill(label_text_or_empty(block.get("students"))),
+        "border": borders.get(building, "#666666"),
+    }
+
+
+def _weekend_columns(lessons: list) -> list[list]:
+    """Split a Saturday column into sub-columns like the visualiserTV canvas."""
+
+    if not lessons:
+        return [[]]
+    required = math.ceil(len(lessons) / TV_WEEKEND_BLOCKS_PER_COLUMN)
+    count = min(required, TV_WEEKEND_MAX_COLUMNS)
+    per_column = math.ceil(len(lessons) / count)
+    return [lessons[start:start + per_column] for start in range(0, len(lessons), per_column)]
+
+
+def _page(building: str, kind: str, by_day: dict) -> dict | None:
+    columns = []
+    for day in (TV_WEEKDAYS if kind == "weekdays" else TV_WEEKEND_DAYS):
+        lessons = by_day.get(day)
+        if not lessons:
+            continue
+        parts = [lessons] if kind == "weekdays" else _weekend_columns(lessons)
+        for index, part in enumerate(parts):
+            columns.append(
+                {
+                    "day": day,
+                    "label": TV_DAY_LABELS[day] if index == 0 else "",
+                    "lessons": part,
+                }
+            )
+    if not columns:
+        return None
+    days = [column["day"] for column in columns]
+    return {
+        "id": f"{building}:{kind}",
+        "building": building,
+        "kind": kind,
+        "title": f"{building} · {days[0]}–{days[-1]}" if days[0] != days[-1] else f"{building} · {days[0]}",
+        "rows": max(len(column["lessons"]) for column in columns),
+        "columns": columns,
+    }
+
+
+def _load_blocks() -> tuple[list, str | None, str | None]:
+    base = state_manager.get_base_schedule()
+    individual = state_manager.get_individual_lessons()
+    base_blocks = base.get("blocks", []) if base.get("published_at") is not None else []
+    individual_blocks = individual.get("blocks", [])
+    blocks = [
+        block
+        for block in list(base_blocks or []) + list(individual_blocks if isinstance(individual_blocks, list) else [])
+        if isinstance(block, dict)
+    ]
+    return blocks, base.get("published_at"), individual.get("last_modified")
+
+
+def display_revision() -> str:
+    """Revision token of the TV picture: base and individual revisions plus today's date.
+
+    The date is included because trial lessons expire without any file change.
+    Reads do not prune expired lessons, so polling screens never write state.
+    """
+
+    raw = "|".join(
+        [
+            str(state_manager.get_base_revision()),
+            str(state_manager.get_individual_revision(prune_expired=False)),
+            state_manager._today_local_date().isoformat(),
+        ]
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def build_display(lesson_type: str = TV_DEFAULT_LESSON_TYPE, building: str | None = None) -> dict:
+    """Return the TV display model for the current schedule state.
+
+    Raises ``ValueError`` for an unknown ``lesson_type``.  The model is cached
+    per revision; callers must treat it as read-only.
+    """
+
+    if lesson_type not in TV_LESSON_TYPE_FILTERS:
+        raise ValueError("lesson_type is invalid")
+    revision = display_revision()
+    key = (revision, lesson_type)
+    with _display_cache_mutex:
+        cached = _display_cache["value"] if _display_cache["key"] == key else None
+    if cached is None:
+        cached = _build_display(revision, lesson_type)
+        with _display_cache_mutex:
+            _display_cache.update(key=key, value=cached)
+    if not building:
+        return cached
+    return dict(cached, pages=[page for page in cached["pages"] if page["building"] == building])
+
+
+def clear_display_cache() -> None:
+    with _display_cache_mutex:
+        _display_cache.update(key=None, value=None)
+    with _revision_watch_mutex:
+        _revision_watch.update(revision=None, checked=None, mutations=None)
+
+
+def _build_display(revision: str, lesson_type: str) -> dict:
+    blocks, base_revision, individual_revision = _load_blocks()
+    public_days = set(PUBLIC_SCHEDULE_DAYS)
+    selected = []
+    for block in blocks:
+        day = str(block.get("day") or "").strip()
+        start, end = _parse_time(block.get("start_time")), _parse_time(block.get("end_time"))
+        if day not in public_days or start < 0 or end <= start:
+            continue
+        if _matches_lesson_type(block, lesson_type):
+            selected.append((DAY_TO_WEEKDAY[day], start, end, block))
+    # Stable sort: lessons with equal start times keep their source order.
+    selected.sort(key=lambda item: (item[0], item[1]))
+
+    borders = _building_borders(label_text_or_empty(item[3].get("building")) for item in selected)
+    by_building = {}
+    for _, _, _, block in selected:
+        entry = _lesson_entry(block, borders)
+        building = label_text_or_empty(block.get("building"))
+        day = str(block.get("day")).strip()
+        by_building.setdefault(building, {}).setdefault(day, []).append(entry)
+
+    pages = []
+    for building in _sort_buildings(by_building):
+        for kind in ("weekdays", "weekend"):
+            page = _page(building, kind, by_building[building])
+            if page is not None:
+                pages.append(page)
+    return {
+        "revision": revision,
+        "base_revision": base_revision,
+        "individual_revision": individual_revision,
+        "lesson_type": lesson_type,
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "pages": pages,
+    }
+
+
+def shared_revision() -> str:
+    """``display_revision`` shared by every connected screen.
+
+    Reading the revision parses the state files under their locks, so it is
+    recomputed only after a schedule mutation finished in this process or
+    when ``TV_POLL_SECONDS`` have passed since the last check.
+    """
+
+    mutations = schedule_mutation_coordinator.mutation_count()
+    with _revision_watch_mutex:
+        now = time.monotonic()
+        checked = _revision_watch["checked"]
+        if _revision_watch["mutations"] != mutations or checked is None or now - checked >= TV_POLL_SECONDS:
+            _revision_watch.update(revision=display_revision(), checked=now, mutations=mutations)
+        return _revision_watch["revision"]
+
+
+def wait_for_revision_change(seen: str | None, timeout: float) -> str:
+    """Wait until the shared revision differs from ``seen`` or ``timeout`` passes."""
+
+    deadline = time.monotonic() + timeout
+    while True:
+        mutations = schedule_mutation_coordinator.mutation_count()
+        current = shared_revision()
+        remaining = deadline - time.monotonic()
+        if current != seen or remaining <= 0:
+            return current
+        schedule_mutation_coordinator.wait_for_mutation(mutations, min(TV_POLL_SECONDS, remaining))
@@ -0,0 +1,114 @@
+import json
+import threading
+
+from flask import Blueprint, Response, jsonify, make_response, request
+
+
+TV_EVENTS_KEEPALIVE_SECONDS = 15
+# Every open push stream holds one server thread for as long as the screen is
+# connected; run_server sets the limit from server.json "tv_streams".
+TV_DEFAULT_MAX_STREAMS = 4
+
+TV_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="de">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Stundenplan - SchedGen TV</title>
+<style>
+html, body { margin: 0; height: 100%; background: #fff; color: #000; font-family: Helvetica, Arial, sans-serif; overflow: hidden; }
+#tv-header { display: flex; justify-content: space-between; align-items: baseline; padding: 8px 16px;
+    border-bottom: 2px solid #333; }
+#tv-title { font-size: 28px; font-weight: bold; }
+#tv-status { font-size: 14px; color: #555; }
+#tv-page { display: grid; grid-auto-flow: column; grid-auto-columns: 1fr; gap: 8px;
+    height: calc(100% - 64px); padding: 8px 16px; box-sizing: border-box; }
+.tv-column { display: grid; grid-template-rows: 36px repeat(var(--tv-rows), minmax(0, 1fr)); gap: 4px; min-width: 0; }
+.tv-day { font-size: 22px; font-weight: bold; text-align: center; align-self: end; }
+.tv-lesson { border: 2px solid #666; border-radius: 5px; padding: 2px 4px; overflow: hidden;
+    display: flex; flex-direction: column; justify-content: center; text-align: center; min-height: 0; }
+.tv-lesson div { white-space: nowrap; overflow: hidden; text-overflow: ellipsis; font-size: clamp(10px, 1.5vh, 18px); }
+.tv-lesson .tv-group { font-weight: bold; }
+#tv-empty { padding: 32px; font-size: 24px; color: #555; }
+</style>
+</head>
+<body>
+<div id="tv-header"><div id="tv-title">Stundenplan</div><div id="tv-status"></div></div>
+<div id="tv-page"></div>
+<div id="tv-empty" hidden>Keine Unterrichtsstunden</div>
+<script src="/static/tv_display.js?v=20261019_1"></script>
+</body>
+</html>"""
+
+bp = Blueprint("tv_routes", __name__)
+_login_required = None
+_page_template = TV_PAGE_TEMPLATE
+_tv_display = None
+_configured = False
+_stream_slots = threading.BoundedSemaphore(TV_DEFAULT_MAX_STREAMS)
+
+
+def set_stream_limit(limit):
+    global _stream_slots
+    _stream_slots = threading.BoundedSemaphore(max(1, int(limit)))
+
+
+def configure(login_required, tv_display, page_template=None):
+    global _configured, _login_required, _page_template, _tv_display
+    _login_required = login_required
+    _tv_display = tv_display
+    if page_template is not None:
+        _page_template = page_template
+    if _configured:
+        return
+
+    @bp.route("/tv")
+    @_login_required
+    def tv():
+        response = make_response(_page_template)
+        response.headers["Cache-Control"] = "no-store"
+        return response
+
+    @bp.route("/api/tv/schedule")
+    @_login_required
+    def api_tv_schedule():
+        try:
+            model = _tv_display.build_display(
+                request.args.get("lesson_type", _tv_display.TV_DEFAULT_LESSON_TYPE).strip(),
+                building=request.args.get("building", "").strip() or None,
+            )
+        except ValueError as exc:
+            return jsonify({"ok": False, "error": str(exc), "code": "VALIDATION_ERROR"}), 400
+        response = jsonify({"ok": True, **model})
+        response.headers["Cache-Control"] = "no-store"
+        return response
+
+    @bp.route("/api/tv/events")
+    @_login_required
+    def api_tv_events():
+        slots = _stream_slots
+        if not slots.acquire(blocking=False):
+            # The screen keeps its last picture and reconnects later
+            return (
+                jsonify({"ok": False, "error": "Too many TV screens are connected", "code": "TV_STREAMS_BUSY"}),
+                503,
+            )
+
+        def _stream():
+            revision = _tv_display.shared_revision()
+            while True:
+                yield f"event: revision\ndata: {json.dumps({'revision': revision})}\n\n"
+                seen = revision
+                while True:
+                    revision = _tv_display.wait_for_revision_change(seen, TV_EVENTS_KEEPALIVE_SECONDS)
+                    if revision != seen:
+                        break
+                    yield ": keepalive\n\n"
+
+        response = Response(_stream(), mimetype="text/event-stream")
+        response.headers["Cache-Control"] = "no-store"
+        response.headers["X-Accel-Buffering"] = "no"
+        response.call_on_close(slots.release)
+        return response
+
+    _configured = True
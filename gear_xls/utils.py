@@ -15,7 +15,7 @@ PROJECT_ROOT = os.path.dirname(THIS_DIR)
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-from gear_xls.runtime_paths import get_html_output_dir
+from gear_xls.runtime_paths import get_asset_bundle_dir, get_html_output_dir
 
 # Настройка логирования
 logging.basicConfig(
@@ -34,6 +34,9 @@ def create_output_directories():
     """
     output_dirs = {
         "html": get_html_output_dir(),
+        # Кэш фрагментов и бандлы остаются в html_output, даже если HTML собирается во временном каталоге
+        "cache": get_html_output_dir(),
+        "assets": get_asset_bundle_dir(),
     }
     
     for dir_name, dir_path in output_dirs.items():
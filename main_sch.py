@@ -44,6 +44,8 @@ def parse_arguments():
                     help='Time interval for scheduling in minutes (default: 15)')
     parser.add_argument('--verbose', action='store_true',
                     help='Enable verbose output')
+    parser.add_argument('--no-sidecar', action='store_true',
+                    help='Do not write the columnar .arrow copy of the output workbook')
     
     return parser.parse_args()
 
@@ -185,7 +187,7 @@ def main():
         
         # Export the result
         print(f"\nExporting schedule to '{args.output}'...")
-        export_to_excel(optimizer, filename=args.output)
+        export_to_excel(optimizer, filename=args.output, sidecar=not args.no_sidecar)
         print("Export completed successfully.")
         
         print(f"\nSchedule generation complete.")
@@ -4,9 +4,13 @@ Module for output utilities.
 
 import pandas as pd
 import re
+from openpyxl import Workbook
+
+from schedule_sidecar import write_sidecar
 
 _INVALID_EXCEL_SHEET_CHARS = re.compile(r"[\[\]:*?/\\]")
 _MAX_EXCEL_SHEET_NAME_LEN = 31
+_ENTITY_SORT_COLUMNS = ["day", "start_time"]
 
 
 def make_safe_sheet_name(prefix, value, used_names=None):
@@ -99,48 +103,91 @@ def get_room_schedule(optimizer, room):
     df = pd.DataFrame(optimizer.solution)
     return df[df["room"] == room].sort_values(by=["day", "start_time"])
 
-def export_to_excel(optimizer, filename="schedule.xlsx"):
+def _equal_partitions(df, column):
+    """Rows per distinct value of column, in df order (one groupby)."""
+    return {value: part for value, part in df.groupby(column, sort=False)}
+
+
+def _group_partitions(df, groups):
+    """
+    Rows per group name, matching get_group_schedule.
+
+    A row belongs to every group whose name is a substring of its group
+    field (e.g. "2A+1A Kunst" belongs to "2A" and "1A"). The membership
+    test runs once per distinct group field, the rows are exploded into
+    (row, group) pairs once and partitioned with a single groupby.
+    """
+    unique_groups = list(dict.fromkeys(groups))
+    members = {
+        value: [group for group in unique_groups if group in value]
+        for value in df["group"].dropna().unique()
+        if isinstance(value, str)
+    }
+    exploded = df["group"].map(members).explode().dropna()
+    return {
+        group: df.loc[labels.index]
+        for group, labels in exploded.groupby(exploded, sort=False)
+    }
+
+
+def _write_sheet(workbook, sheet_name, df):
+    """Stream a DataFrame into a write-only sheet (header row + values, no index)."""
+    ws = workbook.create_sheet(sheet_name)
+    ws.append([str(column) for column in df.columns])
+    values = df.astype(object).where(df.notna(), None)
+    for row in values.itertuples(index=False, name=None):
+        ws.append(row)
+
+
+def export_to_excel(optimizer, filename="schedule.xlsx", sidecar=False):
     """
     Export the schedule to an Excel file.
+
+    The solution DataFrame is built once; teacher, group and room sheets
+    are partitions of it (same rows and order as get_teacher_schedule,
+    get_group_schedule and get_room_schedule) and every sheet is streamed
+    through a write-only openpyxl workbook.
+
+    With sidecar=True the same sheets are also saved as a columnar Arrow
+    copy next to the workbook (see schedule_sidecar), which later pipeline
+    stages read instead of parsing the XLSX.
     
     Args:
         filename: Path to the output Excel file
+        sidecar: Also write the columnar sidecar (requires pyarrow)
         
     Returns:
         True if export was successful, False otherwise
     """
     if not optimizer.solution:
         return False
-    
-    # Используем контекстный менеджер для автоматического закрытия файла
-    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-        used_sheet_names = set()
-
-        # Main schedule
-        main_df = pd.DataFrame(optimizer.solution)
-        main_sheet_name = make_safe_sheet_name("", "Schedule", used_sheet_names)
-        main_df.to_excel(writer, sheet_name=main_sheet_name, index=False)
-        
-        # Teacher schedules
-        for teacher in optimizer.teachers:
-            teacher_df = get_teacher_schedule(optimizer, teacher)
-            if teacher_df is not None and not teacher_df.empty:
-                sheet_name = make_safe_sheet_name("T", teacher, used_sheet_names)
-                teacher_df.to_excel(writer, sheet_name=sheet_name, index=False)
-        
-        # Group schedules
-        for group in optimizer.groups:
-            group_df = get_group_schedule(optimizer, group)
-            if group_df is not None and not group_df.empty:
-                sheet_name = make_safe_sheet_name("G", group, used_sheet_names)
-                group_df.to_excel(writer, sheet_name=sheet_name, index=False)
-        
-        # Room schedules
-        for room in optimizer.rooms:
-            room_df = get_room_schedule(optimizer, room)
-            if room_df is not None and not room_df.empty:
-                sheet_name = make_safe_sheet_name("R", room, used_sheet_names)
-                room_df.to_excel(writer, sheet_name=sheet_name, index=False)
-    
-    # Файл уже закрыт благодаря контекстному менеджеру
+
+    main_df = pd.DataFrame(optimizer.solution)
+    # Multi-column sort is stable, so each partition keeps the per-entity order
+    sorted_df = main_df.sort_values(by=_ENTITY_SORT_COLUMNS)
+    sections = (
+        ("T", optimizer.teachers, _equal_partitions(sorted_df, "teacher")),
+        ("G", optimizer.groups, _group_partitions(sorted_df, optimizer.groups)),
+        ("R", optimizer.rooms, _equal_partitions(sorted_df, "room")),
+    )
+
+    workbook = Workbook(write_only=True)
+    used_sheet_names = set()
+
+    # Main schedule
+    sheets = [(make_safe_sheet_name("", "Schedule", used_sheet_names), main_df)]
+
+    # Teacher, group and room schedules
+    for prefix, names, partitions in sections:
+        for name in names:
+            entity_df = partitions.get(name)
+            if entity_df is not None and not entity_df.empty:
+                sheets.append((make_safe_sheet_name(prefix, name, used_sheet_names), entity_df))
+
+    for sheet_name, df in sheets:
+        _write_sheet(workbook, sheet_name, df)
+    workbook.save(filename)
+
+    if sidecar:
+        write_sidecar(filename, sheets)
     return True
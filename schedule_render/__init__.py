@@ -0,0 +1,8 @@
+"""
+Общие модули отрисовки расписания для visualiser и visualiserTV.
+
+text_layout — измерение и обрезка текста, render_plan — запись и кэш плана
+отрисовки, raster_canvas — растровый холст для PNG/WebP. Правила компоновки
+(enhanced_layout_*, цвета, подписи) остаются в каталоге каждого визуализатора;
+визуализаторы добавляют корень проекта в sys.path и импортируют этот пакет.
+"""
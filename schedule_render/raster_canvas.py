@@ -0,0 +1,206 @@
+"""
+Растровый холст с интерфейсом reportlab pdfgen для прямого экспорта в PNG/WebP.
+
+EnhancedScheduleLayout рисует расписание вызовами холста (setFont, rect,
+roundRect, drawCentredString, ...). RasterCanvas выполняет те же вызовы через
+Pillow: координаты страницы в пунктах (начало внизу слева) переводятся в
+пиксели с заданным DPI. Холст может покрывать только часть страницы (тайл),
+поэтому большую страницу можно отрисовать по частям, не держа в памяти весь
+растр. Как и при конвертации PDF, растеризуется только первая страница.
+"""
+
+import os
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFont
+from reportlab.pdfbase import pdfmetrics
+
+from .text_layout import text_width
+
+# Шрифты, совместимые по метрикам с Helvetica/Arial, затем с кириллицей,
+# в конце — Vera из поставки reportlab
+_FALLBACK_FONTS = {
+    False: ("LiberationSans-Regular.ttf", "arial.ttf", "Arial.ttf", "DejaVuSans.ttf"),
+    True: ("LiberationSans-Bold.ttf", "arialbd.ttf", "Arial Bold.ttf", "DejaVuSans-Bold.ttf"),
+}
+_REPORTLAB_FONTS_DIR = os.path.join(os.path.dirname(pdfmetrics.__file__), "..", "fonts")
+_VERA_FONTS = {False: "Vera.ttf", True: "VeraBd.ttf"}
+
+
+def _is_bold(font_name):
+    return "bold" in font_name.lower()
+
+
+@lru_cache(maxsize=None)
+def _font_file(font_name):
+    """Файл TrueType для имени шрифта reportlab (зарегистрированный TTF или замена)."""
+    try:
+        face = getattr(pdfmetrics.getFont(font_name), "face", None)
+    except KeyError:
+        face = None
+    filename = getattr(face, "filename", None)
+    if isinstance(filename, str) and os.path.isfile(filename):
+        return filename
+    bold = _is_bold(font_name)
+    for candidate in _FALLBACK_FONTS[bold]:
+        try:
+            ImageFont.truetype(candidate, 10)
+            return candidate
+        except OSError:
+            continue
+    return os.path.normpath(os.path.join(_REPORTLAB_FONTS_DIR, _VERA_FONTS[bold]))
+
+
+@lru_cache(maxsize=256)
+def _image_font(font_name, pixel_size):
+    return ImageFont.truetype(_font_file(font_name), pixel_size)
+
+
+def _rgb(color):
+    """Цвет reportlab (Color) в кортеж RGB 0-255."""
+    if hasattr(color, "bitmap_rgb"):
+        return color.bitmap_rgb()
+    return tuple(int(round(255 * component)) for component in color[:3])
+
+
+class RasterCanvas:
+    """
+    Растровый холст, совместимый с используемой частью API pdfgen.Canvas.
+
+    Args:
+        page_width (float): Ширина страницы в пунктах
+        page_height (float): Высота страницы в пунктах
+        dpi (int): Разрешение растра
+        box (tuple): Область страницы в пикселях (left, top, right, bottom);
+            по умолчанию — вся страница
+    """
+
+    def __init__(self, page_width, page_height, dpi=200, box=None):
+        self.scale = dpi / 72.0
+        self.dpi = dpi
+        self.page_height = page_height
+        if box is None:
+            box = (0, 0) + page_pixel_size(page_width, page_height, dpi)
+        self.left, self.top = box[0], box[1]
+        self.image = Image.new("RGB", (box[2] - box[0], box[3] - box[1]), "white")
+        self._draw = ImageDraw.Draw(self.image)
+        self._page = 0
+        self._state = {
+            "fill": (0, 0, 0),
+            "stroke": (0, 0, 0),
+            "line_width": 1,
+            "font": ("Helvetica", 12),
+        }
+        self._stack = []
+
+    def _point(self, x, y):
+        return (x * self.scale - self.left, (self.page_height - y) * self.scale - self.top)
+
+    def _box(self, x, y, width, height):
+        x0, y0 = self._point(x, y + height)
+        x1, y1 = self._point(x + width, y)
+        return [x0, y0, x1, y1]
+
+    def _line_px(self):
+        return max(1, int(round(self._state["line_width"] * self.scale)))
+
+    # Состояние
+
+    def saveState(self):
+        self._stack.append(dict(self._state))
+
+    def restoreState(self):
+        self._state = self._stack.pop()
+
+    def setFillColor(self, color):
+        self._state["fill"] = _rgb(color)
+
+    def setStrokeColor(self, color):
+        self._state["stroke"] = _rgb(color)
+
+    def setLineWidth(self, width):
+        self._state["line_width"] = width
+
+    def setFont(self, font_name, font_size, leading=None):
+        self._state["font"] = (font_name, font_size)
+
+    def stringWidth(self, text, font_name=None, font_size=None):
+        current_name, current_size = self._state["font"]
+        return text_width(text, font_name or current_name, font_size or current_size)
+
+    def showPage(self):
+        # Растр содержит только первую страницу
+        self._page += 1
+
+    # Фигуры
+
+    def rect(self, x, y, width, height, stroke=1, fill=1):
+        if self._page:
+            return
+        self._draw.rectangle(
+            self._box(x, y, width, height),
+            fill=self._state["fill"] if fill else None,
+            outline=self._state["stroke"] if stroke else None,
+            width=self._line_px() if stroke else 0,
+        )
+
+    def roundRect(self, x, y, width, height, radius, stroke=1, fill=1):
+        if self._page:
+            return
+        self._draw.rounded_rectangle(
+            self._box(x, y, width, height),
+            radius=radius * self.scale,
+            fill=self._state["fill"] if fill else None,
+            outline=self._state["stroke"] if stroke else None,
+            width=self._line_px() if stroke else 0,
+        )
+
+    def line(self, x1, y1, x2, y2):
+        if self._page:
+            return
+        self._draw.line([self._point(x1, y1), self._point(x2, y2)],
+                        fill=self._state["stroke"], width=self._line_px())
+
+    # Текст
+
+    def _text(self, x, y, text, anchor):
+        if self._page or not text:
+            return
+        font_name, font_size = self._state["font"]
+        font = _image_font(font_name, max(1, int(round(font_size * self.scale))))
+        self._draw.text(self._point(x, y), str(text), font=font, fill=self._state["fill"], anchor=anchor)
+
+    def drawString(self, x, y, text):
+        self._text(x, y, text, "ls")
+
+    def drawCentredString(self, x, y, text):
+        self._text(x, y, text, "ms")
+
+    def drawRightString(self, x, y, text):
+        self._text(x, y, text, "rs")
+
+    def save(self, output_path, image_format=None):
+        """Сохраняет растр; формат определяется по расширению файла."""
+        self.image.save(output_path, image_format or image_format_for(output_path), dpi=(self.dpi, self.dpi))
+
+
+def page_pixel_size(page_width, page_height, dpi):
+    """Размер страницы в пикселях при заданном DPI."""
+    scale = dpi / 72.0
+    return int(round(page_width * scale)), int(round(page_height * scale))
+
+
+def image_format_for(output_path):
+    """Формат Pillow по расширению файла (PNG по умолчанию)."""
+    extension = os.path.splitext(output_path)[1].lower()
+    return Image.registered_extensions().get(extension, "PNG")
+
+
+def tile_boxes(pixel_width, pixel_height, tile_size):
+    """Разбивает страницу на тайлы: список (строка, столбец, (left, top, right, bottom))."""
+    boxes = []
+    for row, top in enumerate(range(0, pixel_height, tile_size)):
+        for col, left in enumerate(range(0, pixel_width, tile_size)):
+            boxes.append((row, col, (left, top, min(left + tile_size, pixel_width),
+                                     min(top + tile_size, pixel_height))))
+    return boxes
@@ -0,0 +1,242 @@
+"""
+План отрисовки расписания: результат прохода компоновки, общий для всех форматов.
+
+EnhancedScheduleLayout раскладывает блоки (подстолбцы, страницы, координаты,
+шрифты, обрезка текста, цвета) вызовами холста. RecordingCanvas записывает эти
+вызовы в RenderPlan — список операций с уже вычисленными аргументами. План
+воспроизводится на любом холсте с интерфейсом pdfgen: PDF (reportlab) и растр
+(RasterCanvas), поэтому компоновка выполняется один раз на набор данных.
+
+Планы кэшируются в памяти и на диске (каталог RENDER_PLAN_DIR рядом с
+результатом) по ключу из хэша данных, исходников рендерера и геометрии страницы:
+PDF и PNG одного расписания и повторные запуски на тех же данных пропускают
+проход компоновки. Правила компоновки у visualiser и visualiserTV свои, поэтому
+в ключ входят исходники каталога вызывающего визуализатора (layout_dir).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+
+from .text_layout import text_width
+
+RENDER_PLAN_DIR = ".render_plans"
+RENDER_PLAN_VERSION = 1
+# Сколько планов хранить в памяти и на диске
+MEMORY_CACHE_SIZE = 32
+DISK_CACHE_SIZE = 64
+
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+# Модули, от которых зависит план: правка любого из них меняет ключ.
+# Общие модули лежат в этом пакете, правила компоновки — в layout_dir.
+_SHARED_SOURCES = ("text_layout.py", "render_plan.py")
+LAYOUT_SOURCES = (
+    "enhanced_layout_manager.py",
+    "enhanced_layout_drawing.py",
+    "enhanced_layout_rendering.py",
+    "color_manager.py",
+    "lesson_label_utils.py",
+)
+
+# Методы pdfgen, которые вызывает компоновка
+RECORDED_METHODS = frozenset({
+    "saveState", "restoreState", "setFillColor", "setStrokeColor", "setLineWidth",
+    "setFont", "showPage", "rect", "roundRect", "line",
+    "drawString", "drawCentredString", "drawRightString",
+})
+
+_signatures = {}
+
+
+def _plain(value):
+    """Аргумент операции в виде, пригодном для JSON (цвет reportlab -> RGB)."""
+    if hasattr(value, "red") and hasattr(value, "blue"):
+        return [value.red, value.green, value.blue]
+    if isinstance(value, tuple):
+        return [_plain(item) for item in value]
+    return value
+
+
+class RecordingCanvas:
+    """Холст, записывающий вызовы pdfgen в список операций."""
+
+    def __init__(self):
+        self.ops = []
+        self._font = ("Helvetica", 12)
+
+    def __getattr__(self, name):
+        if name not in RECORDED_METHODS:
+            raise AttributeError(name)
+
+        def record(*args, **kwargs):
+            if name == "setFont":
+                self._font = (args[0], args[1])
+            self.ops.append([name, [_plain(arg) for arg in args],
+                             {key: _plain(value) for key, value in kwargs.items()}])
+        return record
+
+    def stringWidth(self, text, font_name=None, font_size=None):
+        current_name, current_size = self._font
+        return text_width(text, font_name or current_name, font_size or current_size)
+
+
+class RenderPlan:
+    """
+    Записанный проход компоновки.
+
+    Args:
+        ops (list): Операции [метод, аргументы, именованные аргументы]
+    """
+
+    def __init__(self, ops):
+        self.ops = ops
+
+    @classmethod
+    def record(cls, draw):
+        """Выполняет draw(canvas) на записывающем холсте и возвращает план."""
+        canvas = RecordingCanvas()
+        draw(canvas)
+        return cls(canvas.ops)
+
+    def replay(self, canvas):
+        """Воспроизводит план на холсте pdfgen или RasterCanvas."""
+        for name, args, kwargs in self.ops:
+            if name in ("setFillColor", "setStrokeColor"):
+                args = [tuple(args[0]) if isinstance(args[0], list) else args[0]]
+            getattr(canvas, name)(*args, **kwargs)
+
+    def to_json(self):
+        return json.dumps({"version": RENDER_PLAN_VERSION, "ops": self.ops},
+                          ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, text):
+        data = json.loads(text)
+        if not isinstance(data, dict) or data.get("version") != RENDER_PLAN_VERSION:
+            raise ValueError("Неподдерживаемая версия плана отрисовки")
+        return cls(data["ops"])
+
+
+def renderer_signature(layout_dir):
+    """Хэш общих исходников и исходников компоновки layout_dir (один раз за процесс)."""
+    layout_dir = os.path.abspath(layout_dir)
+    signature = _signatures.get(layout_dir)
+    if signature is None:
+        digest = hashlib.sha256(f"{RENDER_PLAN_VERSION}|{layout_dir}".encode("utf-8"))
+        sources = [os.path.join(_MODULE_DIR, name) for name in _SHARED_SOURCES]
+        sources += [os.path.join(layout_dir, name) for name in LAYOUT_SOURCES]
+        for path in sources:
+            try:
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+            except OSError:
+                digest.update(os.path.basename(path).encode("utf-8"))
+        signature = _signatures[layout_dir] = digest.hexdigest()
+    return signature
+
+
+def schedule_digest(days_of_week, schedule_by_day):
+    """Хэш данных расписания (дни и занятия по дням в исходном порядке)."""
+    payload = [[day, schedule_by_day.get(day, [])] for day in days_of_week]
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def plan_key(layout_dir, days_of_week, schedule_by_day, *params):
+    """Ключ плана: данные, исходники рендерера из layout_dir и параметры страницы."""
+    raw = "|".join([renderer_signature(layout_dir), schedule_digest(days_of_week, schedule_by_day)]
+                   + [repr(param) for param in params])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class RenderPlanCache:
+    """
+    Кэш планов: в памяти (LRU) и в каталоге на диске.
+
+    Args:
+        cache_dir (str, optional): Каталог для файлов планов; None — только память
+    """
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir
+        self._memory = OrderedDict()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _remember(self, key, plan):
+        self._memory[key] = plan
+        self._memory.move_to_end(key)
+        while len(self._memory) > MEMORY_CACHE_SIZE:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        plan = self._memory.get(key)
+        if plan is not None:
+            self._memory.move_to_end(key)
+            return plan
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                plan = RenderPlan.from_json(f.read())
+        except (OSError, ValueError, KeyError):
+            return None
+        self._remember(key, plan)
+        return plan
+
+    def put(self, key, plan):
+        self._remember(key, plan)
+        if self.cache_dir is None:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=".plan_", suffix=".tmp", dir=self.cache_dir)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(plan.to_json())
+                os.replace(tmp_path, self._path(key))
+            finally:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+            self._prune()
+        except OSError as e:
+            print(f"Не удалось сохранить план отрисовки: {e}")
+
+    def _prune(self):
+        """Оставляет на диске DISK_CACHE_SIZE последних планов."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".json"):
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    entries.append((os.stat(path).st_mtime_ns, path))
+                except OSError:
+                    continue
+        for _, path in sorted(entries, reverse=True)[DISK_CACHE_SIZE:]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def get_or_record(self, key, draw):
+        """План из кэша; при промахе выполняет draw(canvas) один раз и сохраняет план."""
+        plan = self.get(key)
+        if plan is None:
+            plan = RenderPlan.record(draw)
+            self.put(key, plan)
+        return plan
+
+
+_caches = {}
+
+
+def cache_for(output_path):
+    """Общий кэш планов для каталога, в который сохраняется результат."""
+    cache_dir = os.path.join(os.path.dirname(os.path.abspath(output_path)), RENDER_PLAN_DIR)
+    cache = _caches.get(cache_dir)
+    if cache is None:
+        cache = _caches[cache_dir] = RenderPlanCache(cache_dir)
+    return cache
@@ -0,0 +1,67 @@
+"""
+Измерение и обрезка текста для PDF-блоков расписания.
+
+Ширины строк кэшируются по (текст, шрифт, размер): одни и те же имена
+преподавателей, групп и кабинетов повторяются в сотнях блоков и в десятках
+PDF отдельных сущностей. Точка обрезки ищется бинарным поиском по накопленным
+ширинам символов и уточняется точным измерением строки с многоточием.
+"""
+
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+TEXT_WIDTH_CACHE_SIZE = 8192
+TRUNCATE_CACHE_SIZE = 4096
+ELLIPSIS = "..."
+
+
+@lru_cache(maxsize=TEXT_WIDTH_CACHE_SIZE)
+def text_width(text, font_name, font_size):
+    """Ширина строки в пунктах (то же, что canvas.stringWidth)."""
+    return stringWidth(text, font_name, font_size)
+
+
+@lru_cache(maxsize=TRUNCATE_CACHE_SIZE)
+def truncate_text(text, max_width, font_name, font_size):
+    """
+    Обрезает текст, если он не помещается в заданную ширину
+
+    Args:
+        text (str): Исходный текст
+        max_width (float): Максимальная ширина текста
+        font_name (str): Название шрифта
+        font_size (float): Размер шрифта
+
+    Returns:
+        str: Обрезанный текст (с многоточием, если необходимо)
+    """
+    if not text:
+        return ""
+    if text_width(text, font_name, font_size) <= max_width:
+        return text
+
+    def fits(length):
+        return text_width(text[:length] + ELLIPSIS, font_name, font_size) <= max_width
+
+    # Оценка по накопленным ширинам символов (без кернинга они аддитивны)
+    budget = max_width - text_width(ELLIPSIS, font_name, font_size)
+    cumulative = list(accumulate(text_width(char, font_name, font_size) for char in text))
+    length = max(1, min(bisect_right(cumulative, budget), len(text) - 1))
+
+    # Уточняем на случай погрешности суммирования
+    while length > 1 and not fits(length):
+        length -= 1
+    while length < len(text) - 1 and fits(length + 1):
+        length += 1
+
+    # Если даже один символ не помещается, остаётся первый символ
+    return text[:length] + ELLIPSIS
+
+
+def clear_text_caches():
+    """Сбрасывает кэши измерений (например, после регистрации другого шрифта с тем же именем)."""
+    text_width.cache_clear()
+    truncate_text.cache_clear()
@@ -0,0 +1,200 @@
+"""
+Колоночная копия книги расписания (sidecar) для передачи данных между этапами.
+
+main_sch.py сохраняет рядом с optimized_schedule.xlsx файл Arrow IPC
+(optimized_schedule.arrow) с теми же листами и столбцами. Листы записаны
+подряд в одну таблицу; в метаданных схемы хранятся имена листов с диапазонами
+строк и SHA-256 книги, из которой сделана копия. Файл отображается в память,
+лист — срез таблицы без разбора XLSX.
+
+Читатели (visualiser, visualiserTV, gear_xls excel_parser) берут данные из
+sidecar, только если хэш совпадает с текущей книгой: после правки книги в Excel
+или без pyarrow используется сама книга. Excel остаётся форматом для людей.
+
+Модуль один на весь проект: каталоги визуализаторов запускаются как отдельные
+корни импорта, поэтому их модули добавляют корень проекта в sys.path.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc  # noqa: F401  (регистрирует pa.ipc)
+except ImportError:  # pyarrow — необязательная зависимость
+    pa = None
+
+SIDECAR_SUFFIX = ".arrow"
+SIDECAR_VERSION = 1
+_METADATA_KEY = b"schedule_sidecar"
+
+# (путь, mtime_ns, размер) -> хэш книги: читатели одного запуска не хэшируют её повторно
+_digests = {}
+
+
+def sidecar_available():
+    """True, если установлен pyarrow."""
+    return pa is not None
+
+
+def sidecar_path(excel_path):
+    """Путь sidecar для книги: тот же каталог и имя, расширение .arrow."""
+    return os.path.splitext(excel_path)[0] + SIDECAR_SUFFIX
+
+
+def workbook_digest(excel_path):
+    """SHA-256 содержимого книги."""
+    stat = os.stat(excel_path)
+    key = (os.path.abspath(excel_path), stat.st_mtime_ns, stat.st_size)
+    digest = _digests.get(key)
+    if digest is None:
+        sha = hashlib.sha256()
+        with open(excel_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                sha.update(chunk)
+        digest = _digests[key] = sha.hexdigest()
+    return digest
+
+
+def _sidecar_frame(df):
+    """Столбцы целиком из пустых значений пишутся как float (NaN), как их читает read_excel."""
+    empty = [column for column in df.columns if df[column].isna().all()]
+    if empty:
+        df = df.astype({column: "float64" for column in empty})
+    return df
+
+
+def write_sidecar(excel_path, sheets):
+    """
+    Сохраняет sidecar для только что записанной книги.
+
+    Args:
+        excel_path (str): Путь к сохранённой книге Excel
+        sheets (list): Пары (имя листа, DataFrame) в порядке листов книги;
+            у всех листов должны быть одинаковые столбцы
+
+    Returns:
+        str | None: Путь sidecar или None, если он не создан
+    """
+    path = sidecar_path(excel_path)
+    if pa is None:
+        print("pyarrow не установлен: колоночная копия расписания не создаётся")
+        return None
+    if not sheets or any(list(df.columns) != list(sheets[0][1].columns) for _, df in sheets):
+        print("Колоночная копия расписания не создана: листы с разными столбцами")
+        return None
+
+    ranges = []
+    offset = 0
+    for name, df in sheets:
+        ranges.append([name, offset, len(df)])
+        offset += len(df)
+    combined = pd.concat([df for _, df in sheets], ignore_index=True)
+
+    try:
+        table = pa.Table.from_pandas(_sidecar_frame(combined), preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        print(f"Колоночная копия расписания не создана: {e}")
+        return None
+    metadata = {
+        "version": SIDECAR_VERSION,
+        "workbook_sha256": workbook_digest(excel_path),
+        "sheets": ranges,
+    }
+    table = table.replace_schema_metadata({
+        **(table.schema.metadata or {}),
+        _METADATA_KEY: json.dumps(metadata, ensure_ascii=False).encode("utf-8"),
+    })
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".sidecar_", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            with pa.ipc.new_file(f, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Не удалось сохранить колоночную копию расписания: {e}")
+        return None
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+    return path
+
+
+class SidecarBook:
+    """
+    Листы книги из sidecar с интерфейсом pd.ExcelFile (sheet_names, parse).
+
+    Args:
+        source: Отображённый в память файл sidecar
+        table: Таблица со всеми листами подряд
+        sheets (list): Тройки [имя листа, первая строка, число строк]
+    """
+
+    def __init__(self, source, table, sheets):
+        self._source = source
+        self._table = table
+        self._ranges = {name: (start, length) for name, start, length in sheets}
+        self.sheet_names = [name for name, _, _ in sheets]
+
+    def parse(self, sheet_name):
+        if sheet_name not in self._ranges:
+            raise ValueError(f"Worksheet named '{sheet_name}' not found")
+        start, length = self._ranges[sheet_name]
+        return self._table.slice(start, length).to_pandas()
+
+    def close(self):
+        self._table = None
+        self._source.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_sidecar(excel_path):
+    """
+    Открывает sidecar книги, если он есть и сделан из её текущего содержимого.
+
+    Returns:
+        SidecarBook | None: None — sidecar нет, он устарел или не читается
+    """
+    path = sidecar_path(excel_path)
+    if pa is None or not os.path.exists(path) or not os.path.exists(excel_path):
+        return None
+    source = None
+    try:
+        source = pa.memory_map(path, "r")
+        table = pa.ipc.open_file(source).read_all()
+        metadata = json.loads((table.schema.metadata or {})[_METADATA_KEY])
+        if (metadata.get("version") != SIDECAR_VERSION
+                or metadata.get("workbook_sha256") != workbook_digest(excel_path)):
+            source.close()
+            return None
+        return SidecarBook(source, table, metadata["sheets"])
+    except (OSError, ValueError, KeyError, TypeError, pa.ArrowException):
+        if source is not None:
+            source.close()
+        return None
+
+
+def open_schedule_book(excel_path):
+    """Актуальный sidecar книги, иначе pd.ExcelFile; оба закрываются через with."""
+    book = open_sidecar(excel_path)
+    return book if book is not None else pd.ExcelFile(excel_path)
+
+
+def read_schedule_sheet(excel_path, sheet_name="Schedule"):
+    """Лист книги как DataFrame: из актуального sidecar или через pd.read_excel."""
+    book = open_sidecar(excel_path)
+    if book is None:
+        return pd.read_excel(excel_path, sheet_name=sheet_name)
+    with book:
+        return book.parse(sheet_name)
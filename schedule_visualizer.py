@@ -7,6 +7,8 @@ import numpy as np
 from datetime import datetime, timedelta
 import random
 
+from schedule_sidecar import read_schedule_sheet
+
 def time_to_minutes(time_str):
     """Конвертирует время из строкового формата 'HH:MM' в минуты от начала дня"""
     hours, minutes = map(int, time_str.split(':'))
@@ -49,8 +51,8 @@ def wrap_text(text, width):
 
 def create_schedule_visualization(excel_file, output_pdf):
     """Создает визуализацию расписания из Excel-файла и сохраняет в PDF"""
-    # Загрузка данных из Excel
-    df = pd.read_excel(excel_file, sheet_name='Schedule')
+    # Загрузка данных из Excel (или из его актуальной колоночной копии)
+    df = read_schedule_sheet(excel_file, 'Schedule')
     
     # Конвертация времени из строкового формата в минуты
     df['start_minutes'] = df['start_time'].apply(time_to_minutes)
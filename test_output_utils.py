@@ -1,6 +1,13 @@
+import pandas as pd
 from openpyxl import load_workbook
 
-from output_utils import export_to_excel, make_safe_sheet_name
+from output_utils import (
+    export_to_excel,
+    get_group_schedule,
+    get_room_schedule,
+    get_teacher_schedule,
+    make_safe_sheet_name,
+)
 
 
 def test_make_safe_sheet_name_replaces_invalid_excel_chars_and_deduplicates():
@@ -40,3 +47,38 @@ def test_export_to_excel_accepts_group_names_with_slash(tmp_path):
 
     workbook = load_workbook(output_file, read_only=True)
     assert "G_Musikunterricht _ T. Liakhina" in workbook.sheetnames
+
+
+def test_export_to_excel_sheets_match_per_entity_schedules(tmp_path):
+    def lesson(group, teacher, room, day, start):
+        return {"subject": "Mathe", "group": group, "teacher": teacher, "room": room,
+                "building": "Villa", "day": day, "start_time": start, "end_time": "18:00", "duration": 45}
+
+    class OptimizerStub:
+        solution = [
+            lesson("2A", "Anna", "V1.01", "Mo", "11:00"),
+            lesson("2A+1A Kunst", "Boris", "V1.02", "Di", "10:00"),
+            lesson("1A", "Anna", "V1.02", "Mo", "09:00"),
+            lesson(None, "Boris", "V1.01", "Di", "08:00"),
+        ]
+        teachers = ["Anna", "Boris", "Nobody"]
+        groups = ["1A", "2A", "3C"]
+        rooms = ["V1.01", "V1.02"]
+
+    optimizer = OptimizerStub()
+    output_file = tmp_path / "schedule.xlsx"
+    assert export_to_excel(optimizer, filename=str(output_file)) is True
+
+    sheets = pd.read_excel(output_file, sheet_name=None)
+    assert list(sheets) == ["Schedule", "T_Anna", "T_Boris", "G_1A", "G_2A", "R_V1.01", "R_V1.02"]
+    expected = {
+        "T_Anna": get_teacher_schedule(optimizer, "Anna"),
+        "T_Boris": get_teacher_schedule(optimizer, "Boris"),
+        "G_1A": get_group_schedule(optimizer, "1A"),
+        "G_2A": get_group_schedule(optimizer, "2A"),
+        "R_V1.01": get_room_schedule(optimizer, "V1.01"),
+        "R_V1.02": get_room_schedule(optimizer, "V1.02"),
+    }
+    for sheet, df in expected.items():
+        pd.testing.assert_frame_equal(sheets[sheet], df.reset_index(drop=True), check_dtype=False)
+    assert sheets["G_1A"]["group"].tolist() == ["2A+1A Kunst", "1A"]
@@ -3,6 +3,11 @@ import json
 from gear_xls.runtime_paths import (
     DEFAULT_HOST,
     DEFAULT_PORT,
+    DEFAULT_SERVER_CHANNEL_TIMEOUT,
+    DEFAULT_SERVER_CONNECTION_LIMIT,
+    DEFAULT_SERVER_MODE,
+    DEFAULT_SERVER_THREADS,
+    DEFAULT_SERVER_TV_STREAMS,
     get_schedule_url,
     get_server_base_url,
     get_server_health_url,
@@ -19,10 +24,23 @@ def _write_server_config(root, payload):
     )
 
 
+SERVING_DEFAULTS = {
+    "mode": DEFAULT_SERVER_MODE,
+    "threads": DEFAULT_SERVER_THREADS,
+    "connection_limit": DEFAULT_SERVER_CONNECTION_LIMIT,
+    "channel_timeout": DEFAULT_SERVER_CHANNEL_TIMEOUT,
+    "tv_streams": DEFAULT_SERVER_TV_STREAMS,
+    "individual_journal": False,
+    "storage_backend": "json",
+    "backup_store": "zip",
+}
+
+
 def test_server_config_defaults_to_public_5000(tmp_path):
     assert load_server_config(str(tmp_path)) == {
         "host": DEFAULT_HOST,
         "port": DEFAULT_PORT,
+        **SERVING_DEFAULTS,
     }
     assert get_server_base_url(str(tmp_path)) == "http://127.0.0.1:5000"
 
@@ -30,7 +48,11 @@ def test_server_config_defaults_to_public_5000(tmp_path):
 def test_server_config_reads_per_project_port(tmp_path):
     _write_server_config(tmp_path, {"host": "127.0.0.1", "port": 5001})
 
-    assert load_server_config(str(tmp_path)) == {"host": "127.0.0.1", "port": 5001}
+    assert load_server_config(str(tmp_path)) == {
+        "host": "127.0.0.1",
+        "port": 5001,
+        **SERVING_DEFAULTS,
+    }
     assert get_schedule_url(str(tmp_path)) == "http://127.0.0.1:5001/schedule"
     assert get_server_health_url(str(tmp_path)) == "http://127.0.0.1:5001/health"
 
@@ -40,8 +62,58 @@ def test_server_config_env_override_is_explicit(tmp_path, monkeypatch):
     monkeypatch.setenv("HOST", "127.0.0.1")
     monkeypatch.setenv("PORT", "5002")
 
-    assert load_server_config(str(tmp_path)) == {"host": "0.0.0.0", "port": 5000}
+    assert load_server_config(str(tmp_path)) == {
+        "host": "0.0.0.0",
+        "port": 5000,
+        **SERVING_DEFAULTS,
+    }
     assert load_server_config(str(tmp_path), include_env=True) == {
         "host": "127.0.0.1",
         "port": 5002,
+        **SERVING_DEFAULTS,
     }
+
+
+def test_server_config_reads_production_serving_settings(tmp_path, monkeypatch):
+    _write_server_config(
+        tmp_path,
+        {"mode": "production", "threads": 16, "connection_limit": 250, "channel_timeout": 30, "tv_streams": 12},
+    )
+
+    config = load_server_config(str(tmp_path))
+    assert config["mode"] == "production"
+    assert config["threads"] == 16
+    assert config["connection_limit"] == 250
+    assert config["channel_timeout"] == 30
+    assert config["tv_streams"] == 12
+
+    assert config["storage_backend"] == "json"
+
+    monkeypatch.setenv("SCHEDGEN_SERVER_MODE", "development")
+    assert load_server_config(str(tmp_path), include_env=True)["mode"] == "development"
+
+
+def test_server_config_invalid_serving_settings_fall_back(tmp_path):
+    _write_server_config(
+        tmp_path,
+        {
+            "mode": "turbo",
+            "threads": 0,
+            "connection_limit": "many",
+            "channel_timeout": True,
+            "tv_streams": -1,
+            "storage_backend": "mongo",
+            "backup_store": "tape",
+        },
+    )
+
+    config = load_server_config(str(tmp_path))
+    assert {key: config[key] for key in SERVING_DEFAULTS} == SERVING_DEFAULTS
+
+
+def test_server_config_reads_sqlite_storage_backend(tmp_path):
+    _write_server_config(tmp_path, {"storage_backend": " SQLite ", "backup_store": "dedup"})
+
+    config = load_server_config(str(tmp_path))
+    assert config["storage_backend"] == "sqlite"
+    assert config["backup_store"] == "dedup"
@@ -0,0 +1,131 @@
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(ROOT_DIR, "visualiser"))
+
+import schedule_sidecar  # noqa: E402
+from data_processor import load_data  # noqa: E402
+from entity_schedules import TEACHER_PREFIX, load_entity_schedules  # noqa: E402
+from gear_xls.excel_parser import parse_schedule  # noqa: E402
+from output_utils import export_to_excel  # noqa: E402
+from schedule_sidecar import (  # noqa: E402
+    open_schedule_book, open_sidecar, read_schedule_sheet, sidecar_available, sidecar_path, workbook_digest,
+)
+
+
+class OptimizerStub:
+    solution = [
+        {"subject": "Mathe", "group": "2A", "teacher": "Anna", "room": "V1.01", "building": "Villa",
+         "day": "Mo", "start_time": "11:00", "end_time": "11:45", "duration": 45, "lesson_type": None},
+        {"subject": "Kunst", "group": "2A+1A Kunst", "teacher": "Boris", "room": "V1.02", "building": "Villa",
+         "day": "Di", "start_time": "10:00", "end_time": "11:30", "duration": 90, "lesson_type": None},
+    ]
+    teachers = ["Anna", "Boris"]
+    groups = ["1A", "2A"]
+    rooms = ["V1.01", "V1.02"]
+
+
+def _export(tmp_path):
+    excel_file = str(tmp_path / "optimized_schedule.xlsx")
+    assert export_to_excel(OptimizerStub(), filename=excel_file, sidecar=True) is True
+    return excel_file
+
+
+def test_readers_use_the_workbook_when_sidecar_is_missing_or_stale(tmp_path):
+    excel_file = _export(tmp_path)
+    assert os.path.exists(sidecar_path(excel_file)) == sidecar_available()
+
+    workbook = load_workbook(excel_file)
+    workbook["Schedule"]["A2"] = "Physik"
+    workbook.save(excel_file)
+
+    # The workbook changed after export, so its sidecar is no longer used
+    assert open_sidecar(excel_file) is None
+    assert read_schedule_sheet(excel_file)["subject"].tolist() == ["Physik", "Kunst"]
+    activities = parse_schedule(excel_file)
+    assert [activity["subject"] for activity in activities.values()] == ["Physik", "Kunst"]
+    with open_schedule_book(excel_file) as book:
+        assert isinstance(book, pd.ExcelFile)
+
+
+def test_sidecar_matches_every_sheet_of_the_workbook(tmp_path):
+    pytest.importorskip("pyarrow")
+    excel_file = _export(tmp_path)
+
+    with open_sidecar(excel_file) as book, pd.ExcelFile(excel_file) as xl:
+        assert book.sheet_names == xl.sheet_names
+        for sheet in xl.sheet_names:
+            pd.testing.assert_frame_equal(book.parse(sheet), xl.parse(sheet), check_dtype=False)
+
+    activities = parse_schedule(excel_file)
+    assert activities[2]["start_time"] == "10:00" and activities[2]["duration"] == 90
+    assert activities[2]["students"] == "2A+1A Kunst"
+
+
+class _FakeTable:
+    """The part of a pyarrow Table the sidecar readers use, backed by a DataFrame."""
+
+    def __init__(self, frame, metadata=None):
+        self.frame = frame
+        self.schema = SimpleNamespace(metadata=metadata)
+
+    def slice(self, start, length):
+        return _FakeTable(self.frame.iloc[start:start + length].reset_index(drop=True))
+
+    def to_pandas(self):
+        return self.frame.copy()
+
+
+def _fake_sidecar(monkeypatch, excel_file, rename):
+    """Register a sidecar for the current workbook whose subjects differ from it."""
+    with pd.ExcelFile(excel_file) as xl:
+        sheets = [(name, xl.parse(name)) for name in xl.sheet_names]
+    ranges, offset = [], 0
+    for name, df in sheets:
+        ranges.append([name, offset, len(df)])
+        offset += len(df)
+    combined = pd.concat([df for _, df in sheets], ignore_index=True)
+    combined["subject"] = combined["subject"].map(rename)
+    metadata = {"version": schedule_sidecar.SIDECAR_VERSION,
+                "workbook_sha256": workbook_digest(excel_file), "sheets": ranges}
+    table = _FakeTable(combined, {schedule_sidecar._METADATA_KEY: json.dumps(metadata)})
+
+    open(sidecar_path(excel_file), "wb").close()
+    fake_pa = SimpleNamespace(
+        ArrowException=RuntimeError,
+        memory_map=lambda path, mode: SimpleNamespace(close=lambda: None),
+        ipc=SimpleNamespace(open_file=lambda source: SimpleNamespace(read_all=lambda: table)),
+    )
+    monkeypatch.setattr(schedule_sidecar, "pa", fake_pa)
+
+
+def _reader_subjects(excel_file):
+    teachers = load_entity_schedules(excel_file, TEACHER_PREFIX)
+    return (
+        sorted(load_data(excel_file)["subject"]),
+        sorted(activity["subject"] for activity in parse_schedule(excel_file).values()),
+        sorted(subject for _sheet, _name, df in teachers for subject in df["subject"]),
+    )
+
+
+def test_readers_follow_the_sidecar_hash_without_pyarrow(tmp_path, monkeypatch):
+    excel_file = _export(tmp_path)
+    _fake_sidecar(monkeypatch, excel_file, {"Mathe": "Algebra", "Kunst": "Malen"})
+
+    # The hash matches the workbook, so every reader takes the sidecar rows
+    assert _reader_subjects(excel_file) == (["Algebra", "Malen"],) * 3
+
+    workbook = load_workbook(excel_file)
+    workbook["Schedule"]["A2"] = "Physik"
+    workbook["T_Anna"]["A2"] = "Physik"
+    workbook.save(excel_file)
+
+    # After an edit in Excel the hash no longer matches and the workbook is read
+    assert _reader_subjects(excel_file) == (["Kunst", "Physik"],) * 3
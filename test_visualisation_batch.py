@@ -0,0 +1,77 @@
+import os
+
+import pandas as pd
+
+import visualisation
+
+
+def _schedule(anna_start="10:00"):
+    rows = [
+        {"subject": "Mathe", "group": "2A", "teacher": "Anna", "room": "V1.01", "building": "Villa",
+         "day": "Mo", "start_time": anna_start, "end_time": "11:00"},
+        {"subject": "Kunst", "group": "2A+1A Kunst", "teacher": "Boris", "room": "V1.02", "building": "Villa",
+         "day": "Di", "start_time": "12:00", "end_time": "13:30"},
+    ]
+    return visualisation.prepare_schedule_data(pd.DataFrame(rows))
+
+
+def test_render_all_writes_every_entity_and_skips_unchanged(tmp_path):
+    rendered, unchanged, removed = visualisation.render_all(_schedule(), str(tmp_path), jobs=1)
+
+    assert sorted(rendered) == [
+        "group_2A+1A_Kunst.png", "group_2A.png", "room_V1_01.png", "room_V1_02.png",
+        "schedule_Di.png", "schedule_Mo.png", "teacher_Anna.png", "teacher_Boris.png",
+    ]
+    assert unchanged == [] and removed == []
+    assert all((tmp_path / name).stat().st_size > 0 for name in rendered)
+
+    boris_mtime = os.stat(tmp_path / "teacher_Boris.png").st_mtime_ns
+    rendered, unchanged, removed = visualisation.render_all(_schedule("09:30"), str(tmp_path), jobs=1)
+
+    # Only images containing Anna's moved lesson are re-rendered
+    assert sorted(rendered) == ["group_2A.png", "room_V1_01.png", "schedule_Mo.png", "teacher_Anna.png"]
+    assert "teacher_Boris.png" in unchanged and removed == []
+    assert os.stat(tmp_path / "teacher_Boris.png").st_mtime_ns == boris_mtime
+
+
+def test_render_all_removes_images_of_vanished_entities(tmp_path):
+    visualisation.render_all(_schedule(), str(tmp_path), jobs=1)
+
+    df = _schedule()
+    _, _, removed = visualisation.render_all(df[df["teacher"] == "Anna"].copy(), str(tmp_path), jobs=1)
+
+    assert removed == ["group_2A+1A_Kunst.png", "room_V1_02.png", "schedule_Di.png", "teacher_Boris.png"]
+    assert not (tmp_path / "teacher_Boris.png").exists()
+
+
+def test_forced_or_re_signed_runs_still_remove_vanished_entities(tmp_path, monkeypatch):
+    visualisation.render_all(_schedule(), str(tmp_path), jobs=1)
+    df = _schedule()
+    anna = df[df["teacher"] == "Anna"].copy()
+
+    _, _, removed = visualisation.render_all(anna, str(tmp_path), jobs=1, force=True)
+    assert "teacher_Boris.png" in removed and not (tmp_path / "teacher_Boris.png").exists()
+
+    visualisation.render_all(_schedule(), str(tmp_path), jobs=1)
+    monkeypatch.setattr(visualisation, "_renderer_signature", lambda: "changed renderer")
+    rendered, unchanged, removed = visualisation.render_all(anna, str(tmp_path), jobs=1)
+    assert unchanged == [] and "teacher_Anna.png" in rendered
+    assert "teacher_Boris.png" in removed and not (tmp_path / "teacher_Boris.png").exists()
+
+
+def test_day_figures_share_one_subject_palette():
+    rows = [
+        {"subject": subject, "group": "2A", "teacher": "Anna", "room": "V1.01", "building": "Villa",
+         "day": day, "start_time": start, "end_time": end}
+        for subject, day, start, end in (
+            ("Mathe", "Mo", "10:00", "11:00"),
+            ("Deutsch", "Di", "09:00", "10:00"),
+            ("Mathe", "Di", "10:00", "11:00"),
+        )
+    ]
+    monday, tuesday = visualisation.day_specs(visualisation.prepare_schedule_data(pd.DataFrame(rows)))
+
+    assert [subject for subject, _color in monday["legend"]] == ["Mathe"]
+    assert [subject for subject, _color in tuesday["legend"]] == ["Deutsch", "Mathe"]
+    assert dict(monday["legend"])["Mathe"] == dict(tuesday["legend"])["Mathe"]
+    assert monday["blocks"][0][3] == dict(tuesday["legend"])["Mathe"]
@@ -0,0 +1,157 @@
+import json
+import os
+import shutil
+import sys
+
+import pandas as pd
+
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(ROOT_DIR, "visualiser"))
+
+from entity_schedules import GROUP_PREFIX, TEACHER_PREFIX, load_entity_schedules  # noqa: E402
+from output_utils import export_to_excel  # noqa: E402
+from schedule_render import render_plan  # noqa: E402
+import teacher_exporter  # noqa: E402
+from teacher_exporter import export_teacher_schedules  # noqa: E402
+
+
+LONG_TEACHER = "Maximilian Alexander von Longname"
+
+
+class _Optimizer:
+    def __init__(self, solution):
+        self.solution = solution
+        self.teachers = sorted({row["teacher"] for row in solution})
+        self.groups = ["1A", "2A"]
+        self.rooms = []
+
+
+def _lesson(subject, group, teacher, day, start, end):
+    return {
+        "subject": subject,
+        "group": group,
+        "teacher": teacher,
+        "room": "V1.01",
+        "building": "Villa",
+        "day": day,
+        "start_time": start,
+        "end_time": end,
+        "duration": 60,
+        "lesson_type": "group",
+    }
+
+
+def _solution():
+    return [
+        _lesson("Mathe", "2A", "Anna", "Di", "10:00", "11:00"),
+        _lesson("Deutsch", "1A", "Anna", "Mo", "12:00", "13:00"),
+        _lesson("Kunst", "2A+1A Kunst", "Boris", "Mo", "09:00", "10:00"),
+        _lesson("Musik", "1A", LONG_TEACHER, "Mi", "14:00", "15:00"),
+    ]
+
+
+def _workbook(tmp_path, solution=None):
+    solution = solution if solution is not None else _solution()
+    path = tmp_path / "optimized_schedule.xlsx"
+    export_to_excel(_Optimizer(solution), str(path))
+    return path
+
+
+def test_entity_schedules_match_sheets_and_fall_back_for_truncated_names(tmp_path, capsys):
+    path = _workbook(tmp_path)
+
+    for prefix in (TEACHER_PREFIX, GROUP_PREFIX):
+        entities = load_entity_schedules(str(path), prefix)
+        sheets = [sheet for sheet in pd.ExcelFile(path).sheet_names if sheet.startswith(prefix)]
+        assert [sheet for sheet, _, _ in entities] == sheets
+        for sheet, name, df in entities:
+            assert name == sheet[2:]
+            pd.testing.assert_frame_equal(df, pd.read_excel(path, sheet_name=sheet), check_dtype=False)
+
+    log = capsys.readouterr().out
+    # The 33-character teacher name is truncated in its sheet name and re-read.
+    assert "Листов T_*: 3, из листа Schedule: 2, прочитано отдельно: 1" in log
+    assert "Листов G_*: 2, из листа Schedule: 2, прочитано отдельно: 0" in log
+
+
+def test_teacher_pdfs_render_in_worker_processes(tmp_path):
+    path = _workbook(tmp_path)
+    output_dir = tmp_path / "teacher_schedules"
+
+    created = export_teacher_schedules(str(path), output_dir=str(output_dir), jobs=2)
+
+    assert [os.path.basename(item) for item in created] == ["Anna.pdf", "Boris.pdf", LONG_TEACHER[:29] + ".pdf"]
+    assert all(os.path.getsize(item) > 0 for item in created)
+
+
+def test_teacher_export_rerenders_only_changed_entities(tmp_path, capsys):
+    output_dir = tmp_path / "teacher_schedules"
+    export_teacher_schedules(str(_workbook(tmp_path)), output_dir=str(output_dir), jobs=1)
+    (output_dir / "stray.pdf").write_bytes(b"%PDF-")
+    boris_mtime = os.stat(output_dir / "Boris.pdf").st_mtime_ns
+    capsys.readouterr()
+
+    unchanged = export_teacher_schedules(str(_workbook(tmp_path)), output_dir=str(output_dir), jobs=1)
+    assert "Преподаватели: перерисовано 0, без изменений 3, удалено устаревших файлов 0" in capsys.readouterr().out
+    # The tool never wrote stray.pdf, so it is left alone
+    assert len(unchanged) == 3 and (output_dir / "stray.pdf").exists()
+
+    solution = [row for row in _solution() if row["teacher"] != LONG_TEACHER]
+    solution[0]["start_time"] = "10:30"
+    changed = export_teacher_schedules(str(_workbook(tmp_path, solution)), output_dir=str(output_dir), jobs=1)
+
+    assert "Преподаватели: перерисовано 1, без изменений 1, удалено устаревших файлов 1" in capsys.readouterr().out
+    assert [os.path.basename(item) for item in changed] == ["Anna.pdf", "Boris.pdf"]
+    assert os.stat(output_dir / "Boris.pdf").st_mtime_ns == boris_mtime
+    assert sorted(os.listdir(output_dir)) == ["Anna.pdf", "Boris.pdf", "stray.pdf"]
+    assert (tmp_path / "teacher_schedules.manifest.json").exists()
+
+
+def test_failed_render_keeps_the_previous_pdf_and_manifest_entry(tmp_path, monkeypatch):
+    output_dir = tmp_path / "teacher_schedules"
+    export_teacher_schedules(str(_workbook(tmp_path)), output_dir=str(output_dir), jobs=1)
+    manifest_file = tmp_path / "teacher_schedules.manifest.json"
+    boris_entry = json.loads(manifest_file.read_text(encoding="utf-8"))["entities"]["Boris.pdf"]
+    boris_pdf = (output_dir / "Boris.pdf").read_bytes()
+
+    original = teacher_exporter.create_teacher_pdf
+
+    def failing_for_boris(layout_manager, output_path, teacher_name):
+        if teacher_name == "Boris":
+            raise RuntimeError("font missing")
+        return original(layout_manager, output_path, teacher_name)
+
+    monkeypatch.setattr(teacher_exporter, "create_teacher_pdf", failing_for_boris)
+    solution = _solution()
+    solution[2]["start_time"] = "09:30"
+    created = export_teacher_schedules(str(_workbook(tmp_path, solution)), output_dir=str(output_dir), jobs=1)
+
+    assert [os.path.basename(item) for item in created] == ["Anna.pdf", LONG_TEACHER[:29] + ".pdf"]
+    assert (output_dir / "Boris.pdf").read_bytes() == boris_pdf
+    assert json.loads(manifest_file.read_text(encoding="utf-8"))["entities"]["Boris.pdf"] == boris_entry
+
+    # The stale entry does not match the changed rows, so the next run retries Boris
+    monkeypatch.setattr(teacher_exporter, "create_teacher_pdf", original)
+    retried = export_teacher_schedules(str(_workbook(tmp_path, solution)), output_dir=str(output_dir), jobs=1)
+    assert "Boris.pdf" in [os.path.basename(item) for item in retried]
+    assert (output_dir / "Boris.pdf").read_bytes() != boris_pdf
+
+
+def test_editing_a_shared_render_source_invalidates_the_manifest(tmp_path, monkeypatch, capsys):
+    shared_dir = tmp_path / "schedule_render"
+    shutil.copytree(os.path.dirname(render_plan.__file__), shared_dir)
+    monkeypatch.setattr(render_plan, "_MODULE_DIR", str(shared_dir))
+    monkeypatch.setattr(render_plan, "_signatures", {})
+    output_dir = tmp_path / "teacher_schedules"
+    path = str(_workbook(tmp_path))
+    export_teacher_schedules(path, output_dir=str(output_dir), jobs=1)
+
+    with open(shared_dir / "text_layout.py", "a", encoding="utf-8") as f:
+        f.write("\n# truncation changed\n")
+    # A new process computes the signature again
+    monkeypatch.setattr(render_plan, "_signatures", {})
+    capsys.readouterr()
+    export_teacher_schedules(path, output_dir=str(output_dir), jobs=1)
+
+    assert "Преподаватели: перерисовано 3, без изменений 0" in capsys.readouterr().out
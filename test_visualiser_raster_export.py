@@ -0,0 +1,38 @@
+import os
+import sys
+
+import pandas as pd
+from PIL import Image
+
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(ROOT_DIR, "visualiser"))
+
+from data_processor import process_schedule_data  # noqa: E402
+from enhanced_export_manager import EnhancedExportManager  # noqa: E402
+
+
+def _manager():
+    rows = [
+        {"subject": "Mathe", "group": "2A", "teacher": "Anna", "room": "V1.01", "building": "Villa",
+         "day": day, "start_time": "10:00", "end_time": "11:00", "duration": 60}
+        for day in ("Mo", "Di")
+    ]
+    return EnhancedExportManager(*process_schedule_data(pd.DataFrame(rows)))
+
+
+def test_png_export_rasterizes_layout_directly_and_in_tiles(tmp_path):
+    manager = _manager()
+
+    single = tmp_path / "schedule.png"
+    assert manager.export_to_png(str(single), None, dpi=72)
+    with Image.open(single) as image:
+        assert image.size == (1191, 842)
+        # Lesson blocks are filled, not just a blank page
+        assert len(image.getcolors(1 << 16)) > 2
+
+    assert manager.export_to_png(str(tmp_path / "tiled.webp"), None, dpi=72, tile_size=500)
+    tiles = sorted(name for name in os.listdir(tmp_path) if name.startswith("tiled_"))
+    assert tiles == [f"tiled_{row}_{col}.webp" for row in range(2) for col in range(3)]
+    with Image.open(tmp_path / "tiled_1_2.webp") as tile:
+        assert tile.format == "WEBP" and tile.size == (191, 342)
@@ -0,0 +1,82 @@
+import os
+import sys
+
+import pandas as pd
+from reportlab.pdfgen import canvas
+
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(ROOT_DIR, "visualiser"))
+
+import enhanced_layout_manager  # noqa: E402
+from data_processor import process_schedule_data  # noqa: E402
+from enhanced_layout_manager import EnhancedScheduleLayout, build_render_plan  # noqa: E402
+from schedule_render.render_plan import RENDER_PLAN_DIR, RecordingCanvas, RenderPlanCache, cache_for, plan_key  # noqa: E402
+
+
+def _schedule(start="10:00"):
+    rows = [
+        {"subject": "Mathe", "group": "2A", "teacher": "Anna", "room": "V1.01", "building": "Villa",
+         "day": day, "start_time": start, "end_time": "11:00", "duration": 60}
+        for day in ("Mo", "Di")
+    ]
+    return process_schedule_data(pd.DataFrame(rows))
+
+
+def _plan(cache, days, schedule):
+    return build_render_plan(cache, days, schedule, "draw_schedule", 30, 700, 1100, 700, "Helvetica")
+
+
+def test_plan_replays_the_same_canvas_calls_as_direct_drawing(tmp_path):
+    days, schedule = _schedule()
+    direct = RecordingCanvas()
+    EnhancedScheduleLayout(days, schedule).draw_schedule(direct, 30, 700, 1100, 700, "Helvetica")
+
+    plan = _plan(RenderPlanCache(), days, schedule)
+    replayed = RecordingCanvas()
+    plan.replay(replayed)
+
+    assert replayed.ops == direct.ops
+    assert any(op[0] == "roundRect" for op in plan.ops)
+
+    pdf = canvas.Canvas(str(tmp_path / "schedule.pdf"))
+    plan.replay(pdf)
+    pdf.save()
+    assert (tmp_path / "schedule.pdf").stat().st_size > 0
+
+
+def test_cached_plan_skips_layout_until_data_changes(tmp_path, monkeypatch):
+    days, schedule = _schedule()
+    cache_dir = tmp_path / RENDER_PLAN_DIR
+    first = _plan(RenderPlanCache(str(cache_dir)), days, schedule)
+    assert len(os.listdir(cache_dir)) == 1
+
+    layouts = []
+    original = enhanced_layout_manager.EnhancedScheduleLayout
+    monkeypatch.setattr(enhanced_layout_manager, "EnhancedScheduleLayout",
+                        lambda *args: layouts.append(1) or original(*args))
+
+    # A fresh cache on the same directory reads the plan from disk
+    from_disk = _plan(RenderPlanCache(str(cache_dir)), days, schedule)
+    assert from_disk.ops == first.ops
+    assert layouts == []
+
+    changed = _plan(RenderPlanCache(str(cache_dir)), *_schedule("09:30"))
+    assert layouts == [1]
+    assert changed.ops != first.ops
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_cache_is_shared_per_output_directory(tmp_path):
+    assert cache_for(str(tmp_path / "a.pdf")) is cache_for(str(tmp_path / "b.png"))
+    assert cache_for(str(tmp_path / "a.pdf")).cache_dir == str(tmp_path / RENDER_PLAN_DIR)
+
+
+def test_plan_key_covers_the_callers_layout_rules():
+    days, schedule = _schedule()
+    params = ("draw_schedule", 30, 700, 1100, 700, "Helvetica")
+    tv_dir = os.path.join(ROOT_DIR, "visualiserTV")
+
+    own = plan_key(enhanced_layout_manager.LAYOUT_DIR, days, schedule, *params)
+    assert own == plan_key(enhanced_layout_manager.LAYOUT_DIR, days, schedule, *params)
+    assert own != plan_key(tv_dir, days, schedule, *params)
@@ -0,0 +1,45 @@
+import os
+import sys
+
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(ROOT_DIR, "visualiser"))
+
+from schedule_render import text_layout  # noqa: E402
+from color_manager import get_group_color  # noqa: E402
+
+
+def _linear_truncate(text, max_width, font_name, font_size):
+    if not text:
+        return ""
+    if stringWidth(text, font_name, font_size) <= max_width:
+        return text
+    for i in range(len(text) - 1, 0, -1):
+        truncated = text[:i] + "..."
+        if stringWidth(truncated, font_name, font_size) <= max_width:
+            return truncated
+    return text[0] + "..."
+
+
+def test_truncate_text_matches_linear_scan():
+    texts = ["", "A", "Mathe", "Maximilian Alexander von Longname", "2A+1A Kunst Sa StudioP", "Ärztin Öztürk-Weiß"]
+    for text in texts:
+        for font_name in ("Helvetica", "Helvetica-Bold"):
+            for max_width in (0, 5, 12.5, 40, 73.3, 500):
+                for font_size in (6, 9.5, 11):
+                    expected = _linear_truncate(text, max_width, font_name, font_size)
+                    assert text_layout.truncate_text(text, max_width, font_name, font_size) == expected
+
+
+def test_text_measurements_and_group_colours_are_cached():
+    text_layout.clear_text_caches()
+    text_layout.truncate_text("Maximilian Alexander von Longname", 40, "Helvetica", 9)
+    misses = text_layout.text_width.cache_info().misses
+
+    assert text_layout.truncate_text("Maximilian Alexander von Longname", 40, "Helvetica", 9).endswith("...")
+    assert text_layout.truncate_text("Maximilian Alexander von Longname", 41, "Helvetica", 9).endswith("...")
+    assert text_layout.text_width.cache_info().misses <= misses + 2
+
+    assert get_group_color("2A+1A Kunst") is get_group_color("2A+1A Kunst")
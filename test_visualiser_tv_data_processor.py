@@ -70,3 +70,39 @@ def test_filter_by_lesson_type_group_uses_subject_fallback_without_lesson_type()
     filtered = data_processor.filter_by_lesson_type(df, "group")
 
     assert filtered["subject"].tolist() == ["Deutsch"]
+
+
+def test_process_schedule_data_sorts_days_and_cleans_lesson_columns():
+    df = pd.DataFrame(
+        [
+            {"subject": "Kunst", "group": "1A", "teacher": "Anna", "room": "V1.01", "building": "Villa",
+             "day": "Di", "start_time": "12:00", "end_time": "13:00", "duration": 60, "lesson_type": " Group"},
+            {"subject": "Mathe", "group": "2A", "teacher": "Boris", "room": 12, "building": "Villa",
+             "day": "Mo", "start_time": "09:30", "end_time": "10:15", "duration": 45, "lesson_type": None},
+            {"subject": "Musik", "group": "1A", "teacher": "Anna", "room": "V1.02", "building": "Villa",
+             "day": "Di", "start_time": "08:00", "end_time": "09:00", "duration": 60, "lesson_type": "trial"},
+            {"subject": "Sport", "group": "3A", "teacher": "Clara", "room": "K0.01", "building": "Kolibri",
+             "day": "So", "start_time": "10:00", "end_time": "11:00", "duration": 60, "lesson_type": "group"},
+        ]
+    )
+
+    days, schedule = data_processor.process_schedule_data(df)
+
+    assert days == ["Mo", "Di"]
+    assert [lesson["subject"] for lesson in schedule["Di"]] == ["Musik", "Kunst"]
+    assert schedule["Di"][1] == {
+        "subject": "Kunst",
+        "group": "1A",
+        "teacher": "Anna",
+        "room": "1.01",
+        "building": "Villa",
+        "start_time": "12:00",
+        "end_time": "13:00",
+        "duration": 60,
+        "start_time_mins": 720,
+        "end_time_mins": 780,
+        "lesson_type": "group",
+    }
+    assert schedule["Mo"][0]["room"] == 12
+    assert schedule["Mo"][0]["end_time_mins"] == 615
+    assert "lesson_type" not in schedule["Mo"][0]
@@ -11,6 +11,7 @@ from datetime import datetime, timedelta, timezone
 
 import pytest
 
+from gear_xls import backup_blob_store
 from gear_xls import backup_manager
 from gear_xls import lock_manager
 from gear_xls import restore_manager
@@ -466,6 +467,7 @@ def test_restore_status_clear_requires_admin_and_confirm(project_root, server_ap
         ("PUT", "/api/blocks/block-1"),
         ("DELETE", "/api/blocks/block-1"),
         ("POST", "/api/blocks/block-1/convert"),
+        ("POST", "/api/blocks/batch"),
         ("POST", "/api/columns"),
         ("DELETE", "/api/columns"),
         ("POST", "/api/spiski/add"),
@@ -1281,3 +1283,180 @@ def test_rollback_failure_sets_recovery_required(project_root, monkeypatch):
     assert status["active"] is True
     assert status["recovery_required"] is True
     assert status["safety_backup_id"]
+
+
+def test_list_backups_uses_catalogue_and_revalidates_changed_archives(project_root, monkeypatch):
+    first = _create_backup(project_root)
+    backup_dir = project_root / "gear_xls" / "backups"
+    index = json.loads((backup_dir / "index.json").read_text(encoding="utf-8"))
+    assert index["backups"][first["filename"]]["valid"] is True
+
+    calls = []
+    original = backup_manager.validate_backup_zip
+    monkeypatch.setattr(
+        backup_manager,
+        "validate_backup_zip",
+        lambda path, deep=True: calls.append(os.path.basename(path)) or original(path, deep=deep),
+    )
+    assert backup_manager.list_backups(str(project_root))[0]["valid"] is True
+    assert calls == []
+
+    archive = backup_dir / first["filename"]
+    archive.write_bytes(b"not a zip")
+    backups = backup_manager.list_backups(str(project_root))
+    assert calls == [first["filename"]]
+    assert backups[0]["valid"] is False
+
+    archive.unlink()
+    assert backup_manager.list_backups(str(project_root)) == []
+    index = json.loads((backup_dir / "index.json").read_text(encoding="utf-8"))
+    assert index["backups"] == {}
+
+
+def _enable_dedup_store(project_root):
+    _write_json(project_root / "gear_xls" / "config" / "server.json", {"backup_store": "dedup"})
+
+
+def _blob_files(project_root):
+    blob_root = project_root / "gear_xls" / "backups" / "blobs"
+    return sorted(path.name for path in blob_root.rglob("*") if path.is_file())
+
+
+def test_dedup_store_shares_blobs_and_lists_backups(project_root):
+    _enable_dedup_store(project_root)
+    first = _create_backup(project_root, comment="first")
+    second = _create_backup(project_root, comment="second")
+    backup_dir = project_root / "gear_xls" / "backups"
+
+    assert not list(backup_dir.glob("*.zip"))
+    # Only the two manifests differ; every other entry is stored once.
+    assert len(_blob_files(project_root)) == len(backup_manager.EXPECTED_ARCHIVE_PATHS) + 1
+    listed = {item["id"]: item for item in backup_manager.list_backups(str(project_root))}
+    assert listed[first["id"]]["valid"] is True
+    assert listed[second["id"]]["filename"] == f"{second['id']}.zip"
+
+    archive_bytes = backup_manager.read_backup_zip_bytes(first["id"], str(project_root))
+    zip_path = project_root / "rebuilt.zip"
+    zip_path.write_bytes(archive_bytes)
+    assert backup_manager.validate_backup_zip(str(zip_path))["comment"] == "first"
+
+
+def test_dedup_delete_collects_unreferenced_blobs(project_root):
+    _enable_dedup_store(project_root)
+    first = _create_backup(project_root, comment="first")
+    second = _create_backup(project_root, comment="second")
+
+    result = backup_manager.delete_backup(first["id"], str(project_root))
+
+    assert result["blobs_removed"] == 1
+    assert len(_blob_files(project_root)) == len(backup_manager.EXPECTED_ARCHIVE_PATHS)
+    assert [item["id"] for item in backup_manager.list_backups(str(project_root))] == [second["id"]]
+    manifest, entries = backup_manager.load_backup_entries(second["id"], str(project_root))
+    assert manifest["comment"] == "second"
+    with pytest.raises(backup_manager.BackupError):
+        backup_manager.delete_backup(first["id"], str(project_root))
+
+
+def test_dedup_gc_keeps_blobs_when_a_record_cannot_be_read(project_root, monkeypatch):
+    _enable_dedup_store(project_root)
+    first = _create_backup(project_root, comment="first")
+    second = _create_backup(project_root, comment="second")
+    blobs_before = _blob_files(project_root)
+    original_read_record = backup_blob_store.read_record
+
+    def flaky_read_record(backup_dir, backup_id):
+        if backup_id == second["id"]:
+            raise OSError("transient read error")
+        return original_read_record(backup_dir, backup_id)
+
+    monkeypatch.setattr(backup_blob_store, "read_record", flaky_read_record)
+    result = backup_manager.delete_backup(first["id"], str(project_root))
+
+    assert result["blobs_removed"] == 0
+    assert _blob_files(project_root) == blobs_before
+    monkeypatch.setattr(backup_blob_store, "read_record", original_read_record)
+    manifest, _entries = backup_manager.load_backup_entries(second["id"], str(project_root))
+    assert manifest["comment"] == "second"
+
+
+def test_dedup_backup_download_returns_zip(project_root, server_app):
+    _enable_dedup_store(project_root)
+    backup = _create_backup(project_root)
+
+    with server_app.test_client() as client:
+        _login_admin(client)
+        response = client.get(f"/api/backups/{backup['id']}/download")
+
+    assert response.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(response.data)) as archive:
+        assert set(archive.namelist()) == set(backup_manager.EXPECTED_ARCHIVE_PATHS)
+
+
+def _finished_job(client, response):
+    assert response.status_code == 202
+    job = response.get_json()["job"]
+    jobs = sys.modules["background_jobs"]
+    assert jobs.wait_for_job(job["id"], timeout=30)["status"] in jobs.FINISHED_STATES
+    status = client.get(job["status_url"])
+    assert status.status_code == 200
+    return status.get_json()["job"]
+
+
+def test_async_backup_create_and_upload_report_results_through_jobs(project_root, server_app):
+    with server_app.test_client() as client:
+        _login_admin(client)
+        created = _finished_job(
+            client, client.post("/api/backups", json={"comment": "async", "async": True})
+        )
+        payload = (project_root / "gear_xls" / "backups" / created["result"]["backup"]["filename"]).read_bytes()
+        uploaded = _finished_job(client, client.post(
+            "/api/backups/upload?async=1",
+            data={"file": (io.BytesIO(payload), "client_backup.zip")},
+            content_type="multipart/form-data",
+        ))
+        events = client.get(uploaded["events_url"])
+        missing = client.get("/api/jobs/unknown")
+
+    assert created["kind"] == "backup_create"
+    assert created["status"] == "succeeded"
+    assert created["status_code"] == 200
+    assert uploaded["result"]["backup"]["backup_kind"] == "uploaded"
+    assert events.mimetype == "text/event-stream"
+    assert b'"status": "succeeded"' in events.data
+    assert missing.status_code == 404
+    assert not list((project_root / "gear_xls" / "backups").glob(".upload_*"))
+
+
+def test_async_upload_failure_is_reported_on_the_job(server_app):
+    with server_app.test_client() as client:
+        _login_admin(client)
+        job = _finished_job(client, client.post(
+            "/api/backups/upload?async=1",
+            data={"file": (io.BytesIO(b"not a zip"), "client_backup.zip")},
+            content_type="multipart/form-data",
+        ))
+
+    assert job["status"] == "failed"
+    assert job["status_code"] == 400
+    assert job["result"]["ok"] is False
+
+
+def test_async_restore_runs_as_job_and_job_status_stays_reachable(project_root, server_app):
+    backup = _create_backup(project_root)
+
+    with server_app.test_client() as client:
+        _login_admin(client)
+        assert client.post("/api/lock/acquire").get_json()["ok"] is True
+        job = _finished_job(
+            client,
+            client.post(
+                f"/api/backups/{backup['id']}/restore",
+                json={"confirm": True, "async": True},
+            ),
+        )
+        _write_restore_status(project_root, active=True, started_at=_utc_timestamp(), started_by="admin")
+        during_restore = client.get(job["status_url"])
+
+    assert job["status"] == "succeeded"
+    assert job["result"]["restored_from"] == backup["id"]
+    assert during_restore.status_code == 200
@@ -0,0 +1,97 @@
+import importlib
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from gear_xls import schedule_structure
+from gear_xls.services import schedule_pipeline
+
+
+BUNDLE_LINK = r'"assets/(bundle\.[0-9a-f]{16}\.(?:js|css))"'
+
+
+@pytest.fixture()
+def html_coordinator(monkeypatch):
+    # The generators import html_styles/html_javascript as top-level modules.
+    monkeypatch.syspath_prepend(str(PROJECT_ROOT / "gear_xls"))
+    from gear_xls.generators.html_coordinator import HTMLCoordinator
+
+    return HTMLCoordinator
+
+
+def _activities():
+    return {
+        "g1": {
+            "building": "Villa",
+            "day": "Mo",
+            "room": "1.01",
+            "room_display": "1.01",
+            "subject": "Deutsch",
+            "teacher": "Teacher",
+            "students": "Group",
+            "start_time": "10:00",
+            "end_time": "11:00",
+            "lesson_type": "group",
+        }
+    }
+
+
+def test_schedule_html_links_hashed_bundles_served_immutable(tmp_path, monkeypatch, html_coordinator):
+    buildings = schedule_structure.build_schedule_structure(_activities())
+    output = tmp_path / "schedule.html"
+    spiski = {"subjects": ["Deutsch"]}
+    html_coordinator().generate_complete_schedule(buildings, str(output), spiski_data=spiski)
+    first_html = output.read_text(encoding="utf-8")
+    html_coordinator().generate_complete_schedule(buildings, str(output), spiski_data=spiski)
+    html = output.read_text(encoding="utf-8")
+
+    names = re.findall(BUNDLE_LINK, html)
+    assert sorted(name.rsplit(".", 1)[1] for name in names) == ["css", "js"]
+    assert names == re.findall(BUNDLE_LINK, first_html)
+    assert sorted(path.name for path in (tmp_path / "assets").iterdir()) == sorted(names)
+    assert "initializeApplication" not in html and "<style>" not in html
+    assert re.search(r'var spiskiData = \{.*?"Deutsch".*?\};\s*window\.spiskiData = spiskiData;', html, re.S)
+    js_name = next(name for name in names if name.endswith(".js"))
+    assert "initializeApplication();" in (tmp_path / "assets" / js_name).read_text(encoding="utf-8")
+
+    routes = importlib.import_module("gear_xls.server_routes")
+    monkeypatch.setattr(sys.modules["html_bundle"], "get_asset_bundle_dir", lambda: str(tmp_path / "assets"))
+    with routes.app.test_client() as client:
+        hit = client.get(f"/assets/{js_name}")
+        legacy = client.get(f"/js_modules/{js_name}")
+        stale = client.get("/assets/bundle.0123456789abcdef.js")
+        missing = client.get("/assets/core.js")
+        module = client.get("/js_modules/core.js")
+
+    assert hit.status_code == 200
+    assert hit.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+    assert legacy.status_code == 200 and legacy.data == hit.data
+    assert stale.status_code == 200 and stale.data == hit.data
+    assert stale.headers["Cache-Control"] == "no-cache"
+    assert missing.status_code == 404
+    assert module.status_code == 200 and "immutable" not in module.headers.get("Cache-Control", "")
+
+
+def test_staged_pipeline_writes_bundles_next_to_the_published_html(tmp_path, monkeypatch, html_coordinator):
+    monkeypatch.setattr(schedule_pipeline, "parse_schedule", lambda _path: _activities())
+    excel_file = tmp_path / "schedule.xlsx"
+    excel_file.write_bytes(b"")
+    html_output = tmp_path / "html_output"
+    staged = tmp_path / "stage"
+    staged.mkdir()
+    output_dirs = {"html": str(staged), "cache": str(html_output), "assets": str(html_output / "assets")}
+
+    result = schedule_pipeline.SchedulePipeline().process_excel_to_outputs(str(excel_file), output_dirs)
+
+    html = Path(result["html_file"]).read_text(encoding="utf-8")
+    names = re.findall(BUNDLE_LINK, html)
+    assert len(names) == 2
+    # The staged page is copied to html_output/schedule.html, where the relative links resolve
+    assert all((html_output / "assets" / name).is_file() for name in names)
+    assert not (staged / "assets").exists()
@@ -0,0 +1,130 @@
+import importlib
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from gear_xls import schedule_structure
+
+
+def test_compact_grid_mode_draws_background_without_cells(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(PROJECT_ROOT / "gear_xls"))
+    from gear_xls.generators.html_coordinator import HTMLCoordinator
+
+    activities = {
+        f"g{index}": {
+            "building": "Villa",
+            "day": day,
+            "room": room,
+            "room_display": room,
+            "subject": "Deutsch",
+            "teacher": "Teacher",
+            "students": "Group",
+            "start_time": "10:00",
+            "end_time": "11:00",
+            "lesson_type": "group",
+        }
+        for index, (day, room) in enumerate(
+            [(day, room) for day in ("Mo", "Di", "Mi") for room in ("1.01", "1.02", "1.03")]
+        )
+    }
+    buildings = schedule_structure.build_schedule_structure(activities)
+    table_path = tmp_path / "table.html"
+    compact_path = tmp_path / "compact.html"
+    HTMLCoordinator().generate_complete_schedule(buildings, str(table_path))
+    coordinator = HTMLCoordinator(grid_mode="compact")
+    coordinator.generate_complete_schedule(buildings, str(compact_path))
+    table_html = table_path.read_text(encoding="utf-8")
+    compact_html = compact_path.read_text(encoding="utf-8")
+
+    assert "<td" not in compact_html and "<td" in table_html
+    assert len(compact_html) * 5 < len(table_html)
+    assert '<link rel="stylesheet" href="assets/bundle.' in compact_html
+    assert "<script" not in compact_html
+    assert 'id="menuButton"' not in compact_html
+    assert compact_html.count("class='activity-block") == table_html.count("class='activity-block") == 9
+    headers = re.findall(r'class="compact-head day-Mo" data-day="Mo" data-col="(\d)" data-room="([^"]*)"', compact_html)
+    assert headers == [("0", "1.01"), ("1", "1.02"), ("2", "1.03")]
+
+    # A 10:00 block starts exactly on the 10:00 label of the compact body.
+    pitch = coordinator.compact_generator.row_pitch
+    label_top = float(re.search(r'top:([\d.]+)px;">10:00</div>', compact_html).group(1))
+    block_top = float(re.search(r"data-start-time='10:00'[^>]*style='top:([\d.]+)px", compact_html).group(1))
+    assert block_top == label_top + coordinator.compact_generator.header_height
+    assert label_top % pitch == 0
+
+    with pytest.raises(ValueError):
+        HTMLCoordinator(grid_mode="grid")
+
+
+def _lesson(block_id, room, lesson_type="group", day="Mo"):
+    return {
+        "id": block_id,
+        "day": day,
+        "building": "Villa",
+        "room": room,
+        "start_time": "10:00",
+        "end_time": "11:00",
+        "subject": "Mathe",
+        "teacher": "Anna",
+        "students": "2A" if lesson_type == "group" else "Max",
+        "lesson_type": lesson_type,
+    }
+
+
+@pytest.fixture()
+def view_sources(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(PROJECT_ROOT / "gear_xls"))
+    routes = importlib.import_module("gear_xls.server_routes")
+    routes.app.config.update(TESTING=True)
+    view = routes.schedule_view
+    state = {
+        "base": {"published_at": None, "published_by": None, "blocks": []},
+        "individual": {"last_modified": "ind-1", "blocks": []},
+    }
+    monkeypatch.setattr(view.state_manager, "get_base_schedule", lambda: state["base"])
+    monkeypatch.setattr(view.state_manager, "get_individual_lessons", lambda: state["individual"])
+    monkeypatch.setattr(view.state_manager, "get_base_revision", lambda: state["base"]["published_at"])
+    monkeypatch.setattr(
+        view.state_manager, "get_individual_revision", lambda prune_expired=True: state["individual"]["last_modified"]
+    )
+    html_output = tmp_path / "html_output"
+    monkeypatch.setattr(view, "get_html_output_dir", lambda: str(html_output))
+    monkeypatch.setattr(view, "get_asset_bundle_dir", lambda: str(html_output / "assets"))
+    view.clear_view_cache()
+    yield {"app": routes.app, "state": state, "html_output": html_output}
+    view.clear_view_cache()
+
+
+def _login(client):
+    with client.session_transaction() as session:
+        session["login"] = "viewer"
+        session["display_name"] = "Viewer"
+        session["role"] = "viewer"
+
+
+def test_schedule_view_route_serves_compact_page_from_state(view_sources):
+    state = view_sources["state"]
+
+    with view_sources["app"].test_client() as client:
+        _login(client)
+        empty = client.get("/schedule_view")
+        state["base"] = {"published_at": "base-1", "published_by": "admin", "blocks": [_lesson("g1", "1.01")]}
+        state["individual"] = {"last_modified": "ind-2", "blocks": [_lesson("i1", "1.02", "individual")]}
+        page = client.get("/schedule_view")
+        again = client.get("/schedule_view")
+
+    html = page.get_data(as_text=True)
+    assert empty.status_code == 200 and "activity-block" not in empty.get_data(as_text=True)
+    assert page.status_code == 200 and page.headers["Cache-Control"] == "no-store"
+    assert "<td" not in html and "<script" not in html
+    assert html.count("class='activity-block") == 2
+    assert "lesson-type-individual" in html
+    names = re.findall(r'href="assets/(bundle\.[0-9a-f]{16}\.css)"', html)
+    assert len(names) == 1 and (view_sources["html_output"] / "assets" / names[0]).is_file()
+    assert again.get_data(as_text=True) == html
@@ -0,0 +1,111 @@
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from gear_xls import schedule_structure
+from gear_xls.services import schedule_pipeline
+
+
+@pytest.fixture()
+def html_generators(monkeypatch):
+    # The generators import html_styles/html_javascript as top-level modules.
+    monkeypatch.syspath_prepend(str(PROJECT_ROOT / "gear_xls"))
+    from gear_xls.generators.html_coordinator import HTMLCoordinator
+    from gear_xls.generators.html_fragment_cache import HTMLFragmentCache
+
+    return HTMLCoordinator, HTMLFragmentCache
+
+
+def _activity(day, room, subject, lesson_type="group"):
+    return {
+        "building": "Villa",
+        "day": day,
+        "room": room,
+        "room_display": room,
+        "subject": subject,
+        "teacher": "Teacher",
+        "students": "Group",
+        "start_time": "10:00",
+        "end_time": "11:00",
+        "lesson_type": lesson_type,
+    }
+
+
+def test_pipeline_renders_group_only_and_reuses_unchanged_fragments(tmp_path, html_generators):
+    HTMLCoordinator, HTMLFragmentCache = html_generators
+    activities = {
+        "g1": _activity("Mo", "1.01", "Deutsch"),
+        "i1": _activity("Mo", "1.02", "Solo", lesson_type="individual"),
+        "g2": _activity("Di", "1.01", "Mathe"),
+    }
+    cache_path = tmp_path / "fragments.json"
+
+    def render(acts, cache):
+        buildings = schedule_structure.build_schedule_structure(acts)
+        render_buildings, removed = schedule_pipeline.group_only_buildings(buildings)
+        output = tmp_path / "schedule.html"
+        HTMLCoordinator().generate_complete_schedule(render_buildings, str(output), fragment_cache=cache)
+        html = output.read_text(encoding="utf-8")
+        return re.sub(r'id="csrf_token" value="[^"]*"', "", html), removed
+
+    plain, removed = render(activities, None)
+    first_cache = HTMLFragmentCache(str(cache_path))
+    cached, _ = render(activities, first_cache)
+    second_cache = HTMLFragmentCache(str(cache_path))
+    render(activities, second_cache)
+    activities["g2"] = _activity("Di", "1.01", "Englisch")
+    third_cache = HTMLFragmentCache(str(cache_path))
+    changed, _ = render(activities, third_cache)
+
+    assert removed == 1
+    assert cached == plain
+    assert "Solo" not in plain
+    assert "data-room='1.02'" not in plain and 'data-room="1.02"' in plain
+    assert second_cache.rendered == 0 and second_cache.reused == first_cache.rendered
+    assert third_cache.rendered == 1
+    assert "Englisch" in changed and "Mathe" not in changed
+
+
+def test_cell_size_change_invalidates_every_fragment(tmp_path, html_generators):
+    HTMLCoordinator, HTMLFragmentCache = html_generators
+    buildings = schedule_structure.build_schedule_structure({"g1": _activity("Mo", "1.01", "Deutsch")})
+    cache_path = str(tmp_path / "fragments.json")
+    output = str(tmp_path / "schedule.html")
+
+    first = HTMLFragmentCache(cache_path)
+    HTMLCoordinator().generate_complete_schedule(buildings, output, fragment_cache=first)
+    taller = HTMLCoordinator()
+    taller.block_generator.cell_height = 20
+    second = HTMLFragmentCache(cache_path)
+    taller.generate_complete_schedule(buildings, output, fragment_cache=second)
+
+    assert first.rendered > 0
+    assert second.reused == 0 and second.rendered == first.rendered
+
+
+def test_staged_pipeline_runs_share_the_persistent_fragment_cache(tmp_path, monkeypatch, html_generators):
+    activities = {"g1": _activity("Mo", "1.01", "Deutsch"), "g2": _activity("Di", "1.01", "Mathe")}
+    monkeypatch.setattr(schedule_pipeline, "parse_schedule", lambda _path: dict(activities))
+    excel_file = tmp_path / "schedule.xlsx"
+    excel_file.write_bytes(b"")
+    cache_dir = tmp_path / "html_output"
+    cache_dir.mkdir()
+    pipeline = schedule_pipeline.SchedulePipeline()
+
+    results = []
+    for stage in ("stage_1", "stage_2"):
+        staged = tmp_path / stage
+        staged.mkdir()
+        output_dirs = {"html": str(staged), "cache": str(cache_dir)}
+        results.append(pipeline.process_excel_to_outputs(str(excel_file), output_dirs))
+
+    assert (cache_dir / schedule_pipeline.FRAGMENT_CACHE_FILENAME).exists()
+    assert not (tmp_path / "stage_1" / schedule_pipeline.FRAGMENT_CACHE_FILENAME).exists()
+    assert results[1]["fragments_rendered"] == 0
+    assert results[1]["fragments_reused"] == results[0]["fragments_rendered"]
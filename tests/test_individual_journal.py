@@ -0,0 +1,135 @@
+import json
+import os
+
+import pytest
+
+from gear_xls import backup_manager
+from gear_xls import individual_journal
+from gear_xls import schedule_mutation_coordinator
+from gear_xls import state_manager
+
+
+def _read_json(path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _lesson(**overrides):
+    block = {
+        "day": "Mo",
+        "building": "Villa",
+        "room": "0.04",
+        "start_time": "10:30",
+        "end_time": "11:30",
+        "lesson_type": "individual",
+        "subject": "Deutsch",
+        "teacher": "Teacher",
+        "students": "Student",
+    }
+    block.update(overrides)
+    return block
+
+
+@pytest.fixture()
+def journal_state(tmp_path, monkeypatch):
+    state_dir = tmp_path / "gear_xls" / "schedule_state"
+    state_dir.mkdir(parents=True)
+    individual_path = state_dir / "individual_lessons.json"
+    individual_path.write_text(
+        json.dumps({"last_modified": "seed", "blocks": []}, indent=2),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(state_manager, "INDIVIDUAL_LESSONS_PATH", str(individual_path))
+    monkeypatch.setattr(state_manager, "INDIVIDUAL_LOCK_PATH", str(individual_path) + ".lock")
+    monkeypatch.setattr(state_manager, "SCHEDULE_HTML_PATH", str(tmp_path / "missing.html"))
+    monkeypatch.setattr(
+        schedule_mutation_coordinator,
+        "SCHEDULE_MUTATION_LOCK_PATH",
+        str(tmp_path / "schedule_mutation.lock"),
+    )
+    monkeypatch.setattr(state_manager, "_journal_enabled", True)
+    return {
+        "root": tmp_path,
+        "individual_path": individual_path,
+        "journal_path": individual_journal.journal_path_for(str(individual_path)),
+    }
+
+
+def test_mutations_append_to_journal_without_rewriting_snapshot(journal_state):
+    snapshot_before = journal_state["individual_path"].read_bytes()
+
+    first, error = state_manager.add_block(_lesson(), "admin")
+    assert error is None
+    second, error = state_manager.add_block(_lesson(start_time="12:00", end_time="13:00"), "admin")
+    assert error is None
+    _updated, error = state_manager.update_block(first["id"], {"students": "Other"}, "admin")
+    assert error is None
+    deleted, error = state_manager.delete_block(second["id"], "admin")
+    assert deleted is True and error is None
+
+    assert journal_state["individual_path"].read_bytes() == snapshot_before
+    with open(journal_state["journal_path"], "rb") as handle:
+        lines = handle.read().splitlines()
+    assert len(lines) == 5
+
+    state = state_manager.get_individual_lessons_strict()
+    assert [block["id"] for block in state["blocks"]] == [first["id"]]
+    assert state["blocks"][0]["students"] == "Other"
+    assert state["last_modified"] != "seed"
+
+
+def test_compaction_folds_journal_into_snapshot(journal_state):
+    block, _error = state_manager.add_block(_lesson(), "admin")
+    expected = state_manager.get_individual_lessons_strict()
+
+    assert state_manager.compact_individual_journal() is True
+    assert not os.path.exists(journal_state["journal_path"])
+    assert _read_json(journal_state["individual_path"]) == expected
+    assert state_manager.compact_individual_journal() is False
+    assert state_manager.get_individual_lessons_strict()["blocks"][0]["id"] == block["id"]
+
+
+def test_stale_journal_is_ignored_after_full_snapshot_replace(journal_state):
+    state_manager.add_block(_lesson(), "admin")
+    with open(journal_state["journal_path"], "rb") as handle:
+        journal_bytes = handle.read()
+
+    state_manager.replace_individual_state({"last_modified": "restored", "blocks": []})
+    with open(journal_state["journal_path"], "wb") as handle:
+        handle.write(journal_bytes)
+
+    assert state_manager.get_individual_lessons_strict() == {"last_modified": "restored", "blocks": []}
+
+
+def test_torn_trailing_record_is_ignored(journal_state):
+    block, _error = state_manager.add_block(_lesson(), "admin")
+    with open(journal_state["journal_path"], "ab") as handle:
+        handle.write(b'{"v":1,"upsert":[{"id":')
+
+    state = state_manager.get_individual_lessons_strict()
+
+    assert [item["id"] for item in state["blocks"]] == [block["id"]]
+
+
+def test_backup_capture_includes_journal_tail(journal_state):
+    block, _error = state_manager.add_block(_lesson(), "admin")
+
+    data, state = backup_manager._read_individual_state_json(str(journal_state["root"]))
+
+    assert [item["id"] for item in state["blocks"]] == [block["id"]]
+    assert json.loads(data.decode("utf-8"))["blocks"][0]["id"] == block["id"]
+
+
+def test_append_after_torn_tail_keeps_every_mutation(journal_state):
+    first, _error = state_manager.add_block(_lesson(), "admin")
+    with open(journal_state["journal_path"], "ab") as handle:
+        handle.write(b'{"v":1,"upsert":[{"id":')
+
+    second, error = state_manager.add_block(_lesson(start_time="12:00", end_time="13:00"), "admin")
+    assert error is None
+    third, error = state_manager.add_block(_lesson(start_time="14:00", end_time="15:00"), "admin")
+    assert error is None
+
+    with open(journal_state["journal_path"], "rb") as handle:
+        assert b'[{"id":{' not in handle.read()
+    state = state_manager.get_individual_lessons_strict()
+    assert [item["id"] for item in state["blocks"]] == [first["id"], second["id"], third["id"]]
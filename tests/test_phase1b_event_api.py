@@ -362,6 +362,74 @@ def test_legacy_block_mutation_rejects_conflict_with_saved_event(event_server, m
     assert persisted["blocks"][0]["id"] == "event-1"
 
 
+def test_block_batch_applies_operations_with_single_write(event_server, monkeypatch):
+    routes = event_server["routes"]
+    existing = dict(_regular_block(start_time="14:00", end_time="15:00"), id="old-1")
+    doomed = dict(_regular_block(start_time="16:00", end_time="17:00"), id="old-2")
+    _write_json(event_server["individual_path"], _individual_state(existing, doomed))
+    monkeypatch.setattr(routes.lock_manager, "get_lock_status", lambda: {"holder": "admin", "version": 1})
+    writes = []
+    original_write = routes.state_manager._write_individual
+    monkeypatch.setattr(
+        routes.state_manager,
+        "_write_individual",
+        lambda state: (writes.append(1), original_write(state)),
+    )
+
+    with routes.app.test_client() as client:
+        _login(client, "admin", "admin", "Admin")
+        response = client.post(
+            "/api/blocks/batch",
+            json={
+                "operations": [
+                    {"op": "add", "block": _regular_block(start_time="12:00", end_time="13:00")},
+                    {"op": "update", "id": "old-1", "block": {"room": "0.05"}},
+                    {"op": "delete", "id": "old-2"},
+                ]
+            },
+        )
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert [item["ok"] for item in body["operations"]] == [True, True, True]
+    assert body["operations"][2]["deleted"] is True
+    assert writes == [1]
+    persisted = _read_individual(event_server["individual_path"])
+    assert body["individual_revision"] == persisted["last_modified"]
+    assert [block["id"] for block in persisted["blocks"]] == ["old-1", body["operations"][0]["block"]["id"]]
+    assert persisted["blocks"][0]["room"] == "0.05"
+
+
+def test_block_batch_aborts_without_writing_on_first_failure(event_server, monkeypatch):
+    routes = event_server["routes"]
+    _write_json(event_server["individual_path"], _individual_state(_event()))
+    monkeypatch.setattr(routes.lock_manager, "get_lock_status", lambda: {"holder": "admin", "version": 1})
+
+    with routes.app.test_client() as client:
+        _login(client, "admin", "admin", "Admin")
+        response = client.post(
+            "/api/blocks/batch",
+            json={
+                "operations": [
+                    {"op": "add", "block": _regular_block(start_time="12:00", end_time="13:00")},
+                    {"op": "add", "block": _regular_block()},
+                    {"op": "delete", "id": "event-1"},
+                ]
+            },
+        )
+
+    assert response.status_code == 409
+    body = response.get_json()
+    assert body["code"] == "EVENT_ROOM_CONFLICT"
+    assert body["failed_index"] == 1
+    assert body["operations"][0] == {"index": 0, "op": "add", "ok": False, "code": "ROLLED_BACK"}
+    assert body["operations"][1]["ok"] is False
+    assert body["operations"][1]["code"] == "EVENT_ROOM_CONFLICT"
+    assert len(body["operations"]) == 2
+    persisted = _read_individual(event_server["individual_path"])
+    assert [block["id"] for block in persisted["blocks"]] == ["event-1"]
+
+
 @pytest.mark.parametrize("role", ["editor", "organizer", "viewer"])
 def test_non_event_roles_cannot_use_event_endpoints(event_server, role):
     routes = event_server["routes"]
@@ -1,5 +1,6 @@
 import hashlib
 import importlib
+import io
 import json
 import sys
 import zipfile
@@ -9,6 +10,7 @@ from openpyxl import load_workbook
 
 from gear_xls import backup_manager
 from gear_xls import base_schedule_manager
+from gear_xls import excel_exporter
 from gear_xls import group_occupancy_snapshot
 from gear_xls import integration
 from gear_xls import lock_manager
@@ -169,6 +171,144 @@ def test_server_export_filters_events_and_rejects_event_only(tmp_path):
     assert ws.cell(row=2, column=10).value == "individual"
 
 
+def test_streamed_export_uses_named_styles_and_payload_cache(monkeypatch):
+    regular = {
+        "subject": "Deutsch",
+        "students": "S",
+        "teacher": "T",
+        "room": "1.01",
+        "building": "Villa",
+        "day": "Mo",
+        "start_time": {"hour": 9, "minute": 5},
+        "end_time": "10:00",
+        "duration": 55,
+        "lesson_type": "individual",
+    }
+    payload = json.dumps([regular])
+    excel_exporter.clear_export_cache()
+    built = []
+    original = excel_exporter.create_excel_bytes
+    monkeypatch.setattr(excel_exporter, "create_excel_bytes", lambda rows: built.append(1) or original(rows))
+
+    first = excel_exporter.export_schedule_bytes(payload)
+    second = excel_exporter.export_schedule_bytes(payload)
+    wb = load_workbook(io.BytesIO(first))
+    ws = wb["Schedule"]
+
+    assert second is first
+    assert built == [1]
+    assert ws.cell(row=2, column=7).value == "09:05"
+    assert ws.cell(row=1, column=1).style == excel_exporter.HEADER_STYLE_NAME
+    assert ws.cell(row=2, column=1).style == excel_exporter.CELL_STYLE_NAME
+    assert ws.cell(row=1, column=1).font.bold is True
+    assert ws.column_dimensions["C"].width == len("Преподаватель") + 2
+    excel_exporter.clear_export_cache()
+
+
+def test_client_export_is_saved_to_excel_exports_for_gui(tmp_path, monkeypatch):
+    routes = importlib.import_module("gear_xls.server_routes")
+    routes.app.config.update(TESTING=True)
+    monkeypatch.setattr(routes, "EXCEL_EXPORTS_DIR", str(tmp_path))
+    row = {
+        "subject": "Mathe",
+        "students": "2a",
+        "teacher": "T",
+        "room": "1.02",
+        "building": "Villa",
+        "day": "Mo",
+        "start_time": "09:00",
+        "end_time": "09:45",
+        "duration": 45,
+        "lesson_type": "group",
+    }
+
+    with routes.app.test_client() as client:
+        _login(client, "admin", "admin", "Admin")
+        response = client.post("/export_to_excel", data={"schedule_data": json.dumps([row])})
+
+    assert response.status_code == 200
+    saved = list(tmp_path.glob("schedule_export_*.xlsx"))
+    assert len(saved) == 1
+    assert saved[0].read_bytes() == response.data
+    assert saved[0].name in response.headers["Content-Disposition"]
+    excel_exporter.clear_export_cache()
+
+
+def test_state_export_builds_from_persisted_state_and_caches_per_revision(tmp_path, monkeypatch):
+    routes = importlib.import_module("gear_xls.server_routes")
+    routes.app.config.update(TESTING=True)
+    group = {
+        "subject": "Mathe",
+        "students": "2a",
+        "teacher": "T",
+        "room": "1.02",
+        "building": "Villa",
+        "day": "Di",
+        "start_time": "09:00",
+        "end_time": "09:45",
+        "duration": 45,
+        "lesson_type": "group",
+    }
+    trial = {
+        "id": "t1",
+        "subject": "Deutsch",
+        "students": "S",
+        "teacher": "T",
+        "room": "1.01",
+        "building": "Villa",
+        "day": "Mo",
+        "start_time": "10:00",
+        "end_time": "11:30",
+        "lesson_type": "trial",
+        "trial_dates": ["2026-05-18"],
+    }
+    state = {
+        "base": {"published_at": "b1", "blocks": [group]},
+        "individual": {"last_modified": "i1", "blocks": [trial, _event()]},
+    }
+    monkeypatch.setattr(routes, "EXCEL_EXPORTS_DIR", str(tmp_path))
+    monkeypatch.setattr(routes.state_manager, "get_base_schedule", lambda: state["base"])
+    monkeypatch.setattr(routes.state_manager, "get_individual_lessons", lambda: state["individual"])
+    monkeypatch.setattr(
+        routes.restore_manager,
+        "get_restore_status",
+        lambda: {"active": False, "recovery_required": False, "generation": 0},
+    )
+    exporter = sys.modules[routes.export_state_workbook.__module__]
+    built = []
+    original = exporter.write_schedule_workbook
+    monkeypatch.setattr(
+        exporter, "write_schedule_workbook", lambda rows, target: built.append(1) or original(rows, target)
+    )
+
+    with routes.app.test_client() as client:
+        _login(client, "admin", "admin", "Admin")
+        first = client.get("/api/export/xlsx")
+        again = client.get("/api/export/xlsx?revision=b1|i1")
+        stale = client.get("/api/export/xlsx?revision=b0|i1")
+
+    assert first.status_code == 200
+    assert first.headers["X-Schedule-Revision"] == "b1|i1"
+    assert again.data == first.data
+    assert built == [1]
+    assert stale.status_code == 409
+    assert stale.get_json()["code"] == "EXPORT_REVISION_CONFLICT"
+    ws = load_workbook(io.BytesIO(first.data)).active
+    assert [ws.cell(row=row, column=1).value for row in (2, 3)] == ["Deutsch", "Mathe"]
+    assert ws.max_row == 3
+    assert ws.cell(row=2, column=9).value == 90
+    assert ws.cell(row=2, column=11).value == '["2026-05-18"]'
+
+    state["base"] = {"published_at": None, "published_by": None, "blocks": []}
+    with routes.app.test_client() as client:
+        _login(client, "admin", "admin", "Admin")
+        unpublished = client.get("/api/export/xlsx")
+
+    assert unpublished.status_code == 409
+    assert unpublished.get_json()["code"] == "BASE_NOT_PUBLISHED"
+    assert built == [1]
+
+
 def test_client_export_contains_veranstaltung_skip():
     js = (backup_manager.os.path.dirname(backup_manager.__file__))
     path = backup_manager.os.path.join(js, "js_modules", "export_to_excel.js")
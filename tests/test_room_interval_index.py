@@ -0,0 +1,72 @@
+import pytest
+
+from gear_xls import state_manager
+from gear_xls.event_domain import LESSON_TYPE_EVENT
+from gear_xls.room_interval_index import RoomIntervalIndex
+from gear_xls.schedule_state_errors import ScheduleStateReadError
+
+
+def _block(block_id, start, end, *, room="0.04", building="Villa", day="Mo", lesson_type=LESSON_TYPE_EVENT):
+    return {
+        "id": block_id,
+        "lesson_type": lesson_type,
+        "building": building,
+        "day": day,
+        "room": room,
+        "start_time": start,
+        "end_time": end,
+    }
+
+
+def test_find_conflict_uses_half_open_overlap_and_normalized_rooms():
+    index = RoomIntervalIndex(
+        [
+            _block("long", "09:00", "18:00"),
+            _block("short", "10:00", "10:30"),
+            _block("other-room", "12:00", "13:00", room="0.05"),
+        ]
+    )
+
+    assert index.find_conflict(_block("c", "18:00", "19:00")) is None
+    assert index.find_conflict(_block("c", "08:00", "09:00")) is None
+    assert index.find_conflict(_block("c", "17:30", "18:30", room="V0.04"))["id"] == "long"
+    assert index.find_conflict(_block("c", "12:00", "12:30", day="Di")) is None
+
+
+def test_find_conflict_returns_first_stored_match_and_honours_filters():
+    index = RoomIntervalIndex(
+        [
+            _block("trial", "10:00", "11:00", lesson_type="trial"),
+            _block("event", "09:30", "10:30"),
+        ]
+    )
+
+    candidate = _block("c", "10:15", "10:45", lesson_type="group")
+    assert index.find_conflict(candidate)["id"] == "trial"
+    assert index.find_conflict(candidate, allowed_types={LESSON_TYPE_EVENT})["id"] == "event"
+    assert index.find_conflict(candidate, exclude_id="trial", allowed_types={"trial"}) is None
+
+
+def test_invalid_stored_range_raises_only_when_it_participates():
+    index = RoomIntervalIndex(
+        [_block("broken", "11:00", "10:00", lesson_type="trial")],
+        state_code="BASE_SCHEDULE_CORRUPT",
+    )
+
+    assert index.find_conflict(_block("c", "10:00", "11:00"), allowed_types={LESSON_TYPE_EVENT}) is None
+    with pytest.raises(ScheduleStateReadError) as exc_info:
+        index.find_conflict(_block("c", "10:00", "11:00"))
+    assert exc_info.value.code == "BASE_SCHEDULE_CORRUPT"
+
+
+def test_publish_conflict_check_reports_candidate_and_event():
+    events = [dict(_block("event-1", "15:00", "16:00"), event_dates=["2099-01-05"], version=1)]
+    candidates = [
+        _block("g-1", "13:00", "15:00", lesson_type="group"),
+        _block("g-2", "15:30", "17:00", lesson_type="group"),
+    ]
+
+    conflict = state_manager.find_room_time_conflict_with_events(candidates, events)
+
+    assert conflict["candidate"]["id"] == "g-2"
+    assert conflict["event"]["id"] == "event-1"
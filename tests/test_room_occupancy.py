@@ -0,0 +1,37 @@
+from gear_xls.room_occupancy import RoomOccupancy, interval_mask
+from gear_xls.rooms_report import _parse_time
+
+
+def _report(slots, rooms=("1.01", "1.02")):
+    return {
+        "building_order": ["Villa"],
+        "buildings": {"Villa": {"rooms": list(rooms), "days": {"Di": {"1.01": slots}}}},
+    }
+
+
+def test_interval_mask_covers_touched_slots():
+    assert interval_mask(0, 5) == 0b1
+    assert interval_mask(5, 15) == 0b110
+    assert interval_mask(7, 11) == 0b110
+    assert interval_mask(10, 10) == 0
+
+
+def test_find_free_requires_whole_window_without_min_minutes():
+    occupancy = RoomOccupancy.from_report(_report([{"start": "15:30", "end": "16:00"}]), _parse_time)
+
+    rooms = occupancy.find_free("Di", 15 * 60, 16 * 60 + 30)
+
+    assert [room["room"] for room in rooms] == ["1.02"]
+    assert rooms[0]["free_windows"] == [{"start": "15:00", "end": "16:30"}]
+
+
+def test_find_free_reports_runs_of_min_minutes():
+    occupancy = RoomOccupancy.from_report(
+        _report([{"start": "15:20", "end": "15:40"}, {"start": "16:10", "end": "17:00"}]),
+        _parse_time,
+    )
+
+    rooms = occupancy.find_free("Di", 15 * 60, 17 * 60, building="Villa", min_minutes=30)
+
+    assert rooms[0] == {"building": "Villa", "room": "1.01", "free_windows": [{"start": "15:40", "end": "16:10"}]}
+    assert occupancy.find_free("Di", 15 * 60, 17 * 60, building="Kolibri") == []
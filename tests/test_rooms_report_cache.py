@@ -0,0 +1,98 @@
+import json
+import os
+
+import pytest
+
+from gear_xls import rooms_report
+from gear_xls import schedule_mutation_coordinator
+
+
+def _lesson(block_id, start="10:00", end="11:00"):
+    return {
+        "id": block_id,
+        "day": "Mo",
+        "building": "Villa",
+        "room": "1.01",
+        "start_time": start,
+        "end_time": end,
+        "lesson_type": "individual",
+        "subject": "Deutsch",
+        "teacher": "Teacher",
+        "students": "Student",
+    }
+
+
+@pytest.fixture()
+def report_sources(tmp_path, monkeypatch):
+    state_manager = rooms_report.state_manager
+    base_path = tmp_path / "base_schedule.json"
+    individual_path = tmp_path / "individual_lessons.json"
+    base_path.write_text(json.dumps({"published_at": "base-1", "blocks": []}), encoding="utf-8")
+    individual_path.write_text(json.dumps({"last_modified": "ind-1", "blocks": [_lesson("a")]}), encoding="utf-8")
+    monkeypatch.setattr(rooms_report, "BASE_SCHEDULE_PATH", str(base_path))
+    monkeypatch.setattr(rooms_report, "SPISKI_DIR", str(tmp_path / "spiski"))
+    monkeypatch.setattr(rooms_report, "SCHEDULE_HTML_PATH", str(tmp_path / "schedule.html"))
+    monkeypatch.setattr(state_manager, "INDIVIDUAL_LESSONS_PATH", str(individual_path))
+    monkeypatch.setattr(state_manager, "INDIVIDUAL_LOCK_PATH", str(individual_path) + ".lock")
+    monkeypatch.setattr(state_manager, "SCHEDULE_HTML_PATH", str(tmp_path / "missing.html"))
+    monkeypatch.setattr(
+        schedule_mutation_coordinator,
+        "SCHEDULE_MUTATION_LOCK_PATH",
+        str(tmp_path / "schedule_mutation.lock"),
+    )
+    rooms_report.clear_availability_cache()
+    yield {"base": base_path, "individual": individual_path}
+    rooms_report.clear_availability_cache()
+
+
+def _count_computations(monkeypatch):
+    calls = []
+    original = rooms_report._compute_availability
+    monkeypatch.setattr(rooms_report, "_compute_availability", lambda: calls.append(1) or original())
+    return calls
+
+
+def test_unchanged_sources_are_served_from_memory(report_sources, monkeypatch):
+    calls = _count_computations(monkeypatch)
+
+    first = rooms_report.compute_availability()
+    second = rooms_report.compute_availability()
+
+    assert second is first
+    assert calls == [1]
+    assert [slot["start"] for slot in first["buildings"]["Villa"]["days"]["Mo"]["1.01"]] == ["10:00"]
+
+
+def test_individual_change_invalidates_cached_report(report_sources, monkeypatch):
+    calls = _count_computations(monkeypatch)
+    rooms_report.compute_availability()
+
+    path = report_sources["individual"]
+    path.write_text(
+        json.dumps({"last_modified": "ind-2", "blocks": [_lesson("a"), _lesson("b", "12:00", "13:30")]}),
+        encoding="utf-8",
+    )
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    data = rooms_report.compute_availability()
+
+    assert calls == [1, 1]
+    assert [slot["start"] for slot in data["buildings"]["Villa"]["days"]["Mo"]["1.01"]] == ["10:00", "12:00"]
+
+
+def test_find_free_rooms_uses_occupancy_bitmaps(report_sources, monkeypatch):
+    monkeypatch.setattr(rooms_report, "_load_configured_rooms", lambda: {"Villa": ["1.01", "1.02"]})
+
+    whole = rooms_report.find_free_rooms("Mo", "10:30", "11:30", building="Villa")
+    partial = rooms_report.find_free_rooms("Mo", "09:00", "12:00", min_minutes=60)
+
+    assert [room["room"] for room in whole["rooms"]] == ["1.02"]
+    assert partial["rooms"][0] == {
+        "building": "Villa",
+        "room": "1.01",
+        "free_windows": [{"start": "09:00", "end": "10:00"}, {"start": "11:00", "end": "12:00"}],
+    }
+    assert rooms_report.get_room_occupancy() is rooms_report.get_room_occupancy()
+    with pytest.raises(ValueError):
+        rooms_report.find_free_rooms("Mo", "12:00", "11:00")
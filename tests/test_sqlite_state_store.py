@@ -0,0 +1,186 @@
+import json
+import os
+import sqlite3
+
+import pytest
+
+from gear_xls import backup_manager
+from gear_xls import integration
+from gear_xls import individual_journal
+from gear_xls import lock_manager
+from gear_xls import schedule_mutation_coordinator
+from gear_xls import state_manager
+from gear_xls import state_storage
+from gear_xls.runtime_paths import get_individual_lessons_path, get_server_config_path, get_state_db_path
+
+
+def _lesson(block_id, start="10:30", end="11:30", room="0.04"):
+    return {
+        "id": block_id,
+        "day": "Mo",
+        "building": "Villa",
+        "room": room,
+        "start_time": start,
+        "end_time": end,
+        "lesson_type": "individual",
+        "subject": "Deutsch",
+        "teacher": "Teacher",
+        "students": "Student",
+    }
+
+
+@pytest.fixture()
+def sqlite_root(tmp_path, monkeypatch):
+    state_dir = tmp_path / "gear_xls" / "schedule_state"
+    state_dir.mkdir(parents=True)
+    individual_path = get_individual_lessons_path(str(tmp_path))
+    monkeypatch.setattr(state_manager, "INDIVIDUAL_LESSONS_PATH", individual_path)
+    monkeypatch.setattr(state_manager, "INDIVIDUAL_LOCK_PATH", individual_path + ".lock")
+    monkeypatch.setattr(state_manager, "SCHEDULE_HTML_PATH", str(tmp_path / "missing.html"))
+    monkeypatch.setattr(
+        schedule_mutation_coordinator,
+        "SCHEDULE_MUTATION_LOCK_PATH",
+        str(tmp_path / "schedule_mutation.lock"),
+    )
+    monkeypatch.setattr(state_storage, "_active_store", None)
+    return tmp_path
+
+
+def test_first_enable_migrates_json_and_folds_journal(sqlite_root):
+    individual_path = get_individual_lessons_path(str(sqlite_root))
+    raw = json.dumps({"last_modified": "seed", "blocks": [_lesson("a")]}).encode("utf-8")
+    with open(individual_path, "wb") as handle:
+        handle.write(raw)
+    individual_journal.append_record(
+        individual_journal.journal_path_for(individual_path),
+        {"v": 1, "last_modified": "later", "upsert": [_lesson("b", "12:00", "13:00")], "delete": []},
+        snapshot_digest=individual_journal.snapshot_sha256(raw),
+        start_new=True,
+    )
+
+    store = state_storage.configure_state_storage("sqlite", str(sqlite_root))
+
+    state = state_manager.get_individual_lessons_strict()
+    assert state["last_modified"] == "later"
+    assert [block["id"] for block in state["blocks"]] == ["a", "b"]
+    with sqlite3.connect(get_state_db_path(str(sqlite_root))) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert store.read_document("individual_lessons")["blocks"] == state["blocks"]
+
+
+def test_mutations_write_changed_rows_only_and_leave_json_untouched(sqlite_root):
+    state_storage.configure_state_storage("sqlite", str(sqlite_root))
+    individual_path = get_individual_lessons_path(str(sqlite_root))
+
+    first, error = state_manager.add_block(_lesson(None), "admin")
+    assert error is None
+    second, error = state_manager.add_block(_lesson(None, "12:00", "13:00"), "admin")
+    assert error is None
+    _updated, error = state_manager.update_block(second["id"], {"students": "Other"}, "admin")
+    assert error is None
+
+    state = state_manager.get_individual_lessons_strict()
+    assert [block["id"] for block in state["blocks"]] == [first["id"], second["id"]]
+    assert state["blocks"][1]["students"] == "Other"
+    assert not (sqlite_root / "gear_xls" / "schedule_state" / "individual_lessons.json").exists()
+
+    state_storage.get_state_store().export_json_documents()
+    with open(individual_path, "r", encoding="utf-8") as handle:
+        assert json.load(handle) == state
+
+
+def test_lock_and_backup_capture_read_from_store(sqlite_root):
+    state_storage.configure_state_storage("sqlite", str(sqlite_root))
+    root = str(sqlite_root)
+
+    lock_manager.acquire_lock("admin", project_root=root)
+    block, _error = state_manager.add_block(_lesson(None), "admin")
+
+    assert lock_manager.get_lock_status(root)["holder"] == "admin"
+    assert not (sqlite_root / "gear_xls" / "schedule_state" / "lock.json").exists()
+    data, individual_state = backup_manager._read_individual_state_json(root)
+    assert [item["id"] for item in individual_state["blocks"]] == [block["id"]]
+    archived = json.loads(data.decode("utf-8"))
+    assert archived["blocks"][0]["id"] == block["id"]
+
+
+def test_json_backend_keeps_files(sqlite_root):
+    assert state_storage.configure_state_storage("json", str(sqlite_root)) is None
+
+    state_manager.add_block(_lesson(None), "admin")
+
+    assert (sqlite_root / "gear_xls" / "schedule_state" / "individual_lessons.json").exists()
+    assert not (sqlite_root / "gear_xls" / "schedule_state" / "schedule_state.sqlite3").exists()
+
+
+def _rows(root):
+    with sqlite3.connect(get_state_db_path(str(root))) as conn:
+        return dict(
+            conn.execute(
+                "SELECT row_key, position FROM document_blocks WHERE document = 'base_schedule'"
+            ).fetchall()
+        )
+
+
+def test_rows_are_keyed_by_block_id_so_deletes_leave_other_rows_alone(sqlite_root):
+    store = state_storage.configure_state_storage("sqlite", str(sqlite_root))
+    blocks = [_lesson(block_id, room=f"0.0{index}") for index, block_id in enumerate("abcd")]
+    store.write_document("base_schedule", {"published_at": "x", "blocks": blocks})
+    before = _rows(sqlite_root)
+
+    store.write_document("base_schedule", {"published_at": "y", "blocks": blocks[1:] + [_lesson("e")]})
+
+    after = _rows(sqlite_root)
+    assert set(after) == {"id:b", "id:c", "id:d", "id:e"}
+    assert all(after[key] == before[key] for key in ("id:b", "id:c", "id:d"))
+    assert [block["id"] for block in store.read_document("base_schedule")["blocks"]] == ["b", "c", "d", "e"]
+
+    store.write_document("base_schedule", {"published_at": "z", "blocks": [blocks[3], blocks[1]]})
+    assert [block["id"] for block in store.read_document("base_schedule")["blocks"]] == ["d", "b"]
+
+
+def test_rows_carry_indexed_room_and_start_columns(sqlite_root):
+    store = state_storage.configure_state_storage("sqlite", str(sqlite_root))
+    store.write_document(
+        "individual_lessons",
+        {"last_modified": "x", "blocks": [_lesson("a", room=" 0.04 "), _lesson("b", "12:00", "13:00", "0.05")]},
+    )
+
+    with sqlite3.connect(get_state_db_path(str(sqlite_root))) as conn:
+        rows = conn.execute(
+            "SELECT row_key, building, day, room, start_time FROM document_blocks "
+            "WHERE document = 'individual_lessons' AND building = 'Villa' AND day = 'Mo' AND room = '0.05'"
+        ).fetchall()
+        plan = " ".join(
+            row[-1]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT payload FROM document_blocks "
+                "WHERE document = 'individual_lessons' AND building = 'Villa' AND day = 'Mo' AND room = '0.04' "
+                "AND start_time < '11:00'"
+            )
+        )
+
+    assert rows == [("id:b", "Villa", "Mo", "0.05", "12:00")]
+    assert "document_blocks_room_time" in plan
+
+
+def test_regeneration_process_writes_into_the_sqlite_store(sqlite_root, monkeypatch):
+    root = str(sqlite_root)
+    monkeypatch.setenv("SCHEDGEN_PROJECT_ROOT", root)
+    monkeypatch.setattr(integration, "get_schedule_state_dir", lambda: str(sqlite_root / "gear_xls" / "schedule_state"))
+    config_path = get_server_config_path(root)
+    os.makedirs(os.path.dirname(config_path), exist_ok=True)
+    with open(config_path, "w", encoding="utf-8") as handle:
+        json.dump({"storage_backend": "sqlite"}, handle)
+    server_store = state_storage.configure_state_storage("sqlite", root)
+    server_store.write_document("base_schedule", {"published_at": "old", "blocks": [_lesson("stale")]})
+    lock_manager.acquire_lock("admin", project_root=root)
+    # Regeneration runs in a separate process that has not configured any store yet
+    monkeypatch.setattr(state_storage, "_active_store", None)
+
+    integration.reset_web_editor_state([_lesson("fresh")])
+
+    assert server_store.read_document("base_schedule") == {"published_at": None, "published_by": None, "blocks": []}
+    assert server_store.read_document("lock")["holder"] is None
+    assert [block["id"] for block in server_store.read_document("individual_lessons")["blocks"]] == ["fresh"]
+    assert not (sqlite_root / "gear_xls" / "schedule_state" / "base_schedule.json").exists()
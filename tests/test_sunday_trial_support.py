@@ -171,21 +171,6 @@ def test_schedule_structure_binds_empty_sunday_column_to_building_room():
     assert villa["_max_cols"]["So"] == 1
 
 
-def test_pipeline_strips_non_group_blocks_from_generated_html():
-    html = """
-    <div class='activity-block lesson-type-group' data-lesson-type='group'>G</div>
-    <div class='activity-block lesson-type-trial' data-lesson-type='trial'>T</div>
-    <div class='activity-block lesson-type-nachhilfe' data-lesson-type='nachhilfe'>N</div>
-    """
-
-    stripped, removed = schedule_pipeline.strip_non_group_activity_blocks_from_html(html)
-
-    assert removed == 2
-    assert "data-lesson-type='group'" in stripped
-    assert "data-lesson-type='trial'" not in stripped
-    assert "lesson-type-nachhilfe" not in stripped
-
-
 def test_pipeline_collects_trial_blocks_for_individual_state():
     buildings = schedule_structure.build_schedule_structure(
         {
@@ -0,0 +1,171 @@
+import json
+import threading
+import time
+
+import pytest
+
+from gear_xls import base_schedule_manager
+from gear_xls import schedule_mutation_coordinator
+from gear_xls import tv_display
+
+
+def _lesson(block_id, day="Mo", start="10:00", end="11:00", building="Villa", **extra):
+    block = {
+        "id": block_id,
+        "day": day,
+        "building": building,
+        "room": "1.01",
+        "start_time": start,
+        "end_time": end,
+        "subject": "Mathe",
+        "teacher": "Anna",
+        "students": "2A",
+    }
+    block.update(extra)
+    return block
+
+
+@pytest.fixture()
+def tv_sources(tmp_path, monkeypatch):
+    state_manager = tv_display.state_manager
+    base_path = tmp_path / "base_schedule.json"
+    individual_path = tmp_path / "individual_lessons.json"
+    base_path.write_text(json.dumps({"published_at": "base-1", "blocks": []}), encoding="utf-8")
+    individual_path.write_text(json.dumps({"last_modified": "ind-1", "blocks": []}), encoding="utf-8")
+    monkeypatch.setattr(base_schedule_manager, "BASE_SCHEDULE_PATH", str(base_path))
+    monkeypatch.setattr(base_schedule_manager, "BASE_LOCK_PATH", str(base_path) + ".lock")
+    monkeypatch.setattr(state_manager, "INDIVIDUAL_LESSONS_PATH", str(individual_path))
+    monkeypatch.setattr(state_manager, "INDIVIDUAL_LOCK_PATH", str(individual_path) + ".lock")
+    monkeypatch.setattr(state_manager, "SCHEDULE_HTML_PATH", str(tmp_path / "missing.html"))
+    monkeypatch.setattr(
+        schedule_mutation_coordinator,
+        "SCHEDULE_MUTATION_LOCK_PATH",
+        str(tmp_path / "schedule_mutation.lock"),
+    )
+    tv_display.clear_display_cache()
+    yield {"base": base_path, "individual": individual_path}
+    tv_display.clear_display_cache()
+
+
+def _write(path, revision_key, revision, blocks):
+    path.write_text(json.dumps({revision_key: revision, "blocks": blocks}), encoding="utf-8")
+
+
+def test_display_lays_out_pages_by_building_and_tv_day_groups(tv_sources):
+    saturday = [_lesson(f"sa{i}", day="Sa", start=f"{8 + i // 4:02d}:{(i % 4) * 15:02d}", end="20:00") for i in range(20)]
+    _write(
+        tv_sources["base"],
+        "published_at",
+        "base-1",
+        [
+            _lesson("late", start="12:00", end="13:00"),
+            _lesson("early", start="09:00", end="10:00", students="Kunst 3"),
+            _lesson("tue", day="Di"),
+            _lesson("kolibri", building="Kolibri"),
+            _lesson("sunday", day="So"),
+        ]
+        + saturday,
+    )
+    _write(
+        tv_sources["individual"],
+        "last_modified",
+        "ind-1",
+        [_lesson("ind", start="08:00", end="08:45", lesson_type="individual", students="Max")],
+    )
+
+    model = tv_display.build_display()
+
+    assert [page["id"] for page in model["pages"]] == ["Villa:weekdays", "Villa:weekend", "Kolibri:weekdays"]
+    weekdays = model["pages"][0]
+    assert [column["label"] for column in weekdays["columns"]] == ["Montag", "Dienstag"]
+    monday = weekdays["columns"][0]["lessons"]
+    assert [lesson["time"] for lesson in monday] == ["09:00-10:00", "12:00-13:00"]
+    assert monday[0]["group"] == "Kunst 3"
+    assert monday[0]["location"] == "1.01, Villa"
+    assert weekdays["rows"] == 2
+
+    weekend = model["pages"][1]
+    assert [len(column["lessons"]) for column in weekend["columns"]] == [10, 10]
+    assert [column["label"] for column in weekend["columns"]] == ["Samstag", ""]
+
+    individual = tv_display.build_display("individual")
+    assert [lesson["group"] for page in individual["pages"] for column in page["columns"] for lesson in column["lessons"]] == ["Max"]
+
+    with pytest.raises(ValueError):
+        tv_display.build_display("bogus")
+
+
+def test_revision_change_rebuilds_the_display(tv_sources, monkeypatch):
+    calls = []
+    original = tv_display._build_display
+    monkeypatch.setattr(tv_display, "_build_display", lambda *args: calls.append(1) or original(*args))
+
+    first = tv_display.build_display()
+    assert tv_display.build_display() is first
+    assert tv_display.wait_for_revision_change(first["revision"], 0) == first["revision"]
+
+    with schedule_mutation_coordinator.schedule_mutation("test"):
+        _write(tv_sources["individual"], "last_modified", "ind-2", [_lesson("a")])
+
+    assert tv_display.wait_for_revision_change(first["revision"], 0) != first["revision"]
+    second = tv_display.build_display()
+    assert calls == [1, 1]
+    assert [page["id"] for page in second["pages"]] == ["Villa:weekdays"]
+
+
+def test_screens_share_one_revision_check_between_mutations(tv_sources, monkeypatch):
+    checks = []
+    original = tv_display.display_revision
+    monkeypatch.setattr(tv_display, "display_revision", lambda: checks.append(1) or original())
+
+    revisions = {tv_display.shared_revision() for _ in range(20)}
+    # A write from another process is only noticed on the next poll
+    _write(tv_sources["base"], "published_at", "base-2", [_lesson("b")])
+    assert {tv_display.shared_revision()} == revisions
+    assert len(checks) == 1
+
+    monkeypatch.setattr(tv_display, "TV_POLL_SECONDS", 0)
+    assert tv_display.shared_revision() not in revisions
+    assert len(checks) == 2
+
+
+def test_mutation_wakes_waiting_screens_without_polling(tv_sources):
+    seen = tv_display.shared_revision()
+    results = []
+    waiters = [
+        threading.Thread(target=lambda: results.append(tv_display.wait_for_revision_change(seen, 30)))
+        for _ in range(3)
+    ]
+    started = time.monotonic()
+    for waiter in waiters:
+        waiter.start()
+    time.sleep(0.1)
+    with schedule_mutation_coordinator.schedule_mutation("test"):
+        _write(tv_sources["individual"], "last_modified", "ind-2", [_lesson("a")])
+    for waiter in waiters:
+        waiter.join(5)
+
+    assert len(results) == 3 and seen not in results
+    assert time.monotonic() - started < tv_display.TV_POLL_SECONDS
+
+
+def test_tv_event_streams_are_capped(tv_sources, monkeypatch):
+    import importlib
+
+    routes = importlib.import_module("gear_xls.server_routes")
+    routes.app.config.update(TESTING=True)
+    monkeypatch.setattr(routes.tv_routes, "_stream_slots", threading.BoundedSemaphore(1))
+    monkeypatch.setattr(routes.tv_display, "shared_revision", lambda: "rev-1")
+
+    with routes.app.test_client() as client:
+        with client.session_transaction() as session:
+            session.update(login="tv", display_name="TV", role="viewer")
+        first = client.get("/api/tv/events", buffered=False)
+        busy = client.get("/api/tv/events")
+        first.close()
+        again = client.get("/api/tv/events", buffered=False)
+        again.close()
+
+    assert first.status_code == 200
+    assert busy.status_code == 503 and busy.get_json()["code"] == "TV_STREAMS_BUSY"
+    assert again.status_code == 200
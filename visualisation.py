@@ -2,11 +2,29 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 import matplotlib.patches as patches
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PatchCollection
+from matplotlib.figure import Figure
 import argparse
+import hashlib
+import json
 import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 import numpy as np
 
+from schedule_sidecar import read_schedule_sheet
+
+
+DAY_ORDER = {'Mo': 0, 'Di': 1, 'Mi': 2, 'Do': 3, 'Fr': 4, 'Sa': 5, 'So': 6}
+RENDER_DPI = 200
+MANIFEST_NAME = '.visualisation_manifest.json'
+MANIFEST_VERSION = 1
+
+# Figure reused by every render in this process (one per pool worker)
+_template_figure = None
+
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -15,10 +33,15 @@ def parse_arguments():
     parser.add_argument('schedule_file', help='Path to the Excel file with the generated schedule')
     parser.add_argument('--output_dir', default='schedule_visualizations', 
                      help='Directory to save visualizations (default: schedule_visualizations)')
-    parser.add_argument('--view_type', choices=['teacher', 'group', 'room', 'day'], default='day',
-                     help='Type of visualization to generate (default: day)')
+    parser.add_argument('--view_type', choices=['teacher', 'group', 'room', 'day', 'all'], default='day',
+                     help='Type of visualization to generate; "all" renders every day, teacher, '
+                          'group and room (default: day)')
     parser.add_argument('--name', 
                      help='Specific teacher, group, or room name to visualize (required for those view types)')
+    parser.add_argument('--jobs', type=int, default=None,
+                     help='Worker processes for --view_type all (default: number of CPUs)')
+    parser.add_argument('--force', action='store_true',
+                     help='Re-render all images for --view_type all even if unchanged')
     
     return parser.parse_args()
 
@@ -26,8 +49,8 @@ def parse_arguments():
 def load_schedule(file_path):
     """Load schedule data from Excel file."""
     try:
-        # Try to load from main Schedule sheet
-        df = pd.read_excel(file_path, sheet_name='Schedule')
+        # Try to load from main Schedule sheet (columnar sidecar when up to date)
+        df = read_schedule_sheet(file_path, 'Schedule')
         return df
     except Exception as e:
         print(f"Error loading schedule: {e}")
@@ -71,86 +94,167 @@ def create_color_mapping(categories):
     return mapping
 
 
-def visualize_day_schedule(df, output_dir):
+def _sorted_days(days):
+    return sorted(days, key=lambda x: DAY_ORDER.get(x, 999))
+
+
+def _figure_spec(df, name, row_column, row_labels, text_columns, title, ylabel, figsize, filename,
+                 subject_colors=None):
     """
-    Create a visualization of the schedule for each day.
-    Each room is shown as a row, and classes are shown as colored blocks.
+    Describe one timeline figure as plain data.
+
+    Each lesson becomes [row index, start, width, color, text], with times as
+    matplotlib date numbers. The spec fully determines the image, so it is
+    also what the manifest hashes. ``subject_colors`` is a palette shared by
+    several figures; without it the palette covers this figure's subjects.
     """
-    # Get unique days and rooms
-    days = sorted(df['day'].unique(), key=lambda x: {'Mo': 0, 'Di': 1, 'Mi': 2, 'Do': 3, 'Fr': 4, 'Sa': 5, 'So': 6}.get(x, 999))
-    
-    # Create color mapping for subjects
+    if subject_colors is None:
+        subject_colors = create_color_mapping(df['subject'].unique())
+    row_index = {label: i for i, label in enumerate(row_labels)}
+    starts = mdates.date2num(df['start_datetime'])
+    widths = mdates.date2num(df['end_datetime']) - starts
+    texts = [
+        "\n".join(f"{value}" for value in values)
+        for values in zip(*(df[column] for column in text_columns))
+    ]
+    blocks = [
+        [row_index[row], float(start), float(width), list(subject_colors[subject]), text]
+        for row, start, width, subject, text in zip(df[row_column], starts, widths, df['subject'], texts)
+    ]
+    return {
+        'name': name,
+        'filename': filename,
+        'title': title,
+        'xlabel': 'Time',
+        'ylabel': ylabel,
+        'row_labels': [str(label) for label in row_labels],
+        'figsize': list(figsize),
+        'blocks': blocks,
+        'legend': [[subject, list(subject_colors[subject])] for subject in sorted(df['subject'].unique())],
+    }
+
+
+def _figure():
+    """Return this process's template figure, cleared, on the Agg canvas."""
+    global _template_figure
+    if _template_figure is None:
+        _template_figure = Figure()
+        FigureCanvasAgg(_template_figure)
+    _template_figure.clf()
+    return _template_figure
+
+
+def render_figure(spec, output_dir):
+    """
+    Render a figure spec to PNG.
+
+    All lesson blocks are drawn as a single PatchCollection on a reused Agg
+    figure, without pyplot state.
+
+    Returns:
+        str: Path of the written image
+    """
+    fig = _figure()
+    fig.set_size_inches(spec['figsize'])
+    ax = fig.add_subplot()
+
+    rows = spec['row_labels']
+    ax.set_yticks(range(len(rows)))
+    ax.set_yticklabels(rows)
+    ax.set_ylim(-0.5, len(rows) - 0.5)
+
+    # Set up the x-axis for time
+    ax.set_xlim(datetime.strptime('08:00', '%H:%M'), datetime.strptime('20:00', '%H:%M'))
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
+    ax.xaxis.set_major_locator(mdates.HourLocator(interval=1))
+    ax.grid(True, axis='x', linestyle='--', alpha=0.7)
+
+    blocks = spec['blocks']
+    rects = [patches.Rectangle((start, row - 0.4), width, 0.8) for row, start, width, _, _ in blocks]
+    ax.add_collection(PatchCollection(
+        rects,
+        facecolors=[color for _, _, _, color, _ in blocks],
+        edgecolors='black',
+        alpha=0.9,
+    ))
+    for row, start, width, _, text in blocks:
+        ax.text(start + width / 2, row, text, ha='center', va='center',
+                fontsize=8, fontweight='bold', color='black')
+
+    ax.set_title(spec['title'], fontsize=16)
+    ax.set_xlabel(spec['xlabel'], fontsize=12)
+    ax.set_ylabel(spec['ylabel'], fontsize=12)
+
+    # Add legend for subjects
+    legend_patches = [patches.Patch(color=color, label=subject) for subject, color in spec['legend']]
+    ax.legend(handles=legend_patches, title='Subjects', loc='upper right',
+              bbox_to_anchor=(1.15, 1), fontsize=8)
+
+    fig.tight_layout()
+    path = os.path.join(output_dir, spec['filename'])
+    fig.savefig(path, dpi=RENDER_DPI, bbox_inches='tight')
+    return path
+
+
+def day_specs(df):
+    """Figure specs for every day: rooms as rows, one subject palette for all days."""
     subject_colors = create_color_mapping(df['subject'].unique())
-    
-    for day in days:
-        day_df = df[df['day'] == day].copy()
-        
+    specs = []
+    for day in _sorted_days(df['day'].unique()):
+        day_df = df[df['day'] == day]
         if day_df.empty:
             continue
-            
         rooms = sorted(day_df['room'].unique())
-        
-        # Create the figure
-        fig, ax = plt.subplots(figsize=(15, max(10, len(rooms) * 0.5)))
-        
-        # Set up the y-axis for rooms
-        ax.set_yticks(range(len(rooms)))
-        ax.set_yticklabels(rooms)
-        ax.set_ylim(-0.5, len(rooms) - 0.5)
-        
-        # Set up the x-axis for time
-        start_time = datetime.strptime('08:00', '%H:%M')
-        end_time = datetime.strptime('20:00', '%H:%M')
-        ax.set_xlim(start_time, end_time)
-        
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-        ax.xaxis.set_major_locator(mdates.HourLocator(interval=1))
-        
-        # Add grid lines
-        ax.grid(True, axis='x', linestyle='--', alpha=0.7)
-        
-        # Plot classes
-        for _, row in day_df.iterrows():
-            room_idx = rooms.index(row['room'])
-            
-            # Create rectangle for the class
-            rect = patches.Rectangle(
-                (row['start_datetime'], room_idx - 0.4),
-                row['end_datetime'] - row['start_datetime'],
-                0.8,
-                edgecolor='black',
-                facecolor=subject_colors[row['subject']],
-                alpha=0.9
-            )
-            ax.add_patch(rect)
-            
-            # Add text
-            text_x = row['start_datetime'] + (row['end_datetime'] - row['start_datetime']) / 2
-            ax.text(
-                text_x, room_idx,
-                f"{row['subject']}\n{row['teacher']}\n{row['group']}",
-                ha='center', va='center',
-                fontsize=8, fontweight='bold',
-                color='black'
-            )
-        
-        # Add title and labels
-        ax.set_title(f'Schedule for {day}', fontsize=16)
-        ax.set_xlabel('Time', fontsize=12)
-        ax.set_ylabel('Room', fontsize=12)
-        
-        # Add legend for subjects
-        legend_patches = [patches.Patch(color=subject_colors[subject], label=subject) 
-                         for subject in sorted(subject_colors.keys())]
-        ax.legend(handles=legend_patches, title='Subjects', loc='upper right', 
-                 bbox_to_anchor=(1.15, 1), fontsize=8)
-        
-        # Adjust layout and save
-        plt.tight_layout()
-        plt.savefig(os.path.join(output_dir, f'schedule_{day}.png'), dpi=200, bbox_inches='tight')
-        plt.close()
-        
-        print(f"Created visualization for {day}")
+        specs.append(_figure_spec(
+            day_df, day, 'room', rooms, ('subject', 'teacher', 'group'),
+            f'Schedule for {day}', 'Room', (15, max(10, len(rooms) * 0.5)), f'schedule_{day}.png',
+            subject_colors))
+    return specs
+
+
+def _entity_spec(entity_df, name, text_columns, title, filename):
+    days = _sorted_days(entity_df['day'].unique())
+    return _figure_spec(entity_df, name, 'day', days, text_columns, title, 'Day',
+                        (15, max(8, len(days) * 1.5)), filename)
+
+
+def teacher_spec(df, teacher_name):
+    teacher_df = df[df['teacher'] == teacher_name]
+    if teacher_df.empty:
+        return None
+    return _entity_spec(teacher_df, teacher_name, ('subject', 'group', 'room'),
+                        f'Schedule for Teacher: {teacher_name}',
+                        f'teacher_{teacher_name.replace(" ", "_")}.png')
+
+
+def group_spec(df, group_name):
+    # Use contains instead of equality since group field might contain multiple groups
+    groups = df['group'].astype(str).where(df['group'].notna(), '')
+    group_df = df[groups.str.contains(group_name, regex=False)]
+    if group_df.empty:
+        return None
+    return _entity_spec(group_df, group_name, ('subject', 'teacher', 'room'),
+                        f'Schedule for Group: {group_name}',
+                        f'group_{group_name.replace(" ", "_")}.png')
+
+
+def room_spec(df, room_name):
+    room_df = df[df['room'] == room_name]
+    if room_df.empty:
+        return None
+    return _entity_spec(room_df, room_name, ('subject', 'teacher', 'group'),
+                        f'Schedule for Room: {room_name}',
+                        f'room_{str(room_name).replace(".", "_")}.png')
+
+
+def visualize_day_schedule(df, output_dir):
+    """
+    Create a visualization of the schedule for each day.
+    Each room is shown as a row, and classes are shown as colored blocks.
+    """
+    for spec in day_specs(df):
+        render_figure(spec, output_dir)
+        print(f"Created visualization for {spec['name']}")
 
 
 def visualize_teacher_schedule(df, teacher_name, output_dir):
@@ -158,79 +262,11 @@ def visualize_teacher_schedule(df, teacher_name, output_dir):
     Create a visualization of a teacher's schedule.
     Each day is shown as a row, and classes are shown as colored blocks.
     """
-    # Filter for the specified teacher
-    teacher_df = df[df['teacher'] == teacher_name].copy()
-    
-    if teacher_df.empty:
+    spec = teacher_spec(df, teacher_name)
+    if spec is None:
         print(f"No classes found for teacher: {teacher_name}")
         return
-    
-    # Get days with classes
-    days = sorted(teacher_df['day'].unique(), key=lambda x: {'Mo': 0, 'Di': 1, 'Mi': 2, 'Do': 3, 'Fr': 4, 'Sa': 5, 'So': 6}.get(x, 999))
-    
-    # Create color mapping for subjects
-    subject_colors = create_color_mapping(teacher_df['subject'].unique())
-    
-    # Create the figure
-    fig, ax = plt.subplots(figsize=(15, max(8, len(days) * 1.5)))
-    
-    # Set up the y-axis for days
-    ax.set_yticks(range(len(days)))
-    ax.set_yticklabels(days)
-    ax.set_ylim(-0.5, len(days) - 0.5)
-    
-    # Set up the x-axis for time
-    start_time = datetime.strptime('08:00', '%H:%M')
-    end_time = datetime.strptime('20:00', '%H:%M')
-    ax.set_xlim(start_time, end_time)
-    
-    ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-    ax.xaxis.set_major_locator(mdates.HourLocator(interval=1))
-    
-    # Add grid lines
-    ax.grid(True, axis='x', linestyle='--', alpha=0.7)
-    
-    # Plot classes
-    for _, row in teacher_df.iterrows():
-        day_idx = days.index(row['day'])
-        
-        # Create rectangle for the class
-        rect = patches.Rectangle(
-            (row['start_datetime'], day_idx - 0.4),
-            row['end_datetime'] - row['start_datetime'],
-            0.8,
-            edgecolor='black',
-            facecolor=subject_colors[row['subject']],
-            alpha=0.9
-        )
-        ax.add_patch(rect)
-        
-        # Add text
-        text_x = row['start_datetime'] + (row['end_datetime'] - row['start_datetime']) / 2
-        ax.text(
-            text_x, day_idx,
-            f"{row['subject']}\n{row['group']}\n{row['room']}",
-            ha='center', va='center',
-            fontsize=8, fontweight='bold',
-            color='black'
-        )
-    
-    # Add title and labels
-    ax.set_title(f'Schedule for Teacher: {teacher_name}', fontsize=16)
-    ax.set_xlabel('Time', fontsize=12)
-    ax.set_ylabel('Day', fontsize=12)
-    
-    # Add legend for subjects
-    legend_patches = [patches.Patch(color=subject_colors[subject], label=subject) 
-                     for subject in sorted(subject_colors.keys())]
-    ax.legend(handles=legend_patches, title='Subjects', loc='upper right', 
-             bbox_to_anchor=(1.15, 1), fontsize=8)
-    
-    # Adjust layout and save
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, f'teacher_{teacher_name.replace(" ", "_")}.png'), dpi=200, bbox_inches='tight')
-    plt.close()
-    
+    render_figure(spec, output_dir)
     print(f"Created visualization for teacher: {teacher_name}")
 
 
@@ -239,80 +275,11 @@ def visualize_group_schedule(df, group_name, output_dir):
     Create a visualization of a group's schedule.
     Each day is shown as a row, and classes are shown as colored blocks.
     """
-    # Filter for the specified group
-    # Use contains instead of equality since group field might contain multiple groups
-    group_df = df[df['group'].str.contains(group_name, na=False)].copy()
-    
-    if group_df.empty:
+    spec = group_spec(df, group_name)
+    if spec is None:
         print(f"No classes found for group: {group_name}")
         return
-    
-    # Get days with classes
-    days = sorted(group_df['day'].unique(), key=lambda x: {'Mo': 0, 'Di': 1, 'Mi': 2, 'Do': 3, 'Fr': 4, 'Sa': 5, 'So': 6}.get(x, 999))
-    
-    # Create color mapping for subjects
-    subject_colors = create_color_mapping(group_df['subject'].unique())
-    
-    # Create the figure
-    fig, ax = plt.subplots(figsize=(15, max(8, len(days) * 1.5)))
-    
-    # Set up the y-axis for days
-    ax.set_yticks(range(len(days)))
-    ax.set_yticklabels(days)
-    ax.set_ylim(-0.5, len(days) - 0.5)
-    
-    # Set up the x-axis for time
-    start_time = datetime.strptime('08:00', '%H:%M')
-    end_time = datetime.strptime('20:00', '%H:%M')
-    ax.set_xlim(start_time, end_time)
-    
-    ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-    ax.xaxis.set_major_locator(mdates.HourLocator(interval=1))
-    
-    # Add grid lines
-    ax.grid(True, axis='x', linestyle='--', alpha=0.7)
-    
-    # Plot classes
-    for _, row in group_df.iterrows():
-        day_idx = days.index(row['day'])
-        
-        # Create rectangle for the class
-        rect = patches.Rectangle(
-            (row['start_datetime'], day_idx - 0.4),
-            row['end_datetime'] - row['start_datetime'],
-            0.8,
-            edgecolor='black',
-            facecolor=subject_colors[row['subject']],
-            alpha=0.9
-        )
-        ax.add_patch(rect)
-        
-        # Add text
-        text_x = row['start_datetime'] + (row['end_datetime'] - row['start_datetime']) / 2
-        ax.text(
-            text_x, day_idx,
-            f"{row['subject']}\n{row['teacher']}\n{row['room']}",
-            ha='center', va='center',
-            fontsize=8, fontweight='bold',
-            color='black'
-        )
-    
-    # Add title and labels
-    ax.set_title(f'Schedule for Group: {group_name}', fontsize=16)
-    ax.set_xlabel('Time', fontsize=12)
-    ax.set_ylabel('Day', fontsize=12)
-    
-    # Add legend for subjects
-    legend_patches = [patches.Patch(color=subject_colors[subject], label=subject) 
-                     for subject in sorted(subject_colors.keys())]
-    ax.legend(handles=legend_patches, title='Subjects', loc='upper right', 
-             bbox_to_anchor=(1.15, 1), fontsize=8)
-    
-    # Adjust layout and save
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, f'group_{group_name.replace(" ", "_")}.png'), dpi=200, bbox_inches='tight')
-    plt.close()
-    
+    render_figure(spec, output_dir)
     print(f"Created visualization for group: {group_name}")
 
 
@@ -321,82 +288,127 @@ def visualize_room_schedule(df, room_name, output_dir):
     Create a visualization of a room's schedule.
     Each day is shown as a row, and classes are shown as colored blocks.
     """
-    # Filter for the specified room
-    room_df = df[df['room'] == room_name].copy()
-    
-    if room_df.empty:
+    spec = room_spec(df, room_name)
+    if spec is None:
         print(f"No classes found for room: {room_name}")
         return
-    
-    # Get days with classes
-    days = sorted(room_df['day'].unique(), key=lambda x: {'Mo': 0, 'Di': 1, 'Mi': 2, 'Do': 3, 'Fr': 4, 'Sa': 5, 'So': 6}.get(x, 999))
-    
-    # Create color mapping for subjects
-    subject_colors = create_color_mapping(room_df['subject'].unique())
-    
-    # Create the figure
-    fig, ax = plt.subplots(figsize=(15, max(8, len(days) * 1.5)))
-    
-    # Set up the y-axis for days
-    ax.set_yticks(range(len(days)))
-    ax.set_yticklabels(days)
-    ax.set_ylim(-0.5, len(days) - 0.5)
-    
-    # Set up the x-axis for time
-    start_time = datetime.strptime('08:00', '%H:%M')
-    end_time = datetime.strptime('20:00', '%H:%M')
-    ax.set_xlim(start_time, end_time)
-    
-    ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-    ax.xaxis.set_major_locator(mdates.HourLocator(interval=1))
-    
-    # Add grid lines
-    ax.grid(True, axis='x', linestyle='--', alpha=0.7)
-    
-    # Plot classes
-    for _, row in room_df.iterrows():
-        day_idx = days.index(row['day'])
-        
-        # Create rectangle for the class
-        rect = patches.Rectangle(
-            (row['start_datetime'], day_idx - 0.4),
-            row['end_datetime'] - row['start_datetime'],
-            0.8,
-            edgecolor='black',
-            facecolor=subject_colors[row['subject']],
-            alpha=0.9
-        )
-        ax.add_patch(rect)
-        
-        # Add text
-        text_x = row['start_datetime'] + (row['end_datetime'] - row['start_datetime']) / 2
-        ax.text(
-            text_x, day_idx,
-            f"{row['subject']}\n{row['teacher']}\n{row['group']}",
-            ha='center', va='center',
-            fontsize=8, fontweight='bold',
-            color='black'
-        )
-    
-    # Add title and labels
-    ax.set_title(f'Schedule for Room: {room_name}', fontsize=16)
-    ax.set_xlabel('Time', fontsize=12)
-    ax.set_ylabel('Day', fontsize=12)
-    
-    # Add legend for subjects
-    legend_patches = [patches.Patch(color=subject_colors[subject], label=subject) 
-                     for subject in sorted(subject_colors.keys())]
-    ax.legend(handles=legend_patches, title='Subjects', loc='upper right', 
-             bbox_to_anchor=(1.15, 1), fontsize=8)
-    
-    # Adjust layout and save
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, f'room_{room_name.replace(".", "_")}.png'), dpi=200, bbox_inches='tight')
-    plt.close()
-    
+    render_figure(spec, output_dir)
     print(f"Created visualization for room: {room_name}")
 
 
+def all_specs(df):
+    """Figure specs for every day, teacher, group and room in the schedule."""
+    specs = day_specs(df)
+    for values, build in ((df['teacher'], teacher_spec), (df['group'], group_spec), (df['room'], room_spec)):
+        for name in sorted(values.dropna().unique(), key=str):
+            spec = build(df, name)
+            if spec is not None:
+                specs.append(spec)
+    return specs
+
+
+def _renderer_signature():
+    """Hash of this module's source: any renderer change re-renders everything."""
+    with open(os.path.abspath(__file__), 'rb') as f:
+        return hashlib.sha256(f"{MANIFEST_VERSION}|".encode('utf-8') + f.read()).hexdigest()
+
+
+def _spec_digest(spec):
+    raw = json.dumps(spec, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def _load_manifest(path):
+    """Return (signature, images) of the stored manifest; (None, {}) if unreadable."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None, {}
+    if not isinstance(data, dict):
+        return None, {}
+    images = data.get('images')
+    return data.get('signature'), images if isinstance(images, dict) else {}
+
+
+def _save_manifest(path, signature, images):
+    fd, tmp_path = tempfile.mkstemp(prefix='.manifest_', suffix='.tmp', dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'signature': signature, 'images': images}, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def _render_task(task):
+    spec, output_dir = task
+    return render_figure(spec, output_dir)
+
+
+def render_all(df, output_dir, jobs=None, force=False):
+    """
+    Render every day, teacher, group and room image, skipping unchanged ones.
+
+    The manifest in output_dir stores a digest of each image's figure spec;
+    images whose spec and file are unchanged are not re-rendered, and images
+    from a previous run that no longer have a spec are removed (also after a
+    renderer change or with force). Changed images are spread across a
+    process pool.
+
+    Args:
+        df (DataFrame): Prepared schedule data
+        output_dir (str): Directory for the images
+        jobs (int, optional): Worker processes; None uses the number of CPUs
+        force (bool): Re-render every image
+
+    Returns:
+        tuple: (rendered file names, unchanged file names, removed file names)
+    """
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    signature = _renderer_signature()
+    stored_signature, stored = _load_manifest(manifest_path)
+    # The signature and force only decide what is re-rendered; every image the
+    # previous run recorded is still a candidate for orphan removal
+    previous = stored if stored_signature == signature and not force else {}
+
+    current = {}
+    pending = []
+    unchanged = []
+    for spec in all_specs(df):
+        digest = _spec_digest(spec)
+        current[spec['filename']] = digest
+        if previous.get(spec['filename']) == digest and os.path.isfile(os.path.join(output_dir, spec['filename'])):
+            unchanged.append(spec['filename'])
+        else:
+            pending.append(spec)
+
+    tasks = [(spec, output_dir) for spec in pending]
+    workers = max(1, min(jobs or os.cpu_count() or 1, len(tasks)))
+    if workers == 1:
+        for task in tasks:
+            _render_task(task)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_render_task, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+
+    removed = []
+    for filename in sorted(set(stored) - set(current)):
+        if filename != os.path.basename(filename):
+            continue
+        try:
+            os.remove(os.path.join(output_dir, filename))
+            removed.append(filename)
+        except OSError:
+            pass
+    _save_manifest(manifest_path, signature, current)
+
+    rendered = [spec['filename'] for spec in pending]
+    print(f"Rendered {len(rendered)} images, {len(unchanged)} unchanged, {len(removed)} removed")
+    return rendered, unchanged, removed
+
+
 def main():
     """Main function."""
     args = parse_arguments()
@@ -426,6 +438,10 @@ def main():
         print("Creating day-based schedule visualizations...")
         visualize_day_schedule(df, args.output_dir)
     
+    elif args.view_type == 'all':
+        print("Creating all schedule visualizations...")
+        render_all(df, args.output_dir, jobs=args.jobs, force=args.force)
+    
     elif args.view_type == 'teacher':
         if not args.name:
             print("Error: Teacher name is required for teacher view type.")
@@ -3,9 +3,19 @@
 Содержит функции для загрузки и обработки данных из Excel-файла
 """
 
+import os
+import sys
 import pandas as pd
 import numpy as np
 from datetime import datetime
+
+# Общий модуль schedule_sidecar лежит в корне проекта
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from schedule_sidecar import read_schedule_sheet
+
 try:
     from .lesson_type_utils import classify_lesson_type
 except ImportError:
@@ -101,6 +111,42 @@ def _effective_lesson_types(df):
     return explicit_types.where(explicit_types != '', classified_types)
 
 
+def _map_unique(series, func):
+    """Применяет func к каждому уникальному значению столбца, а не к каждой строке."""
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    mapped = np.empty(len(series), dtype=object)
+    if len(uniques):
+        mapped[:] = np.array([func(value) for value in uniques], dtype=object)[codes]
+    # Пустые значения (None/NaN) передаются в func как есть
+    missing = codes == -1
+    mapped[missing] = [func(value) for value in series.to_numpy(dtype=object)[missing]]
+    return pd.Series(mapped, index=series.index, dtype=object)
+
+
+def _normalize_time_column(times):
+    """Приводит значения времени к строкам ЧЧ:ММ; нераспознанные — NaN."""
+    if pd.api.types.is_datetime64_dtype(times):
+        return times.dt.strftime('%H:%M')
+    codes, uniques = pd.factorize(times, use_na_sentinel=True)
+    parsed = pd.to_datetime(pd.Series(uniques, dtype=object), format='%H:%M', errors='coerce')
+    formatted = np.append(parsed.dt.strftime('%H:%M').to_numpy(dtype=object), np.nan)
+    return pd.Series(formatted[codes], index=times.index, dtype=object)
+
+
+def _minutes_column(times):
+    """Минуты от полуночи для столбца ЧЧ:ММ (NaN для пустых значений)."""
+    codes, uniques = pd.factorize(times, use_na_sentinel=True)
+    minutes = np.array([time_to_minutes(value) for value in uniques] + [np.nan], dtype=float)
+    return pd.Series(minutes[codes], index=times.index)
+
+
+def _clean_room(room):
+    """Очищает номер кабинета от символа-здания (первая буква в названии)."""
+    if isinstance(room, str) and room and room[0].isalpha():
+        return room[1:]
+    return room
+
+
 def load_data(excel_file_path):
     """
     Загружает данные расписания из Excel-файла
@@ -111,8 +157,8 @@ def load_data(excel_file_path):
     Returns:
         pandas.DataFrame: Датафрейм с данными расписания
     """
-    # Загружаем данные с листа Schedule
-    df = pd.read_excel(excel_file_path, sheet_name='Schedule')
+    # Загружаем данные с листа Schedule (из колоночной копии, если она актуальна)
+    df = read_schedule_sheet(excel_file_path, 'Schedule')
     df = _normalize_columns(df)
     
     # Проверяем структуру данных
@@ -127,19 +173,13 @@ def load_data(excel_file_path):
             raise ValueError(f"В таблице отсутствует обязательный столбец '{col}'")
 
     if 'lesson_type' in df.columns:
-        df['lesson_type'] = df['lesson_type'].apply(_normalize_lesson_type_value)
-    
-    # Убедимся, что start_time и end_time имеют правильный формат времени
-    if not pd.api.types.is_datetime64_dtype(df['start_time']):
-        df['start_time'] = pd.to_datetime(df['start_time'], format='%H:%M', errors='coerce')
-    
-    if not pd.api.types.is_datetime64_dtype(df['end_time']):
-        df['end_time'] = pd.to_datetime(df['end_time'], format='%H:%M', errors='coerce')
-    
-    # Извлекаем только время (без даты)
-    df['start_time'] = df['start_time'].dt.strftime('%H:%M')
-    df['end_time'] = df['end_time'].dt.strftime('%H:%M')
+        df['lesson_type'] = _map_unique(df['lesson_type'], _normalize_lesson_type_value)
     
+    # Приводим start_time и end_time к строкам ЧЧ:ММ (разбирается каждое
+    # уникальное значение, а не каждая строка)
+    df['start_time'] = _normalize_time_column(df['start_time'])
+    df['end_time'] = _normalize_time_column(df['end_time'])
+
     return df
 
 
@@ -183,7 +223,11 @@ def filter_final_visualization_days(df):
 def process_schedule_data(df):
     """
     Обрабатывает данные расписания, группируя их по дням недели
-    
+
+    Столбцы занятий (минуты начала/конца, кабинет без буквы здания, тип
+    занятия) вычисляются целиком для датафрейма, записи дней собираются
+    одним проходом после сортировки по времени начала.
+
     Args:
         df (pandas.DataFrame): Датафрейм с данными расписания
         
@@ -197,48 +241,44 @@ def process_schedule_data(df):
     
     # Получаем уникальные дни недели в правильном порядке
     unique_days = sorted(df['day'].unique(), key=lambda x: day_order.get(x, 99))
-    
-    # Словарь для хранения расписания по дням
-    schedule_by_day = {}
-    
-    for day in unique_days:
-        # Фильтруем занятия для текущего дня
-        day_schedule = df[df['day'] == day].copy()
-        
-        # Преобразуем время в формат для сортировки
-        day_schedule['start_time_dt'] = pd.to_datetime(day_schedule['start_time'], format='%H:%M')
-        
-        # Сортируем по времени начала
-        day_schedule = day_schedule.sort_values('start_time_dt')
-        
-        # Создаем список занятий для текущего дня с нужной информацией
-        lessons = []
-        for _, row in day_schedule.iterrows():
-            # очищаем номер кабинета от символа-здания (первая буква в названии кабинета):
-            original_room = row['room']
-            if isinstance(original_room, str) and original_room and original_room[0].isalpha():
-                cleaned_room = original_room[1:]
-            else:
-                cleaned_room = original_room
-
-            lesson = {
-                'subject':         row['subject'],
-                'group':           row['group'],
-                'teacher':         row['teacher'],
-                'room':            cleaned_room,     # теперь без первого символа
-                'building':        row['building'],
-                'start_time':      row['start_time'],
-                'end_time':        row['end_time'],
-                'duration':        row['duration'],
-                'start_time_mins': time_to_minutes(row['start_time']),
-                'end_time_mins':   time_to_minutes(row['end_time'])
-            }
-            if 'lesson_type' in day_schedule.columns and pd.notna(row['lesson_type']):
-                lesson['lesson_type'] = str(row['lesson_type']).strip().lower()
-            lessons.append(lesson)
-        
-        schedule_by_day[day] = lessons
-    
+    schedule_by_day = {day: [] for day in unique_days}
+    if df.empty:
+        return unique_days, schedule_by_day
+
+    start_mins = _minutes_column(df['start_time'])
+    lessons_df = pd.DataFrame({
+        'subject':         df['subject'],
+        'group':           df['group'],
+        'teacher':         df['teacher'],
+        'room':            _map_unique(df['room'], _clean_room),  # без символа-здания
+        'building':        df['building'],
+        'start_time':      df['start_time'],
+        'end_time':        df['end_time'],
+        'duration':        df['duration'],
+        'start_time_mins': start_mins.fillna(0).astype(int),
+        'end_time_mins':   _minutes_column(df['end_time']).fillna(0).astype(int),
+    })
+    has_lesson_type = 'lesson_type' in df.columns
+    if has_lesson_type:
+        lesson_types = df['lesson_type']
+        present = lesson_types.notna()
+        lessons_df['lesson_type'] = lesson_types.where(
+            ~present, lesson_types.astype(str).str.strip().str.lower()
+        ).astype(object)
+
+    # Устойчивая сортировка по времени начала; нераспознанное время — в конце
+    order = np.argsort(start_mins.to_numpy(), kind='stable')
+    lessons_df = lessons_df.iloc[order]
+    days = df['day'].to_numpy()[order]
+
+    records = lessons_df.to_dict('records')
+    if has_lesson_type:
+        # Тип занятия указывается только у строк, где он заполнен
+        for position in np.flatnonzero(~present.to_numpy()[order]):
+            del records[position]['lesson_type']
+    for day, lesson in zip(days, records):
+        schedule_by_day[day].append(lesson)
+
     return unique_days, schedule_by_day
 
 
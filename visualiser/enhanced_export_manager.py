@@ -14,11 +14,7 @@ try:
 except ImportError:
     PDF_EXPORT_AVAILABLE = False
 
-try:
-    from enhanced_export_manager_extra import convert_from_path
-    PNG_EXPORT_AVAILABLE = True
-except ImportError:
-    PNG_EXPORT_AVAILABLE = False
+from enhanced_export_manager_extra import PNG_EXPORT_AVAILABLE
 
 
 class EnhancedExportManager:
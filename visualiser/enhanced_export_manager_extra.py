@@ -3,107 +3,109 @@
 """
 
 import os
+import sys
 import hashlib
 from datetime import datetime, timedelta
-import tempfile
+
+# Общий пакет schedule_render лежит в корне проекта
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
 
 # Импортируем необходимые модули при наличии
 try:
     from reportlab.lib.pagesizes import A3, landscape
-    from reportlab.pdfgen import canvas
     PDF_EXPORT_AVAILABLE = True
 except ImportError:
     PDF_EXPORT_AVAILABLE = False
 
 try:
-    from pdf2image import convert_from_path
-    PNG_EXPORT_AVAILABLE = True
+    from schedule_render.raster_canvas import RasterCanvas, image_format_for, page_pixel_size, tile_boxes
+    PNG_EXPORT_AVAILABLE = PDF_EXPORT_AVAILABLE
 except ImportError:
     PNG_EXPORT_AVAILABLE = False
 
+PNG_EXPORT_DPI = 200
+# Страницы больше этого числа пикселей сохраняются тайлами
+PNG_MAX_PIXELS = 64_000_000
+PNG_TILE_SIZE = 4096
+# Поле страницы и шрифт растрового экспорта
+PNG_MARGIN = 20
+PNG_FONT_NAME = 'Helvetica'
+
 
 class ExtraExportMixin:
     """Миксин с дополнительными методами экспорта"""
     
-    def export_to_png(self, output_path, layout_manager):
+    def export_to_png(self, output_path, layout_manager, dpi=PNG_EXPORT_DPI, tile_size=None):
         """
-        Экспортирует расписание в PNG с улучшенным качеством
+        Экспортирует расписание в PNG (или WebP/JPEG по расширению файла)
+
+        Расписание рисуется сразу в растр (Pillow) по плану компоновки
+        EnhancedScheduleLayout, без промежуточного PDF и внешних программ.
+        План берется из кэша рядом с файлом, если данные не менялись.
+        Если задан tile_size или страница больше PNG_MAX_PIXELS, она
+        сохраняется тайлами <имя>_<строка>_<столбец>.<расширение>.
         
         Args:
-            output_path (str): Путь для сохранения PNG-файла
+            output_path (str): Путь для сохранения файла изображения
             layout_manager (ScheduleLayout): Менеджер компоновки расписания
+            dpi (int): Разрешение растра
+            tile_size (int, optional): Сторона тайла в пикселях
             
         Returns:
             bool: True, если экспорт успешен, иначе False
         """
         if not PNG_EXPORT_AVAILABLE:
             print("Ошибка: Для экспорта в PNG требуются дополнительные библиотеки")
-            print("Установите их с помощью команды: pip install pdf2image reportlab[images]")
+            print("Установите их с помощью команды: pip install pillow reportlab")
             return False
         
         try:
-            # Создаем временный PDF-файл
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as temp_pdf:
-                temp_pdf_path = temp_pdf.name
-            
-            # Создаем экземпляр EnhancedExportManager с тем же набором данных
-            from enhanced_layout_manager import EnhancedScheduleLayout
-            layout = EnhancedScheduleLayout(self.days_of_week, self.schedule_by_day)
-            
-            # Экспортируем расписание в PDF
-            if PDF_EXPORT_AVAILABLE:
-                # Создаем PDF-холст
-                c = canvas.Canvas(temp_pdf_path, pagesize=landscape(A3))
-                width, height = landscape(A3)
-                
-                # Настройка полей страницы
-                margin = 20
-                content_width = width - 2 * margin
-                content_height = height - 2 * margin
-                
-                # Устанавливаем заголовок
-                font_name = 'Helvetica'
-                c.setFont(font_name, 18)
-                #c.drawString(margin, height - margin - 20, "Stundenplan")
-                
-                # Рисуем расписание
-                layout.draw_schedule(c, margin, height - margin - 50, content_width, content_height - 50, font_name)
-                
-                # Добавляем информацию о дате создания
-                c.setFont(font_name, 8)
-                c.drawString(margin, margin - 15, f"Создано: {datetime.now().strftime('%d.%m.%Y %H:%M')}")
-                
-                # Сохраняем PDF
-                c.save()
-            else:
-                print("Ошибка: Отсутствуют библиотеки для создания PDF")
-                return False
-            
-            # Конвертируем PDF в PNG
-            # Увеличиваем DPI для лучшего качества
-            images = convert_from_path(temp_pdf_path, dpi=200)
-            if images:
-                images[0].save(output_path, 'PNG')
+            from enhanced_layout_manager import build_render_plan
+            from schedule_render.render_plan import cache_for
+
+            width, height = landscape(A3)
+            content_width = width - 2 * PNG_MARGIN
+            content_height = height - 2 * PNG_MARGIN
+            # Компоновка выполняется один раз (или берется из кэша) для всех тайлов
+            plan = build_render_plan(cache_for(output_path), self.days_of_week, self.schedule_by_day,
+                                     "draw_schedule", PNG_MARGIN, height - PNG_MARGIN - 50,
+                                     content_width, content_height - 50, PNG_FONT_NAME)
+            pixel_width, pixel_height = page_pixel_size(width, height, dpi)
+            if tile_size is None and pixel_width * pixel_height > PNG_MAX_PIXELS:
+                tile_size = PNG_TILE_SIZE
+
+            if tile_size is None:
+                c = RasterCanvas(width, height, dpi=dpi)
+                self._draw_raster_page(c, plan)
+                c.save(output_path)
                 print(f"PNG-файл сохранен: {output_path}")
-                
-                # Удаляем временный PDF-файл
-                os.unlink(temp_pdf_path)
-                
                 return True
-            else:
-                print("Ошибка: Не удалось преобразовать PDF в PNG")
-                return False
-        
-        except ImportError:
-            print("Ошибка: Для экспорта в PNG требуется библиотека pdf2image")
-            print("Установите ее с помощью команды: pip install pdf2image")
-            print("Также может потребоваться установка Poppler: https://github.com/oschwartz10612/poppler-windows")
-            return False
-        
+
+            # Каждый тайл отрисовывается отдельно: в памяти только один тайл
+            stem, extension = os.path.splitext(output_path)
+            image_format = image_format_for(output_path)
+            tiles = tile_boxes(pixel_width, pixel_height, tile_size)
+            for row, col, box in tiles:
+                c = RasterCanvas(width, height, dpi=dpi, box=box)
+                self._draw_raster_page(c, plan)
+                c.save(f"{stem}_{row}_{col}{extension}", image_format)
+            print(f"Изображение сохранено тайлами ({len(tiles)} шт.): {stem}_*{extension}")
+            return True
+
         except Exception as e:
             print(f"Ошибка при экспорте в PNG: {e}")
             return False
 
+    def _draw_raster_page(self, c, plan):
+        """Воспроизводит план расписания и подпись с датой создания."""
+        plan.replay(c)
+
+        # Добавляем информацию о дате создания
+        c.setFont(PNG_FONT_NAME, 8)
+        c.drawString(PNG_MARGIN, PNG_MARGIN - 15, f"Создано: {datetime.now().strftime('%d.%m.%Y %H:%M')}")
+
     def export_to_ics(self, output_path):
         """
         Экспортирует расписание в формат календаря ICS (iCalendar) с улучшенным форматированием
@@ -5,6 +5,7 @@
 
 from color_manager import get_group_color, get_building_color, get_text_color
 from lesson_label_utils import format_pdf_group_label, label_text_or_empty, should_show_subject_line
+from schedule_render.text_layout import truncate_text
 
 
 class BlockRenderingMixin:
@@ -122,31 +123,17 @@ class BlockRenderingMixin:
     def truncate_text(self, text, max_width, font_name, font_size, canvas):
         """
         Обрезает текст, если он не помещается в заданную ширину
-        
+
+        Ширины строк и результаты обрезки кэшируются в text_layout.
+
         Args:
             text (str): Исходный текст
             max_width (float): Максимальная ширина текста
             font_name (str): Название шрифта
             font_size (float): Размер шрифта
-            canvas: PDF-холст
+            canvas: PDF-холст (не используется, оставлен для совместимости)
             
         Returns:
             str: Обрезанный текст (с многоточием, если необходимо)
         """
-        if not text:
-            return ""
-        
-        # Проверяем ширину текста
-        text_width = canvas.stringWidth(text, font_name, font_size)
-        
-        if text_width <= max_width:
-            return text
-        
-        # Если текст не помещается, обрезаем его
-        for i in range(len(text) - 1, 0, -1):
-            truncated = text[:i] + "..."
-            if canvas.stringWidth(truncated, font_name, font_size) <= max_width:
-                return truncated
-        
-        # Если даже один символ не помещается
-        return text[0] + "..."
+        return truncate_text(text, max_width, font_name, font_size)
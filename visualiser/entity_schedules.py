@@ -0,0 +1,247 @@
+"""
+Модуль подготовки расписаний преподавателей и групп для экспорта в PDF
+
+Книга Excel открывается один раз: расписание каждого преподавателя (лист T_*)
+и группы (лист G_*) выбирается из основного листа Schedule в памяти тем же
+правилом, что и в output_utils.export_to_excel. Лист сущности разбирается
+отдельно только если по его имени нельзя восстановить исходное значение
+(имя обрезано до 31 символа, содержит заменённые символы или суффикс
+дедупликации). Если рядом с книгой есть актуальная колоночная копия
+(schedule_sidecar), листы берутся из неё. Отрисовка PDF распределяется по
+процессам.
+
+ExportManifest хранит рядом с каталогом PDF хэш строк каждой сущности и
+исходников рендерера, чтобы повторный запуск перерисовывал только изменившиеся
+расписания и удалял PDF сущностей, которых больше нет.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+# Общие модули schedule_sidecar и schedule_render лежат в корне проекта
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from schedule_render.render_plan import renderer_signature as layout_signature
+from schedule_sidecar import open_schedule_book
+
+SCHEDULE_SHEET = "Schedule"
+TEACHER_PREFIX = "T_"
+GROUP_PREFIX = "G_"
+
+MANIFEST_SUFFIX = ".manifest.json"
+MANIFEST_VERSION = 1
+
+_VISUALISER_DIR = os.path.dirname(os.path.abspath(__file__))
+# Модули, от которых зависит вид PDF, кроме модулей компоновки и общих модулей
+# schedule_render (их хэширует layout_signature): правка любого перерисовывает всё
+_RENDERER_SOURCES = (
+    "data_processor.py",
+    "lesson_type_utils.py",
+)
+
+_INVALID_EXCEL_SHEET_CHARS = re.compile(r"[\[\]:*?/\\]")
+_MAX_EXCEL_SHEET_NAME_LEN = 31
+
+
+def _sheet_round_trips(sheet, name):
+    """Проверяет, что лист назван по значению name без замен и обрезки."""
+    if len(sheet) >= _MAX_EXCEL_SHEET_NAME_LEN or not name:
+        return False
+    return name == name.strip("' ") and not _INVALID_EXCEL_SHEET_CHARS.search(name)
+
+
+def _select_teacher(schedule_df, name):
+    return schedule_df[schedule_df["teacher"] == name]
+
+
+def _select_group(schedule_df, name):
+    groups = schedule_df["group"].astype(str).where(schedule_df["group"].notna(), "")
+    return schedule_df[groups.str.contains(name, regex=False)]
+
+
+def load_entity_schedules(excel_file_path, prefix):
+    """
+    Возвращает расписания сущностей (преподавателей или групп) из книги Excel
+
+    Args:
+        excel_file_path (str): Путь к Excel-файлу с расписанием
+        prefix (str): Префикс листов: "T_" для преподавателей, "G_" для групп
+
+    Returns:
+        list: Список кортежей (имя листа, имя сущности, DataFrame)
+    """
+    select = _select_teacher if prefix == TEACHER_PREFIX else _select_group
+    entities = []
+    with open_schedule_book(excel_file_path) as xl:
+        sheets = [sheet for sheet in xl.sheet_names if sheet.startswith(prefix)]
+        schedule_df = None
+        if SCHEDULE_SHEET in xl.sheet_names:
+            schedule_df = xl.parse(SCHEDULE_SHEET)
+            column = "teacher" if prefix == TEACHER_PREFIX else "group"
+            if column not in schedule_df.columns:
+                schedule_df = None
+
+        derived = 0
+        for sheet in sheets:
+            name = sheet[len(prefix):]
+            df = None
+            if schedule_df is not None and _sheet_round_trips(sheet, name):
+                df = select(schedule_df, name)
+                if df.empty:
+                    df = None
+                else:
+                    # Тот же порядок строк, что у листа сущности в книге
+                    df = df.sort_values(by=["day", "start_time"]).reset_index(drop=True)
+                    derived += 1
+            if df is None:
+                df = xl.parse(sheet)
+            entities.append((sheet, name, df))
+
+    print(f"Листов {prefix}*: {len(sheets)}, из листа {SCHEDULE_SHEET}: {derived}, "
+          f"прочитано отдельно: {len(sheets) - derived}")
+    return entities
+
+
+def resolve_jobs(jobs, task_count):
+    """Число процессов отрисовки: None — по числу ядер, не больше числа задач."""
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    return max(1, min(int(jobs), task_count))
+
+
+def run_render_tasks(render_func, tasks, jobs=None):
+    """
+    Выполняет render_func для каждой задачи, при jobs > 1 — в пуле процессов
+
+    Args:
+        render_func (callable): Функция верхнего уровня модуля (должна сериализоваться)
+        tasks (list): Аргументы задач (по одному объекту на вызов)
+        jobs (int): Число процессов; None — по числу ядер
+
+    Returns:
+        list: Результаты в порядке задач
+    """
+    if not tasks:
+        return []
+    workers = resolve_jobs(jobs, len(tasks))
+    if workers == 1:
+        return [render_func(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(render_func, tasks))
+
+
+def renderer_signature(exporter_file, lesson_type_filter):
+    """Хэш исходников рендерера, модуля экспортёра и параметров отрисовки."""
+    digest = hashlib.sha256(f"{MANIFEST_VERSION}|{lesson_type_filter}".encode("utf-8"))
+    digest.update(layout_signature(_VISUALISER_DIR).encode("utf-8"))
+    paths = [os.path.join(_VISUALISER_DIR, name) for name in _RENDERER_SOURCES]
+    for path in paths + [os.path.abspath(exporter_file)]:
+        try:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(path.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def entity_digest(df):
+    """Хэш строк расписания сущности (порядок строк сохраняется)."""
+    records = df.astype(object).where(df.notna(), None).to_dict("records")
+    raw = json.dumps(records, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def manifest_path(output_dir):
+    return os.path.normpath(output_dir) + MANIFEST_SUFFIX
+
+
+class ExportManifest:
+    """
+    Манифест инкрементального экспорта PDF одного каталога.
+
+    Записи хранятся по имени PDF-файла; при смене сигнатуры рендерера
+    манифест считается пустым и всё перерисовывается.
+    """
+
+    def __init__(self, output_dir, signature):
+        self.output_dir = output_dir
+        self.path = manifest_path(output_dir)
+        self.signature = signature
+        stored_signature, stored = self._load()
+        # PDF, записанные прошлым запуском: только их можно удалять как устаревшие
+        self._recorded = set(stored)
+        self._entries = stored if stored_signature == signature else {}
+        self._current = {}
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None, {}
+        if not isinstance(data, dict):
+            return None, {}
+        entries = data.get("entities")
+        return data.get("signature"), entries if isinstance(entries, dict) else {}
+
+    def is_current(self, pdf_file, digest):
+        """PDF можно не перерисовывать: хэш совпал и файл на месте."""
+        name = os.path.basename(pdf_file)
+        return self._entries.get(name) == digest and os.path.isfile(pdf_file)
+
+    def keep(self, pdf_file, digest):
+        self._current[os.path.basename(pdf_file)] = digest
+
+    def keep_previous(self, pdf_file):
+        """
+        PDF не удалось перерисовать: остаётся прежний файл и его запись.
+
+        Хэш записи не совпадает с новыми строками сущности (после смены
+        сигнатуры записи без хэша), поэтому следующий запуск снова попробует
+        перерисовать PDF, а файл остаётся в манифесте для удаления устаревших.
+        """
+        name = os.path.basename(pdf_file)
+        if name in self._recorded:
+            self._current[name] = self._entries.get(name)
+
+    def remove_orphans(self, pdf_files):
+        """
+        Удаляет PDF прошлого запуска, сущностей которых больше нет в книге.
+
+        Удаляются только файлы из манифеста: остальные PDF каталога
+        (например, положенные туда пользователем) не трогаются.
+
+        Args:
+            pdf_files (list): PDF всех сущностей книги, включая неудачно отрисованные
+        """
+        expected = {os.path.basename(pdf_file) for pdf_file in pdf_files}
+        removed = []
+        for name in sorted(self._recorded - expected):
+            if name == os.path.basename(name) and os.path.isfile(os.path.join(self.output_dir, name)):
+                try:
+                    os.remove(os.path.join(self.output_dir, name))
+                    removed.append(name)
+                except OSError as e:
+                    print(f"Не удалось удалить устаревший файл {name}: {e}")
+        return removed
+
+    def save(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".manifest_", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"signature": self.signature, "entities": self._current},
+                          f, ensure_ascii=False, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
@@ -2,7 +2,7 @@
 
 import os
 import sys
-from schedule_visualizer_enhanced import main
+from schedule_visualizer_enhanced import main, positive_int
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.pdfbase import pdfmetrics
 
@@ -19,6 +19,12 @@ if __name__ == "__main__":
         choices=['all', 'group', 'individual', 'nachhilfe', 'trial', 'non-group'],
         help='Filter lessons by type (default: all)'
     )
+    parser.add_argument(
+        '--jobs',
+        type=positive_int,
+        default=None,
+        help='Worker processes for teacher/group PDFs (default: CPU count)'
+    )
     args = parser.parse_args()
 
     # Path to the Excel file with the schedule
@@ -33,7 +39,7 @@ if __name__ == "__main__":
 
     try:
         main(excel_file, pdf_file, export_teachers=True, export_groups=True, export_html=True,
-             lesson_type_filter=args.lesson_type)
+             lesson_type_filter=args.lesson_type, jobs=args.jobs)
 
         print(f"\nРасписание успешно визуализировано с улучшениями:")
         print(f"1. Основное расписание: {pdf_file}")
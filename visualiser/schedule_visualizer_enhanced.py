@@ -6,6 +6,7 @@
 - Улучшенный HTML-экспорт с адаптивностью
 """
 
+import argparse
 import os
 import pandas as pd
 from datetime import datetime
@@ -16,14 +17,15 @@ from reportlab.pdfbase.ttfonts import TTFont
 
 # Импортируем модули проекта
 from data_processor import load_data, process_schedule_data, filter_by_lesson_type
-from enhanced_layout_manager import EnhancedScheduleLayout
+from enhanced_layout_manager import EnhancedScheduleLayout, build_render_plan
+from schedule_render.render_plan import cache_for
 from teacher_exporter import export_teacher_schedules
 from group_exporter import export_group_schedules
 from enhanced_export_manager import EnhancedExportManager
 
 
 def main(excel_file_path, output_pdf_path, export_teachers=False, export_groups=False, export_html=False,
-         lesson_type_filter='all'):
+         lesson_type_filter='all', jobs=None):
     """
     Основная функция для генерации PDF с расписанием и дополнительными экспортами
     
@@ -33,6 +35,7 @@ def main(excel_file_path, output_pdf_path, export_teachers=False, export_groups=
         export_teachers (bool): Экспортировать расписание преподавателей
         export_groups (bool): Экспортировать расписание групп
         export_html (bool): Экспортировать в HTML формат
+        jobs (int): Число процессов для PDF преподавателей/групп; None — по числу ядер
     """
     print(f"Загрузка данных из {excel_file_path}...")
     
@@ -56,12 +59,14 @@ def main(excel_file_path, output_pdf_path, export_teachers=False, export_groups=
     
     # Экспорт расписания преподавателей, если выбрано
     if export_teachers:
-        teacher_files = export_teacher_schedules(excel_file_path, lesson_type_filter=lesson_type_filter)
+        teacher_files = export_teacher_schedules(excel_file_path, lesson_type_filter=lesson_type_filter,
+                                                 jobs=jobs)
         print(f"Создано расписаний преподавателей: {len(teacher_files)}")
     
     # Экспорт расписания групп, если выбрано
     if export_groups:
-        group_files = export_group_schedules(excel_file_path, lesson_type_filter=lesson_type_filter)
+        group_files = export_group_schedules(excel_file_path, lesson_type_filter=lesson_type_filter,
+                                             jobs=jobs)
         print(f"Создано расписаний групп: {len(group_files)}")
     
     # Экспорт в HTML, если выбрано
@@ -101,8 +106,12 @@ def create_pdf(layout_manager, output_path):
     c.setFont(font_name, 18)
     #c.drawString(margin, height - margin - 20, "Stundenplan")
     
-    # Рисуем расписание (layout_manager сам добавит страницы при необходимости)
-    layout_manager.draw_schedule(c, margin, height - margin - 50, content_width, content_height - 50, font_name)
+    # Рисуем расписание (layout_manager сам добавит страницы при необходимости);
+    # план компоновки общий с PNG-экспортом и повторными запусками на тех же данных
+    plan = build_render_plan(cache_for(output_path), layout_manager.days_of_week, layout_manager.schedule_by_day,
+                             "draw_schedule", margin, height - margin - 50, content_width, content_height - 50,
+                             font_name, layout=layout_manager)
+    plan.replay(c)
     
     # Добавляем информацию о дате создания на последней странице
     c.setFont(font_name, 8)
@@ -112,11 +121,28 @@ def create_pdf(layout_manager, output_path):
     c.save()
 
 
+def positive_int(value):
+    """Тип аргумента argparse для --jobs."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("значение должно быть не меньше 1")
+    return number
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Генерация визуализации расписания')
+    parser.add_argument(
+        '--jobs',
+        type=positive_int,
+        default=None,
+        help='Число процессов для PDF преподавателей и групп (по умолчанию — по числу ядер)'
+    )
+    args = parser.parse_args()
+
     # Путь к файлу расписания
     excel_file = "optimized_schedule.xlsx"
     # Путь для сохранения PDF
     pdf_file = "enhanced_schedule_visualization.pdf"
     
     # Запускаем визуализацию с включенными опциями экспорта
-    main(excel_file, pdf_file, export_teachers=True, export_groups=True, export_html=True)
+    main(excel_file, pdf_file, export_teachers=True, export_groups=True, export_html=True, jobs=args.jobs)
@@ -4,7 +4,6 @@
 
 import os
 import sys
-import pandas as pd
 import re
 from datetime import datetime
 from reportlab.lib.pagesizes import A4, landscape
@@ -15,6 +14,14 @@ from reportlab.pdfbase.ttfonts import TTFont
 # Импортируем модули проекта
 from data_processor import process_schedule_data, filter_by_lesson_type
 from enhanced_layout_manager import EnhancedScheduleLayout
+from entity_schedules import (
+    TEACHER_PREFIX,
+    ExportManifest,
+    entity_digest,
+    load_entity_schedules,
+    renderer_signature,
+    run_render_tasks,
+)
 
 
 def _configure_stdio_for_unicode_logs():
@@ -29,16 +36,17 @@ def _configure_stdio_for_unicode_logs():
             pass
 
 
-def export_teacher_schedules(excel_file_path, output_dir="teacher_schedules", lesson_type_filter='all'):
+def export_teacher_schedules(excel_file_path, output_dir="teacher_schedules", lesson_type_filter='all', jobs=None):
     """
     Экспортирует расписание преподавателей в отдельные PDF-файлы
     
     Args:
         excel_file_path (str): Путь к Excel-файлу с расписанием
         output_dir (str): Директория для сохранения PDF-файлов с расписаниями преподавателей
+        jobs (int): Число процессов для отрисовки PDF; None — по числу ядер
         
     Returns:
-        list: Список созданных файлов с расписанием преподавателей
+        list: PDF-файлы с расписанием преподавателей (перерисованные и оставленные без изменений)
     """
     # Создаем директорию для сохранения файлов, если она не существует
     _configure_stdio_for_unicode_logs()
@@ -46,59 +54,80 @@ def export_teacher_schedules(excel_file_path, output_dir="teacher_schedules", le
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
     
-    # Получаем список листов в Excel-файле
-    xl = pd.ExcelFile(excel_file_path)
-    sheets = xl.sheet_names
+    # Манифест: PDF перерисовывается только при изменении строк сущности или рендерера
+    manifest = ExportManifest(output_dir, renderer_signature(__file__, lesson_type_filter))
     
-    # Фильтруем листы, начинающиеся с "T_"
-    teacher_sheets = [sheet for sheet in sheets if sheet.startswith("T_")]
+    # Книга читается один раз; расписания берутся из листа Schedule
+    tasks = []
+    digests = []
+    pdf_files = []
+    current_files = set()
+    for sheet, teacher_name, df in load_entity_schedules(excel_file_path, TEACHER_PREFIX):
+        # Создаем имя файла для сохранения PDF
+        # Заменяем недопустимые символы в имени файла
+        safe_name = re.sub(r'[\\/*?:"<>|]', "_", teacher_name)
+        pdf_file = os.path.join(output_dir, f"{safe_name}.pdf")
+        pdf_files.append(pdf_file)
+        digest = entity_digest(df)
+        if manifest.is_current(pdf_file, digest):
+            manifest.keep(pdf_file, digest)
+            current_files.add(pdf_file)
+            continue
+        tasks.append((sheet, teacher_name, df, pdf_file, lesson_type_filter))
+        digests.append(digest)
+    skipped = len(current_files)
     
-    created_files = []
+    results = run_render_tasks(_render_teacher_task, tasks, jobs)
+    for task, (message, pdf_file), digest in zip(tasks, results, digests):
+        print(message)
+        if pdf_file:
+            manifest.keep(pdf_file, digest)
+            current_files.add(pdf_file)
+        else:
+            # Ошибка или пустое расписание: прежний PDF не удаляется
+            manifest.keep_previous(task[3])
     
-    # Для каждого листа с расписанием преподавателя
-    for sheet in teacher_sheets:
-        try:
-            # Извлекаем имя преподавателя из названия листа
-            teacher_name = sheet[2:]  # Удаляем префикс "T_"
-            
-            # Загружаем данные с листа
-            df = pd.read_excel(excel_file_path, sheet_name=sheet)
-            
-            # Проверяем, есть ли данные на листе
-            if df.empty:
-                print(f"Лист {sheet} не содержит данных. Пропускаем.")
-                continue
-            
-            # Обрабатываем данные расписания
-            df = filter_by_lesson_type(df, lesson_type_filter)
-            if df.empty:
-                print(f"Лист {sheet} не содержит данных после фильтрации по типу занятий. Пропускаем.")
-                continue
+    removed = manifest.remove_orphans(pdf_files)
+    manifest.save()
+    print(f"Преподаватели: перерисовано {len(current_files) - skipped}, без изменений {skipped}, "
+          f"удалено устаревших файлов {len(removed)}")
+    
+    return [pdf_file for pdf_file in pdf_files if pdf_file in current_files]
+
+
+def _render_teacher_task(task):
+    """
+    Строит PDF расписания одного преподавателя (выполняется в процессе пула)
+    
+    Returns:
+        tuple: (сообщение для журнала, путь к PDF или None)
+    """
+    sheet, teacher_name, df, pdf_file, lesson_type_filter = task
+    try:
+        # Проверяем, есть ли данные на листе
+        if df.empty:
+            return f"Лист {sheet} не содержит данных. Пропускаем.", None
+        
+        # Обрабатываем данные расписания
+        df = filter_by_lesson_type(df, lesson_type_filter)
+        if df.empty:
+            return f"Лист {sheet} не содержит данных после фильтрации по типу занятий. Пропускаем.", None
 
-            days_of_week, schedule_by_day = process_schedule_data(df)
-            
-            if not days_of_week:
-                print(f"Лист {sheet} не содержит данных о днях недели. Пропускаем.")
-                continue
-            
-            # Создаем имя файла для сохранения PDF
-            # Заменяем недопустимые символы в имени файла
-            safe_name = re.sub(r'[\\/*?:"<>|]', "_", teacher_name)
-            pdf_file = os.path.join(output_dir, f"{safe_name}.pdf")
-            
-            # Создаем менеджер компоновки для расписания
-            layout_manager = EnhancedScheduleLayout(days_of_week, schedule_by_day)
-            
-            # Создаем PDF с визуализацией расписания преподавателя
-            create_teacher_pdf(layout_manager, pdf_file, teacher_name)
-            
-            print(f"Расписание для преподавателя '{teacher_name}' сохранено в файле: {pdf_file}")
-            created_files.append(pdf_file)
+        days_of_week, schedule_by_day = process_schedule_data(df)
+        
+        if not days_of_week:
+            return f"Лист {sheet} не содержит данных о днях недели. Пропускаем.", None
+        
+        # Создаем менеджер компоновки для расписания
+        layout_manager = EnhancedScheduleLayout(days_of_week, schedule_by_day)
+        
+        # Создаем PDF с визуализацией расписания преподавателя
+        create_teacher_pdf(layout_manager, pdf_file, teacher_name)
         
-        except Exception as e:
-            print(f"Ошибка при обработке листа {sheet}: {e}")
+        return f"Расписание для преподавателя '{teacher_name}' сохранено в файле: {pdf_file}", pdf_file
     
-    return created_files
+    except Exception as e:
+        return f"Ошибка при обработке листа {sheet}: {e}", None
 
 
 def create_teacher_pdf(layout_manager, output_path, teacher_name):
@@ -51,8 +51,7 @@ def initialize_group_colors(group_names, saturation=0.6, value=0.9):
 def get_group_color(group_name):
     """
     Возвращает цвет группы. 
-    Если вы предварительно вызвали initialize_group_colors, 
-    берёт готовый цвет из GROUP_COLOR_CACHE, иначе — делает фолбэк.
+    Цвет вычисляется один раз на название и запоминается в GROUP_COLOR_CACHE.
     """
 #    if group_name in GROUP_COLOR_CACHE:
 #        return GROUP_COLOR_CACHE[group_name]
@@ -65,8 +64,10 @@ def get_group_color(group_name):
 #
     # единичная генерация, как было раньше
 #    color = generate_color_from_string(key)
+    if group_name in GROUP_COLOR_CACHE:
+        return GROUP_COLOR_CACHE[group_name]
     color = generate_color_from_string(group_name)
-#    GROUP_COLOR_CACHE[group_name] = color
+    GROUP_COLOR_CACHE[group_name] = color
     return color
 
 
@@ -4,7 +4,17 @@
 Версия 2: добавлена поддержка разделения дней на группы (Mo-Fr и Sa отдельно)
 Версия 3: адаптивная толщина границ блоков
 """
+import os
+import sys
+
+LAYOUT_DIR = os.path.dirname(os.path.abspath(__file__))
+# Общий пакет schedule_render лежит в корне проекта
+PROJECT_ROOT = os.path.dirname(LAYOUT_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
 from color_manager import initialize_group_colors, initialize_building_colors
+from schedule_render.render_plan import plan_key
 
 class EnhancedScheduleLayout:
     """Улучшенный класс для управления компоновкой расписания со скругленными углами"""
@@ -348,4 +358,33 @@ class FullEnhancedScheduleLayout(EnhancedScheduleLayout, LayoutDrawingMixin, Blo
     pass
 
 # Заменяем исходный класс на полный для удобства использования
-EnhancedScheduleLayout = FullEnhancedScheduleLayout
\ No newline at end of file
+EnhancedScheduleLayout = FullEnhancedScheduleLayout
+
+
+def build_render_plan(cache, days_of_week, schedule_by_day, method, x, y, width, height, font_name, layout=None):
+    """
+    Возвращает план отрисовки метода компоновки (draw_schedule и т.п.)
+
+    План берется из кэша, если данные, исходники рендерера и геометрия не
+    менялись; иначе метод выполняется один раз на записывающем холсте.
+    Компоновка создается только при промахе кэша, если не передана готовая.
+
+    Args:
+        cache (RenderPlanCache): Кэш планов
+        days_of_week (list): Список дней недели
+        schedule_by_day (dict): Словарь с расписанием по дням
+        method (str): Имя метода отрисовки EnhancedScheduleLayout
+        x, y, width, height (float): Область расписания
+        font_name (str): Название шрифта
+        layout (EnhancedScheduleLayout, optional): Готовый менеджер компоновки
+
+    Returns:
+        RenderPlan: План для воспроизведения на холсте
+    """
+    key = plan_key(LAYOUT_DIR, days_of_week, schedule_by_day, method, x, y, width, height, font_name)
+
+    def draw(canvas):
+        manager = layout if layout is not None else EnhancedScheduleLayout(days_of_week, schedule_by_day)
+        getattr(manager, method)(canvas, x, y, width, height, font_name)
+
+    return cache.get_or_record(key, draw)
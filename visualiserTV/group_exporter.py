@@ -3,17 +3,23 @@
 """
 
 import os
-import pandas as pd
 import re
+import sys
 from datetime import datetime
 from reportlab.lib.pagesizes import A4, landscape
 from reportlab.pdfgen import canvas
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 
+# Общий модуль schedule_sidecar лежит в корне проекта
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
 # Импортируем модули проекта
 from data_processor import process_schedule_data
 from enhanced_layout_manager import EnhancedScheduleLayout
+from schedule_sidecar import open_schedule_book
 
 
 def export_group_schedules(excel_file_path, output_dir="group_schedules"):
@@ -32,7 +38,7 @@ def export_group_schedules(excel_file_path, output_dir="group_schedules"):
         os.makedirs(output_dir)
     
     # Получаем список листов в Excel-файле
-    xl = pd.ExcelFile(excel_file_path)
+    xl = open_schedule_book(excel_file_path)
     sheets = xl.sheet_names
     
     # Фильтруем листы, начинающиеся с "G_"
@@ -47,7 +53,7 @@ def export_group_schedules(excel_file_path, output_dir="group_schedules"):
             group_name = sheet[2:]  # Удаляем префикс "G_"
             
             # Загружаем данные с листа
-            df = pd.read_excel(excel_file_path, sheet_name=sheet)
+            df = xl.parse(sheet)
             
             # Проверяем, есть ли данные на листе
             if df.empty:
@@ -78,6 +84,7 @@ def export_group_schedules(excel_file_path, output_dir="group_schedules"):
         except Exception as e:
             print(f"Ошибка при обработке листа {sheet}: {e}")
     
+    xl.close()
     return created_files
 
 
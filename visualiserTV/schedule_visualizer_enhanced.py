@@ -17,7 +17,8 @@ from reportlab.pdfbase.ttfonts import TTFont
 
 # Импортируем модули проекта
 from data_processor import load_data, process_schedule_data, filter_by_lesson_type
-from enhanced_layout_manager import EnhancedScheduleLayout
+from enhanced_layout_manager import EnhancedScheduleLayout, build_render_plan
+from schedule_render.render_plan import cache_for
 from enhanced_export_manager import EnhancedExportManager
 
 
@@ -87,6 +88,9 @@ def create_pdf_v2(layout_manager, output_path):
     if not has_weekdays and not has_weekends:
         print("Нет данных для экспорта")
         return
+
+    # Планы компоновки холстов кэшируются по данным рядом с PDF
+    plan_cache = cache_for(output_path)
     
     # Определяем размер первого холста
     if has_weekdays:
@@ -105,8 +109,10 @@ def create_pdf_v2(layout_manager, output_path):
         # c.drawString(margin, weekday_canvas_size[1] - margin - 35, "Stundenplan (Mo-Fr)")
         
         # Рисуем расписание рабочих дней
-        layout_manager.draw_weekday_schedule(c, margin, weekday_canvas_size[1] - margin - 50, 
-                                           content_width, content_height - 50, font_name)
+        plan = build_render_plan(plan_cache, layout_manager.days_of_week, layout_manager.schedule_by_day,
+                                 "draw_weekday_schedule", margin, weekday_canvas_size[1] - margin - 50,
+                                 content_width, content_height - 50, font_name, layout=layout_manager)
+        plan.replay(c)
         
         # Добавляем информацию о дате создания
         c.setFont(font_name, 8)
@@ -136,8 +142,10 @@ def create_pdf_v2(layout_manager, output_path):
         # c.drawString(margin, height - margin - 30, "Stundenplan (Sa)")
         
         # Рисуем расписание выходных дней
-        layout_manager.draw_weekend_schedule(c, margin, height - margin - 40, 
-                                           content_width, content_height - 40, font_name)
+        plan = build_render_plan(plan_cache, layout_manager.days_of_week, layout_manager.schedule_by_day,
+                                 "draw_weekend_schedule", margin, height - margin - 40,
+                                 content_width, content_height - 40, font_name, layout=layout_manager)
+        plan.replay(c)
         
         # Добавляем информацию о дате создания
         c.setFont(font_name, 8)